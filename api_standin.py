@@ -0,0 +1,435 @@
+#!/usr/bin/env python3
+"""
+오프라인 API 대역 서버 - FRED / BLS / Yahoo 응답을 로컬 HTTP 로 재생
+
+fetch 경로(get_fred_data, _fetch_bls_series_range, _fetch_history,
+_batch_fetch_quote, fetch_chart_series_daily)를 실제 API 없이 벤치마크하거나
+회귀 확인할 때 사용한다. 표준 라이브러리만 사용.
+
+지원 엔드포인트 (실제 API 와 같은 경로/응답 모양):
+  GET  /fred/series/observations?series_id=..&observation_start=..&observation_end=..
+  POST /publicAPI/v2/timeseries/data/          {"seriesid": [...], "startyear", "endyear"}
+  GET  /v8/finance/chart/<symbol>?range=..     또는 ?period1=..&period2=..
+  GET  /v7/finance/quote?symbols=A,B,...
+
+응답은 시리즈/심볼 이름으로 시드한 결정적 합성 데이터이며, replay_dir 에
+녹화 응답이 있으면 그것을 그대로 돌려준다:
+  <replay_dir>/fred/<series_id>.json
+  <replay_dir>/bls/<series_id>.json
+  <replay_dir>/chart/<symbol>.json
+  <replay_dir>/quote/<symbol>.json   (quoteResponse.result 의 한 항목)
+
+지연(latency/jitter), 5xx 오류율, 429(Retry-After) 비율을 설정할 수 있다.
+
+사용법:
+  python api_standin.py --port 8765 --latency-ms 40 --error-rate 0.01 --rate-limit-rate 0.02
+  BLS_API_URL=http://127.0.0.1:8765/publicAPI/v2/timeseries/data/ \\
+  FRED_API_URL=http://127.0.0.1:8765/fred/series/observations \\
+  YAHOO_BASE_URL=http://127.0.0.1:8765 YF_HISTORY_MODE=chart python ...
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import random
+import threading
+import time
+from collections import Counter
+from datetime import date, datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, unquote, urlparse
+
+# 합성 데이터 시작 시점
+SYNTH_START = date(1990, 1, 1)
+# BLS API 한 번에 허용하는 최대 연도 수 (등록 키 기준)
+BLS_MAX_YEARS = 20
+FRED_MISSING_SHARE = 0.01
+
+RANGE_DAYS = {
+    "1d": 1, "5d": 7, "1mo": 31, "3mo": 92, "6mo": 183, "1y": 366,
+    "2y": 731, "5y": 1827, "10y": 3653, "ytd": None, "max": None,
+}
+
+
+class StandinConfig:
+    """대역 서버 동작 설정."""
+
+    def __init__(self, latency_ms=0.0, jitter_ms=0.0, error_rate=0.0, rate_limit_rate=0.0,
+                 retry_after=1, seed=7, replay_dir=None):
+        self.latency_ms = float(latency_ms)
+        self.jitter_ms = float(jitter_ms)
+        self.error_rate = float(error_rate)
+        self.rate_limit_rate = float(rate_limit_rate)
+        self.retry_after = int(retry_after)
+        self.seed = int(seed)
+        self.replay_dir = Path(replay_dir) if replay_dir else None
+
+    def to_dict(self):
+        return {
+            "latency_ms": self.latency_ms,
+            "jitter_ms": self.jitter_ms,
+            "error_rate": self.error_rate,
+            "rate_limit_rate": self.rate_limit_rate,
+            "retry_after": self.retry_after,
+            "seed": self.seed,
+            "replay_dir": str(self.replay_dir) if self.replay_dir else None,
+        }
+
+
+# %%
+# === 합성 데이터 ===
+
+def _rng(key, seed):
+    digest = hashlib.sha1(f"{seed}:{key}".encode("utf-8")).digest()
+    return random.Random(int.from_bytes(digest[:8], "big"))
+
+
+def _month_starts(start, end):
+    y, m = start.year, start.month
+    while (y, m) <= (end.year, end.month):
+        yield date(y, m, 1)
+        m += 1
+        if m > 12:
+            y, m = y + 1, 1
+
+
+def synthetic_monthly(key, seed, end=None):
+    """월별 (date, value) 목록 - 완만한 추세 + 잡음의 로그 랜덤워크."""
+    end = end or date.today()
+    rng = _rng(key, seed)
+    level = 50.0 + rng.random() * 200.0
+    drift = rng.uniform(0.0005, 0.004)
+    vol = rng.uniform(0.001, 0.01)
+    out = []
+    for d in _month_starts(SYNTH_START, end):
+        level *= math.exp(drift + rng.gauss(0.0, vol))
+        out.append((d, round(level, 3)))
+    return out
+
+
+def synthetic_daily(key, seed, start, end):
+    """영업일 OHLCV 목록 (start~end, UTC 날짜) - 심볼별로 결정적."""
+    rng = _rng(key, seed)
+    level = 20.0 + rng.random() * 500.0
+    vol = rng.uniform(0.004, 0.02)
+    rows = []
+    d = SYNTH_START
+    while d <= end:
+        if d.weekday() < 5:
+            prev = level
+            level *= math.exp(rng.gauss(0.0002, vol))
+            if d >= start:
+                hi = max(prev, level) * (1 + abs(rng.gauss(0, vol / 2)))
+                lo = min(prev, level) * (1 - abs(rng.gauss(0, vol / 2)))
+                rows.append((d, round(prev, 4), round(hi, 4), round(lo, 4), round(level, 4),
+                             int(rng.uniform(1e5, 5e6))))
+        d += timedelta(days=1)
+    return rows
+
+
+def fred_payload(series_id, start, end, seed):
+    obs = []
+    rng = _rng(f"fred-missing:{series_id}", seed)
+    for d, v in synthetic_monthly(f"fred:{series_id}", seed):
+        if start <= d <= end:
+            value = "." if rng.random() < FRED_MISSING_SHARE else f"{v:.3f}"
+            obs.append({"realtime_start": end.isoformat(), "realtime_end": end.isoformat(),
+                        "date": d.isoformat(), "value": value})
+    return {
+        "realtime_start": end.isoformat(), "realtime_end": end.isoformat(),
+        "observation_start": start.isoformat(), "observation_end": end.isoformat(),
+        "units": "lin", "output_type": 1, "file_type": "json", "order_by": "observation_date",
+        "sort_order": "asc", "count": len(obs), "offset": 0, "limit": 100000,
+        "observations": obs,
+    }
+
+
+def bls_series(series_id, start_year, end_year, seed):
+    data = []
+    for d, v in synthetic_monthly(f"bls:{series_id}", seed):
+        if start_year <= d.year <= end_year:
+            data.append({"year": str(d.year), "period": f"M{d.month:02d}",
+                         "periodName": d.strftime("%B"), "value": f"{v:.1f}", "footnotes": [{}]})
+    data.reverse()  # BLS 는 최신순
+    return {"seriesID": series_id, "data": data}
+
+
+def chart_payload(symbol, start, end, seed):
+    rows = synthetic_daily(f"yahoo:{symbol}", seed, start, end)
+    ts = [int(datetime(d.year, d.month, d.day, 14, 30, tzinfo=timezone.utc).timestamp()) for d, *_ in rows]
+    quote = {
+        "open": [r[1] for r in rows], "high": [r[2] for r in rows], "low": [r[3] for r in rows],
+        "close": [r[4] for r in rows], "volume": [r[5] for r in rows],
+    }
+    meta = {"symbol": symbol, "currency": "USD", "dataGranularity": "1d",
+            "regularMarketPrice": rows[-1][4] if rows else None}
+    return {"chart": {"result": [{
+        "meta": meta, "timestamp": ts,
+        "indicators": {"quote": [quote], "adjclose": [{"adjclose": quote["close"]}]},
+    }], "error": None}}
+
+
+def quote_item(symbol, seed):
+    rng = _rng(f"quote:{symbol}", seed)
+    price = round(20.0 + rng.random() * 500.0, 2)
+    eps = round(price / rng.uniform(8, 35), 3)
+    bvps = round(price / rng.uniform(0.8, 6), 3)
+    rate = round(price * rng.uniform(0.0, 0.05), 3)
+    return {
+        "symbol": symbol, "quoteType": "INDEX" if symbol.startswith("^") else "ETF", "currency": "USD",
+        "regularMarketPrice": price, "epsTrailingTwelveMonths": eps, "bookValue": bvps,
+        "trailingPE": round(price / eps, 3), "priceToBook": round(price / bvps, 3),
+        "trailingAnnualDividendRate": rate, "trailingAnnualDividendYield": round(rate / price, 5),
+        "dividendYield": round(100 * rate / price, 3),
+    }
+
+
+# %%
+# === HTTP 서버 ===
+
+def _parse_date(value, default):
+    try:
+        return date.fromisoformat(value[:10]) if value else default
+    except ValueError:
+        return default
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "ApiStandin/1.0"
+    protocol_version = "HTTP/1.1"
+
+    # 기본 접근 로그는 벤치마크 출력만 어지럽힌다
+    def log_message(self, fmt, *args):
+        pass
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def _dispatch(self, method):
+        standin = self.server.standin
+        url = urlparse(self.path)
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        body = b""
+        if method == "POST":
+            length = int(self.headers.get("Content-Length") or 0)
+            body = self.rfile.read(length) if length else b""
+
+        route = self._route(method, url.path)
+        standin._delay()
+        fault = standin._fault()
+        if fault == 429:
+            standin._count(route, 429)
+            return self._send(429, b"Too Many Requests", "text/plain",
+                              {"Retry-After": str(standin.config.retry_after)})
+        if fault == 500:
+            standin._count(route, 500)
+            return self._send(500, b"Internal Server Error", "text/plain")
+
+        try:
+            payload = self._payload(route, url.path, query, body)
+        except ValueError as e:
+            standin._count(route, 400)
+            return self._send(400, json.dumps({"error_message": str(e)}).encode("utf-8"))
+        if payload is None:
+            standin._count(route, 404)
+            return self._send(404, b'{"error": "not found"}')
+        standin._count(route, 200)
+        self._send(200, json.dumps(payload, separators=(",", ":")).encode("utf-8"))
+
+    @staticmethod
+    def _route(method, path):
+        if path.rstrip("/").endswith("/fred/series/observations"):
+            return "fred"
+        if method == "POST" and "/timeseries/data" in path:
+            return "bls"
+        if "/v8/finance/chart/" in path:
+            return "chart"
+        if path.rstrip("/").endswith("/v7/finance/quote"):
+            return "quote"
+        return "unknown"
+
+    def _payload(self, route, path, query, body):
+        standin = self.server.standin
+        seed = standin.config.seed
+        today = date.today()
+        if route == "fred":
+            series_id = query.get("series_id")
+            if not series_id:
+                raise ValueError("Bad Request. Variable series_id is not set.")
+            recorded = standin._replay("fred", series_id)
+            if recorded is not None:
+                return recorded
+            return fred_payload(series_id, _parse_date(query.get("observation_start"), SYNTH_START),
+                                _parse_date(query.get("observation_end"), today), seed)
+        if route == "bls":
+            req = json.loads(body.decode("utf-8") or "{}")
+            start_year = int(req.get("startyear") or today.year - 9)
+            end_year = int(req.get("endyear") or today.year)
+            if end_year - start_year + 1 > BLS_MAX_YEARS:
+                return {"status": "REQUEST_NOT_PROCESSED", "responseTime": 1,
+                        "message": [f"Year range has been reduced to the system-allowed limit of {BLS_MAX_YEARS} years."],
+                        "Results": {"series": []}}
+            series = []
+            for series_id in req.get("seriesid") or []:
+                recorded = standin._replay("bls", series_id)
+                series.append(recorded if recorded is not None else bls_series(series_id, start_year, end_year, seed))
+            return {"status": "REQUEST_SUCCEEDED", "responseTime": 1, "message": [], "Results": {"series": series}}
+        if route == "chart":
+            symbol = unquote(path.rsplit("/", 1)[-1])
+            recorded = standin._replay("chart", symbol)
+            if recorded is not None:
+                return recorded
+            if "period1" in query:
+                start = datetime.fromtimestamp(int(query["period1"]), tz=timezone.utc).date()
+                end = datetime.fromtimestamp(int(query.get("period2") or time.time()), tz=timezone.utc).date()
+            else:
+                days = RANGE_DAYS.get(query.get("range", "max"))
+                if query.get("range") == "ytd":
+                    start = date(today.year, 1, 1)
+                else:
+                    start = today - timedelta(days=days) if days else SYNTH_START
+                end = today
+            return chart_payload(symbol, max(start, SYNTH_START), end, seed)
+        if route == "quote":
+            symbols = [s for s in unquote(query.get("symbols", "")).split(",") if s]
+            result = []
+            for symbol in symbols:
+                recorded = standin._replay("quote", symbol)
+                result.append(recorded if recorded is not None else quote_item(symbol, seed))
+            return {"quoteResponse": {"result": result, "error": None}}
+        return None
+
+    def _send(self, status, payload, content_type="application/json", headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+class StandinServer:
+    """백그라운드 스레드에서 도는 대역 서버 - `with StandinServer(config) as srv:` 로 사용.
+
+    `srv.env()` 는 fetch 모듈이 이 서버를 보도록 하는 환경 변수 매핑을 돌려준다.
+    """
+
+    def __init__(self, config=None, host="127.0.0.1", port=0):
+        self.config = config or StandinConfig()
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.standin = self
+        self._thread = None
+        self._lock = threading.Lock()
+        self._fault_rng = random.Random(self.config.seed)
+        self.counts = Counter()
+
+    @property
+    def base_url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def env(self):
+        return {
+            "FRED_API_URL": f"{self.base_url}/fred/series/observations",
+            "BLS_API_URL": f"{self.base_url}/publicAPI/v2/timeseries/data/",
+            "YAHOO_BASE_URL": self.base_url,
+            "YF_HISTORY_MODE": "chart",
+        }
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="api-standin", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+    def reset_counts(self):
+        with self._lock:
+            self.counts.clear()
+
+    def stats(self):
+        with self._lock:
+            return {f"{route}:{status}": n for (route, status), n in sorted(self.counts.items())}
+
+    # --- 요청 처리 도우미 ---
+    def _count(self, route, status):
+        with self._lock:
+            self.counts[(route, status)] += 1
+
+    def _delay(self):
+        cfg = self.config
+        if cfg.latency_ms or cfg.jitter_ms:
+            with self._lock:
+                jitter = self._fault_rng.uniform(0, cfg.jitter_ms) if cfg.jitter_ms else 0.0
+            time.sleep((cfg.latency_ms + jitter) / 1000.0)
+
+    def _fault(self):
+        cfg = self.config
+        if not (cfg.rate_limit_rate or cfg.error_rate):
+            return None
+        with self._lock:
+            r = self._fault_rng.random()
+        if r < cfg.rate_limit_rate:
+            return 429
+        if r < cfg.rate_limit_rate + cfg.error_rate:
+            return 500
+        return None
+
+    def _replay(self, kind, key):
+        if self.config.replay_dir is None:
+            return None
+        path = self.config.replay_dir / kind / f"{key.replace('/', '_')}.json"
+        if not path.exists():
+            return None
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+
+
+def main(argv=None) -> int:
+    p = argparse.ArgumentParser(description="Local FRED/BLS/Yahoo stand-in server (synthetic or recorded responses)")
+    p.add_argument("--host", default="127.0.0.1")
+    p.add_argument("--port", type=int, default=8765)
+    p.add_argument("--latency-ms", type=float, default=0.0, help="Fixed per-request latency")
+    p.add_argument("--jitter-ms", type=float, default=0.0, help="Extra uniform random latency")
+    p.add_argument("--error-rate", type=float, default=0.0, help="Share of requests answered with HTTP 500")
+    p.add_argument("--rate-limit-rate", type=float, default=0.0, help="Share of requests answered with HTTP 429")
+    p.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds sent with 429")
+    p.add_argument("--seed", type=int, default=7)
+    p.add_argument("--replay-dir", help="Directory with recorded responses (fred/, bls/, chart/, quote/)")
+    args = p.parse_args(argv)
+
+    config = StandinConfig(args.latency_ms, args.jitter_ms, args.error_rate, args.rate_limit_rate,
+                           args.retry_after, args.seed, args.replay_dir)
+    server = StandinServer(config, args.host, args.port)
+    print(f"🛰️ API stand-in listening on {server.base_url}")
+    for key, value in server.env().items():
+        print(f"   export {key}={value}")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
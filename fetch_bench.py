@@ -0,0 +1,406 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark suite for the FRED / BLS / Yahoo fetch paths.
+
+Starts the local API stand-in (api_standin.py) and points the fetchers at it
+via their endpoint settings (FRED_API_URL, BLS_API_URL, YAHOO_BASE_URL,
+YF_HISTORY_MODE=chart), then times each stage end to end:
+
+  fred_fetch          get_fred_data for --series synthetic series
+  bls_fetch           get_bls_data (20-year chunked POSTs) for --series series
+  us_eco_refresh      full API reload of us_eco refactor modules (--module), using
+                      the exact series dicts each module passes to its loader
+  yahoo_history       world_indices._fetch_history (chart API) for --symbols symbols
+  yahoo_quote         world_indices._batch_fetch_quote in chunks of 20
+  world_indices_update  update_all_daily_data into a scratch data directory (cold)
+  fx_build            fx_rates.build_fx_rates(force=True) into a scratch directory
+
+Throughput is items / median seconds over --repeat runs. Request counts, bytes
+and errors come from run_metrics; the stand-in reports per-route status counts.
+Latency, 5xx and 429 rates of the stand-in are configurable so retry/backoff
+behaviour can be measured too. Each run is appended to a JSONL history file
+and optionally compared with a baseline (a stage regresses when it is slower
+than baseline × (1 + tolerance)).
+
+Usage:
+  python fetch_bench.py
+  python fetch_bench.py --latency-ms 40 --rate-limit-rate 0.02 --stage fred_fetch --stage bls_fetch
+  python fetch_bench.py --save-baseline
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import logging
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+REPO_ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(REPO_ROOT))
+import api_standin
+import run_metrics
+
+DEFAULT_BASELINE = str(REPO_ROOT / "fetch_bench_baseline.json")
+DEFAULT_HISTORY = str(REPO_ROOT / "fetch_bench_history.jsonl")
+DEFAULT_MODULES = ["CPI_analysis_refactor", "pce_analysis_refactor", "house_price_refactor"]
+QUOTE_CHUNK = 20
+
+
+# %%
+# === 대상 모듈 연결 ===
+
+def _point_modules_at(server: api_standin.StandinServer) -> None:
+    """이미 import 된 fetch 모듈도 대역 서버를 보도록 엔드포인트 설정을 덮어쓴다."""
+    env = server.env()
+    os.environ.update(env)
+    utils = sys.modules.get("us_eco_utils")
+    if utils is not None:
+        utils.FRED_API_URL = env["FRED_API_URL"]
+        utils.BLS_API_URL = env["BLS_API_URL"]
+    for name in ("global_universe.world_indices", "world_indices"):
+        mod = sys.modules.get(name)
+        if mod is not None:
+            mod.YAHOO_BASE_URL = env["YAHOO_BASE_URL"]
+            mod.YF_HISTORY_MODE = "chart"
+    for name in ("global_universe.fx_rates", "fx_rates"):
+        mod = sys.modules.get(name)
+        if mod is not None:
+            mod.YAHOO_BASE_URL = env["YAHOO_BASE_URL"]
+
+
+def _us_eco_utils():
+    sys.path.insert(0, str(REPO_ROOT / "us_eco"))
+    import us_eco_utils
+    return us_eco_utils
+
+
+def capture_module_loads(stem: str) -> List[tuple]:
+    """us_eco 모듈을 CSV 전용으로 import 하면서 로더 호출 인자를 기록.
+
+    반환: [(loader_name, series_dict_or_groups, data_source, kwargs), ...]
+    """
+    _us_eco_utils()
+    import batch_render
+
+    batch_render._init_worker(quiet=False)  # fig.show() 무력화
+    with contextlib.redirect_stdout(io.StringIO()):
+        calls = batch_render.capture_loader_calls(stem)
+    return [(loader, series, source, {k: v for k, v in kwargs.items() if k != "csv_file_path"})
+            for loader, series, source, kwargs in calls]
+
+
+def _series_count(loader: str, series) -> int:
+    if loader == "load_economic_data_grouped":
+        return sum(len(group) for group in series.values())
+    return len(series)
+
+
+# %%
+# === 스테이지 ===
+
+def _stage_fred(n_series: int, workdir: str) -> tuple:
+    utils = _us_eco_utils()
+    utils.initialize_fred_api()
+    ids = [f"BENCHFRED{i:03d}" for i in range(n_series)]
+
+    def run():
+        for sid in ids:
+            utils.get_fred_data(sid, "2000-01-01")
+    return run, None, n_series
+
+
+def _stage_bls(n_series: int, workdir: str) -> tuple:
+    utils = _us_eco_utils()
+    utils.initialize_bls_api()
+    ids = [f"BENCHBLS{i:03d}" for i in range(n_series)]
+
+    def run():
+        for sid in ids:
+            utils.get_bls_data(sid, 1995)
+    return run, None, n_series
+
+
+def _stage_us_eco(modules: List[str], workdir: str) -> tuple:
+    utils = _us_eco_utils()
+    jobs = []
+    for stem in modules:
+        for i, (loader, series, source, kwargs) in enumerate(capture_module_loads(stem)):
+            jobs.append((stem, i, loader, series, source, kwargs))
+    if not jobs:
+        raise RuntimeError(f"로더 호출을 찾지 못했습니다: {modules}")
+    out_dir = Path(workdir) / "us_eco"
+
+    def setup():
+        shutil.rmtree(out_dir, ignore_errors=True)
+        out_dir.mkdir(parents=True)
+
+    def run():
+        for stem, i, loader, series, source, kwargs in jobs:
+            fn = getattr(utils, loader)
+            fn(series, data_source=source, csv_file_path=str(out_dir / f"{stem}_{i}.csv"),
+               start_date=kwargs.get("start_date", "2020-01-01"), smart_update=False, force_reload=True)
+    items = sum(_series_count(loader, series) for _, _, loader, series, _, _ in jobs)
+    return run, setup, items
+
+
+def _world_indices():
+    sys.path.insert(0, str(REPO_ROOT))
+    from global_universe import world_indices
+    return world_indices
+
+
+def _stage_yahoo_history(n_symbols: int, workdir: str) -> tuple:
+    wi = _world_indices()
+    symbols = wi.list_primary_symbols(wi.investment_universe)[:n_symbols]
+
+    def run():
+        for sym in symbols:
+            wi._fetch_history(sym, pause=0.0)
+    return run, None, len(symbols)
+
+
+def _stage_yahoo_quote(n_symbols: int, workdir: str) -> tuple:
+    wi = _world_indices()
+    symbols = wi.list_primary_symbols(wi.investment_universe)[:n_symbols]
+
+    def run():
+        for i in range(0, len(symbols), QUOTE_CHUNK):
+            wi._batch_fetch_quote(symbols[i:i + QUOTE_CHUNK])
+    return run, None, len(symbols)
+
+
+def _stage_world_update(n_symbols: int, workdir: str) -> tuple:
+    wi = _world_indices()
+    symbols = wi.list_primary_symbols(wi.investment_universe)[:n_symbols]
+    base = Path(workdir) / "world_indices"
+
+    def setup():
+        shutil.rmtree(base, ignore_errors=True)
+        (base / "data" / "daily").mkdir(parents=True)
+        wi._BASE_DIR = base
+        wi._DATA_DIR = base / "data" / "daily"
+
+    def run():
+        wi.update_all_daily_data(wi.investment_universe, pause=0.0, symbols=symbols)
+    return run, setup, len(symbols)
+
+
+def _stage_fx(n_symbols: int, workdir: str) -> tuple:
+    from global_universe import fx_rates
+    out_dir = Path(workdir) / "fx"
+    currencies = {fx_rates.normalize_currency(c)[0]
+                  for c in fx_rates.gather_currencies(fx_rates.load_investment_universe_literal(fx_rates.UNIVERSE_FILE))}
+    currencies.discard("USD")
+
+    def setup():
+        shutil.rmtree(out_dir, ignore_errors=True)
+        fx_rates.OUT_DIR = out_dir
+
+    def run():
+        fx_rates.build_fx_rates(force=True)
+    return run, setup, len(currencies)
+
+
+STAGES: Dict[str, Callable] = {
+    "fred_fetch": lambda args, wd: _stage_fred(args.series, wd),
+    "bls_fetch": lambda args, wd: _stage_bls(args.series, wd),
+    "us_eco_refresh": lambda args, wd: _stage_us_eco(args.modules or DEFAULT_MODULES, wd),
+    "yahoo_history": lambda args, wd: _stage_yahoo_history(args.symbols, wd),
+    "yahoo_quote": lambda args, wd: _stage_yahoo_quote(args.symbols, wd),
+    "world_indices_update": lambda args, wd: _stage_world_update(args.symbols, wd),
+    "fx_build": lambda args, wd: _stage_fx(args.symbols, wd),
+}
+
+
+# %%
+# === 측정 ===
+
+def _measure(fn: Callable[[], object], setup: Optional[Callable[[], None]], repeat: int, items: int,
+             server: api_standin.StandinServer, quiet: bool) -> dict:
+    run_metrics.metrics.reset()
+    server.reset_counts()
+    timings = []
+    sink = io.StringIO() if quiet else None
+    for _ in range(repeat):
+        if setup:
+            setup()
+        with contextlib.redirect_stdout(sink) if sink is not None else contextlib.nullcontext():
+            t0 = time.perf_counter()
+            fn()
+            timings.append(time.perf_counter() - t0)
+
+    report = run_metrics.run_report()["sources"]
+    requests = sum(v.get("requests", 0) for v in report.values())
+    errors = sum(v.get("request_errors", 0) for v in report.values())
+    nbytes = sum(v.get("bytes", 0) for v in report.values())
+    median = statistics.median(timings)
+    return {
+        "seconds": median,
+        "min_seconds": min(timings),
+        "runs": len(timings),
+        "items": items,
+        "items_per_sec": items / median if median > 0 else None,
+        "requests_per_run": requests / repeat,
+        "request_errors_per_run": errors / repeat,
+        "bytes_per_run": nbytes / repeat,
+        "standin": server.stats(),
+    }
+
+
+def run_suite(args, workdir: str) -> dict:
+    config = api_standin.StandinConfig(args.latency_ms, args.jitter_ms, args.error_rate,
+                                       args.rate_limit_rate, args.retry_after, args.seed, args.replay_dir)
+    selected = args.stages or list(STAGES)
+    results: Dict[str, dict] = {}
+    skipped: Dict[str, str] = {}
+    previous_verbosity = run_metrics.RUN_VERBOSITY
+    if not args.verbose:
+        # 429/5xx 주입 시 쏟아지는 fetch 오류 로그도 숨김 (오류 수는 결과에 집계됨)
+        logging.getLogger("macro").setLevel(logging.CRITICAL)
+
+    with api_standin.StandinServer(config) as server:
+        os.environ.update(server.env())
+        for name in selected:
+            try:
+                with contextlib.redirect_stdout(io.StringIO()) if not args.verbose else contextlib.nullcontext():
+                    fn, setup, items = STAGES[name](args, workdir)
+                _point_modules_at(server)
+            except Exception as e:
+                skipped[name] = f"missing dependency: {e}" if isinstance(e, ImportError) else f"setup failed: {e}"
+                if not args.quiet:
+                    print(f"⚠️ {name} 건너뜀 ({skipped[name]})")
+                continue
+            if not args.quiet:
+                print(f"⏱️ {name} …", end=" ", flush=True)
+            results[name] = _measure(fn, setup, args.repeat, items, server, quiet=not args.verbose)
+            if not args.quiet:
+                r = results[name]
+                print(f"{r['seconds']:.3f}s (min {r['min_seconds']:.3f}s), "
+                      f"{r['items_per_sec'] or 0:.1f} items/s, {r['requests_per_run']:.0f} req/run")
+    run_metrics.set_verbosity(previous_verbosity)
+
+    return {
+        "meta": {
+            "generated_at": datetime.now().isoformat(timespec="seconds"),
+            "series": args.series,
+            "symbols": args.symbols,
+            "modules": args.modules or DEFAULT_MODULES,
+            "repeat": args.repeat,
+            "standin": config.to_dict(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "stages": results,
+        "skipped": skipped,
+    }
+
+
+def compare_with_baseline(current: dict, baseline: dict, tolerance: float) -> List[str]:
+    """Return human-readable regressions of current vs baseline."""
+    regressions: List[str] = []
+    for key in ("series", "symbols", "modules", "standin"):
+        if current["meta"].get(key) != baseline.get("meta", {}).get(key):
+            print(f"⚠️ 기준선과 설정({key})이 다릅니다; 비교 결과는 참고용입니다.")
+            break
+    for name, cur in current["stages"].items():
+        base = baseline.get("stages", {}).get(name)
+        if not base:
+            continue
+        if cur["seconds"] > base["seconds"] * (1 + tolerance):
+            regressions.append(f"{name}: {cur['seconds']:.3f}s vs baseline {base['seconds']:.3f}s (+{cur['seconds'] / base['seconds'] - 1:.0%})")
+        if base.get("requests_per_run") and cur["requests_per_run"] > base["requests_per_run"] * (1 + tolerance):
+            regressions.append(f"{name}: {cur['requests_per_run']:.0f} requests/run vs baseline {base['requests_per_run']:.0f}")
+    return regressions
+
+
+def _write_json(path: str, payload: dict) -> None:
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=1, ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+def append_history(path: str, results: dict) -> None:
+    """실행 결과 한 줄을 JSONL 이력에 추가 (시간에 따른 추세 추적용)."""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    line = {
+        "generated_at": results["meta"]["generated_at"],
+        "meta": results["meta"],
+        "stages": {name: {k: r[k] for k in ("seconds", "items_per_sec", "requests_per_run")}
+                   for name, r in results["stages"].items()},
+    }
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(line, ensure_ascii=False) + "\n")
+
+
+def main(argv=None) -> int:
+    p = argparse.ArgumentParser(description="Benchmark FRED/BLS/Yahoo fetch paths against a local stand-in server (offline)")
+    p.add_argument("--stage", action="append", dest="stages", choices=sorted(STAGES), help="Run only this stage (repeatable)")
+    p.add_argument("--series", type=int, default=20, help="Series per FRED/BLS stage")
+    p.add_argument("--symbols", type=int, default=30, help="Symbols per Yahoo stage")
+    p.add_argument("--module", action="append", dest="modules", help="us_eco module stem for us_eco_refresh (repeatable)")
+    p.add_argument("--repeat", type=int, default=3, help="Timed runs per stage (median reported)")
+    p.add_argument("--latency-ms", type=float, default=0.0)
+    p.add_argument("--jitter-ms", type=float, default=0.0)
+    p.add_argument("--error-rate", type=float, default=0.0)
+    p.add_argument("--rate-limit-rate", type=float, default=0.0)
+    p.add_argument("--retry-after", type=int, default=1)
+    p.add_argument("--seed", type=int, default=7)
+    p.add_argument("--replay-dir", help="Recorded responses for the stand-in (see api_standin.py)")
+    p.add_argument("--workdir", help="Scratch directory (default: temporary, removed afterwards)")
+    p.add_argument("--output", help="Write results JSON here")
+    p.add_argument("--history", default=DEFAULT_HISTORY, help="Append a summary line to this JSONL file ('' to disable)")
+    p.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline JSON to compare against")
+    p.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown vs baseline (0.25 = +25%%)")
+    p.add_argument("--save-baseline", action="store_true", help="Store these results as the new baseline")
+    p.add_argument("--verbose", action="store_true", help="Show fetcher output while benchmarking")
+    p.add_argument("--quiet", action="store_true")
+    args = p.parse_args(argv)
+    args.repeat = max(1, args.repeat)
+
+    workdir = args.workdir or tempfile.mkdtemp(prefix="fetch_bench_")
+    try:
+        results = run_suite(args, workdir)
+    finally:
+        if not args.workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    if args.output:
+        _write_json(args.output, results)
+        if not args.quiet:
+            print(f"결과 저장: {args.output}")
+    if args.history and results["stages"]:
+        append_history(args.history, results)
+
+    if args.save_baseline:
+        _write_json(args.baseline, results)
+        print(f"기준선 저장: {args.baseline}")
+        return 0
+
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare_with_baseline(results, baseline, args.tolerance)
+        if regressions:
+            print("❌ 성능 회귀 감지:")
+            for line in regressions:
+                print(f"  - {line}")
+            return 1
+        print("✅ 기준선 대비 회귀 없음")
+    elif not args.quiet:
+        print(f"기준선 없음 ({args.baseline}); --save-baseline 으로 생성하세요.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -3,7 +3,7 @@
 This package exposes modules:
 - world_indices: data collection utilities (prices/valuations)
 - world_returns: flexible-period return calculations
-- fx_rates: FX cache helpers
+- fx_rates: consolidated FX store and cross-rate accessor
 """
 
 # Re-export common modules for convenience
@@ -1,36 +1,64 @@
 """
 Collect FX rates for all currencies used in investment_universe
-and produce per-currency daily conversion factors to USD and KRW.
+and keep them in a single consolidated USD-per-currency store.
 
 - Sources: Yahoo Finance chart API via curl to avoid blocking
-- Output: CSV files under global_universe/data/fx/<CURRENCY>.csv
-  Columns: Date,toUSD,toKRW,currency
+- Output: one wide file under global_universe/data/fx/usd_per_ccy.parquet
+  (usd_per_ccy.csv when pyarrow is unavailable)
+  Index: Date (observed trading days only, no calendar forward-fill)
+  Columns: base currency codes (KRW, EUR, JPY, ...); value = USD per 1 unit
+  USD itself is implicit (1.0) and not stored.
 
 Conventions:
 - Yahoo 'USD{CCY}=X' represents {CCY} per USD. For example, USDJPY=X ≈ 150.
-  Hence conversion factors are:
-    CCY->USD = 1 / (USD{CCY})
-    CCY->KRW = (USDKRW) / (USD{CCY})
-- Special subunit mapping: 'GBp' is treated as 0.01 GBP
+  Hence the stored value is CCY->USD = 1 / (USD{CCY})
+- Cross rates are derived on read: CCY->QUOTE = (CCY->USD) / (QUOTE->USD),
+  e.g. toKRW = toUSD / KRW->USD. See fx_rate()/fx_rates().
+- Special subunit mapping: 'GBp' is treated as 0.01 GBP (applied on read)
+- Calendar forward-fill is only applied when requested (fill="calendar").
+
+Legacy per-currency CSVs (<CURRENCY>.csv with Date,toUSD,toKRW,currency) can
+still be produced from the store via export_legacy_csvs(), and an existing
+set of legacy CSVs can be folded into the store with migrate_legacy_csvs().
 
 Usage:
-  python -m global_universe.fx_rates [--range 10y|max] [--force]
+  python -m global_universe.fx_rates [--recent N] [--legacy-csv] [--migrate] [--profile [MODES]]
 """
 
 from __future__ import annotations
 
 import json
+import os
 import subprocess
 import time
 from pathlib import Path
-from typing import Dict, Any, Iterable, List, Tuple
+from functools import lru_cache
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 from datetime import datetime, timedelta, timezone
 
+import numpy as np
 import pandas as pd
 
+try:
+    import run_metrics as _run_metrics
+except ImportError:  # run as a script from global_universe/
+    import sys as _sys
+    _sys.path.append(str(Path(__file__).resolve().parents[1]))
+    import run_metrics as _run_metrics
+
 THIS_DIR = Path(__file__).resolve().parent
 UNIVERSE_FILE = THIS_DIR / "world_indices.py"
 OUT_DIR = THIS_DIR / "data" / "fx"
+STORE_STEM = "usd_per_ccy"
+# Yahoo endpoint base (swap for a local stand-in server in offline benchmarks)
+YAHOO_BASE_URL = os.environ.get("YAHOO_BASE_URL", "https://query1.finance.yahoo.com").rstrip("/")
+
+try:  # prefer a columnar parquet store when pyarrow is available
+    import pyarrow  # type: ignore  # noqa: F401
+
+    STORE_BACKEND = "parquet"
+except ModuleNotFoundError:
+    STORE_BACKEND = "csv"
 
 
 def load_investment_universe_literal(path: Path) -> Dict[str, Any]:
@@ -92,7 +120,7 @@ def normalize_currency(code: str) -> Tuple[str, float]:
 
 def fetch_chart_series(symbol: str, range_: str = "10y", interval: str = "1d") -> pd.Series:
     """Fetch Yahoo chart series via range/interval. May be downsampled by Yahoo for long ranges."""
-    url = f"https://query1.finance.yahoo.com/v8/finance/chart/{symbol}"
+    url = f"{YAHOO_BASE_URL}/v8/finance/chart/{symbol}"
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36",
         "Accept": "application/json, text/plain, */*",
@@ -135,7 +163,7 @@ def fetch_chart_series_daily(symbol: str, start_epoch: int = 0, end_epoch: int |
     """Fetch Yahoo chart series using explicit period1/period2 and interval=1d to enforce daily granularity."""
     if end_epoch is None:
         end_epoch = int(time.time())
-    url = f"https://query1.finance.yahoo.com/v8/finance/chart/{symbol}"
+    url = f"{YAHOO_BASE_URL}/v8/finance/chart/{symbol}"
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36",
         "Accept": "application/json, text/plain, */*",
@@ -153,7 +181,9 @@ def fetch_chart_series_daily(symbol: str, start_epoch: int = 0, end_epoch: int |
         f"Accept-Language: {headers['Accept-Language']}",
         f"{url}?period1={start_epoch}&period2={end_epoch}&interval=1d",
     ]
-    out = subprocess.check_output(cmd, timeout=45)
+    with _run_metrics.timed_request("yahoo_fx") as req:
+        out = subprocess.check_output(cmd, timeout=45)
+        req["nbytes"] = len(out or b"")
     data = json.loads(out.decode("utf-8", errors="ignore"))
     result = (data or {}).get("chart", {}).get("result")
     if not result:
@@ -188,137 +218,301 @@ def _epoch(dt) -> int:
     return int(datetime(dt.year, dt.month, dt.day, tzinfo=timezone.utc).timestamp())
 
 
-def build_fx_rates(range_: str = "10y", force: bool = False, recent_days: int | None = None, buffer_days: int = 3) -> List[Path]:
-    universe = load_investment_universe_literal(UNIVERSE_FILE)
-    currencies = gather_currencies(universe)
+# ----------------------------
+# Consolidated store
+# ----------------------------
+
+def store_path(backend: str | None = None) -> Path:
+    """Return the path of the consolidated store for the given backend."""
+    ext = ".parquet" if (backend or STORE_BACKEND) == "parquet" else ".csv"
+    return OUT_DIR / f"{STORE_STEM}{ext}"
+
+
+def _existing_store_path() -> Optional[Path]:
+    """Return the store file on disk (parquet preferred), or None."""
+    for backend in ("parquet", "csv"):
+        if backend == "parquet" and STORE_BACKEND != "parquet":
+            continue
+        path = store_path(backend)
+        if path.exists():
+            return path
+    return None
+
+
+@lru_cache(maxsize=4)
+def _read_store_cached(path_str: str, mtime: float) -> pd.DataFrame:
+    path = Path(path_str)
+    if path.suffix == ".parquet":
+        df = pd.read_parquet(path)
+    else:
+        df = pd.read_csv(path, index_col="Date")
+    df.index = pd.to_datetime(df.index).normalize()
+    df.index.name = "Date"
+    df.columns = [str(c) for c in df.columns]
+    return df.astype("float64").sort_index()
+
+
+def read_store() -> pd.DataFrame:
+    """Load the USD-per-currency matrix (observed closes only).
+
+    Returns an empty frame when the store has not been built yet. The result is
+    memoized on the file mtime; treat it as read-only.
+    """
+    path = _existing_store_path()
+    if path is None:
+        return pd.DataFrame(index=pd.DatetimeIndex([], name="Date"), dtype="float64")
+    return _read_store_cached(str(path), path.stat().st_mtime)
+
+
+def write_store(df: pd.DataFrame) -> Path:
+    """Atomically write the USD-per-currency matrix to the configured backend."""
+    ensure_dir(OUT_DIR)
+    out = df.copy()
+    out.index = pd.to_datetime(out.index).normalize()
+    out.index.name = "Date"
+    out = out[~out.index.duplicated(keep="last")].sort_index()
+    out = out.reindex(columns=sorted(c for c in out.columns if c != "USD"))
+    out = out.dropna(how="all").astype("float64")
+    path = store_path()
+    tmp = path.with_name(path.name + ".tmp")
+    if path.suffix == ".parquet":
+        out.to_parquet(tmp)
+    else:
+        out.to_csv(tmp, index_label="Date")
+    tmp.replace(path)
+    # Drop a stale store written by the other backend so readers agree
+    for other in ("parquet", "csv"):
+        other_path = store_path(other)
+        if other_path != path and other_path.exists():
+            try:
+                other_path.unlink()
+            except OSError:
+                pass
+    _read_store_cached.cache_clear()
+    return path
+
+
+def _merge_store(old: pd.DataFrame, new: pd.DataFrame) -> pd.DataFrame:
+    """Overlay `new` observations onto `old` (new wins on overlapping cells)."""
+    if old is None or old.empty:
+        return new.sort_index()
+    merged = new.combine_first(old)
+    return merged[~merged.index.duplicated(keep="last")].sort_index()
+
+
+def _store_last_date(store: pd.DataFrame, base: str) -> Optional[pd.Timestamp]:
+    if store is None or store.empty or base not in store.columns:
+        return None
+    last = store[base].last_valid_index()
+    return None if last is None or pd.isna(last) else pd.Timestamp(last)
+
+
+def _start_epoch_from(last: Optional[pd.Timestamp], buffer_days: int) -> int:
+    if last is None:
+        return 0
+    start_dt = last.to_pydatetime().replace(tzinfo=timezone.utc) - timedelta(days=buffer_days)
+    return int(start_dt.timestamp())
+
+
+# ----------------------------
+# Read-side accessor
+# ----------------------------
 
-    # Determine start epoch for incremental fetch
-    now = datetime.now(timezone.utc)
-    # Default start for full backfill
-    start_epoch_usdkrw = 0
-    existing_krw = OUT_DIR / "KRW.csv"
-    if recent_days is not None and existing_krw.exists():
+def _usd_per_unit(store: pd.DataFrame, codes: List[str]) -> Tuple[pd.DataFrame, np.ndarray]:
+    """Return (USD per base unit for each code's base currency, sub-unit scales)."""
+    bases: List[str] = []
+    scales = np.empty(len(codes), dtype="float64")
+    for i, code in enumerate(codes):
+        base, scale = normalize_currency(code)
+        bases.append(base)
+        scales[i] = scale
+    missing = sorted({b for b in bases if b != "USD" and b not in store.columns})
+    if missing:
+        raise KeyError(f"FX store has no series for: {', '.join(missing)}")
+    cols = [b for b in dict.fromkeys(bases) if b != "USD"]
+    frame = store[cols].copy() if cols else pd.DataFrame(index=store.index)
+    frame["USD"] = 1.0
+    return frame, scales
+
+
+def fx_rates(
+    currencies: Iterable[str],
+    quote: str = "USD",
+    start=None,
+    end=None,
+    fill: str = "observed",
+    store: pd.DataFrame | None = None,
+) -> pd.DataFrame:
+    """Return conversion factors `1 unit of currency -> quote` for many currencies.
+
+    - currencies: codes as used in the universe (sub-units like 'GBp' are scaled)
+    - quote: target currency (e.g. 'USD', 'KRW', 'EUR'; 'GBp' also accepted)
+    - fill: 'observed' keeps store dates (each leg forward-filled across the
+      other legs' observation days); 'calendar' forward-fills to every day.
+    - store: optional pre-loaded store (defaults to read_store()).
+
+    All pairs are computed in one vectorized division over the USD matrix.
+    """
+    codes = [str(c) for c in currencies]
+    if store is None:
+        store = read_store()
+    if not codes:
+        return pd.DataFrame(index=store.index)
+    frame, scales = _usd_per_unit(store, codes + [quote])
+    # Only keep rows where at least one requested leg was observed
+    legs = [c for c in frame.columns if c != "USD"]
+    if legs:
+        frame = frame.loc[frame[legs].notna().any(axis=1)]
+    frame = frame.ffill()
+    if fill == "calendar" and len(frame.index) > 0:
+        full_idx = pd.date_range(frame.index.min(), frame.index.max(), freq="D", name="Date")
+        frame = frame.reindex(full_idx).ffill()
+    elif fill != "observed":
+        raise ValueError(f"Unknown fill mode: {fill}")
+    if start is not None:
+        frame = frame.loc[pd.Timestamp(start):]
+    if end is not None:
+        frame = frame.loc[:pd.Timestamp(end)]
+
+    bases = [normalize_currency(c)[0] for c in codes + [quote]]
+    values = frame.reindex(columns=bases).to_numpy(dtype="float64") * scales
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = values[:, :-1] / values[:, -1:]
+    result = pd.DataFrame(out, index=frame.index, columns=codes)
+    result.index.name = "Date"
+    return result.replace([np.inf, -np.inf], np.nan)
+
+
+def fx_rate(
+    currency: str,
+    quote: str = "USD",
+    start=None,
+    end=None,
+    fill: str = "observed",
+) -> pd.Series:
+    """Return a single conversion series `1 unit of currency -> quote`."""
+    df = fx_rates([currency], quote=quote, start=start, end=end, fill=fill)
+    ser = df[currency].dropna() if currency in df.columns else pd.Series(dtype=float)
+    ser.name = f"{currency}->{quote}"
+    return ser
+
+
+def legacy_frame(code: str, fill: str = "calendar") -> pd.DataFrame:
+    """Return the legacy per-currency layout (toUSD, toKRW, currency) for `code`."""
+    to_usd = fx_rates([code], quote="USD", fill=fill)[code]
+    to_krw = fx_rates([code], quote="KRW", fill=fill)[code]
+    out = pd.DataFrame({"toUSD": to_usd, "toKRW": to_krw.reindex(to_usd.index)}, index=to_usd.index)
+    out["currency"] = code
+    return out.dropna(how="all", subset=["toUSD", "toKRW"])
+
+
+def export_legacy_csvs(currencies: Iterable[str] | None = None) -> List[Path]:
+    """Write <CURRENCY>.csv files in the legacy layout, derived from the store."""
+    if currencies is None:
+        currencies = gather_currencies(load_investment_universe_literal(UNIVERSE_FILE))
+    written: List[Path] = []
+    for code in currencies:
         try:
-            df_old = pd.read_csv(existing_krw, parse_dates=["Date"], index_col="Date")
-            last = df_old.index.max()
-            if pd.notna(last):
-                start_dt = (last.to_pydatetime().replace(tzinfo=timezone.utc) - timedelta(days=buffer_days))
-                start_epoch_usdkrw = int(start_dt.timestamp())
-        except Exception:
-            # Fall back to 0 if parsing fails
-            start_epoch_usdkrw = 0
+            written.append(write_currency_csv(code, legacy_frame(code)))
+        except KeyError as exc:
+            print(f"Skipping legacy export for {code}: {exc}")
+    return written
 
-    # Fetch USDKRW once with enforced daily
-    usdk_rw = fetch_chart_series_daily("USDKRW=X", start_epoch=start_epoch_usdkrw)
 
-    # Cache for USD{CCY}
-    usd_per_ccy: Dict[str, pd.Series] = {}
+def migrate_legacy_csvs(remove: bool = False) -> Optional[Path]:
+    """Fold legacy <CURRENCY>.csv files into the consolidated store.
+
+    Legacy files were forward-filled to every calendar day, so weekend rows are
+    dropped to approximate observed closes. Sub-unit files (e.g. GBp) are skipped
+    because they duplicate their base currency.
+    """
+    cols: Dict[str, pd.Series] = {}
+    legacy_paths: List[Path] = []
+    for path in sorted(OUT_DIR.glob("*.csv")):
+        code = path.stem
+        if code == STORE_STEM:
+            continue
+        legacy_paths.append(path)
+        base, scale = normalize_currency(code)
+        if scale != 1.0 or base == "USD" or base in cols:
+            continue
+        try:
+            df = pd.read_csv(path, parse_dates=["Date"], index_col="Date")
+        except Exception as exc:
+            print(f"Skipping {path.name}: {exc}")
+            continue
+        if "toUSD" not in df.columns:
+            continue
+        ser = pd.to_numeric(df["toUSD"], errors="coerce")
+        ser = ser[ser.index.dayofweek < 5].dropna()
+        cols[base] = ser
+    if not cols:
+        return None
+    legacy = pd.DataFrame(cols)
+    path = write_store(_merge_store(read_store(), legacy))
+    if remove:
+        for p in legacy_paths:
+            try:
+                p.unlink()
+            except OSError:
+                pass
+    return path
+
+
+# ----------------------------
+# Builder
+# ----------------------------
+
+@_run_metrics.profiled("fx_rates.build_fx_rates", out_dir=OUT_DIR)
+def build_fx_rates(
+    range_: str = "10y",
+    force: bool = False,
+    recent_days: int | None = None,
+    buffer_days: int = 3,
+    legacy_csv: bool = False,
+) -> List[Path]:
+    """Fetch USD{CCY} closes and merge them into the consolidated store.
+
+    Returns the list of written paths (empty when nothing changed).
+    """
+    universe = load_investment_universe_literal(UNIVERSE_FILE)
+    currencies = gather_currencies(universe)
+    store = pd.DataFrame() if force else read_store()
+    incremental = recent_days is not None and not store.empty
+
+    # CCY per USD closes keyed by base code (KRW included)
+    ccy_per_usd: Dict[str, pd.Series] = {}
 
     for code in currencies:
         base, _ = normalize_currency(code)
-        if base in {"USD", "KRW"}:
-            continue
-        if base in usd_per_ccy:
+        if base == "USD" or base in ccy_per_usd:
             continue
+        start_epoch_ccy = _start_epoch_from(_store_last_date(store, base), buffer_days) if incremental else 0
         sym = f"USD{base}=X"
         try:
-            # Determine start epoch per currency using its existing file if recent mode
-            start_epoch_ccy = 0
-            dest_ccy = OUT_DIR / f"{base}.csv"
-            if recent_days is not None and dest_ccy.exists():
-                try:
-                    df_old = pd.read_csv(dest_ccy, parse_dates=["Date"], index_col="Date")
-                    last = df_old.index.max()
-                    if pd.notna(last):
-                        start_dt = (last.to_pydatetime().replace(tzinfo=timezone.utc) - timedelta(days=buffer_days))
-                        start_epoch_ccy = int(start_dt.timestamp())
-                except Exception:
-                    start_epoch_ccy = 0
             ser = fetch_chart_series_daily(sym, start_epoch=start_epoch_ccy)
         except Exception as e:
             # Fallback to legacy symbol (e.g., JPY=X which is USDJPY)
             legacy = f"{base}=X"
             try:
-                start_epoch_ccy = 0
-                dest_ccy = OUT_DIR / f"{base}.csv"
-                if recent_days is not None and dest_ccy.exists():
-                    try:
-                        df_old = pd.read_csv(dest_ccy, parse_dates=["Date"], index_col="Date")
-                        last = df_old.index.max()
-                        if pd.notna(last):
-                            start_dt = (last.to_pydatetime().replace(tzinfo=timezone.utc) - timedelta(days=buffer_days))
-                            start_epoch_ccy = int(start_dt.timestamp())
-                    except Exception:
-                        start_epoch_ccy = 0
                 ser = fetch_chart_series_daily(legacy, start_epoch=start_epoch_ccy)
             except Exception as e2:
                 raise RuntimeError(f"Failed to fetch FX for {base}: {sym} and fallback {legacy} failed: {e}; {e2}")
-        usd_per_ccy[base] = ser
+        ccy_per_usd[base] = ser
 
-    # Build daily index for the period fetched (incremental or full)
-    start_date = min([min(usdk_rw.index)] + [min(s.index) for s in usd_per_ccy.values() if len(s) > 0])
-    end_date = max([max(usdk_rw.index)] + [max(s.index) for s in usd_per_ccy.values() if len(s) > 0])
-    idx = pd.date_range(start=start_date, end=end_date, freq="D")
-
-    # Prepare USDKRW aligned series (daily, forward-filled)
-    usdk_rw_full = pd.Series(index=idx, dtype=float)
-    usdk_rw_full.loc[usdk_rw.index] = usdk_rw.values
-    usdk_rw_full = usdk_rw_full.sort_index().ffill()
+    observed = pd.DataFrame({
+        base: 1.0 / pd.Series(ser.values, index=pd.to_datetime(ser.index), dtype="float64")
+        for base, ser in ccy_per_usd.items()
+    })
+    observed = observed.replace([np.inf, -np.inf], np.nan)
 
     written: List[Path] = []
+    merged = _merge_store(store, observed)
+    if store.empty or not merged.equals(store.reindex_like(merged)):
+        written.append(write_store(merged))
 
-    for code in currencies:
-        base, scale = normalize_currency(code)
-        # Build series for toUSD and toKRW
-        if base == "USD":
-            to_usd = pd.Series(1.0, index=idx)
-            to_krw = usdk_rw_full.copy()
-        elif base == "KRW":
-            to_usd = 1.0 / usdk_rw_full
-            to_krw = pd.Series(1.0, index=idx)
-        else:
-            c_per_usd = pd.Series(index=idx, dtype=float)
-            ser = usd_per_ccy.get(base)
-            if ser is None:
-                raise RuntimeError(f"Missing USD{base} series")
-            c_per_usd.loc[ser.index] = ser.values
-            c_per_usd = c_per_usd.sort_index().ffill()
-            to_usd = 1.0 / c_per_usd
-            to_krw = usdk_rw_full / c_per_usd
-
-        if scale != 1.0:
-            to_usd = to_usd * scale
-            to_krw = to_krw * scale
-
-        df = pd.DataFrame({
-            "toUSD": to_usd,
-            "toKRW": to_krw,
-            "currency": code,
-        }, index=idx)
-
-        # Drop rows where both numeric conversions are missing (ignore constant 'currency' col)
-        df = df.dropna(how="all", subset=["toUSD", "toKRW"])
-
-        dest = OUT_DIR / f"{code}.csv"
-        if dest.exists():
-            try:
-                old = pd.read_csv(dest, parse_dates=["Date"], index_col="Date")
-                merged = pd.concat([old, df])
-                merged = merged[~merged.index.duplicated(keep="last")].sort_index()
-                merged = merged.dropna(how="all", subset=["toUSD", "toKRW"])
-                if not merged.equals(old):
-                    merged.to_csv(dest, index_label="Date")
-                    written.append(dest)
-                else:
-                    # No change for this currency
-                    pass
-            except Exception:
-                # If read fails, just write new df
-                written.append(write_currency_csv(code, df))
-        else:
-            # Bootstrap case: write new
-            written.append(write_currency_csv(code, df))
-
+    if legacy_csv:
+        written.extend(export_legacy_csvs(currencies))
     return written
 
 
@@ -326,19 +520,37 @@ def main(argv: List[str] | None = None) -> int:
     import argparse
     p = argparse.ArgumentParser()
     p.add_argument("--range", default="10y", help="Deprecated: kept for compatibility; ignored in daily mode")
-    p.add_argument("--force", action="store_true", help="Rewrite even if output exists (full mode)")
+    p.add_argument("--force", action="store_true", help="Rebuild the store from scratch (full history)")
     p.add_argument("--recent", type=int, default=None, help="Incremental mode: only fetch last N days and merge")
     p.add_argument("--buffer-days", type=int, default=3, help="Backfill cushion when merging (default: 3)")
+    p.add_argument("--legacy-csv", action="store_true", help="Also write per-currency <CCY>.csv files derived from the store")
+    p.add_argument("--migrate", action="store_true", help="Fold existing per-currency CSVs into the store and exit")
+    p.add_argument("--prune-legacy", action="store_true", help="With --migrate: delete the per-currency CSVs afterwards")
+    p.add_argument("--profile", nargs="?", const="cprofile,memory", default=None, metavar="MODES",
+                   help="Profile the build (cprofile,sample,memory or all); writes to data/fx/profiles/")
     args = p.parse_args(argv)
+    if args.profile:
+        _run_metrics.enable_profiling(args.profile)
 
     OUT_DIR.mkdir(parents=True, exist_ok=True)
-    written = build_fx_rates(range_=args.range, force=args.force, recent_days=args.recent, buffer_days=args.buffer_days)
+    if args.migrate:
+        path = migrate_legacy_csvs(remove=args.prune_legacy)
+        print(f"Migrated legacy FX CSVs into {path}" if path else "No legacy FX CSVs found")
+        return 0
+
+    written = build_fx_rates(
+        range_=args.range,
+        force=args.force,
+        recent_days=args.recent,
+        buffer_days=args.buffer_days,
+        legacy_csv=args.legacy_csv,
+    )
     if written:
         print("Wrote/updated:")
         for pth in written:
             print(f"- {pth}")
     else:
-        print("FX files already up-to-date (or nothing to write)")
+        print("FX store already up-to-date (or nothing to write)")
     return 0
 
 
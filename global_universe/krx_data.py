@@ -12,7 +12,11 @@ e.g., KOSPI (1001) -> data/daily/KRX_IDX_1001.csv
 
 from __future__ import annotations
 
+import json
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 from pathlib import Path
@@ -20,6 +24,15 @@ import pandas as pd
 
 from pykrx import stock
 
+try:
+    import run_metrics as _run_metrics
+except ImportError:  # run as a script from global_universe/
+    import sys as _sys
+    _sys.path.append(str(Path(__file__).resolve().parents[1]))
+    import run_metrics as _run_metrics
+
+_log = _run_metrics.get_logger("krx")
+
 # --------------------
 # Paths and helpers
 # --------------------
@@ -56,6 +69,91 @@ def _to_yyyymmdd(dt: datetime | str | None) -> str | None:
     return dt.strftime("%Y%m%d")
 
 
+class _RateLimiter:
+    """Thread-safe minimum-interval limiter shared by all pykrx calls."""
+
+    def __init__(self, min_interval: float = 0.0):
+        self.min_interval = float(min_interval)
+        self._lock = threading.Lock()
+        self._next_at = 0.0
+
+    def wait(self) -> None:
+        if self.min_interval <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_at - now
+            self._next_at = max(now, self._next_at) + self.min_interval
+        if delay > 0:
+            time.sleep(delay)
+
+
+# Polite global pacing for KRX scraping (seconds between request starts).
+# Sequential paths are unthrottled unless KRX_MIN_INTERVAL is set; the parallel
+# batch applies KRX_PARALLEL_MIN_INTERVAL for its own duration.
+KRX_PARALLEL_MIN_INTERVAL = 0.25
+_KRX_LIMITER = _RateLimiter(float(os.environ.get("KRX_MIN_INTERVAL", "0")))
+
+
+def _krx_call(fn, *args, **kwargs):
+    """Invoke a pykrx function through the global rate limiter (timed as a `krx` request)."""
+    _KRX_LIMITER.wait()
+    with _run_metrics.timed_request("krx"):
+        result = fn(*args, **kwargs)
+    if isinstance(result, pd.DataFrame):
+        _run_metrics.record_rows("krx", len(result))
+    return result
+
+
+def fetch_trading_calendar(start: str | datetime | None = None, end: str | datetime | None = None, lookback_days: int = 14) -> pd.DatetimeIndex:
+    """Return KRX trading days between start and end (default: last `lookback_days`)."""
+    if end is None:
+        end = datetime.now(ZoneInfo("Asia/Seoul")).replace(tzinfo=None)
+    if start is None:
+        end_dt = datetime.strptime(_to_yyyymmdd(end), "%Y%m%d")
+        start = end_dt - timedelta(days=lookback_days)
+    days = _krx_call(stock.get_previous_business_days, fromdate=_to_yyyymmdd(start), todate=_to_yyyymmdd(end))
+    return pd.DatetimeIndex(pd.to_datetime(list(days or []))).normalize().sort_values()
+
+
+def _tail_row(path: Path, block: int = 4096) -> dict[str, str] | None:
+    """Return the header-mapped last data row of a CSV without reading the whole file."""
+    try:
+        with open(path, "rb") as fh:
+            header = fh.readline().decode("utf-8", errors="ignore").strip()
+            fh.seek(0, os.SEEK_END)
+            size = fh.tell()
+            fh.seek(max(0, size - block))
+            tail = fh.read().decode("utf-8", errors="ignore")
+    except OSError:
+        return None
+    lines = [ln.strip() for ln in tail.splitlines() if ln.strip()]
+    if not header or not lines or lines[-1] == header:
+        return None
+    return dict(zip(header.split(","), lines[-1].split(",")))
+
+
+def _last_date_in_csv(path: Path, require_valuation: bool = False) -> pd.Timestamp | None:
+    """Return the last Date of a daily/valuation CSV (None if missing or invalid).
+
+    With require_valuation, a last row whose PE and PB are both missing/<=0 counts
+    as not present so that append_today can still replace it.
+    """
+    row = _tail_row(path)
+    if not row or not row.get("Date"):
+        return None
+    if require_valuation:
+        def _pos(key: str) -> bool:
+            try:
+                return float(row.get(key) or "nan") > 0
+            except ValueError:
+                return False
+        if not (_pos("trailingPE") or _pos("priceToBook")):
+            return None
+    ts = pd.to_datetime(row["Date"][:10], errors="coerce")
+    return None if pd.isna(ts) else pd.Timestamp(ts).normalize()
+
+
 def list_krx_index_tickers(market: str = "KOSPI", date: str | None = None) -> pd.DataFrame:
     """Return DataFrame of available index tickers and names for a market.
 
@@ -66,7 +164,7 @@ def list_krx_index_tickers(market: str = "KOSPI", date: str | None = None) -> pd
         date = datetime.today().strftime("%Y%m%d")
     else:
         date = _to_yyyymmdd(date)
-    codes = stock.get_index_ticker_list(date=date, market=market)
+    codes = _krx_call(stock.get_index_ticker_list, date=date, market=market)
     rows = [{"ticker": c, "name": stock.get_index_ticker_name(c)} for c in codes]
     return pd.DataFrame(rows)
 
@@ -87,10 +185,18 @@ def fetch_index_ohlcv(ticker: str, start: str | datetime | None = None, end: str
         start = datetime(1990, 1, 1)
     s = _to_yyyymmdd(start)
     e = _to_yyyymmdd(end)
-    df = stock.get_index_ohlcv_by_date(s, e, str(ticker), freq=freq)
+    df = _krx_call(stock.get_index_ohlcv_by_date, s, e, str(ticker), freq=freq)
     if df is None or df.empty:
         return pd.DataFrame(columns=["Open", "High", "Low", "Close", "Volume"]).astype({})
-    # Normalize headers
+    out = _normalize_ohlcv_columns(df)
+    # Index normalization
+    out.index.name = "Date"
+    out = out.sort_index()
+    return out
+
+
+def _normalize_ohlcv_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Rename pykrx OHLCV headers to English and keep [Open, High, Low, Close, Volume]."""
     rename_map = {
         "시가": "Open",
         "고가": "High",
@@ -101,11 +207,7 @@ def fetch_index_ohlcv(ticker: str, start: str | datetime | None = None, end: str
     out = df.rename(columns=rename_map).copy()
     # Ensure we keep only expected columns
     keep = [c for c in ["Open", "High", "Low", "Close", "Volume"] if c in out.columns]
-    out = out[keep]
-    # Index normalization
-    out.index.name = "Date"
-    out = out.sort_index()
-    return out
+    return out[keep]
 
 
 def _load_existing_daily(path: Path) -> pd.DataFrame | None:
@@ -182,6 +284,7 @@ VAL_FIELDS = [
     "priceToBook",               # from PBR
     "trailingAnnualDividendYield"  # from 배당수익률 (as decimal)
 ]
+VAL_CANONICAL_COLS = ["Date", *VAL_FIELDS, "symbol", "currency", "quoteType"]
 
 
 def fetch_index_fundamentals(ticker: str, start: str | datetime, end: str | datetime) -> pd.DataFrame:
@@ -191,10 +294,28 @@ def fetch_index_fundamentals(ticker: str, start: str | datetime, end: str | date
     """
     s = _to_yyyymmdd(start)
     e = _to_yyyymmdd(end)
-    df = stock.get_index_fundamental_by_date(s, e, str(ticker))
+    df = _krx_call(stock.get_index_fundamental_by_date, s, e, str(ticker))
     if df is None or df.empty:
         return pd.DataFrame(columns=["Date","symbol","currency","quoteType",*VAL_FIELDS])
 
+    out = _normalize_fundamental_metrics(df)
+    out.index.name = "Date"
+    out = out.sort_index().reset_index()
+    # Normalize Date to ISO string
+    out["Date"] = pd.to_datetime(out["Date"], errors="coerce").dt.date.astype(str)
+    # Append metadata
+    out["symbol"] = _symbol_for_krx_index(ticker)
+    out["currency"] = "KRW"
+    out["quoteType"] = "INDEX"
+    # Final column order
+    keep_metrics = [c for c in VAL_FIELDS if c in out.columns]
+    columns = ["Date", *keep_metrics, "symbol", "currency", "quoteType"]
+    out = out[columns]
+    return out
+
+
+def _normalize_fundamental_metrics(df: pd.DataFrame) -> pd.DataFrame:
+    """Map pykrx fundamental headers to VAL_FIELDS and drop placeholder rows (index preserved)."""
     # Rename columns to English and support both 'DIV' and '배당수익률'
     rename_map = {
         "PER": "trailingPE",
@@ -220,156 +341,262 @@ def fetch_index_fundamentals(ticker: str, start: str | datetime, end: str | date
         out = out[mask_valid]
     # Keep desired cols in standard order
     keep_metrics = [c for c in ["trailingPE","priceToBook","trailingAnnualDividendYield"] if c in out.columns]
-    out = out[keep_metrics]
-    out.index.name = "Date"
-    out = out.sort_index().reset_index()
-    # Normalize Date to ISO string
+    return out[keep_metrics]
+
+
+# --------------------
+# Append-only valuation writer
+# --------------------
+
+VAL_STATE_PATH = BASE_DIR / "data" / "krx_valuation_state.json"
+_VAL_STATE_LOCK = threading.RLock()
+_VAL_STATE: dict[str, dict] | None = None
+
+
+def _load_val_state() -> dict[str, dict]:
+    global _VAL_STATE
+    if _VAL_STATE is None:
+        try:
+            _VAL_STATE = json.loads(VAL_STATE_PATH.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            _VAL_STATE = {}
+    return _VAL_STATE
+
+
+def _save_val_state() -> None:
+    tmp = VAL_STATE_PATH.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(_load_val_state(), indent=1, sort_keys=True), encoding="utf-8")
+    os.replace(tmp, VAL_STATE_PATH)
+
+
+def _is_valid_valuation(row: dict) -> bool:
+    for key in ("trailingPE", "priceToBook"):
+        try:
+            if float(row.get(key) or "nan") > 0:
+                return True
+        except (TypeError, ValueError):
+            continue
+    return False
+
+
+def _scan_valuation_file(path: Path) -> dict | None:
+    """Derive the state record for a valuation CSV from its header and tail only."""
+    if not path.exists() or path.stat().st_size == 0:
+        return None
+    with open(path, "rb") as fh:
+        header = fh.readline().decode("utf-8", errors="ignore").strip().split(",")
+        fh.seek(0, os.SEEK_END)
+        size = fh.tell()
+        fh.seek(max(0, size - 16384))
+        tail = fh.read().decode("utf-8", errors="ignore")
+    rows = [dict(zip(header, ln.strip().split(","))) for ln in tail.splitlines()[1:] if ln.strip()]
+    rows = [r for r in rows if r.get("Date") and r.get("Date") != "Date"]
+    last_date = rows[-1]["Date"][:10] if rows else None
+    valid = [r["Date"][:10] for r in rows if _is_valid_valuation(r)]
+    return {
+        "schema_ok": header == VAL_CANONICAL_COLS,
+        "last_date": last_date,
+        "last_valid_date": valid[-1] if valid else None,
+        "size": size,
+        "mtime": path.stat().st_mtime,
+    }
+
+
+def _valuation_state(ticker: str) -> dict | None:
+    """Return the cached state for a valuation file, rescanning if it changed on disk."""
+    path = _valuation_csv_path(ticker)
+    symbol = _symbol_for_krx_index(ticker)
+    with _VAL_STATE_LOCK:
+        state = _load_val_state()
+        entry = state.get(symbol)
+        try:
+            st = path.stat()
+        except OSError:
+            state.pop(symbol, None)
+            return None
+        if entry and entry.get("size") == st.st_size and entry.get("mtime") == st.st_mtime:
+            return entry
+        entry = _scan_valuation_file(path)
+        if entry is None:
+            state.pop(symbol, None)
+        else:
+            state[symbol] = entry
+            _save_val_state()
+        return entry
+
+
+def _truncate_invalid_tail(path: Path) -> str | None:
+    """Cut a valuation CSV back to just after its last valid row, in place.
+
+    Trailing rows that fail validation (PE and PB missing/<=0) or are partial
+    (fewer fields than the header) are dropped; earlier rows are never rewritten.
+    The tail is read in growing windows until a valid row or the header is
+    reached. Returns the date of the last kept row (None if only the header remains).
+    """
+    with open(path, "rb+") as fh:
+        header = fh.readline().decode("utf-8", errors="ignore").strip().split(",")
+        header_end = fh.tell()
+        size = fh.seek(0, os.SEEK_END)
+        window = 16384
+        while True:
+            start = max(header_end, size - window)
+            fh.seek(start)
+            chunk = fh.read(size - start)
+            if start > header_end:
+                # Skip the (possibly partial) first line of the window
+                nl = chunk.find(b"\n")
+                if nl < 0:
+                    window *= 2
+                    continue
+                start += nl + 1
+                chunk = chunk[nl + 1:]
+            # (offset just after the line incl. its newline, line text), last line first
+            lines, pos = [], 0
+            for raw in chunk.split(b"\n"):
+                pos += len(raw) + 1
+                lines.append((start + min(pos, len(chunk)), raw.decode("utf-8", errors="ignore").strip()))
+            for cut, line in reversed(lines):
+                fields = line.split(",")
+                row = dict(zip(header, fields))
+                if line and len(fields) == len(header) and row.get("Date") and _is_valid_valuation(row):
+                    fh.truncate(cut)
+                    return row["Date"][:10]
+            if start <= header_end:
+                fh.truncate(header_end)
+                return None
+            window *= 2
+
+
+def _canonical_valuation_rows(ticker: str, df: pd.DataFrame) -> pd.DataFrame:
+    out = df.copy()
+    for col in VAL_CANONICAL_COLS:
+        if col not in out.columns:
+            out[col] = pd.NA
     out["Date"] = pd.to_datetime(out["Date"], errors="coerce").dt.date.astype(str)
-    # Append metadata
-    out["symbol"] = _symbol_for_krx_index(ticker)
-    out["currency"] = "KRW"
-    out["quoteType"] = "INDEX"
-    # Final column order
-    columns = ["Date", *keep_metrics, "symbol", "currency", "quoteType"]
-    out = out[columns]
-    return out
+    out["symbol"] = out["symbol"].fillna(_symbol_for_krx_index(ticker))
+    out["currency"] = out["currency"].fillna("KRW")
+    out["quoteType"] = out["quoteType"].fillna("INDEX")
+    out = out[VAL_CANONICAL_COLS]
+    return out.sort_values("Date").drop_duplicates(subset=["Date"], keep="last")
+
+
+def append_index_valuation_rows(ticker: str, rows: pd.DataFrame) -> int:
+    """Append new valuation rows to a KRX index CSV without rewriting it.
+
+    The header is validated once per file (tracked in VAL_STATE_PATH together
+    with the last and last-valid dates). Only rows after the last date are
+    appended; invalid or partial trailing rows (PE and PB missing/<=0) are
+    truncated back to the last valid row, and replaced by incoming rows for
+    their dates. Returns rows appended.
+    """
+    path = _valuation_csv_path(ticker)
+    symbol = _symbol_for_krx_index(ticker)
+    if rows is None or rows.empty:
+        return 0
+    new = _canonical_valuation_rows(ticker, rows)
+    with _VAL_STATE_LOCK:
+        entry = _valuation_state(ticker)
+        if entry is not None and not entry["schema_ok"]:
+            # One-time migration for files written before the canonical layout
+            _log.info(f"[{ticker}] valuation schema differs; compacting once before append")
+            compact_index_valuation_csv(ticker)
+            entry = _valuation_state(ticker)
+        if entry is None or entry.get("last_date") is None:
+            new.to_csv(path, index=False)
+        else:
+            last_date = entry["last_date"]
+            if entry["last_valid_date"] != last_date:
+                # Invalid/partial tail rows: cut back to the last valid row whatever
+                # the incoming dates; rows for the dropped dates may replace them
+                kept = _truncate_invalid_tail(path)
+                new = new[new["Date"] > kept] if kept else new
+            else:
+                new = new[new["Date"] > last_date]
+            if not new.empty:
+                _append_csv_rows(path, new)
+        scanned = _scan_valuation_file(path)
+        if scanned is not None:
+            _load_val_state()[symbol] = scanned
+            _save_val_state()
+    return len(new)
+
+
+def compact_index_valuation_csv(ticker: str) -> tuple[Path, int]:
+    """Canonicalize one valuation CSV: column order, sort by Date, de-duplicate.
+
+    This is the only valuation path that rewrites a file; run it explicitly
+    (KRX_VAL_COMPACT=1) rather than on every update. Returns (path, rows).
+    """
+    path = _valuation_csv_path(ticker)
+    with _VAL_STATE_LOCK:
+        if not path.exists():
+            return path, 0
+        df0 = pd.read_csv(path)
+        # Add missing cols
+        for col in VAL_CANONICAL_COLS:
+            if col not in df0.columns:
+                df0[col] = pd.NA
+        df0 = df0[VAL_CANONICAL_COLS]
+        df0["Date"] = pd.to_datetime(df0["Date"], errors="coerce").dt.date.astype(str)
+        df0 = df0.sort_values("Date").drop_duplicates(subset=["Date"], keep="last")
+        tmp2 = path.with_suffix(".csv.tmp")
+        df0.to_csv(tmp2, index=False)
+        os.replace(tmp2, path)
+        scanned = _scan_valuation_file(path)
+        if scanned is not None:
+            _load_val_state()[_symbol_for_krx_index(ticker)] = scanned
+            _save_val_state()
+    return path, len(df0)
+
+
+def compact_index_valuations(index_map: dict[str, str] | None = None) -> pd.DataFrame:
+    """Run `compact_index_valuation_csv` for a batch and return a small summary."""
+    if index_map is None:
+        index_map = KRX_TEST_INDICES
+    rows: list[dict] = []
+    for code, name in index_map.items():
+        try:
+            path, n = compact_index_valuation_csv(code)
+            rows.append({"ticker": code, "name": name, "path": str(path), "rows": n, "status": "ok"})
+        except Exception as e:
+            rows.append({"ticker": code, "name": name, "path": None, "rows": 0, "status": f"error: {e}"[:200]})
+    return pd.DataFrame(rows)
 
 
 def update_index_valuation_csv(ticker: str, mode: str = "append_today") -> tuple[Path, int]:
-    """Update valuation CSV for a KRX index.
+    """Update valuation CSV for a KRX index (append-only).
 
-    - mode='append_today': append only today's row if missing
-    - mode='backfill': if file missing/empty, write full history; else append from last+1 day
+    - mode='append_today': fetch a short lookback window and append rows newer
+      than the last stored date (new file: latest valid row only)
+    - mode='backfill': if file missing/empty, write full history; else fetch
+      from the last valid date onward and append
+    Neither mode rewrites an existing file; see compact_index_valuation_csv.
     Returns (path, rows_added)
     """
     path = _valuation_csv_path(ticker)
     # Use KST for KRX-related dating and summaries
     today_str = datetime.now(ZoneInfo("Asia/Seoul")).date().isoformat()
-
-    canonical_cols = ["Date", "trailingPE", "priceToBook", "trailingAnnualDividendYield", "symbol", "currency", "quoteType"]
-
-    def _ensure_canonical(path: Path):
-        try:
-            df0 = pd.read_csv(path)
-            # Add missing cols
-            for col in canonical_cols:
-                if col not in df0.columns:
-                    df0[col] = pd.NA
-            df0 = df0[canonical_cols]
-            df0 = df0.sort_values("Date").drop_duplicates(subset=["Date"], keep="last")
-            tmp2 = path.with_suffix(".csv.tmp")
-            df0.to_csv(tmp2, index=False)
-            os.replace(tmp2, path)
-        except Exception:
-            pass
+    entry = _valuation_state(ticker)
+    has_rows = entry is not None and entry.get("last_date") is not None
 
     if mode == "append_today":
         # Guard against same-day zeros by looking back a few days
         lookback_days = int(os.environ.get("KRX_VAL_LOOKBACK", "7"))
         start_dt = datetime.strptime(today_str, "%Y-%m-%d") - timedelta(days=lookback_days)
         df = fetch_index_fundamentals(ticker, start_dt, today_str)
-        if df is None or df.empty:
-            # Ensure file exists
-            if not path.exists():
-                pd.DataFrame(columns=["Date","symbol","currency","quoteType",*VAL_FIELDS]).to_csv(path, index=False)
-            _ensure_canonical(path)
-            return path, 0
-        if path.exists():
-            try:
-                cur = pd.read_csv(path)
-                # Normalize Date to ISO string and numeric metrics
-                if "Date" in cur.columns:
-                    cur["Date"] = pd.to_datetime(cur["Date"], errors="coerce").dt.date.astype(str)
-                for c in ["trailingPE", "priceToBook"]:
-                    if c in cur.columns:
-                        cur[c] = pd.to_numeric(cur[c], errors="coerce")
-                # Determine last row validity
-                if cur.empty:
-                    last_date = "1990-01-01"
-                    invalid_last = False
-                else:
-                    last_date = cur["Date"].max()
-                    last_row = cur[cur["Date"] == last_date].tail(1)
-                    pe_ok = not (last_row.get("trailingPE").fillna(0) <= 0).all() if "trailingPE" in last_row.columns else False
-                    pb_ok = not (last_row.get("priceToBook").fillna(0) <= 0).all() if "priceToBook" in last_row.columns else False
-                    invalid_last = not (pe_ok or pb_ok)
-
-                appended_df = None
-                if invalid_last:
-                    # Replace the invalid last row with the latest valid row from df (if any)
-                    latest_valid = df.tail(1)
-                    if latest_valid.empty:
-                        _ensure_canonical(path)
-                        return path, 0
-                    cur = cur[cur["Date"] != last_date]
-                    appended_df = latest_valid
-                else:
-                    # Append any newer valid rows
-                    df_new = df[df["Date"] > last_date]
-                    if df_new.empty:
-                        _ensure_canonical(path)
-                        return path, 0
-                    appended_df = df_new
-                new_df = pd.concat([cur, appended_df], ignore_index=True)
-            except Exception:
-                new_df = df
-        else:
+        if df is not None and not has_rows:
             # New file: take only the latest valid row from lookback window (if any)
-            new_df = df.tail(1)
-        # Reorder to canonical schema and sort
-        for col in canonical_cols:
-            if col not in new_df.columns:
-                new_df[col] = pd.NA
-        # Ensure Date as ISO string before sorting/dedup
-        if "Date" in new_df.columns:
-            new_df["Date"] = pd.to_datetime(new_df["Date"], errors="coerce").dt.date.astype(str)
-        new_df = new_df[canonical_cols]
-        new_df = new_df.sort_values("Date").drop_duplicates(subset=["Date"], keep="last")
-        tmp = path.with_suffix(".csv.tmp")
-        new_df.to_csv(tmp, index=False)
-        os.replace(tmp, path)
-        # Compute appended row count if possible
-        try:
-            if 'appended_df' in locals() and isinstance(appended_df, pd.DataFrame):
-                added_count = len(appended_df)
-            elif 'df_new' in locals() and isinstance(df_new, pd.DataFrame):
-                added_count = len(df_new)
-            else:
-                added_count = len(new_df)
-        except Exception:
-            added_count = 0
-        return path, added_count
+            df = df.tail(1)
+    else:
+        start = (entry.get("last_valid_date") or "19900101") if has_rows else "19900101"
+        df = fetch_index_fundamentals(ticker, start, datetime.today())
 
-    # backfill mode: always fetch full history and merge with existing
-    try:
-        cur = pd.read_csv(path) if path.exists() and os.path.getsize(path) > 0 else None
-        if cur is not None and not cur.empty and "Date" in cur.columns:
-            cur["Date"] = pd.to_datetime(cur["Date"], errors="coerce").dt.date.astype(str)
-    except Exception:
-        cur = None
-    full_df = fetch_index_fundamentals(ticker, "19900101", datetime.today())
-    if full_df is None or full_df.empty:
+    if df is None or df.empty:
+        # Ensure file exists
         if not path.exists():
-            pd.DataFrame(columns=["Date","symbol","currency","quoteType",*VAL_FIELDS]).to_csv(path, index=False)
-        _ensure_canonical(path)
+            pd.DataFrame(columns=VAL_CANONICAL_COLS).to_csv(path, index=False)
         return path, 0
-    # Canonical order
-    for col in canonical_cols:
-        if col not in full_df.columns:
-            full_df[col] = pd.NA
-    full_df = full_df[canonical_cols]
-    if cur is None or cur.empty:
-        new_df = full_df.sort_values("Date").drop_duplicates(subset=["Date"], keep="last")
-        added = len(new_df)
-    else:
-        merged = pd.concat([cur, full_df], ignore_index=True)
-        merged = merged.sort_values("Date").drop_duplicates(subset=["Date"], keep="last")
-        added = max(0, len(merged) - len(cur))
-        new_df = merged
-    tmp = path.with_suffix(".csv.tmp")
-    new_df.to_csv(tmp, index=False)
-    os.replace(tmp, path)
-    return path, added
+    return path, append_index_valuation_rows(ticker, df)
 
 
 # --------------------
@@ -430,33 +657,34 @@ KRX_TEST_INDICES: dict[str, str] = {
 }
 
 
-def batch_update_indices(index_map: dict[str, str] | None = None, valuation_mode: str = "append_today") -> pd.DataFrame:
-    """Run price and valuation updates for a batch of indices.
+def _new_batch_entry(code: str, name: str, run_at: str) -> dict:
+    return {
+        "ticker": code,
+        "name": name,
+        "price_path": None,
+        "price_rows_added": 0,
+        "price_updated": False,
+        "price_status": None,
+        "price_reason": None,
+        "valuation_path": None,
+        "valuation_rows_added": 0,
+        "valuation_updated": False,
+        "valuation_status": None,
+        "valuation_reason": None,
+        "status": "ok",
+        "run_at": run_at,
+    }
 
-    Returns a summary DataFrame with columns:
-    [ticker, name, price_path, price_rows_added, valuation_path, valuation_rows_added, status]
-    """
-    if index_map is None:
-        index_map = KRX_TEST_INDICES
-    rows: list[dict] = []
-    run_at = datetime.now(ZoneInfo("Asia/Seoul")).isoformat(timespec="seconds")
-    for code, name in index_map.items():
-        entry = {
-            "ticker": code,
-            "name": name,
-            "price_path": None,
-            "price_rows_added": 0,
-            "price_updated": False,
-            "price_status": None,
-            "price_reason": None,
-            "valuation_path": None,
-            "valuation_rows_added": 0,
-            "valuation_updated": False,
-            "valuation_status": None,
-            "valuation_reason": None,
-            "status": "ok",
-            "run_at": run_at,
-        }
+
+def _update_one_index(code: str, name: str, valuation_mode: str, run_at: str,
+                      skip_price: bool = False, skip_valuation: bool = False) -> dict:
+    """Run price and valuation updates for one index and return its summary row."""
+    entry = _new_batch_entry(code, name, run_at)
+    if skip_price:
+        entry["price_path"] = str(_daily_csv_path(code))
+        entry["price_status"] = "skipped"
+        entry["price_reason"] = "has latest trading date"
+    else:
         try:
             price_mode = os.environ.get("KRX_PRICE_MODE", "quick").lower()
             if price_mode == "full":
@@ -478,53 +706,329 @@ def batch_update_indices(index_map: dict[str, str] | None = None, valuation_mode
             entry["status"] = f"price_error: {e}"[:200]
             entry["price_status"] = "error"
             entry["price_reason"] = str(e)[:200]
-        try:
-            v_path, v_added = update_index_valuation_csv(code, mode=valuation_mode)
-            entry["valuation_path"] = str(v_path)
-            entry["valuation_rows_added"] = int(v_added)
-            if v_added > 0:
-                entry["valuation_updated"] = True
-                entry["valuation_status"] = "updated"
-                entry["valuation_reason"] = f"appended {v_added}"
-            else:
-                entry["valuation_status"] = "no_change"
-                entry["valuation_reason"] = "up_to_date or no_new_rows"
-            if entry["status"] == "ok":
-                entry["status"] = "ok"
-        except Exception as e:
-            # Preserve prior error if any
-            if entry["status"] == "ok":
-                entry["status"] = f"valuation_error: {e}"[:200]
-            else:
-                entry["status"] = (entry["status"] + f"; valuation_error: {e}")[:200]
-            entry["valuation_status"] = "error"
-            entry["valuation_reason"] = str(e)[:200]
+    if skip_valuation:
+        entry["valuation_path"] = str(_valuation_csv_path(code))
+        entry["valuation_status"] = "skipped"
+        entry["valuation_reason"] = "has latest trading date"
+        return entry
+    try:
+        v_path, v_added = update_index_valuation_csv(code, mode=valuation_mode)
+        entry["valuation_path"] = str(v_path)
+        entry["valuation_rows_added"] = int(v_added)
+        if v_added > 0:
+            entry["valuation_updated"] = True
+            entry["valuation_status"] = "updated"
+            entry["valuation_reason"] = f"appended {v_added}"
+        else:
+            entry["valuation_status"] = "no_change"
+            entry["valuation_reason"] = "up_to_date or no_new_rows"
+    except Exception as e:
+        # Preserve prior error if any
+        if entry["status"] == "ok":
+            entry["status"] = f"valuation_error: {e}"[:200]
+        else:
+            entry["status"] = (entry["status"] + f"; valuation_error: {e}")[:200]
+        entry["valuation_status"] = "error"
+        entry["valuation_reason"] = str(e)[:200]
+    return entry
+
+
+@_run_metrics.profiled("krx.batch_update_indices", out_dir=BASE_DIR / "data")
+def batch_update_indices(index_map: dict[str, str] | None = None, valuation_mode: str = "append_today") -> pd.DataFrame:
+    """Run price and valuation updates for a batch of indices.
+
+    Returns a summary DataFrame with columns:
+    [ticker, name, price_path, price_rows_added, valuation_path, valuation_rows_added, status]
+    """
+    if index_map is None:
+        index_map = KRX_TEST_INDICES
+    rows: list[dict] = []
+    run_at = datetime.now(ZoneInfo("Asia/Seoul")).isoformat(timespec="seconds")
+    for code, name in index_map.items():
+        entry = _update_one_index(code, name, valuation_mode, run_at)
         rows.append(entry)
-        # Minimal progress print for long runs
-        print(f"[{code} {name}] price+val done -> status={entry['status']}")
+        # Minimal progress line for long runs (RUN_VERBOSITY=2)
+        _log.debug(f"[{code} {name}] price+val done -> status={entry['status']}")
     return pd.DataFrame(rows)
 
+
+@_run_metrics.profiled("krx.batch_update_indices_parallel", out_dir=BASE_DIR / "data")
+def batch_update_indices_parallel(
+    index_map: dict[str, str] | None = None,
+    valuation_mode: str = "append_today",
+    max_workers: int = 4,
+    min_interval: float | None = None,
+) -> pd.DataFrame:
+    """Parallel variant of `batch_update_indices` with a shared trading calendar.
+
+    - The KRX trading calendar is fetched once; indices whose daily and valuation
+      CSVs already hold the latest trading date are skipped without any request.
+    - Remaining indices run on a bounded thread pool (`max_workers`); every pykrx
+      call goes through the global rate limiter, `min_interval` seconds apart for
+      the duration of the batch (default KRX_MIN_INTERVAL, else
+      KRX_PARALLEL_MIN_INTERVAL); the previous interval is restored afterwards.
+    Returns the same summary columns as `batch_update_indices`, in input order.
+    """
+    if index_map is None:
+        index_map = KRX_TEST_INDICES
+    if min_interval is None:
+        min_interval = float(os.environ.get("KRX_MIN_INTERVAL", KRX_PARALLEL_MIN_INTERVAL))
+    previous_interval = _KRX_LIMITER.min_interval
+    _KRX_LIMITER.min_interval = float(min_interval)
+    try:
+        return _batch_update_indices_parallel(index_map, valuation_mode, max_workers)
+    finally:
+        _KRX_LIMITER.min_interval = previous_interval
+
+
+def _batch_update_indices_parallel(index_map: dict[str, str], valuation_mode: str, max_workers: int) -> pd.DataFrame:
+    run_at = datetime.now(ZoneInfo("Asia/Seoul")).isoformat(timespec="seconds")
+
+    latest: pd.Timestamp | None = None
+    try:
+        calendar = fetch_trading_calendar()
+        if len(calendar):
+            latest = calendar[-1]
+    except Exception as e:
+        _log.warning(f"Trading calendar fetch failed; processing all indices: {e}")
+
+    rows: dict[str, dict] = {}
+    jobs: list[tuple[str, str, bool, bool]] = []
+    for code, name in index_map.items():
+        skip_price = skip_val = False
+        if latest is not None:
+            last_p = _last_date_in_csv(_daily_csv_path(code))
+            last_v = _last_date_in_csv(_valuation_csv_path(code), require_valuation=True)
+            skip_price = last_p is not None and last_p >= latest
+            skip_val = last_v is not None and last_v >= latest
+        _run_metrics.record_cache("krx_batch", skip_price and skip_val)
+        if skip_price and skip_val:
+            rows[code] = _update_one_index(code, name, valuation_mode, run_at, skip_price=True, skip_valuation=True)
+            continue
+        jobs.append((code, name, skip_price, skip_val))
+
+    _log.info(f"KRX batch: {len(jobs)} to update, {len(rows)} already at {latest.date() if latest is not None else 'n/a'}")
+    with ThreadPoolExecutor(max_workers=max(1, int(max_workers))) as pool:
+        futures = {
+            pool.submit(_update_one_index, code, name, valuation_mode, run_at, sp, sv): (code, name)
+            for code, name, sp, sv in jobs
+        }
+        for fut in as_completed(futures):
+            code, name = futures[fut]
+            try:
+                entry = fut.result()
+            except Exception as e:
+                entry = _new_batch_entry(code, name, run_at)
+                entry["status"] = f"error: {e}"[:200]
+            rows[code] = entry
+            _log.debug(f"[{code} {name}] price+val done -> status={entry['status']}")
+    return pd.DataFrame([rows[c] for c in index_map if c in rows])
+
+# --------------------
+# By-date (cross-sectional) ingestion
+# --------------------
+
+_NAME_TO_CODE_CACHE: dict[tuple[str, str], dict[str, str]] = {}
+
+
+def _market_for_index(ticker: str) -> str:
+    """Infer the pykrx market bucket from an index code (1xxx KOSPI, 2xxx KOSDAQ)."""
+    return {"1": "KOSPI", "2": "KOSDAQ"}.get(str(ticker).strip()[:1], "KRX")
+
+
+def _index_name_to_code(date: str, market: str) -> dict[str, str]:
+    """Map pykrx index names (as used by by-ticker snapshots) to codes for a market."""
+    key = (date, market)
+    _run_metrics.record_cache("krx_index_names", key in _NAME_TO_CODE_CACHE)
+    if key not in _NAME_TO_CODE_CACHE:
+        codes = _krx_call(stock.get_index_ticker_list, date=date, market=market)
+        _NAME_TO_CODE_CACHE[key] = {stock.get_index_ticker_name(c): str(c) for c in codes}
+    return _NAME_TO_CODE_CACHE[key]
+
+
+def fetch_index_snapshot(date: str | datetime, market: str = "KOSPI") -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Fetch one trading day's OHLCV and fundamentals for every index in a market.
+
+    Returns (ohlcv, fundamentals), both indexed by index code; two requests total.
+    """
+    d = _to_yyyymmdd(date)
+    names = _index_name_to_code(d, market)
+
+    def _by_code(df: pd.DataFrame | None) -> pd.DataFrame:
+        if df is None or df.empty:
+            return pd.DataFrame()
+        out = df.copy()
+        out.index = [names.get(str(n).strip(), str(n).strip()) for n in out.index]
+        out.index.name = "ticker"
+        return out[~out.index.duplicated(keep="first")]
+
+    ohlcv = _by_code(_krx_call(stock.get_index_ohlcv_by_ticker, d, market=market))
+    if not ohlcv.empty:
+        ohlcv = _normalize_ohlcv_columns(ohlcv)
+    fund = _by_code(_krx_call(stock.get_index_fundamental_by_ticker, d, market=market))
+    if not fund.empty:
+        fund = _normalize_fundamental_metrics(fund)
+    return ohlcv, fund
+
+
+def _append_csv_rows(path: Path, rows: pd.DataFrame, index: bool = False) -> None:
+    """Append rows to an existing CSV in its header's column order (no rewrite)."""
+    with open(path, "rb") as fh:
+        cols = fh.readline().decode("utf-8", errors="ignore").strip().split(",")
+        fh.seek(0, os.SEEK_END)
+        size = fh.tell()
+        needs_nl = False
+        if size > 0:
+            fh.seek(size - 1)
+            needs_nl = fh.read(1) != b"\n"
+    out = rows.reindex(columns=cols[1:] if index else cols)
+    with open(path, "a", encoding="utf-8", newline="") as fh:
+        if needs_nl:
+            fh.write("\n")
+        out.to_csv(fh, header=False, index=index, lineterminator="\n")
+
+
+@_run_metrics.profiled("krx.update_indices_by_date", out_dir=BASE_DIR / "data")
+def update_indices_by_date(
+    index_map: dict[str, str] | None = None,
+    valuation_mode: str = "append_today",
+    lookback_days: int | None = None,
+) -> pd.DataFrame:
+    """Refresh daily and valuation CSVs from per-date market snapshots.
+
+    Instead of one pykrx request per index, fetch one OHLCV + one fundamentals
+    snapshot per missing trading day (per market) and fan rows out to every
+    index file. Indices without a file, with a gap older than the calendar
+    window, or with an invalid last valuation row fall back to the per-index
+    updater, as do indices missing from (or whose snapshot failed on) any
+    trading day they need - appending the other days would leave a silent gap.
+    Returns the same summary columns as `batch_update_indices`.
+    """
+    if index_map is None:
+        index_map = KRX_TEST_INDICES
+    if lookback_days is None:
+        lookback_days = int(os.environ.get("KRX_BYDATE_LOOKBACK", "14"))
+    run_at = datetime.now(ZoneInfo("Asia/Seoul")).isoformat(timespec="seconds")
+    calendar = fetch_trading_calendar(lookback_days=lookback_days)
+
+    rows: dict[str, dict] = {}
+    # Per-index state: (last daily date, last valuation date)
+    state: dict[str, tuple[pd.Timestamp, pd.Timestamp]] = {}
+    for code, name in index_map.items():
+        last_p = _last_date_in_csv(_daily_csv_path(code))
+        last_v_any = _last_date_in_csv(_valuation_csv_path(code))
+        last_v = _last_date_in_csv(_valuation_csv_path(code), require_valuation=True)
+        window_ok = len(calendar) > 0 and last_p is not None and last_v is not None
+        if window_ok and last_v_any == last_v and min(last_p, last_v) >= calendar[0]:
+            state[code] = (last_p, last_v)
+        else:
+            rows[code] = _update_one_index(code, name, valuation_mode, run_at)
+            rows[code]["price_reason"] = f"per-index fallback; {rows[code]['price_reason']}"
+
+    # Collect snapshot rows per index for every missing trading day
+    daily_new: dict[str, list[pd.DataFrame]] = {c: [] for c in state}
+    val_new: dict[str, list[pd.DataFrame]] = {c: [] for c in state}
+    # Codes that need the per-index updater: snapshot failed or lacked the code
+    gaps: dict[str, list[str]] = {}
+    by_market: dict[str, list[str]] = {}
+    for code in state:
+        by_market.setdefault(_market_for_index(code), []).append(code)
+    for market, codes in by_market.items():
+        oldest = min(min(state[c]) for c in codes)
+        for day in [d for d in calendar if d > oldest]:
+            try:
+                ohlcv, fund = fetch_index_snapshot(day, market=market)
+            except Exception as e:
+                _log.warning(f"[{market}] snapshot {day.date()} failed: {e}")
+                for c in codes:
+                    if day > min(state[c]):
+                        gaps.setdefault(c, []).append(f"{day.date()} error")
+                continue
+            for c in codes:
+                last_p, last_v = state[c]
+                if day > last_p and c not in ohlcv.index:
+                    gaps.setdefault(c, []).append(f"{day.date()} ohlcv")
+                if day > last_v and c not in fund.index:
+                    gaps.setdefault(c, []).append(f"{day.date()} fundamental")
+                if c in gaps:
+                    continue
+                if day > last_p:
+                    daily_new[c].append(ohlcv.loc[[c]].set_axis([day], axis=0).rename_axis("Date"))
+                if day > last_v:
+                    v = fund.loc[[c]].reset_index(drop=True)
+                    v.insert(0, "Date", day.date().isoformat())
+                    v["symbol"] = _symbol_for_krx_index(c)
+                    v["currency"] = "KRW"
+                    v["quoteType"] = "INDEX"
+                    val_new[c].append(v)
+
+    for code in state:
+        name = index_map[code]
+        if code in gaps:
+            # Missing/renamed in a snapshot (name-based matching) or snapshot error
+            missing = ", ".join(gaps[code][:5]) + (" ..." if len(gaps[code]) > 5 else "")
+            _log.warning(f"[{code} {name}] not in by-date snapshot ({missing}); per-index fallback")
+            rows[code] = _update_one_index(code, name, valuation_mode, run_at)
+            rows[code]["price_reason"] = f"per-index fallback (snapshot missing {missing}); {rows[code]['price_reason']}"
+            continue
+        entry = _new_batch_entry(code, name, run_at)
+        entry["price_path"] = str(_daily_csv_path(code))
+        entry["valuation_path"] = str(_valuation_csv_path(code))
+        try:
+            p_added = 0
+            if daily_new[code]:
+                new = pd.concat(daily_new[code])
+                _append_csv_rows(_daily_csv_path(code), new, index=True)
+                p_added = len(new)
+            entry["price_rows_added"] = p_added
+            entry["price_updated"] = p_added > 0
+            entry["price_status"] = "updated" if p_added else "no_change"
+            entry["price_reason"] = f"by-date appended {p_added}" if p_added else "up_to_date or no_new_rows"
+            v_added = 0
+            if val_new[code]:
+                v_added = append_index_valuation_rows(code, pd.concat(val_new[code], ignore_index=True))
+            entry["valuation_rows_added"] = v_added
+            entry["valuation_updated"] = v_added > 0
+            entry["valuation_status"] = "updated" if v_added else "no_change"
+            entry["valuation_reason"] = f"by-date appended {v_added}" if v_added else "up_to_date or no_new_rows"
+        except Exception as e:
+            entry["status"] = f"by_date_error: {e}"[:200]
+        rows[code] = entry
+        _log.debug(f"[{code} {name}] by-date done -> status={entry['status']}")
+    return pd.DataFrame([rows[c] for c in index_map if c in rows])
+
 if __name__ == "__main__":
     # If KRX_INDEX is set to 'ALL' or 'TEST_ALL', run batch for provided list.
     env_code = os.environ.get("KRX_INDEX", "1001")
     mode = os.environ.get("KRX_VAL_MODE", "append_today")  # or 'backfill'
 
-    if env_code.upper() in {"ALL", "TEST_ALL"}:
-        print("Running batch update for KRX test indices...")
-        summary = batch_update_indices(KRX_TEST_INDICES, valuation_mode=mode)
+    if os.environ.get("KRX_VAL_COMPACT", "0").lower() in {"1", "true", "yes", "on"}:
+        _log.info("Compacting KRX valuation CSVs (canonical columns, sorted, de-duplicated)...")
+        _log.info(compact_index_valuations(KRX_TEST_INDICES)["status"].value_counts(dropna=False))
+    elif env_code.upper() in {"ALL", "TEST_ALL"}:
+        workers = int(os.environ.get("KRX_WORKERS", "1"))
+        _log.info(f"Running batch update for KRX test indices (workers={workers})...")
+        if os.environ.get("KRX_BY_DATE", "0").lower() in {"1", "true", "yes", "on"}:
+            summary = update_indices_by_date(KRX_TEST_INDICES, valuation_mode=mode)
+        elif workers > 1:
+            summary = batch_update_indices_parallel(KRX_TEST_INDICES, valuation_mode=mode, max_workers=workers)
+        else:
+            summary = batch_update_indices(KRX_TEST_INDICES, valuation_mode=mode)
         # Write a small run summary next to data dir for quick inspection
         out_csv = BASE_DIR / "data" / "krx_batch_summary.csv"
         summary.to_csv(out_csv, index=False)
-        print(f"Batch summary saved: {out_csv}")
+        _log.info(f"Batch summary saved: {out_csv}")
         # Print compact status counts
-        print(summary["status"].value_counts(dropna=False))
+        _log.info(summary["status"].value_counts(dropna=False))
     else:
         # Single index mode (default 1001)
         code = env_code
-        print(f"Updating daily OHLCV for KRX index {code}...")
-        p, added = update_index_daily_csv(code)
-        print(f"Saved: {p} (+{added} rows)")
+        _log.info(f"Updating daily OHLCV for KRX index {code}...")
+        with _run_metrics.stage("krx.daily"):
+            p, added = update_index_daily_csv(code)
+        _log.info(f"Saved: {p} (+{added} rows)")
 
-        print(f"Updating valuation snapshots for {code} (mode={mode})...")
-        vp, vadded = update_index_valuation_csv(code, mode=mode)
-        print(f"Saved: {vp} (+{vadded} rows)")
+        _log.info(f"Updating valuation snapshots for {code} (mode={mode})...")
+        with _run_metrics.stage("krx.valuations"):
+            vp, vadded = update_index_valuation_csv(code, mode=mode)
+        _log.info(f"Saved: {vp} (+{vadded} rows)")
@@ -226,38 +226,83 @@ def classify_phase(cli_value: float | pd.Series, mom: float | pd.Series, long_av
     return phase
 
 
-def compute_phases(wide: pd.DataFrame, long_avg: float = 100.0) -> pd.DataFrame:
+PHASE_ORDER: list[str] = ["Recession", "Recovery", "Expansion", "Slowdown", "Neutral"]
+_NEUTRAL_CODE = PHASE_ORDER.index("Neutral")
+
+
+def mom_matrix(wide: pd.DataFrame) -> pd.DataFrame:
+    """Month-over-month change for every area (shared by phases and diffusion)."""
+    return wide.diff()
+
+
+def classify_phase_matrix(values: np.ndarray, mom: np.ndarray, long_avg: float = 100.0) -> np.ndarray:
+    """Classify a (time x area) matrix into phase codes (index into PHASE_ORDER).
+
+    Same rules as `classify_phase`: flat months (MoM==0 or NaN) keep the previous
+    phase of that area; leading flat months are Neutral.
+    """
+    v = np.asarray(values, dtype="float64")
+    d = np.asarray(mom, dtype="float64")
+    below = v < long_avg
+    above = v >= long_avg
+    up = d > 0
+    down = d < 0
+    codes = np.full(v.shape, _NEUTRAL_CODE, dtype="int8")
+    codes[below & down] = 0
+    codes[below & up] = 1
+    codes[above & up] = 2
+    codes[above & down] = 3
+    flat = np.isnan(d) | (d == 0)
+    if codes.size == 0:
+        return codes
+    # Column-wise forward fill of the last non-flat row index
+    rows = np.arange(v.shape[0])[:, None]
+    last = np.where(flat, -1, rows)
+    np.maximum.accumulate(last, axis=0, out=last)
+    filled = np.take_along_axis(codes, np.clip(last, 0, None), axis=0)
+    filled[last < 0] = _NEUTRAL_CODE
+    return filled
+
+
+def compute_phases(wide: pd.DataFrame, long_avg: float = 100.0, mom: pd.DataFrame | None = None) -> pd.DataFrame:
     """Compute MoM and phase for each area; return long DataFrame.
 
+    Classifies the whole wide matrix in one NumPy pass and emits the long
+    table (area-major, like stacking column by column) in a single reshape.
+    Pass `mom` (from `mom_matrix`) to reuse an already computed MoM matrix.
+
     Columns: [date, area, value, mom, phase_en, phase_ko]
     """
     if wide is None or wide.empty:
         return pd.DataFrame(columns=["date", "area", "value", "mom", "phase_en", "phase_ko"])
-    long_rows: list[pd.DataFrame] = []
-    for area in wide.columns:
-        ser = wide[area].copy()
-        mom = ser.diff()
-        phase = classify_phase(ser, mom, long_avg)
-        df_area = pd.DataFrame({
-            "date": ser.index,
-            "area": area,
-            "value": ser.values,
-            "mom": mom.values,
-            "phase_en": phase.values,
-        })
-        df_area["phase_ko"] = df_area["phase_en"].map(PHASE_EN_TO_KO)
-        long_rows.append(df_area)
-    return pd.concat(long_rows, ignore_index=True)
+    if mom is None:
+        mom = mom_matrix(wide)
+    values = wide.to_numpy(dtype="float64")
+    deltas = mom.reindex_like(wide).to_numpy(dtype="float64")
+    codes = classify_phase_matrix(values, deltas, long_avg)
+    n_dates, n_areas = values.shape
+    flat_codes = codes.ravel(order="F")
+    phase_en = np.asarray(PHASE_ORDER, dtype=object)[flat_codes]
+    phase_ko = np.asarray([PHASE_EN_TO_KO[p] for p in PHASE_ORDER], dtype=object)[flat_codes]
+    return pd.DataFrame({
+        "date": np.tile(wide.index.to_numpy(), n_areas),
+        "area": np.repeat(wide.columns.to_numpy(), n_dates),
+        "value": values.ravel(order="F"),
+        "mom": deltas.ravel(order="F"),
+        "phase_en": phase_en,
+        "phase_ko": phase_ko,
+    })
 
 
 # --------------------
 # Diffusion index
 # --------------------
 
-def diffusion_index(wide: pd.DataFrame, members: Iterable[str] | None = None) -> pd.Series:
+def diffusion_index(wide: pd.DataFrame, members: Iterable[str] | None = None, mom: pd.DataFrame | None = None) -> pd.Series:
     """Compute fraction of members with MoM > 0 for each month.
 
     - If members is None: use all non-aggregate columns
+    - mom: optional precomputed `mom_matrix(wide)` to avoid recomputing diffs
     Returns a Series in [0,1] indexed by date.
     """
     if wide is None or wide.empty:
@@ -267,10 +312,13 @@ def diffusion_index(wide: pd.DataFrame, members: Iterable[str] | None = None) ->
     members = [m for m in members if m in wide.columns]
     if not members:
         return pd.Series(index=wide.index, dtype=float)
-    mom = wide[members].diff()
-    pos = (mom > 0).sum(axis=1)
-    count = mom.notna().sum(axis=1).replace(0, np.nan)
-    di = (pos / count).fillna(method="ffill")  # keep continuity when early NaNs
+    if mom is None:
+        mom = mom_matrix(wide[members])
+    block = mom[members].to_numpy(dtype="float64")
+    pos = (block > 0).sum(axis=1)
+    count = (~np.isnan(block)).sum(axis=1).astype("float64")
+    count[count == 0] = np.nan
+    di = pd.Series(pos / count, index=mom.index).ffill()  # keep continuity when early NaNs
     di.name = "diffusion"
     return di
 
@@ -463,10 +511,11 @@ def run_analysis(start_period: str = "1990-01", ref_areas: Sequence[str] | None
     }
     """
     wide = fetch_cli(ref_areas, start_period=start_period)
-    phases = compute_phases(wide)
+    mom = mom_matrix(wide)
+    phases = compute_phases(wide, mom=mom)
 
     # Diffusion examples
-    di_g20 = diffusion_index(wide, members=[m for m in G20_MEMBERS if m in wide.columns])
+    di_g20 = diffusion_index(wide, members=[m for m in G20_MEMBERS if m in wide.columns], mom=mom)
 
     # Plots
     out = {}
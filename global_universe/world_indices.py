@@ -13,7 +13,7 @@ except Exception:
     _Retry = None
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from zoneinfo import ZoneInfo as _ZoneInfo
 import warnings
 warnings.filterwarnings('ignore')
@@ -963,6 +963,39 @@ import io as _io
 import subprocess as _sp
 
 _BASE_DIR = _Path(__file__).resolve().parent
+
+# Run logging/metrics shared with us_eco (run_metrics.py lives at the repo root)
+try:
+    import run_metrics as _run_metrics
+except ImportError:
+    import sys as _sys
+    _sys.path.append(str(_BASE_DIR.parent))
+    import run_metrics as _run_metrics
+_log = _run_metrics.get_logger("world_indices")
+
+# Yahoo endpoint base (swap for a local stand-in server in offline benchmarks)
+YAHOO_BASE_URL = os.environ.get("YAHOO_BASE_URL", "https://query1.finance.yahoo.com").rstrip("/")
+# 'auto' = yfinance with chart API fallback, 'chart' = chart API only (no yfinance)
+YF_HISTORY_MODE = os.environ.get("YF_HISTORY_MODE", "auto").lower()
+
+
+def _timed_history(t, source: str = "yahoo_history", **kwargs) -> pd.DataFrame:
+    """yf.Ticker.history with request latency/row metrics."""
+    with _run_metrics.timed_request(source):
+        hist = t.history(**kwargs)
+    if hist is not None:
+        _run_metrics.record_rows(source, len(hist))
+    return hist
+
+
+def _curl_json(url: str, headers: list[str], timeout: int, source: str):
+    """Run curl for a Yahoo endpoint and decode JSON, recording latency/bytes."""
+    with _run_metrics.timed_request(source) as req:
+        out = _sp.check_output(["curl", "-s", *headers, url], timeout=timeout)
+        req["nbytes"] = len(out or b"")
+    if not out:
+        return None
+    return _json.loads(out.decode("utf-8", errors="ignore"))
 _DATA_DIR = _BASE_DIR / "data" / "daily"
 _DATA_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -1141,14 +1174,18 @@ def _fetch_history(symbol: str, start: datetime | None = None, end: datetime | N
     for attempt in range(1, max_retries + 1):
         try:
             t = yf.Ticker(symbol)
-            if start is None and end is None:
+            if YF_HISTORY_MODE == "chart":
+                hist = _fetch_history_via_chart(symbol, start=start, end=end)
+                if hist is None:
+                    hist = pd.DataFrame()
+            elif start is None and end is None:
                 # Try a sequence of periods from longest to shortest; some symbols only allow 1d/5d
                 periods = ["max", "10y", "5y", "2y", "1y", "6mo", "3mo", "1mo", "5d", "1d"]
                 hist = pd.DataFrame()
                 last_exc = None
                 for p in periods:
                     try:
-                        h = t.history(period=p, interval="1d")
+                        h = _timed_history(t, period=p, interval="1d")
                         if h is not None and not h.empty:
                             hist = h
                             break
@@ -1178,10 +1215,10 @@ def _fetch_history(symbol: str, start: datetime | None = None, end: datetime | N
                 # Remove Nones
                 kwargs = {k: v for k, v in kwargs.items() if v is not None}
                 try:
-                    hist = t.history(**kwargs)
+                    hist = _timed_history(t, **kwargs)
                 except Exception:
                     # As a fallback, try a short period if range query fails
-                    hist = t.history(period="5d", interval="1d")
+                    hist = _timed_history(t, period="5d", interval="1d")
                     if hist is None or hist.empty:
                         # fallback to chart api for a short period
                         hist = _fetch_history_via_chart(symbol, period="5d")
@@ -1193,6 +1230,8 @@ def _fetch_history(symbol: str, start: datetime | None = None, end: datetime | N
             return hist
         except Exception as e:
             last_err = e
+            _run_metrics.metrics.inc("retries", "yahoo_history")
+            _log.debug(f"Retry {attempt}/{max_retries} for {symbol}: {e}")
             time.sleep(min(10, pause * (2 ** (attempt - 1))))
     raise RuntimeError(f"Failed to fetch history for {symbol}: {last_err}")
 
@@ -1353,6 +1392,7 @@ def analyze_price_file(symbol: str) -> dict:
         out.update({"status": "error", "note": f"analyze_error: {str(e)[:120]}"})
     return out
 
+@_run_metrics.profiled("world_indices.backfill_all_prices", out_dir=_BASE_DIR / "data")
 def backfill_all_prices(universe: dict, pause: float = 0.6, symbols: list[str] | None = None) -> pd.DataFrame:
     """Backfill price history to the maximum available for the given symbols and write a monitoring summary."""
     if symbols is None:
@@ -1462,22 +1502,26 @@ def build_symbols_catalog(universe: dict, primary_only: bool = True) -> pd.DataF
     df.to_csv(_BASE_DIR / "data" / "symbols_catalog.csv", index=False)
     return df
 
-def _fetch_history_via_chart(symbol: str, period: str = "max", interval: str = "1d") -> pd.DataFrame | None:
+def _fetch_history_via_chart(symbol: str, period: str = "max", interval: str = "1d",
+                             start: datetime | None = None, end: datetime | None = None) -> pd.DataFrame | None:
     """Fallback downloader using Yahoo chart API via curl with browser-like headers.
+    `start`/`end` switch from a range query to explicit period1/period2 bounds.
     Returns OHLCV (+ Adj Close if available) DataFrame or None.
     """
     try:
-        url = f"https://query1.finance.yahoo.com/v8/finance/chart/{symbol}?range={period}&interval={interval}"
+        if start is not None or end is not None:
+            p1 = int(start.timestamp()) if start is not None else 0
+            p2 = int((end or datetime.now(timezone.utc)).timestamp())
+            url = f"{YAHOO_BASE_URL}/v8/finance/chart/{symbol}?period1={p1}&period2={p2}&interval={interval}"
+        else:
+            url = f"{YAHOO_BASE_URL}/v8/finance/chart/{symbol}?range={period}&interval={interval}"
         headers = [
             "-H", "User-Agent: Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36",
             "-H", "Accept: application/json, text/plain, */*",
             "-H", f"Referer: https://finance.yahoo.com/quote/{symbol}",
             "-H", "Accept-Language: en-US,en;q=0.9",
         ]
-        out = _sp.check_output(["curl", "-s", *headers, url], timeout=20)
-        if not out:
-            return None
-        data = _json.loads(out.decode("utf-8", errors="ignore"))
+        data = _curl_json(url, headers, timeout=20, source="yahoo_chart")
         result = (data or {}).get("chart", {}).get("result")
         if not result:
             return None
@@ -1509,10 +1553,12 @@ def _fetch_history_via_chart(symbol: str, period: str = "max", interval: str = "
         if "Adj Close" in df.columns:
             cols = ["Open","High","Low","Close","Adj Close","Volume"]
             df = df[[c for c in cols if c in df.columns]]
+        _run_metrics.record_rows("yahoo_chart", len(df))
         return df
     except Exception:
         return None
 
+@_run_metrics.profiled("world_indices.update_all_daily_data", out_dir=_BASE_DIR / "data")
 def update_all_daily_data(universe: dict, pause: float = 0.6, symbols: list[str] | None = None, lookback_days: int = 0) -> pd.DataFrame:
     if symbols is None:
         symbols = list_primary_symbols(universe)
@@ -1546,6 +1592,7 @@ def update_all_daily_data(universe: dict, pause: float = 0.6, symbols: list[str]
                 "status": "error",
                 "reason": str(e)[:200],
             })
+        _run_metrics.metrics.inc(f"symbols_{results[-1]['status']}", "yahoo_history")
         time.sleep(pause)
     df = pd.DataFrame(results)
     # Mark execution time for visibility in CI even when no rows are added
@@ -1617,7 +1664,8 @@ def fetch_valuation_snapshot(symbol: str) -> dict | None:
     """
     try:
         t = yf.Ticker(symbol)
-        info = t.info
+        with _run_metrics.timed_request("yahoo_info"):
+            info = t.info
         if not info or not isinstance(info, dict):
             return None
         row = {k: info.get(k) for k in _VALUATION_FIELDS}
@@ -1691,7 +1739,7 @@ def _batch_fetch_quote(symbols: list[str]) -> dict:
         "quoteType",
     ]
     url = (
-        f"https://query1.finance.yahoo.com/v7/finance/quote?symbols={_up.quote(joined)}"
+        f"{YAHOO_BASE_URL}/v7/finance/quote?symbols={_up.quote(joined)}"
         f"&fields={_up.quote(','.join(fields))}"
     )
     headers = [
@@ -1701,8 +1749,7 @@ def _batch_fetch_quote(symbols: list[str]) -> dict:
         "-H", "Referer: https://finance.yahoo.com/",
     ]
     try:
-        out = _sp.check_output(["curl", "-s", *headers, url], timeout=25)
-        data = _json.loads(out.decode("utf-8", errors="ignore"))
+        data = _curl_json(url, headers, timeout=25, source="yahoo_quote")
         results = (((data or {}).get("quoteResponse") or {}).get("result")) or []
         out_map: dict[str, dict] = {}
         for item in results:
@@ -1827,15 +1874,21 @@ def _append_valuation_row(symbol: str, row: dict) -> tuple[_Path, bool]:
 # KRX Integration (pykrx)
 # ============================
 
+@_run_metrics.profiled("world_indices.update_krx_indices", out_dir=_BASE_DIR / "data")
 def update_krx_indices(run_backfill: bool = True,
                        price_mode: str = "full",
                        price_years: int = 3,
-                       pause: float = 0.0) -> pd.DataFrame | None:
+                       pause: float = 0.0,
+                       workers: int = 1,
+                       by_date: bool = False) -> pd.DataFrame | None:
     """Update KRX index OHLCV and valuations using krx_data module.
 
     - run_backfill: if True, run valuation backfill; else append_today.
     - price_mode: 'full' for full backfill; 'quick' limits initial backfill to recent years.
     - price_years: used when price_mode='quick'.
+    - workers: >1 uses the parallel batch (shared calendar, skips up-to-date indices).
+    - by_date: append missing trading days from per-date market snapshots
+      (one request per day instead of per index); takes precedence over workers.
     Returns batch summary DataFrame or None on import failure.
     """
     try:
@@ -1854,7 +1907,12 @@ def update_krx_indices(run_backfill: bool = True,
         if price_mode == "quick":
             _os.environ["KRX_PRICE_YEARS"] = str(int(price_years))
         mode = "backfill" if run_backfill else "append_today"
-        df = _krx.batch_update_indices(_krx.KRX_TEST_INDICES, valuation_mode=mode)
+        if by_date:
+            df = _krx.update_indices_by_date(_krx.KRX_TEST_INDICES, valuation_mode=mode)
+        elif workers > 1:
+            df = _krx.batch_update_indices_parallel(_krx.KRX_TEST_INDICES, valuation_mode=mode, max_workers=workers)
+        else:
+            df = _krx.batch_update_indices(_krx.KRX_TEST_INDICES, valuation_mode=mode)
         # Save a separate summary file
         out_csv = _BASE_DIR / "data" / "krx_batch_summary_from_world_indices.csv"
         df.to_csv(out_csv, index=False)
@@ -1862,6 +1920,7 @@ def update_krx_indices(run_backfill: bool = True,
     except Exception:
         return None
 
+@_run_metrics.profiled("world_indices.update_all_valuations", out_dir=_BASE_DIR / "data")
 def update_all_valuations(
     universe: dict,
     pause: float = 0.2,
@@ -2083,9 +2142,10 @@ if __name__ == "__main__":
         _sanitize = _os.environ.get("SANITIZE_DAILY", "0").lower() in {"1","true","yes","on"}
         _sanitize_only = _os.environ.get("SANITIZE_ONLY", "0").lower() in {"1","true","yes","on"}
         if _sanitize or _sanitize_only:
-            print("Sanitizing daily CSV files (removing merge markers, dedup headers)...")
-            ssum = sanitize_all_daily_csvs()
-            print("Sanitization complete. Summary saved to data/daily_sanitization_summary.csv")
+            _log.info("Sanitizing daily CSV files (removing merge markers, dedup headers)...")
+            with _run_metrics.stage("world_indices.sanitize"):
+                ssum = sanitize_all_daily_csvs()
+            _log.info("Sanitization complete. Summary saved to data/daily_sanitization_summary.csv")
             # If sanitize-only, exit before doing network work
             if _sanitize_only:
                 raise SystemExit(0)
@@ -2111,18 +2171,18 @@ if __name__ == "__main__":
         if _max:
             syms = syms[:int(_max)]
 
-        print(f"Price update scope={price_scope} mode={price_mode} lb={price_lookback} symbols={len(syms)}")
+        _log.info(f"Price update scope={price_scope} mode={price_mode} lb={price_lookback} symbols={len(syms)}")
         if price_mode == "backfill":
             summary = backfill_all_prices(investment_universe, pause=price_pause, symbols=syms)
-            print("Backfill complete. Summary saved to data/prices_backfill_summary.csv")
+            _log.info("Backfill complete. Summary saved to data/prices_backfill_summary.csv")
         else:
             summary = update_all_daily_data(investment_universe, pause=price_pause, symbols=syms, lookback_days=price_lookback)
-            print("Incremental price update complete. Summary saved to data/update_summary.csv")
+            _log.info("Incremental price update complete. Summary saved to data/update_summary.csv")
 
         # Valuation snapshots (snapshot only, daily append)
         skip_vals = _os.environ.get("SKIP_VALUATIONS", "false").lower() in {"1","true","yes","on"}
         if not skip_vals:
-            print("Updating valuation snapshots (primary symbols, with ETF fallback)...")
+            _log.info("Updating valuation snapshots (primary symbols, with ETF fallback)...")
             val_pause = float(_os.environ.get("VALUATION_PAUSE", "1.0" if _is_ci else "0.2"))
             # Optional limiting in CI to avoid 429
             _max_val = _os.environ.get("MAX_VAL_SYMBOLS")
@@ -2144,24 +2204,27 @@ if __name__ == "__main__":
                 info_fallback=_info_fallback,
                 max_info_calls=int(_max_info_calls) if _max_info_calls else None,
             )
-            print("Valuation update complete. Saved to data/valuations_update_summary.csv")
-            print(vsummary.head())
+            _log.info("Valuation update complete. Saved to data/valuations_update_summary.csv")
+            _log.debug(vsummary.head())
         else:
-            print("Skipping valuation snapshots (set FORCE_VALUATIONS=1 to override).")
+            _log.info("Skipping valuation snapshots (set FORCE_VALUATIONS=1 to override).")
 
         # KRX indices via pykrx (prices + valuations)
         _krx_run = _os.environ.get("INCLUDE_KRX", "1").lower() in {"1","true","yes","on"}
         if _krx_run:
-            print("Updating KRX index prices and valuations (via pykrx)...")
+            _log.info("Updating KRX index prices and valuations (via pykrx)...")
             _krx_backfill = _os.environ.get("KRX_VAL_MODE", "backfill").lower() == "backfill"
             _krx_price_mode = _os.environ.get("KRX_PRICE_MODE", "full")
             _krx_price_years = int(_os.environ.get("KRX_PRICE_YEARS", "3"))
+            _krx_workers = int(_os.environ.get("KRX_WORKERS", "1"))
             ksum = update_krx_indices(run_backfill=_krx_backfill,
                                       price_mode=_krx_price_mode,
-                                      price_years=_krx_price_years)
+                                      price_years=_krx_price_years,
+                                      workers=_krx_workers,
+                                      by_date=_os.environ.get("KRX_BY_DATE", "0").lower() in {"1","true","yes","on"})
             if ksum is not None:
-                print("KRX update complete. Saved to data/krx_batch_summary_from_world_indices.csv")
+                _log.info("KRX update complete. Saved to data/krx_batch_summary_from_world_indices.csv")
             else:
-                print("KRX update skipped (import or runtime error)")
+                _log.warning("KRX update skipped (import or runtime error)")
     except Exception as e:
-        print(f"Error during update: {e}")
+        _log.error(f"Error during update: {e}")
@@ -187,16 +187,25 @@ def _fx_usd_per_local(currency: str) -> pd.Series:
 
 @lru_cache(maxsize=64)
 def _fx_usd_from_cache(currency: str) -> pd.Series:
-    """Load daily USD per currency series from fx_rates module cache, if available.
+    """Load daily USD per currency series from the fx_rates store, if available.
 
-    Returns an empty series if not found.
+    Falls back to a legacy per-currency CSV; returns an empty series if neither exists.
     """
     code = (currency or "").upper()
     # Map sub-units (GBp/GBX) to GBP like fx_rates
     if code in {"GBP", "GBP.", "GBp", "GBX"}:
         code = "GBP"
-    fx_dir = fxmod.OUT_DIR
-    path = fx_dir / f"{code}.csv"
+    try:
+        # Calendar fill matches the legacy per-currency CSVs (every day forward-filled),
+        # so local trading days without an FX print still convert.
+        s = fxmod.fx_rate(code, "USD", fill="calendar")
+        if not s.empty:
+            s.name = f"USD/{code} (cache)"
+            return s
+    except Exception:
+        # Missing/unreadable store or unknown currency: try the legacy CSV below
+        pass
+    path = fxmod.OUT_DIR / f"{code}.csv"
     if not path.exists():
         # Do not trigger a full FX rebuild here; it is expensive and blocks UI.
         # Fallback to Yahoo FX pairs path handled by _fx_usd_per_local.
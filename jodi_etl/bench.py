@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark suite for the JODI ingestion and load path.
+
+Generates synthetic JODI-shaped CSVs (countries × products × flows × units ×
+months), then times and memory-profiles each stage against that data:
+
+  split_csv_by_country      world CSV → per-country partitions
+  load_split_section_cold   partitions → finalized frames (empty frame cache)
+  load_split_section_warm   same, served by the frame cache
+  load_jodi_base            primary + secondary base frame (warm)
+  build_series_dataframe    series query against the split store
+  processed_views_build     cube + seasonal table build (what the app needs cold)
+  processed_views_load      memory-mapped cube load (app warm start)
+  aggregate_jodi            region/formula aggregation (empty panel cache, warm frames)
+
+Timings are the median of --repeat runs; peak memory comes from one extra
+tracemalloc run so tracing does not skew the timings. Results are written as
+JSON and optionally compared with a baseline; a stage regresses when it is
+slower (or uses more memory) than baseline × (1 + tolerance).
+
+Usage:
+  python -m jodi_etl.bench --scale small
+  python -m jodi_etl.bench --scale medium --save-baseline
+  python -m jodi_etl.bench --baseline jodi_etl/bench_baseline.json --tolerance 0.3
+"""
+
+import argparse
+import importlib
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "bench_baseline.json")
+
+# countries, products per section, flows per section, units, months
+SCALES = {
+    "small": (12, 3, 5, 2, 120),
+    "medium": (40, 4, 8, 2, 240),
+    "large": (120, 9, 10, 3, 300),
+}
+
+PRIMARY_PRODUCTS = ["CRUDEOIL", "NGL", "OTHERCRUDE", "TOTCRUDE"]
+PRIMARY_FLOWS = ["INDPROD", "OSOURCES", "TOTIMPSB", "TOTEXPSB", "TRANSBAK", "DIRECUSE", "STOCKCH", "STATDIFF", "REFINOBS", "CLOSTLV"]
+SECONDARY_PRODUCTS = ["LPG", "NAPHTHA", "GASOLINE", "KEROSENE", "JETKERO", "GASDIES", "RESFUEL", "ONONSPEC", "TOTPRODS"]
+SECONDARY_FLOWS = ["REFGROUT", "RECEIPTS", "PTRANSF", "IPTRANSF", "TOTIMPSB", "TOTEXPSB", "STOCKCH", "TOTDEMO", "STATDIFF", "CLOSTLV"]
+UNITS = ["KBD", "KBBL", "KTONS", "KL", "CONVBBL"]
+MISSING_SHARE = 0.02
+
+
+def _codes(pool: List[str], n: int, prefix: str) -> List[str]:
+    """First n codes of pool, padded with synthetic ones when n exceeds it."""
+    return pool[:n] + [f"{prefix}{i}" for i in range(max(0, n - len(pool)))]
+
+
+def _country_codes(n: int) -> List[str]:
+    # Two-letter codes; "NA" is skipped since it collides with missing-value parsing
+    codes = [f"{chr(65 + i // 26)}{chr(65 + i % 26)}" for i in range(26 * 26)]
+    return [c for c in codes if c != "NA"][:n]
+
+
+def generate_section_csv(path: str, section: str, countries: int, products: int, flows: int,
+                         units: int, months: int, seed: int) -> int:
+    """Write one synthetic world CSV for a section; returns the row count."""
+    rng = np.random.default_rng(seed)
+    if section == "primary":
+        prod_codes = _codes(PRIMARY_PRODUCTS, products, "PP")
+        flow_codes = _codes(PRIMARY_FLOWS, flows, "PF")
+    else:
+        prod_codes = _codes(SECONDARY_PRODUCTS, products, "SP")
+        flow_codes = _codes(SECONDARY_FLOWS, flows, "SF")
+    country_codes = _country_codes(countries)
+    unit_codes = _codes(UNITS, units, "U")
+    periods = pd.period_range("2002-01", periods=months, freq="M").strftime("%Y-%m")
+
+    dims = [country_codes, prod_codes, flow_codes, unit_codes, list(periods)]
+    grid = np.meshgrid(*[np.arange(len(d)) for d in dims], indexing="ij")
+    n_rows = grid[0].size
+
+    values = np.round(rng.gamma(2.0, 250.0, n_rows), 3).astype(str)
+    values[rng.random(n_rows) < MISSING_SHARE] = "-"
+    frame = pd.DataFrame({
+        "REF_AREA": np.asarray(country_codes)[grid[0].ravel()],
+        "TIME_PERIOD": np.asarray(periods)[grid[4].ravel()],
+        "ENERGY_PRODUCT": np.asarray(prod_codes)[grid[1].ravel()],
+        "FLOW_BREAKDOWN": np.asarray(flow_codes)[grid[2].ravel()],
+        "UNIT_MEASURE": np.asarray(unit_codes)[grid[3].ravel()],
+        "OBS_VALUE": values,
+        "ASSESSMENT_CODE": rng.integers(1, 4, n_rows),
+    })
+    frame.to_csv(path, index=False)
+    return n_rows
+
+
+def _measure(fn: Callable[[], object], setup: Optional[Callable[[], None]], repeat: int) -> dict:
+    timings = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        t0 = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - t0)
+    if setup:
+        setup()
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "seconds": statistics.median(timings),
+        "min_seconds": min(timings),
+        "runs": len(timings),
+        "peak_mb": peak / (1024 * 1024),
+    }
+
+
+def run_suite(workdir: str, scale: tuple, split_format: str, repeat: int, seed: int,
+              stages: Optional[List[str]] = None, quiet: bool = False) -> dict:
+    """Generate data under workdir, run every stage and return the results dict."""
+    countries, products, flows, units, months = scale
+    os.environ["JODI_DATA_DIR"] = workdir
+    from jodi_etl import cli as jodi_cli
+    jodi = importlib.import_module("jodi_etl.jodi_oil_refactor")
+    if os.path.abspath(jodi.JODI_DATA_DIR) != os.path.abspath(workdir):
+        # Module was imported earlier with another data root; reload to pick up the env override
+        jodi = importlib.reload(jodi)
+
+    os.makedirs(workdir, exist_ok=True)
+    primary_csv = os.path.join(workdir, "NewProcedure_Primary_CSV.csv")
+    secondary_csv = os.path.join(workdir, "NewProcedure_Secondary_CSV.csv")
+    rows = {
+        "primary": generate_section_csv(primary_csv, "primary", countries, products, flows, units, months, seed),
+        "secondary": generate_section_csv(secondary_csv, "secondary", countries, products, flows, units, months, seed + 1),
+    }
+    split_root = os.path.join(workdir, "split")
+    cache_dir = jodi.CACHE_DIR
+
+    def _clear_split() -> None:
+        shutil.rmtree(split_root, ignore_errors=True)
+
+    def _clear_cache() -> None:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+    def _clear_aggregates() -> None:
+        shutil.rmtree(jodi.AGG_CACHE_DIR, ignore_errors=True)
+        jodi._AGGREGATE_CACHE.clear()
+
+    def _clear_cube() -> None:
+        shutil.rmtree(jodi.JODI_CUBE_DIR, ignore_errors=True)
+
+    def _split() -> None:
+        jodi_cli.split_csv_by_country(primary_csv, os.path.join(split_root, "primary"), fmt=split_format)
+        jodi_cli.split_csv_by_country(secondary_csv, os.path.join(split_root, "secondary"), fmt=split_format)
+
+    def _load_sections() -> None:
+        jodi._load_split_section("PRIMARY")
+        jodi._load_split_section("SECONDARY")
+
+    country_codes = _country_codes(countries)
+    series_defs = {
+        f"S{i}": {
+            "section": "PRIMARY",
+            "country": country_codes[i % len(country_codes)],
+            "product": _codes(PRIMARY_PRODUCTS, products, "PP")[i % products],
+            "flow": _codes(PRIMARY_FLOWS, flows, "PF")[i % flows],
+            "unit": UNITS[0],
+        }
+        for i in range(8)
+    }
+
+    plan = [
+        ("split_csv_by_country", _split, _clear_split),
+        ("load_split_section_cold", _load_sections, _clear_cache),
+        ("load_split_section_warm", _load_sections, None),
+        ("load_jodi_base", jodi.load_jodi_base, None),
+        ("build_series_dataframe", lambda: jodi.build_series_dataframe(series_defs, start_date="2002-01-01"), None),
+        ("processed_views_build", lambda: jodi.ensure_jodi_cube(force=True), _clear_cube),
+        ("processed_views_load", jodi.ensure_jodi_cube, None),
+        ("aggregate_jodi", jodi.aggregate_jodi, _clear_aggregates),
+    ]
+
+    results: Dict[str, dict] = {}
+    _split()  # later stages need partitions even when split_csv_by_country is skipped
+    for name, fn, setup in plan:
+        if stages and name not in stages:
+            continue
+        if not quiet:
+            print(f"⏱️ {name} …", end=" ", flush=True)
+        results[name] = _measure(fn, setup, repeat)
+        if not quiet:
+            r = results[name]
+            print(f"{r['seconds']:.3f}s (min {r['min_seconds']:.3f}s), peak {r['peak_mb']:.1f} MB")
+
+    return {
+        "meta": {
+            "generated_at": datetime.now().isoformat(timespec="seconds"),
+            "scale": {"countries": countries, "products": products, "flows": flows, "units": units, "months": months},
+            "rows": rows,
+            "split_format": split_format,
+            "repeat": repeat,
+            "seed": seed,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "pandas": pd.__version__,
+            "numpy": np.__version__,
+        },
+        "stages": results,
+    }
+
+
+def compare_with_baseline(current: dict, baseline: dict, tolerance: float, memory_tolerance: float) -> List[str]:
+    """Return human-readable regressions of current vs baseline."""
+    regressions: List[str] = []
+    if current["meta"].get("scale") != baseline.get("meta", {}).get("scale"):
+        print("⚠️ 기준선과 데이터 규모가 다릅니다; 비교 결과는 참고용입니다.")
+    for name, cur in current["stages"].items():
+        base = baseline.get("stages", {}).get(name)
+        if not base:
+            continue
+        if cur["seconds"] > base["seconds"] * (1 + tolerance):
+            regressions.append(f"{name}: {cur['seconds']:.3f}s vs baseline {base['seconds']:.3f}s (+{cur['seconds'] / base['seconds'] - 1:.0%})")
+        if base.get("peak_mb") and cur["peak_mb"] > base["peak_mb"] * (1 + memory_tolerance):
+            regressions.append(f"{name}: peak {cur['peak_mb']:.1f} MB vs baseline {base['peak_mb']:.1f} MB")
+    return regressions
+
+
+def _write_json(path: str, payload: dict) -> None:
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=1)
+    os.replace(tmp, path)
+
+
+def main(argv=None) -> int:
+    p = argparse.ArgumentParser(description="Benchmark the JODI ingestion/load path on synthetic data (offline)")
+    p.add_argument("--scale", choices=sorted(SCALES), default="small", help="Preset data size")
+    p.add_argument("--countries", type=int, help="Override the preset country count")
+    p.add_argument("--products", type=int, help="Override products per section")
+    p.add_argument("--flows", type=int, help="Override flows per section")
+    p.add_argument("--units", type=int, help="Override unit count")
+    p.add_argument("--months", type=int, help="Override month count")
+    p.add_argument("--split-format", choices=["csv", "parquet"], default="csv")
+    p.add_argument("--repeat", type=int, default=3, help="Timed runs per stage (median reported)")
+    p.add_argument("--seed", type=int, default=7)
+    p.add_argument("--stage", action="append", dest="stages", help="Run only this stage (repeatable)")
+    p.add_argument("--workdir", help="Directory for synthetic data (default: temporary, removed afterwards)")
+    p.add_argument("--output", help="Write results JSON here")
+    p.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline JSON to compare against")
+    p.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown vs baseline (0.25 = +25%%)")
+    p.add_argument("--memory-tolerance", type=float, default=0.25, help="Allowed peak-memory growth vs baseline")
+    p.add_argument("--save-baseline", action="store_true", help="Store these results as the new baseline")
+    p.add_argument("--quiet", action="store_true")
+    args = p.parse_args(argv)
+
+    preset = SCALES[args.scale]
+    scale = tuple(
+        override if override is not None else default
+        for override, default in zip((args.countries, args.products, args.flows, args.units, args.months), preset)
+    )
+
+    workdir = args.workdir or tempfile.mkdtemp(prefix="jodi_bench_")
+    try:
+        results = run_suite(workdir, scale, args.split_format, max(1, args.repeat), args.seed, args.stages, args.quiet)
+    finally:
+        if not args.workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    if args.output:
+        _write_json(args.output, results)
+        if not args.quiet:
+            print(f"결과 저장: {args.output}")
+
+    if args.save_baseline:
+        _write_json(args.baseline, results)
+        print(f"기준선 저장: {args.baseline}")
+        return 0
+
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare_with_baseline(results, baseline, args.tolerance, args.memory_tolerance)
+        if regressions:
+            print("❌ 성능 회귀 감지:")
+            for line in regressions:
+                print(f"  - {line}")
+            return 1
+        print("✅ 기준선 대비 회귀 없음")
+    elif not args.quiet:
+        print(f"기준선 없음 ({args.baseline}); --save-baseline 으로 생성하세요.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+    raise SystemExit(main())
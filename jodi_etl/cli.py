@@ -1,19 +1,33 @@
 #!/usr/bin/env python3
 import argparse
+import hashlib
+import json
 import os
+import shutil
 import sys
 import time
 import zipfile
-from typing import List
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
 
 import requests
 
+try:
+    import run_metrics
+except ImportError:  # run as a script from jodi_etl/
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    import run_metrics
+
 # Official JODI Oil monthly CSV bundles (world)
 WORLD_PRIMARY_ZIP_URL = "https://www.jodidata.org/_resources/files/downloads/oil-data/world_primary_csv.zip?iid=163"
 WORLD_SECONDARY_ZIP_URL = "https://www.jodidata.org/_resources/files/downloads/oil-data/world_secondary_csv.zip?iid=163"
 
 # Default output directory inside this package
 DEFAULT_OUTDIR = os.path.join(os.path.dirname(__file__), "data")
+# Incremental fetch bookkeeping (HTTP validators + per-partition hashes)
+FETCH_STATE_FILE = "fetch_state.json"
+# Change manifest written under <outdir>/split after every fetch (full fetches list all partitions)
+MANIFEST_FILE = "_manifest.json"
 
 
 def ensure_dir(path: str) -> None:
@@ -29,6 +43,69 @@ def download_file(url: str, dest: str, chunk: int = 1024 * 1024) -> None:
                 f.write(part)
 
 
+def download_file_conditional(url: str, dest: str, validators: Optional[Dict[str, str]] = None,
+                              chunk: int = 1024 * 1024) -> Tuple[bool, Dict[str, str]]:
+    """Download url to dest unless the server reports it unchanged (HTTP 304).
+
+    Returns (downloaded, validators) where validators holds ETag/Last-Modified.
+    """
+    validators = dict(validators or {})
+    headers = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+    r = requests.get(url, stream=True, timeout=300, headers=headers)
+    if r.status_code == 304:
+        r.close()
+        return False, validators
+    r.raise_for_status()
+    with open(dest, "wb") as f:
+        for part in r.iter_content(chunk_size=chunk):
+            if part:
+                f.write(part)
+    new_validators = {}
+    if r.headers.get("ETag"):
+        new_validators["etag"] = r.headers["ETag"]
+    if r.headers.get("Last-Modified"):
+        new_validators["last_modified"] = r.headers["Last-Modified"]
+    return True, new_validators
+
+
+def file_sha256(path: str, chunk: int = 1024 * 1024) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(chunk), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def load_fetch_state(out_dir: str) -> dict:
+    path = os.path.join(out_dir, FETCH_STATE_FILE)
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_fetch_state(out_dir: str, state: dict) -> None:
+    path = os.path.join(out_dir, FETCH_STATE_FILE)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=1, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def load_change_manifest(out_dir: str = DEFAULT_OUTDIR) -> Optional[dict]:
+    """Return the last fetch change manifest, or None if there is none."""
+    try:
+        with open(os.path.join(out_dir, "split", MANIFEST_FILE), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
 def extract_csvs_from_zip(zip_path: str, out_dir: str) -> List[str]:
     """Extract all CSV files from the zip into out_dir, preserving filenames and contents."""
     saved: List[str] = []
@@ -45,34 +122,259 @@ def extract_csvs_from_zip(zip_path: str, out_dir: str) -> List[str]:
     return saved
 
 
-def split_csv_by_country(csv_path: str, out_dir: str, fmt: str = "csv") -> List[str]:
-    import pandas as pd
+# Dimension columns stored as categorical (dictionary-encoded) codes
+SPLIT_CATEGORY_COLUMNS = ["REF_AREA", "ENERGY_PRODUCT", "FLOW_BREAKDOWN", "UNIT_MEASURE", "ASSESSMENT_CODE"]
+# JODI placeholders for missing observations
+MISSING_VALUE_TOKENS = ["-", "x", "N/A", ".."]
+DEFAULT_CHUNKSIZE = 500_000
 
-    df = pd.read_csv(csv_path, dtype=str)
-    out_paths: List[str] = []
 
-    # Normalise values
-    df["REF_AREA"] = df["REF_AREA"].astype(str).str.strip().str.upper()
+def _typed_chunk(chunk, categorical: bool):
+    """Normalise a raw CSV chunk; optionally convert to compact typed columns."""
+    import pandas as pd
 
-    for country, group in df.groupby("REF_AREA", sort=True):
-        if not country:
-            continue
-        country_dir = os.path.join(out_dir, country)
-        ensure_dir(country_dir)
-        base = os.path.splitext(os.path.basename(csv_path))[0]
-        file_stem = f"{base}_{country}"
-        if fmt == "parquet":
-            dest_path = os.path.join(country_dir, f"{file_stem}.parquet")
-            group.to_parquet(dest_path, index=False)
+    chunk["REF_AREA"] = chunk["REF_AREA"].astype(str).str.strip().str.upper()
+    if not categorical:
+        return chunk
+    for col in SPLIT_CATEGORY_COLUMNS:
+        if col in chunk.columns and col != "REF_AREA":
+            chunk[col] = chunk[col].str.strip().astype("category")
+    if "TIME_PERIOD" in chunk.columns:
+        chunk["TIME_PERIOD"] = pd.to_datetime(chunk["TIME_PERIOD"], format="%Y-%m", errors="coerce")
+    if "OBS_VALUE" in chunk.columns:
+        chunk["OBS_VALUE"] = pd.to_numeric(chunk["OBS_VALUE"], errors="coerce").astype("float32")
+    return chunk
+
+
+def _parquet_schema(columns: List[str]):
+    import pyarrow as pa
+
+    fields = []
+    for col in columns:
+        if col in SPLIT_CATEGORY_COLUMNS:
+            fields.append(pa.field(col, pa.dictionary(pa.int32(), pa.string())))
+        elif col == "TIME_PERIOD":
+            fields.append(pa.field(col, pa.timestamp("ms")))
+        elif col == "OBS_VALUE":
+            fields.append(pa.field(col, pa.float32()))
         else:
-            dest_path = os.path.join(country_dir, f"{file_stem}.csv")
-            group.to_csv(dest_path, index=False)
-        out_paths.append(dest_path)
+            fields.append(pa.field(col, pa.string()))
+    return pa.schema(fields)
+
+
+class _CountryWriters:
+    """Keep one open writer per country and flush buffered rows in bounded batches."""
+
+    def __init__(self, out_dir: str, base: str, fmt: str, max_buffered_rows: int):
+        self.out_dir = out_dir
+        self.base = base
+        self.fmt = fmt
+        self.max_buffered_rows = max_buffered_rows
+        self.buffers: dict = {}
+        self.buffered_rows = 0
+        self.writers: dict = {}
+        self.paths: dict = {}
+        self.schema = None
+
+    def _dest(self, country: str) -> str:
+        country_dir = os.path.join(self.out_dir, country)
+        ensure_dir(country_dir)
+        ext = "parquet" if self.fmt == "parquet" else "csv"
+        return os.path.join(country_dir, f"{self.base}_{country}.{ext}")
+
+    def add(self, country: str, frame) -> None:
+        self.buffers.setdefault(country, []).append(frame)
+        self.buffered_rows += len(frame)
+        if self.buffered_rows >= self.max_buffered_rows:
+            self.flush()
+
+    def flush(self) -> None:
+        import pandas as pd
+
+        for country, frames in self.buffers.items():
+            data = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+            if self.fmt == "parquet":
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+
+                if self.schema is None:
+                    self.schema = _parquet_schema(list(data.columns))
+                writer = self.writers.get(country)
+                if writer is None:
+                    dest = self._dest(country)
+                    writer = pq.ParquetWriter(dest + ".tmp", self.schema, compression="zstd")
+                    self.writers[country] = writer
+                    self.paths[country] = dest
+                table = pa.Table.from_pandas(data, preserve_index=False).cast(self.schema)
+                writer.write_table(table)
+            else:
+                fh = self.writers.get(country)
+                if fh is None:
+                    dest = self._dest(country)
+                    fh = open(dest + ".tmp", "w", encoding="utf-8", newline="")
+                    data.to_csv(fh, index=False)
+                    self.writers[country] = fh
+                    self.paths[country] = dest
+                else:
+                    data.to_csv(fh, index=False, header=False)
+        self.buffers = {}
+        self.buffered_rows = 0
+
+    def close(self) -> List[str]:
+        self.flush()
+        for country, writer in self.writers.items():
+            writer.close()
+            os.replace(self.paths[country] + ".tmp", self.paths[country])
+        return [self.paths[c] for c in sorted(self.paths)]
+
+
+def _split_stream(source, base: str, out_dir: str, fmt: str, chunksize: int) -> List[str]:
+    import pandas as pd
 
+    writers = _CountryWriters(out_dir, base, fmt, max_buffered_rows=chunksize)
+    reader = pd.read_csv(
+        source,
+        dtype=str,
+        chunksize=chunksize,
+        na_values=MISSING_VALUE_TOKENS if fmt == "parquet" else None,
+        keep_default_na=fmt == "parquet",
+    )
+    try:
+        for chunk in reader:
+            chunk = _typed_chunk(chunk, categorical=(fmt == "parquet"))
+            for country, group in chunk.groupby("REF_AREA", sort=False):
+                if not country:
+                    continue
+                writers.add(country, group)
+    except Exception:
+        for writer in writers.writers.values():
+            writer.close()
+        for dest in writers.paths.values():
+            try:
+                os.remove(dest + ".tmp")
+            except OSError:
+                pass
+        raise
+    return writers.close()
+
+
+def split_csv_by_country(csv_path: str, out_dir: str, fmt: str = "csv", chunksize: int = DEFAULT_CHUNKSIZE) -> List[str]:
+    """Stream a world CSV in chunks and write one file per REF_AREA.
+
+    Peak memory is bounded by `chunksize` rows. Parquet output is typed:
+    dictionary-encoded dimensions, float32 OBS_VALUE and a month TIME_PERIOD.
+    CSV output keeps the original text values.
+    """
+    base = os.path.splitext(os.path.basename(csv_path))[0]
+    return _split_stream(csv_path, base, out_dir, fmt, chunksize)
+
+
+def split_zip_by_country(zip_path: str, split_root: str, fmt: str = "csv", chunksize: int = DEFAULT_CHUNKSIZE) -> List[str]:
+    """Split every CSV member of a ZIP by country without extracting it to disk.
+
+    Members are routed to split_root/primary or split_root/secondary by name.
+    """
+    out_paths: List[str] = []
+    with zipfile.ZipFile(zip_path) as zf:
+        for name in zf.namelist():
+            if not name.lower().endswith(".csv"):
+                continue
+            base = os.path.splitext(os.path.basename(name))[0]
+            section_dir = os.path.join(split_root, "primary" if "Primary" in base else "secondary")
+            ensure_dir(section_dir)
+            with zf.open(name) as src:
+                out_paths.extend(_split_stream(src, base, section_dir, fmt, chunksize))
     return out_paths
 
 
+def split_zips_incremental(zip_paths: List[str], split_root: str, fmt: str, chunksize: int,
+                           state: dict) -> dict:
+    """Split ZIPs into a staging area and publish only partitions whose content changed.
+
+    Partition hashes are tracked in state["partitions"] keyed by path relative
+    to split_root. Returns the change manifest.
+    """
+    staging = os.path.join(split_root, ".staging")
+    shutil.rmtree(staging, ignore_errors=True)
+    ensure_dir(staging)
+    hashes: Dict[str, str] = state.setdefault("partitions", {})
+    changes: List[dict] = []
+    unchanged = 0
+    sections_seen: set = set()
+    produced: set = set()
+    ext = ".parquet" if fmt == "parquet" else ".csv"
+    try:
+        for zip_path in zip_paths:
+            for staged in split_zip_by_country(zip_path, staging, fmt=fmt, chunksize=chunksize):
+                rel = os.path.relpath(staged, staging).replace(os.sep, "/")
+                section, country = rel.split("/")[:2]
+                sections_seen.add(section)
+                produced.add(rel)
+                digest = file_sha256(staged)
+                target = os.path.join(split_root, rel)
+                if hashes.get(rel) == digest and os.path.exists(target):
+                    unchanged += 1
+                    continue
+                ensure_dir(os.path.dirname(target))
+                status = "changed" if os.path.exists(target) else "added"
+                os.replace(staged, target)
+                hashes[rel] = digest
+                changes.append({"section": section, "country": country, "path": rel, "status": status})
+        # Partitions that disappeared from a re-split section
+        for rel in sorted(hashes):
+            section, country = rel.split("/")[:2]
+            if section in sections_seen and rel.endswith(ext) and rel not in produced:
+                try:
+                    os.remove(os.path.join(split_root, rel))
+                except FileNotFoundError:
+                    pass
+                hashes.pop(rel, None)
+                changes.append({"section": section, "country": country, "path": rel, "status": "removed"})
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+    return {
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "format": fmt,
+        "sections": sorted(sections_seen),
+        "changed": changes,
+        "changed_countries": sorted({c["country"] for c in changes}),
+        "unchanged": unchanged,
+    }
+
+
+def full_change_manifest(written: List[str], split_root: str, fmt: str) -> dict:
+    """Manifest for a full (non-incremental) split: every written partition counts as changed."""
+    changes = []
+    for path in written:
+        rel = os.path.relpath(path, split_root).replace(os.sep, "/")
+        section, country = rel.split("/")[:2]
+        changes.append({"section": section, "country": country, "path": rel, "status": "changed"})
+    return {
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "format": fmt,
+        "sections": sorted({c["section"] for c in changes}),
+        "changed": changes,
+        "changed_countries": sorted({c["country"] for c in changes}),
+        "unchanged": 0,
+    }
+
+
+def write_change_manifest(split_root: str, manifest: dict) -> str:
+    path = os.path.join(split_root, MANIFEST_FILE)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1, ensure_ascii=False)
+    os.replace(tmp, path)
+    return path
+
+
 def cmd_fetch(args: argparse.Namespace) -> None:
+    ensure_dir(args.outdir)
+    with run_metrics.profiled("jodi.cmd_fetch", out_dir=args.outdir):
+        _cmd_fetch(args)
+
+
+def _cmd_fetch(args: argparse.Namespace) -> None:
     start = time.time()
     out_dir = args.outdir
     ensure_dir(out_dir)
@@ -80,48 +382,51 @@ def cmd_fetch(args: argparse.Namespace) -> None:
     # Download zips
     primary_zip = os.path.join(out_dir, "world_primary_csv.zip")
     secondary_zip = os.path.join(out_dir, "world_secondary_csv.zip")
+    incremental = getattr(args, "incremental", False)
+    state = load_fetch_state(out_dir) if incremental else {}
+    http_state = state.setdefault("http", {})
+
+    to_split: List[str] = []
+    for label, url, dest in (("primary", args.primary_url, primary_zip), ("secondary", args.secondary_url, secondary_zip)):
+        if not args.quiet:
+            print(f"Downloading {label} ZIP…")
+        if incremental:
+            downloaded, validators = download_file_conditional(url, dest, http_state.get(url))
+            if not downloaded:
+                if not args.quiet:
+                    print(f"{label} ZIP not modified; skipping")
+                continue
+            http_state[url] = validators
+        else:
+            download_file(url, dest)
+        to_split.append(dest)
 
-    if not args.quiet:
-        print("Downloading primary ZIP…")
-    download_file(args.primary_url, primary_zip)
-
-    if not args.quiet:
-        print("Downloading secondary ZIP…")
-    download_file(args.secondary_url, secondary_zip)
-
-    # Extract CSVs unchanged
-    if not args.quiet:
-        print("Extracting CSVs…")
-    primary_csvs = extract_csvs_from_zip(primary_zip, out_dir)
-    secondary_csvs = extract_csvs_from_zip(secondary_zip, out_dir)
-
-    # Split by country
+    # Split by country straight from the ZIP members (no extracted CSVs)
     split_format = args.split_format
     split_out = os.path.join(out_dir, "split")
     ensure_dir(split_out)
+    chunksize = getattr(args, "chunksize", DEFAULT_CHUNKSIZE)
 
     if not args.quiet:
         print(f"Splitting CSVs by country into {split_format.upper()} format…")
 
-    for csv_file in primary_csvs + secondary_csvs:
-        basename = os.path.basename(csv_file)
-        section_dir = os.path.join(split_out, "primary" if "Primary" in basename else "secondary")
-        ensure_dir(section_dir)
-        split_csv_by_country(csv_file, section_dir, fmt=split_format)
-
-        # Remove original bulky CSV after successful split
-        try:
-            os.remove(csv_file)
-            if not args.quiet:
-                print(f"Deleted extracted CSV: {csv_file}")
-        except FileNotFoundError:
-            pass
-        except OSError as exc:
-            if not args.quiet:
-                print(f"Warning: could not delete {csv_file}: {exc}")
+    written: List[str] = []
+    if incremental:
+        manifest = split_zips_incremental(to_split, split_out, split_format, chunksize, state)
+        manifest_path = write_change_manifest(split_out, manifest)
+        save_fetch_state(out_dir, state)
+        written = [os.path.join(split_out, c["path"]) for c in manifest["changed"] if c["status"] != "removed"]
+        if not args.quiet:
+            print(f"{len(manifest['changed'])} partitions changed, {manifest['unchanged']} unchanged; manifest: {manifest_path}")
+    else:
+        for zip_path in to_split:
+            written.extend(split_zip_by_country(zip_path, split_out, fmt=split_format, chunksize=chunksize))
+        # Downstream caches (JODI cube, chart cache) key off the manifest, so a full
+        # re-split must publish one too or they keep serving the previous data
+        write_change_manifest(split_out, full_change_manifest(written, split_out, split_format))
 
     # Remove temporary ZIP archives to conserve disk space
-    for zip_path in (primary_zip, secondary_zip):
+    for zip_path in to_split:
         try:
             os.remove(zip_path)
             if not args.quiet:
@@ -133,10 +438,7 @@ def cmd_fetch(args: argparse.Namespace) -> None:
                 print(f"Warning: could not delete {zip_path}: {exc}")
 
     if not args.quiet:
-        for p in primary_csvs:
-            print(f"Saved: {p}")
-        for s in secondary_csvs:
-            print(f"Saved: {s}")
+        print(f"Saved {len(written)} country files under {split_out}")
 
     elapsed = time.time() - start
     if not args.quiet:
@@ -152,10 +454,17 @@ def main(argv=None) -> int:
     f.add_argument("--primary-url", default=WORLD_PRIMARY_ZIP_URL)
     f.add_argument("--secondary-url", default=WORLD_SECONDARY_ZIP_URL)
     f.add_argument("--split-format", choices=["csv", "parquet"], default="csv", help="File format for split output")
+    f.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE, help="Rows per streamed CSV chunk (bounds peak memory)")
+    f.add_argument("--incremental", action="store_true",
+                   help="Conditional GET on the ZIPs and rewrite only country files whose content changed")
     f.add_argument("--quiet", action="store_true")
+    f.add_argument("--profile", nargs="?", const="cprofile,memory", default=None, metavar="MODES",
+                   help="Profile the fetch (cprofile,sample,memory or all); writes to <outdir>/profiles/")
     f.set_defaults(func=cmd_fetch)
 
     args = p.parse_args(argv)
+    if getattr(args, "profile", None):
+        run_metrics.enable_profiling(args.profile)
     args.func(args)
     return 0
 
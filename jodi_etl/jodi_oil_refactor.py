@@ -19,10 +19,12 @@ Examples of codes:
 import os
 import sys
 import json
+import hashlib
 import pandas as pd
 import numpy as np
 from datetime import datetime, date
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Any
 import plotly.graph_objects as go
 from pathlib import Path
@@ -54,6 +56,8 @@ try:
         FONT_SIZE_ANNOTATION,
         calculate_title_position,
         create_five_year_comparison_chart,
+        chart_cache,
+        chart_fingerprint,
     )
 except ImportError:
     sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'us_eco'))
@@ -74,6 +78,8 @@ except ImportError:
         FONT_SIZE_ANNOTATION,
         calculate_title_position,
         create_five_year_comparison_chart,
+        chart_cache,
+        chart_fingerprint,
     )
 
 try:
@@ -88,11 +94,15 @@ except Exception:
 # -----------------------------------------------------------------------------
 
 BASE_DIR = os.path.dirname(__file__)
-JODI_DATA_DIR = os.path.join(BASE_DIR, "data")
+# JODI_DATA_DIR env overrides the data root (e.g. synthetic data for benchmarks)
+JODI_DATA_DIR = os.environ.get("JODI_DATA_DIR") or os.path.join(BASE_DIR, "data")
 PRIMARY_CSV = os.path.join(JODI_DATA_DIR, "NewProcedure_Primary_CSV.csv")
 SECONDARY_CSV = os.path.join(JODI_DATA_DIR, "NewProcedure_Secondary_CSV.csv")
 CACHE_DIR = os.path.join(JODI_DATA_DIR, "_cache")
-CACHE_VERSION = "v2"
+FRAME_CACHE_DIR = os.path.join(CACHE_DIR, "frames")
+SOURCE_HASH_INDEX = os.path.join(CACHE_DIR, "source_hashes.json")
+# Schema version of cached finalized frames; bump when _finalize_jodi_frame changes
+CACHE_VERSION = "v3"
 CACHE_COLUMNS = [
     "REF_AREA",
     "TIME_PERIOD",
@@ -311,6 +321,7 @@ def _update_jodi_data(outdir: str) -> tuple[bool, str]:
         primary_url=jodi_cli.WORLD_PRIMARY_ZIP_URL,
         secondary_url=jodi_cli.WORLD_SECONDARY_ZIP_URL,
         split_format="csv",
+        incremental=True,
         quiet=True,
     )
 
@@ -319,6 +330,11 @@ def _update_jodi_data(outdir: str) -> tuple[bool, str]:
     except Exception as exc:  # pragma: no cover - network/IO heavy path
         return False, f"데이터 업데이트 실패: {exc}"
 
+    try:
+        ensure_jodi_cube()  # rebuilds only if the fetch manifest lists changed partitions
+    except Exception as exc:  # pragma: no cover - cube is rebuilt lazily on next load
+        print(f"⚠️ JODI 큐브 갱신 실패: {exc}")
+
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
     return True, f"데이터 업데이트가 완료되었습니다. ({timestamp})"
 
@@ -669,88 +685,95 @@ def _build_combined_dataframe_jodi(selected_infos: list[dict[str, Any]], dtype_m
     return combined, label_dtype
 
 
+def _upper_combo_values(series: pd.Series) -> np.ndarray:
+    """Return stripped, uppercased strings for a combo column via its categories."""
+    cat = series.astype("category")
+    labels = np.array([str(c).strip().upper() for c in cat.cat.categories] + ["NAN"], dtype=object)
+    return labels[cat.cat.codes.to_numpy()]
+
+
 def build_jodi_series_registry(combos: pd.DataFrame) -> tuple[dict[str, dict[str, Any]], list[dict[str, Any]], list[str]]:
-    registry: dict[str, dict[str, Any]] = {}
-    tree_sections: dict[str, dict[str, Any]] = {}
-
-    for _, row in combos.iterrows():
-        section = str(row["SECTION"]).upper()
-        country = str(row["REF_AREA"]).upper()
-        product = str(row["ENERGY_PRODUCT"]).upper()
-        flow = str(row["FLOW_BREAKDOWN"]).upper()
-        unit = str(row["UNIT_MEASURE"]).upper()
-        display_label = _series_simple_label(country, product, flow)
-        unit_label = _unit_label(unit)
-        leaf_label = f"{display_label} · {unit_label}" if unit_label else display_label
-        key = sectioned_series_key(section, country, product, flow, unit)
-
-        registry[key] = {
+    """Build the series registry, the section → country → product → flow tree and default keys.
+
+    Labels and keys are computed column-wise (label helpers run once per
+    distinct code); the tree is assembled in one pass over the rows sorted by
+    the four tree levels. Registry order follows `combos`.
+    """
+    if combos.empty:
+        return {}, [], []
+
+    sec = _upper_combo_values(combos["SECTION"])
+    cty = _upper_combo_values(combos["REF_AREA"])
+    prod = _upper_combo_values(combos["ENERGY_PRODUCT"])
+    flow = _upper_combo_values(combos["FLOW_BREAKDOWN"])
+    unit = _upper_combo_values(combos["UNIT_MEASURE"])
+    codes = pd.DataFrame({
+        "SECTION": sec,
+        "REF_AREA": cty,
+        "ENERGY_PRODUCT": prod,
+        "FLOW_BREAKDOWN": flow,
+        "UNIT_MEASURE": unit,
+    })
+
+    if "DISPLAY_LABEL" in combos.columns:
+        display = pd.Series(combos["DISPLAY_LABEL"].astype(str).to_numpy(), dtype=object)
+    else:
+        display = pd.Series(_combo_display_labels(codes).to_numpy(), dtype=object)
+    unit_labels = codes["UNIT_MEASURE"].map({u: _unit_label(u) for u in codes["UNIT_MEASURE"].unique()})
+    leaf = display.where(unit_labels == "", display + " · " + unit_labels)
+    base_key = codes["REF_AREA"] + "_" + codes["ENERGY_PRODUCT"] + "_" + codes["FLOW_BREAKDOWN"] + "_" + codes["UNIT_MEASURE"]
+    keys = base_key.where(codes["SECTION"] == "", codes["SECTION"] + "_" + base_key)
+
+    data_types = [key for key, _ in STANDARD_DATA_KEYS]
+    registry: dict[str, dict[str, Any]] = {
+        key: {
             "key": key,
-            "section": section,
-            "country": country,
-            "product": product,
-            "flow": flow,
-            "unit": unit,
-            "display_label": display_label,
-            "leaf_label": leaf_label,
-            "series_label": display_label,
-            "unit_label": unit_label,
-            "column_tuple": (section, country, product, flow, unit),
-            "series_spec": {
-                "section": section,
-                "country": country,
-                "product": product,
-                "flow": flow,
-                "unit": unit,
-            },
-            "available_types": [key for key, _ in STANDARD_DATA_KEYS],
+            "section": s,
+            "country": c,
+            "product": p,
+            "flow": f,
+            "unit": u,
+            "display_label": d,
+            "leaf_label": lf,
+            "series_label": d,
+            "unit_label": ul,
+            "column_tuple": (s, c, p, f, u),
+            "series_spec": {"section": s, "country": c, "product": p, "flow": f, "unit": u},
+            "available_types": list(data_types),
         }
+        for key, s, c, p, f, u, d, lf, ul in zip(keys, sec, cty, prod, flow, unit, display, leaf, unit_labels)
+    }
 
-        section_node = tree_sections.setdefault(section, {"label": _section_label(section), "value": f"section::{section}", "children": {}})
-        country_nodes = section_node["children"]
-        country_node = country_nodes.setdefault(country, {"label": _country_label(country), "value": f"country::{section}::{country}", "children": {}})
-        product_nodes = country_node["children"]
-        product_node = product_nodes.setdefault(product, {"label": _product_label(product), "value": f"product::{section}::{country}::{product}", "children": {}})
-        flow_nodes = product_node["children"]
-        flow_node = flow_nodes.setdefault(flow, {"label": _flow_label(flow), "value": f"flow::{section}::{country}::{product}::{flow}", "children": []})
-        flow_children = flow_node["children"]
-        flow_children.append({"label": leaf_label, "value": key})
+    section_labels = {s: _section_label(s) for s in set(sec)}
+    country_labels = {c: _country_label(c) for c in set(cty)}
+    product_labels = {p: _product_label(p) for p in set(prod)}
+    flow_labels = {f: _flow_label(f) for f in set(flow)}
 
+    order = codes.sort_values(["SECTION", "REF_AREA", "ENERGY_PRODUCT", "FLOW_BREAKDOWN"], kind="mergesort").index
     tree_nodes: list[dict[str, Any]] = []
-    for section_key in sorted(tree_sections.keys()):
-        section_node = tree_sections[section_key]
-        country_nodes = []
-        for country_key in sorted(section_node["children"].keys()):
-            country_node = section_node["children"][country_key]
+    prev: tuple = (None, None, None, None)
+    country_nodes = product_nodes = flow_nodes = leaves = None
+    for i in order:
+        s, c, p, f = sec[i], cty[i], prod[i], flow[i]
+        if s != prev[0]:
+            country_nodes = []
+            tree_nodes.append({"label": section_labels[s], "value": f"section::{s}", "children": country_nodes})
+            prev = (s, None, None, None)
+        if c != prev[1]:
             product_nodes = []
-            for product_key in sorted(country_node["children"].keys()):
-                product_node = country_node["children"][product_key]
-                flow_nodes = []
-                for flow_key in sorted(product_node["children"].keys()):
-                    flow_node = product_node["children"][flow_key]
-                    flow_node_struct = {
-                        "label": flow_node["label"],
-                        "value": flow_node["value"],
-                        "children": flow_node["children"],
-                    }
-                    flow_nodes.append(flow_node_struct)
-                product_nodes.append({
-                    "label": product_node["label"],
-                    "value": product_node["value"],
-                    "children": flow_nodes,
-                })
-            country_nodes.append({
-                "label": country_node["label"],
-                "value": country_node["value"],
-                "children": product_nodes,
-            })
-        tree_nodes.append({
-            "label": section_node["label"],
-            "value": section_node["value"],
-            "children": country_nodes,
-        })
-
-    default_checked = [key for key in list(registry.keys())[:2]]
+            country_nodes.append({"label": country_labels[c], "value": f"country::{s}::{c}", "children": product_nodes})
+            prev = (s, c, None, None)
+        if p != prev[2]:
+            flow_nodes = []
+            product_nodes.append({"label": product_labels[p], "value": f"product::{s}::{c}::{p}", "children": flow_nodes})
+            prev = (s, c, p, None)
+        if f != prev[3]:
+            leaves = []
+            flow_nodes.append({"label": flow_labels[f], "value": f"flow::{s}::{c}::{p}::{f}", "children": leaves})
+            prev = (s, c, p, f)
+        leaves.append({"label": leaf.iat[i], "value": keys.iat[i]})
+
+    default_checked = list(registry.keys())[:2]
     return registry, tree_nodes, default_checked
 
 
@@ -1034,9 +1057,11 @@ def _create_monthly_five_year_chart(
     recent_years: int,
     chart_width: int,
     chart_height: int,
+    formatted: pd.DataFrame | None = None,
 ) -> tuple[Optional[object], Optional[pd.DataFrame]]:
     history_years = max(recent_years, 5)
-    formatted = _make_monthly_five_year_format(series, history_years=history_years)
+    if formatted is None:
+        formatted = _make_monthly_five_year_format(series, history_years=history_years)
     if formatted is None or formatted.dropna(how="all").empty:
         return None, None
 
@@ -1062,15 +1087,59 @@ def _normalize_country(code: str) -> str:
 
 
 def _ensure_cache_dir() -> None:
-    if not os.path.isdir(CACHE_DIR):
-        os.makedirs(CACHE_DIR, exist_ok=True)
+    if not os.path.isdir(FRAME_CACHE_DIR):
+        os.makedirs(FRAME_CACHE_DIR, exist_ok=True)
+
 
+def _load_hash_index() -> dict[str, dict[str, Any]]:
+    try:
+        with open(SOURCE_HASH_INDEX, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
 
-def _cache_path_for_csv(csv_path: str) -> str:
-    """Return a deterministic pickle cache path for a CSV."""
-    fname = os.path.basename(csv_path)
-    safe_name, _ = os.path.splitext(fname)
-    return os.path.join(CACHE_DIR, f"{safe_name}.{CACHE_VERSION}{CACHE_EXT}")
+
+def _save_hash_index(index: dict[str, dict[str, Any]]) -> None:
+    try:
+        _ensure_cache_dir()
+        tmp = SOURCE_HASH_INDEX + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(index, f, indent=1)
+        os.replace(tmp, SOURCE_HASH_INDEX)
+    except OSError:
+        pass
+
+
+def _source_digest(path: str, index: dict[str, dict[str, Any]]) -> str:
+    """Return the sha256 of a source file, rehashing only when its size or mtime changed."""
+    rel = os.path.relpath(path, JODI_DATA_DIR).replace(os.sep, "/")
+    stat = os.stat(path)
+    entry = index.get(rel)
+    if entry and entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns:
+        return entry["sha256"]
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    index[rel] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": digest.hexdigest()}
+    return index[rel]["sha256"]
+
+
+def _frame_cache_key(section: str, sources: list[str]) -> str:
+    """Content address of a finalized section frame: schema version + source hashes."""
+    index = _load_hash_index()
+    known = dict(index)
+    key = hashlib.sha256(f"{CACHE_VERSION}|{section}".encode())
+    for path in sorted(sources):
+        rel = os.path.relpath(path, JODI_DATA_DIR).replace(os.sep, "/")
+        key.update(f"|{rel}={_source_digest(path, index)}".encode())
+    if index != known:
+        _save_hash_index(index)
+    return key.hexdigest()
+
+
+def _frame_cache_path(section: str, key: str) -> str:
+    return os.path.join(FRAME_CACHE_DIR, f"{section.lower()}-{key[:24]}{CACHE_EXT}")
 
 
 def _load_cached_frame(cache_path: str) -> Optional[pd.DataFrame]:
@@ -1078,23 +1147,55 @@ def _load_cached_frame(cache_path: str) -> Optional[pd.DataFrame]:
         return None
     try:
         if CACHE_BACKEND == "feather":
-            return pd.read_feather(cache_path)
+            from pyarrow import feather
+
+            table = feather.read_table(cache_path, memory_map=True)
+            return table.to_pandas(split_blocks=True)
         return pd.read_pickle(cache_path)
     except Exception:
         return None
 
 
-def _store_cached_frame(df: pd.DataFrame, cache_path: str) -> None:
+def _store_cached_frame(df: pd.DataFrame, cache_path: str, section: str) -> None:
+    """Write a finalized frame atomically and drop superseded entries of the same section."""
     try:
         _ensure_cache_dir()
+        tmp = cache_path + ".tmp"
         if CACHE_BACKEND == "feather":
-            df.to_feather(cache_path, version=2)
+            # Uncompressed so memory-mapped reads need no decode pass
+            df.reset_index(drop=True).to_feather(tmp, compression="uncompressed")
         else:
-            df.to_pickle(cache_path)
+            df.reset_index(drop=True).to_pickle(tmp)
+        os.replace(tmp, cache_path)
+        prefix = f"{section.lower()}-"
+        for fname in os.listdir(FRAME_CACHE_DIR):
+            fpath = os.path.join(FRAME_CACHE_DIR, fname)
+            if fname.startswith(prefix) and fpath != cache_path:
+                os.remove(fpath)
     except Exception:
         pass  # caching failure should not break execution
 
 
+def _cached_jodi_frame(section: str, sources: list[str], loader) -> Optional[pd.DataFrame]:
+    """Return the finalized frame for `sources`, from the content-addressed cache when possible.
+
+    `loader()` returns (frame, complete); incomplete frames (e.g. a partition
+    failed to read) are served but not cached.
+    """
+    canonical_section = section.upper()
+    try:
+        cache_path = _frame_cache_path(canonical_section, _frame_cache_key(canonical_section, sources))
+    except OSError:
+        return loader()[0]
+    cached = _load_cached_frame(cache_path)
+    if cached is not None:
+        return cached
+    df, complete = loader()
+    if df is not None and complete:
+        _store_cached_frame(df, cache_path, canonical_section)
+    return df
+
+
 def _normalize_category(series: pd.Series, uppercase: bool = True) -> pd.Series:
     """Return a categorical Series with trimmed/uppercased categories."""
 
@@ -1148,41 +1249,95 @@ def _finalize_jodi_frame(df: pd.DataFrame, section: str) -> pd.DataFrame:
     return df
 
 
+def _parse_jodi_csv(path: str, section: str) -> pd.DataFrame:
+    df = pd.read_csv(path, dtype=str, usecols=CACHE_COLUMNS)
+    val = df["OBS_VALUE"].astype(str).str.strip().replace({"-": np.nan, "x": np.nan, "N/A": np.nan, "..": np.nan})
+    df["VALUE_NUM"] = val
+    return _finalize_jodi_frame(df, section.upper())
+
+
 def _read_jodi_csv(path: str, section: str) -> pd.DataFrame:
     if not os.path.exists(path):
         raise FileNotFoundError(f"CSV not found: {path}")
+    return _cached_jodi_frame(section, [path], lambda: (_parse_jodi_csv(path, section), True))
 
-    canonical_section = section.upper()
-    cache_path = _cache_path_for_csv(path)
-    csv_mtime = os.path.getmtime(path)
-    cache_df = _load_cached_frame(cache_path)
-    if cache_df is not None and "VALUE_NUM" in cache_df.columns:
-        cache_mtime = os.path.getmtime(cache_path)
-        if cache_mtime >= csv_mtime:
-            if cache_df.empty:
-                return cache_df
-            if "SECTION" in cache_df.columns:
-                cached_section = str(cache_df["SECTION"].iloc[0]).upper()
-                if cached_section == canonical_section:
-                    return _finalize_jodi_frame(cache_df, canonical_section)
 
-    df = pd.read_csv(path, dtype=str, usecols=CACHE_COLUMNS)
-    val = df["OBS_VALUE"].astype(str).str.strip().replace({"-": np.nan, "x": np.nan, "N/A": np.nan, "..": np.nan})
-    df["VALUE_NUM"] = val
+JODI_DIMENSION_COLUMNS = ["REF_AREA", "ENERGY_PRODUCT", "FLOW_BREAKDOWN", "UNIT_MEASURE"]
+JODI_MISSING_TOKENS = {"-": np.nan, "x": np.nan, "N/A": np.nan, "..": np.nan}
+
+
+def _parse_time_period(series: pd.Series) -> pd.Series:
+    """Return month-start timestamps from datetime or 'YYYY-MM' string input."""
+    if np.issubdtype(series.dtype, np.datetime64):
+        return series
+    parsed = pd.to_datetime(series, format="%Y-%m", errors="coerce")
+    if parsed.isna().all() and series.notna().any():
+        parsed = pd.to_datetime(series, errors="coerce")
+    return parsed
+
 
-    df = _finalize_jodi_frame(df, canonical_section)
+def _read_split_partition(ext_lower: str, fpath: str, filters: dict[str, list[str]] | None = None) -> pd.DataFrame:
+    """Read one country partition with column projection, keeping native dtypes.
 
-    _store_cached_frame(df, cache_path)
+    `filters` maps dimension columns to allowed values; Parquet partitions push
+    them into the reader, CSV partitions apply them right after parsing.
+    """
+    if ext_lower == ".csv":
+        dtypes = {col: "category" for col in JODI_DIMENSION_COLUMNS}
+        dtypes.update({"TIME_PERIOD": str, "OBS_VALUE": str})
+        df = pd.read_csv(fpath, usecols=CACHE_COLUMNS, dtype=dtypes)
+        if filters:
+            mask = np.ones(len(df), dtype=bool)
+            for col, allowed in filters.items():
+                mask &= df[col].astype(str).str.strip().str.upper().isin(allowed).to_numpy()
+            df = df.loc[mask].reset_index(drop=True)
+    else:
+        pushdown = [(col, "in", list(allowed)) for col, allowed in (filters or {}).items()]
+        df = pd.read_parquet(fpath, columns=CACHE_COLUMNS, filters=pushdown or None)
+
+    values = df.pop("OBS_VALUE")
+    # Text partitions (object / string / pandas 3 "str" / category) need token cleanup
+    if not pd.api.types.is_numeric_dtype(values):
+        values = pd.to_numeric(values.astype("string").str.strip().replace(JODI_MISSING_TOKENS), errors="coerce")
+    df["VALUE_NUM"] = values.astype("float32")
+    df["TIME_PERIOD"] = _parse_time_period(df["TIME_PERIOD"])
+    for col in JODI_DIMENSION_COLUMNS:
+        if df[col].dtype.name != "category":
+            df[col] = df[col].astype("category")
     return df
 
 
-def _load_split_section(section: str) -> pd.DataFrame | None:
-    split_dir = os.path.join(JODI_DATA_DIR, "split", section.lower())
+def _concat_categorical_frames(frames: list[pd.DataFrame], columns: list[str]) -> pd.DataFrame:
+    """Concatenate frames, unifying categories first so categorical dtypes survive."""
+    for col in columns:
+        cats = pd.Index([])
+        for frame in frames:
+            cats = cats.union(frame[col].cat.categories)
+        for frame in frames:
+            frame[col] = frame[col].cat.set_categories(cats)
+    return pd.concat(frames, ignore_index=True)
+
+
+def _split_section_dir(section: str) -> str:
+    return os.path.join(JODI_DATA_DIR, "split", section.lower())
+
+
+def _split_partition_files(section: str, countries: list[str] | None = None) -> list[tuple[str, str]]:
+    """Return (ext, path) per partition under data/split/{section}, one file per base name.
+
+    With `countries`, only the matching REF_AREA directories are listed.
+    """
+    split_dir = _split_section_dir(section)
     if not os.path.isdir(split_dir):
-        return None
+        return []
 
-    frames: list[pd.DataFrame] = []
-    for root, _, files in os.walk(split_dir):
+    if countries is None:
+        roots = [split_dir]
+    else:
+        roots = [os.path.join(split_dir, c) for c in countries if os.path.isdir(os.path.join(split_dir, c))]
+
+    selected: list[tuple[str, str]] = []
+    for root, _, files in (entry for r in roots for entry in os.walk(r)):
         chosen: dict[str, tuple[str, str]] = {}
         for fname in files:
             base, ext = os.path.splitext(fname)
@@ -1201,27 +1356,41 @@ def _load_split_section(section: str) -> pd.DataFrame | None:
                 chosen[base] = (ext_lower, fpath)
             elif new_mtime == current_mtime and current_ext != ".parquet" and ext_lower == ".parquet":
                 chosen[base] = (ext_lower, fpath)
+        selected.extend(chosen.values())
+    return sorted(selected, key=lambda item: item[1])
 
-        for ext_lower, fpath in chosen.values():
-            try:
-                if ext_lower == ".csv":
-                    df = pd.read_csv(fpath, dtype=str)
-                else:
-                    df = pd.read_parquet(fpath)
-                    df = df.astype(str)
-            except Exception as exc:
-                print(f"⚠️ {fpath} 로드에 실패했습니다: {exc}")
-                continue
 
-            if "OBS_VALUE" in df.columns and "VALUE_NUM" not in df.columns:
-                val = df["OBS_VALUE"].astype(str).str.strip().replace({"-": np.nan, "x": np.nan, "N/A": np.nan, "..": np.nan})
-                df["VALUE_NUM"] = val
+def _load_split_section(section: str) -> pd.DataFrame | None:
+    partitions = _split_partition_files(section)
+    if not partitions:
+        return None
+    return _cached_jodi_frame(
+        section,
+        [fpath for _, fpath in partitions],
+        lambda: _read_split_section(section, partitions),
+    )
 
-            frames.append(_finalize_jodi_frame(df, section))
+
+def _read_split_section(section: str, partitions: list[tuple[str, str]]) -> tuple[pd.DataFrame | None, bool]:
+    """Read and finalize all partitions; the flag is False if any partition failed."""
+
+    def _safe_read(item: tuple[str, str]) -> pd.DataFrame | None:
+        ext_lower, fpath = item
+        try:
+            return _read_split_partition(ext_lower, fpath)
+        except Exception as exc:
+            print(f"⚠️ {fpath} 로드에 실패했습니다: {exc}")
+            return None
+
+    workers = int(os.environ.get("JODI_LOAD_WORKERS", str(min(16, (os.cpu_count() or 4) * 2))))
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        results = list(pool.map(_safe_read, partitions))
+    frames = [df for df in results if df is not None]
 
     if not frames:
-        return None
-    return pd.concat(frames, ignore_index=True)
+        return None, False
+    df = _concat_categorical_frames(frames, JODI_DIMENSION_COLUMNS)
+    return _finalize_jodi_frame(df, section), len(frames) == len(results)
 
 
 def load_jodi_base() -> pd.DataFrame:
@@ -1237,6 +1406,50 @@ def load_jodi_base() -> pd.DataFrame:
     return df
 
 
+def _normalize_series_specs(series_defs: dict) -> dict[str, tuple[str, str, str, str, str]]:
+    """Return {name: (section, country, product, flow, unit)} with canonical codes."""
+    specs: dict[str, tuple[str, str, str, str, str]] = {}
+    for name, spec in series_defs.items():
+        specs[name] = (
+            spec.get("section", "").upper().strip(),
+            _normalize_country(spec.get("country", "")),
+            spec.get("product", "").upper().strip(),
+            spec.get("flow", "").upper().strip(),
+            spec.get("unit", "").upper().strip(),
+        )
+    return specs
+
+
+def _resolve_series_grouped(df: pd.DataFrame, specs: dict[str, tuple[str, str, str, str, str]], start_ts: pd.Timestamp) -> pd.DataFrame:
+    """Resolve all requested series from `df` with one filter and one grouped sum."""
+    if not specs:
+        return pd.DataFrame()
+    dims = ["REF_AREA", "ENERGY_PRODUCT", "FLOW_BREAKDOWN", "UNIT_MEASURE"]
+    mask = np.ones(len(df), dtype=bool)
+    for pos, col in enumerate(dims, start=1):
+        mask &= df[col].isin({spec[pos] for spec in specs.values()}).to_numpy()
+    sub = df.loc[mask, [*dims, "SECTION", "TIME_PERIOD", "VALUE_NUM"]]
+    grouped = sub.groupby([*dims, "SECTION", "TIME_PERIOD"], observed=True)["VALUE_NUM"].sum()
+
+    out = {}
+    empty = pd.Series(dtype="float32", index=pd.DatetimeIndex([], name="TIME_PERIOD"))
+    for name, (section, country, product, flow, unit) in specs.items():
+        try:
+            s = grouped.loc[(country, product, flow, unit)]
+        except KeyError:
+            s = None
+        if s is None or s.empty:
+            s = empty
+        elif section:
+            sections_present = s.index.get_level_values("SECTION").astype(str)
+            s = s[sections_present == section].droplevel("SECTION") if (sections_present == section).any() else empty
+        else:
+            s = s.groupby(level="TIME_PERIOD").sum()
+        s = s.sort_index()
+        out[name] = s[s.index >= start_ts]
+    return pd.DataFrame(out)
+
+
 def build_series_dataframe_from_df(df: pd.DataFrame, series_defs: dict, start_date: str = "2002-01-01", sections: list | None = None) -> pd.DataFrame:
     """Build a wide DataFrame from a provided base df with optional SECTION filter.
 
@@ -1248,33 +1461,627 @@ def build_series_dataframe_from_df(df: pd.DataFrame, series_defs: dict, start_da
     """
     if sections:
         df = df[df["SECTION"].isin(sections)]
-    out = {}
-    start_ts = pd.to_datetime(start_date)
-    for name, spec in series_defs.items():
-        country = _normalize_country(spec.get("country", ""))
-        product = spec.get("product", "").upper().strip()
-        flow = spec.get("flow", "").upper().strip()
-        unit = spec.get("unit", "").upper().strip()
-        section = spec.get("section", "").upper().strip()
-        sel = (
-            (df["REF_AREA"] == country)
-            & (df["ENERGY_PRODUCT"] == product)
-            & (df["FLOW_BREAKDOWN"] == flow)
-            & (df["UNIT_MEASURE"] == unit)
-        )
-        if section:
-            sel = sel & (df["SECTION"] == section)
-        s = (
-            df.loc[sel, ["TIME_PERIOD", "VALUE_NUM"]]
-            .groupby("TIME_PERIOD")
-            .sum()["VALUE_NUM"]
-            .sort_index()
+    return _resolve_series_grouped(df, _normalize_series_specs(series_defs), pd.to_datetime(start_date))
+
+
+def query_jodi_series(series_defs: dict, start_date: str = "2002-01-01", sections: list | None = None) -> pd.DataFrame | None:
+    """Query series straight from the country-partitioned split store.
+
+    Only partitions of the requested REF_AREAs are opened, product/flow/unit
+    filters are pushed into the Parquet reader, and all series are resolved in
+    one grouped pass. Returns None when a needed section has no split store
+    (callers then fall back to `load_jodi_base`).
+    """
+    specs = _normalize_series_specs(series_defs)
+    if not specs:
+        return pd.DataFrame()
+    frames: list[pd.DataFrame] = []
+    for section in ("PRIMARY", "SECONDARY"):
+        if sections and section not in sections:
+            continue
+        sec_specs = [spec for spec in specs.values() if not spec[0] or spec[0] == section]
+        if not sec_specs:
+            continue
+        if not os.path.isdir(_split_section_dir(section)):
+            return None
+        countries = sorted({spec[1] for spec in sec_specs})
+        filters = {
+            "ENERGY_PRODUCT": sorted({spec[2] for spec in sec_specs}),
+            "FLOW_BREAKDOWN": sorted({spec[3] for spec in sec_specs}),
+            "UNIT_MEASURE": sorted({spec[4] for spec in sec_specs}),
+        }
+        partitions = _split_partition_files(section, countries=countries)
+        if not partitions:
+            continue
+        with ThreadPoolExecutor(max_workers=min(len(partitions), 8)) as pool:
+            parts = list(pool.map(lambda item: _read_split_partition(item[0], item[1], filters), partitions))
+        parts = [part for part in parts if not part.empty]
+        for part in parts:
+            part["SECTION"] = pd.Categorical([section] * len(part), categories=["PRIMARY", "SECONDARY"])
+        frames.extend(parts)
+    if not frames:
+        return _resolve_series_grouped(
+            pd.DataFrame(columns=["REF_AREA", "ENERGY_PRODUCT", "FLOW_BREAKDOWN", "UNIT_MEASURE", "SECTION", "TIME_PERIOD", "VALUE_NUM"]),
+            specs,
+            pd.to_datetime(start_date),
         )
-        s = s[s.index >= start_ts]
-        out[name] = s
-    if not out:
+    df = _concat_categorical_frames(frames, JODI_DIMENSION_COLUMNS)
+    return _resolve_series_grouped(df, specs, pd.to_datetime(start_date))
+
+
+# -----------------------------------------------------------------------------
+# Persistent wide cube (time × series) for the Streamlit app
+# -----------------------------------------------------------------------------
+
+JODI_CUBE_DIR = os.path.join(CACHE_DIR, "cube")
+JODI_CUBE_VERSION = 2
+JODI_CUBE_KEYS = ["SECTION", "REF_AREA", "ENERGY_PRODUCT", "FLOW_BREAKDOWN", "UNIT_MEASURE"]
+_CUBE_VALUES_FILE = "values.npy"
+_CUBE_PERIODS_FILE = "periods.npy"
+_CUBE_COMBOS_FILE = "combos.csv"
+_CUBE_META_FILE = "meta.json"
+
+
+def _cube_path(name: str) -> str:
+    return os.path.join(JODI_CUBE_DIR, name)
+
+
+def _read_cube_meta() -> dict | None:
+    try:
+        with open(_cube_path(_CUBE_META_FILE), encoding="utf-8") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if meta.get("version") != JODI_CUBE_VERSION:
+        return None
+    return meta
+
+
+def _write_cube_meta(meta: dict) -> None:
+    path = _cube_path(_CUBE_META_FILE)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=1, ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+def _current_change_manifest() -> dict | None:
+    if jodi_cli is None:
+        return None
+    return jodi_cli.load_change_manifest(JODI_DATA_DIR)
+
+
+def _combo_display_labels(combos: pd.DataFrame) -> pd.Series:
+    """Label every combo via the distinct (country, product, flow) triples only."""
+    triple_cols = ["REF_AREA", "ENERGY_PRODUCT", "FLOW_BREAKDOWN"]
+    triples = combos[triple_cols].drop_duplicates()
+    triples["DISPLAY_LABEL"] = [
+        _series_simple_label(c, p, f)
+        for c, p, f in zip(triples["REF_AREA"], triples["ENERGY_PRODUCT"], triples["FLOW_BREAKDOWN"])
+    ]
+    return combos[triple_cols].merge(triples, on=triple_cols, how="left")["DISPLAY_LABEL"]
+
+
+def build_jodi_cube(base: pd.DataFrame | None = None) -> tuple[np.ndarray, np.ndarray, pd.DataFrame]:
+    """Aggregate the long JODI frame into a series-major float32 matrix.
+
+    Returns (values, periods, combos): `values[i, t]` is series `combos.iloc[i]`
+    at `periods[t]`. Series with no observation above 1e-6 in absolute value
+    are dropped, and combos carry their DISPLAY_LABEL.
+    """
+    if base is None:
+        base = load_jodi_base()
+    grouped = base.groupby(["TIME_PERIOD", *JODI_CUBE_KEYS], observed=True)["VALUE_NUM"].sum()
+    flat = grouped.reset_index()
+
+    periods = np.sort(flat["TIME_PERIOD"].unique()).astype("datetime64[ns]")
+    row_pos = np.searchsorted(periods, flat["TIME_PERIOD"].to_numpy(dtype="datetime64[ns]"))
+    col_ids = flat.groupby(JODI_CUBE_KEYS, observed=True, sort=True).ngroup().to_numpy()
+
+    n_series = int(col_ids.max()) + 1 if len(col_ids) else 0
+    values = np.full((n_series, len(periods)), np.nan, dtype="float32")
+    values[col_ids, row_pos] = flat["VALUE_NUM"].to_numpy(dtype="float32")
+
+    first = np.unique(col_ids, return_index=True)[1]
+    combos = flat.iloc[first][JODI_CUBE_KEYS].astype(str).reset_index(drop=True)
+
+    with np.errstate(invalid="ignore"):
+        valid = (np.abs(values) > 1e-6).any(axis=1)
+    values = np.ascontiguousarray(values[valid])
+    combos = combos.loc[valid].reset_index(drop=True)
+    combos["DISPLAY_LABEL"] = _combo_display_labels(combos).to_numpy()
+    return values, periods, combos
+
+
+def save_jodi_cube(values: np.ndarray, periods: np.ndarray, combos: pd.DataFrame, manifest: dict | None = None) -> str:
+    """Persist the cube under JODI_CUBE_DIR; meta.json is written last and marks it complete."""
+    os.makedirs(JODI_CUBE_DIR, exist_ok=True)
+    for name, writer in (
+        (_CUBE_VALUES_FILE, lambda f: np.save(f, values)),
+        (_CUBE_PERIODS_FILE, lambda f: np.save(f, periods.astype("datetime64[ns]"))),
+        (_CUBE_COMBOS_FILE, lambda f: combos.to_csv(f, index=False)),
+    ):
+        path = _cube_path(name)
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            writer(f)
+        os.replace(tmp, path)
+    _write_cube_meta({
+        "version": JODI_CUBE_VERSION,
+        "layout": "series-major",
+        "n_series": int(values.shape[0]),
+        "n_periods": int(values.shape[1]),
+        "built_at": datetime.now().isoformat(timespec="seconds"),
+        "manifest_generated_at": (manifest or {}).get("generated_at"),
+    })
+    return JODI_CUBE_DIR
+
+
+def load_jodi_cube(mmap: bool = True) -> tuple[pd.DataFrame, pd.DataFrame] | None:
+    """Return (wide, combos) from the persisted cube, or None if it is missing.
+
+    The matrix is memory-mapped read-only and wrapped without copying, so
+    `wide` has TIME_PERIOD rows and a five-level column MultiIndex.
+    """
+    meta = _read_cube_meta()
+    if meta is None:
+        return None
+    try:
+        values = np.load(_cube_path(_CUBE_VALUES_FILE), mmap_mode="r" if mmap else None)
+        periods = np.load(_cube_path(_CUBE_PERIODS_FILE))
+        # keep_default_na=False: "NA" is Namibia's REF_AREA, not a missing value
+        combos = pd.read_csv(_cube_path(_CUBE_COMBOS_FILE), dtype=str, keep_default_na=False)
+    except (OSError, ValueError):
+        return None
+    if values.shape != (len(combos), len(periods)) or values.shape != (meta.get("n_series"), meta.get("n_periods")):
+        return None
+
+    columns = pd.MultiIndex.from_frame(combos[JODI_CUBE_KEYS])
+    index = pd.DatetimeIndex(periods, name="TIME_PERIOD")
+    wide = pd.DataFrame(values.T, index=index, columns=columns, copy=False)
+    return wide, combos
+
+
+# Seasonal (month-of-year) envelopes per cube series, e.g. 5-year mean/min/max
+_CUBE_SEASONAL_FILE = "seasonal.npy"
+_CUBE_SEASONAL_LAST_YEAR_FILE = "seasonal_last_year.npy"
+SEASONAL_STATS = ("평균", "Min", "Min~Max")
+
+
+def _seasonal_windows() -> list[int]:
+    raw = os.environ.get("JODI_SEASONAL_WINDOWS", "5,6,10")
+    windows = sorted({int(tok) for tok in raw.replace(" ", "").split(",") if tok.isdigit() and int(tok) > 0})
+    return windows or [5]
+
+
+def build_jodi_seasonal(values: np.ndarray, periods: np.ndarray, windows: list[int]) -> tuple[np.ndarray, np.ndarray]:
+    """Compute monthly seasonal envelopes for every cube series in one reshape.
+
+    Each series is scattered onto a (year, month) grid; for window w the years
+    [last_year - w + 1, last_year] of that series are reduced with NaN-aware
+    mean/min/max. Returns (stats, last_year) where stats has shape
+    (len(windows), 3, n_series, 12) and last_year is -1 for empty series.
+    """
+    n_series, n_periods = values.shape
+    stats = np.full((len(windows), 3, n_series, 12), np.nan, dtype="float32")
+    last_year = np.full(n_series, -1, dtype="int16")
+    if n_series == 0 or n_periods == 0:
+        return stats, last_year
+
+    periods = np.asarray(periods, dtype="datetime64[M]")
+    years = periods.astype("datetime64[Y]").astype(int) + 1970
+    months = periods.astype(int) % 12
+    first_year = int(years.min())
+    year_axis = np.arange(first_year, int(years.max()) + 1)
+
+    observed = ~np.isnan(values)
+    has_data = observed.any(axis=1)
+    last_pos = n_periods - 1 - np.argmax(observed[:, ::-1], axis=1)
+    last_year[has_data] = years[last_pos[has_data]]
+
+    # Bound the (rows, years, 12) float64 scratch grid to ~64 MB
+    rows_per_chunk = max(1, (64 << 20) // (len(year_axis) * 12 * 8))
+    for start in range(0, n_series, rows_per_chunk):
+        stop = min(start + rows_per_chunk, n_series)
+        grid = np.full((stop - start, len(year_axis), 12), np.nan)
+        grid[:, years - first_year, months] = values[start:stop]
+        last = last_year[start:stop, None].astype(int)
+        for wi, window in enumerate(windows):
+            in_window = (year_axis[None, :] >= last - window + 1) & (year_axis[None, :] <= last)
+            masked = np.where(in_window[:, :, None], grid, np.nan)
+            stats[wi, 0, start:stop] = np.nanmean(masked, axis=1)
+            stats[wi, 1, start:stop] = np.nanmin(masked, axis=1)
+            stats[wi, 2, start:stop] = np.nanmax(masked, axis=1)
+    return stats, last_year
+
+
+def save_jodi_seasonal(stats: np.ndarray, last_year: np.ndarray, windows: list[int]) -> None:
+    """Store the seasonal table next to the cube and register its windows in meta.json."""
+    for name, array in ((_CUBE_SEASONAL_FILE, stats), (_CUBE_SEASONAL_LAST_YEAR_FILE, last_year)):
+        path = _cube_path(name)
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            np.save(f, array)
+        os.replace(tmp, path)
+    meta = _read_cube_meta() or {}
+    _write_cube_meta({**meta, "seasonal_windows": list(windows)})
+
+
+def load_jodi_seasonal() -> dict[str, Any] | None:
+    """Return {"stats", "last_year", "windows"} (stats memory-mapped), or None if absent."""
+    meta = _read_cube_meta()
+    if meta is None or not meta.get("seasonal_windows"):
+        return None
+    try:
+        stats = np.load(_cube_path(_CUBE_SEASONAL_FILE), mmap_mode="r")
+        last_year = np.load(_cube_path(_CUBE_SEASONAL_LAST_YEAR_FILE))
+    except (OSError, ValueError):
+        return None
+    windows = list(meta["seasonal_windows"])
+    if stats.shape != (len(windows), 3, meta.get("n_series"), 12) or len(last_year) != meta.get("n_series"):
+        return None
+    return {"stats": stats, "last_year": last_year, "windows": windows}
+
+
+def seasonal_five_year_frame(
+    wide: pd.DataFrame,
+    seasonal: dict[str, Any] | None,
+    column: tuple,
+    history_years: int = 5,
+    start_ts: pd.Timestamp | None = None,
+) -> pd.DataFrame | None:
+    """Look up the month × (years + 평균/Min/Min~Max) table for one cube series.
+
+    Matches `_make_monthly_five_year_format`; returns None when the window was
+    not precomputed or `start_ts` cuts into it (callers then pivot instead).
+    """
+    if seasonal is None or history_years not in seasonal["windows"]:
+        return None
+    try:
+        pos = wide.columns.get_loc(column)
+    except KeyError:
+        return None
+    if not isinstance(pos, (int, np.integer)):
+        return None
+    last = int(seasonal["last_year"][pos])
+    if last < 0:
+        return None
+    first = last - history_years + 1
+    if start_ts is not None and start_ts > pd.Timestamp(year=first, month=1, day=1):
+        return None
+
+    series = wide.iloc[:, pos]
+    window = series[(series.index.year >= first) & (series.index.year <= last)].dropna()
+    if window.empty:
+        return None
+    years = sorted(window.index.year.unique())
+    grid = np.full((12, len(years)), np.nan)
+    grid[window.index.month - 1, np.searchsorted(years, window.index.year)] = window.to_numpy(dtype=float)
+
+    result = pd.DataFrame(grid, index=pd.RangeIndex(1, 13, name="month"), columns=[str(y) for y in years])
+    stats = seasonal["stats"][seasonal["windows"].index(history_years), :, pos, :]
+    for name, row in zip(SEASONAL_STATS, stats):
+        result[name] = row.astype(float)
+    return result
+
+
+def _cube_is_stale(meta: dict | None, manifest: dict | None) -> bool:
+    if meta is None:
+        return True
+    if not manifest or manifest.get("generated_at") == meta.get("manifest_generated_at"):
+        return False
+    return bool(manifest.get("changed"))
+
+
+def ensure_jodi_cube(force: bool = False) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Return the wide cube, rebuilding it only when the fetch change manifest reports changes.
+
+    A newer manifest without changed partitions only re-stamps meta.json. If the
+    cube cannot be persisted, the freshly built arrays are served from memory.
+    """
+    force = force or os.environ.get("JODI_CUBE_REBUILD", "").lower() in {"1", "true", "yes", "on"}
+    manifest = _current_change_manifest()
+    meta = _read_cube_meta()
+
+    if not force and not _cube_is_stale(meta, manifest):
+        stamp = (manifest or {}).get("generated_at")
+        if stamp and stamp != meta.get("manifest_generated_at"):
+            try:
+                _write_cube_meta({**meta, "manifest_generated_at": stamp})
+            except OSError:
+                pass
+        cube = load_jodi_cube()
+        if cube is not None:
+            return cube
+
+    values, periods, combos = build_jodi_cube()
+    try:
+        save_jodi_cube(values, periods, combos, manifest)
+        windows = _seasonal_windows()
+        save_jodi_seasonal(*build_jodi_seasonal(values, periods, windows), windows)
+        cube = load_jodi_cube()
+        if cube is not None:
+            return cube
+    except OSError as exc:
+        print(f"⚠️ JODI 큐브 저장 실패, 메모리에서 사용합니다: {exc}")
+
+    columns = pd.MultiIndex.from_frame(combos[JODI_CUBE_KEYS])
+    wide = pd.DataFrame(values.T, index=pd.DatetimeIndex(periods, name="TIME_PERIOD"), columns=columns)
+    return wide, combos
+
+
+# -----------------------------------------------------------------------------
+# Aggregation engine (regions, world totals, flow balances)
+# -----------------------------------------------------------------------------
+
+JODI_REGIONS: dict[str, list[str]] = {
+    "OPEC": ["DZ", "CG", "GQ", "GA", "IR", "IQ", "KW", "LY", "NG", "SA", "AE", "VE"],
+    "OECD": [
+        "AU", "AT", "BE", "CA", "CL", "CO", "CR", "CZ", "DK", "EE", "FI", "FR", "DE",
+        "GR", "HU", "IS", "IE", "IL", "IT", "JP", "KR", "LV", "LT", "LU", "MX", "NL",
+        "NZ", "NO", "PL", "PT", "SK", "SI", "ES", "SE", "CH", "TR", "GB", "US",
+    ],
+    "ASIA": ["CN", "IN", "JP", "KR", "ID", "MY", "PH", "SG", "TH", "VN", "TW", "HK", "PK", "BD", "LK", "MM", "BN"],
+}
+WORLD_REGION = "WORLD"
+
+# {name: {FLOW_BREAKDOWN: coefficient}}; a result needs every term present
+JODI_FLOW_FORMULAS: dict[str, dict[str, float]] = {
+    "CRUDE_BALANCE": {"INDPROD": 1.0, "REFINOBS": -1.0},      # 생산 − 정유 투입
+    "NET_IMPORTS": {"TOTIMPSB": 1.0, "TOTEXPSB": -1.0},        # 수입 − 수출
+    "OUTPUT_MINUS_DEMAND": {"REFGROUT": 1.0, "TOTDEMO": -1.0},  # 정유 생산 − 수요
+    "STOCK_CHANGE": {"STOCKCH": 1.0},
+}
+
+AGG_CACHE_DIR = os.path.join(CACHE_DIR, "aggregates")
+AGG_PANEL_VERSION = 1
+AGG_PANEL_KEYS = ["SECTION", "REF_AREA", "ENERGY_PRODUCT", "FLOW_BREAKDOWN", "UNIT_MEASURE", "TIME_PERIOD"]
+_AGG_PANEL_META = os.path.join(AGG_CACHE_DIR, "panel_meta.json")
+_AGGREGATE_CACHE: dict[str, pd.DataFrame] = {}
+_AGGREGATE_CACHE_MAX = 32
+
+
+def _agg_panel_path() -> str:
+    return os.path.join(AGG_CACHE_DIR, f"panel{CACHE_EXT}")
+
+
+def _categorize_panel(df: pd.DataFrame) -> pd.DataFrame:
+    for col in AGG_PANEL_KEYS[:-1]:
+        if df[col].dtype.name != "category":
+            df[col] = df[col].astype(str).astype("category")
+    return df
+
+
+def _reduce_to_panel(df: pd.DataFrame) -> pd.DataFrame:
+    """Country-level panel: one summed value per (section, country, product, flow, unit, month)."""
+    panel = (
+        df.groupby(AGG_PANEL_KEYS, observed=True, sort=False)["VALUE_NUM"]
+        .sum(min_count=1)
+        .dropna()
+        .astype("float64")
+        .reset_index()
+    )
+    for col in AGG_PANEL_KEYS[:-1]:
+        panel[col] = panel[col].astype(str)
+    return _categorize_panel(panel)
+
+
+def _panel_sources() -> dict[str, str]:
+    """Map every input file (split partitions, else monolithic CSV) to its content hash."""
+    index = _load_hash_index()
+    known = dict(index)
+    sources: dict[str, str] = {}
+    for section, csv_path in (("PRIMARY", PRIMARY_CSV), ("SECONDARY", SECONDARY_CSV)):
+        paths = [fpath for _, fpath in _split_partition_files(section)]
+        if not paths and os.path.exists(csv_path):
+            paths = [csv_path]
+        for path in paths:
+            rel = os.path.relpath(path, JODI_DATA_DIR).replace(os.sep, "/")
+            sources[rel] = _source_digest(path, index)
+    if index != known:
+        _save_hash_index(index)
+    return sources
+
+
+def _changed_split_countries(old: dict[str, str], new: dict[str, str]) -> dict[str, set[str]] | None:
+    """Return {SECTION: {countries}} whose split partitions changed, or None if a non-split source changed."""
+    delta: dict[str, set[str]] = {}
+    for rel in set(old) | set(new):
+        if old.get(rel) == new.get(rel):
+            continue
+        parts = rel.split("/")
+        if len(parts) < 4 or parts[0] != "split":
+            return None
+        delta.setdefault(parts[1].upper(), set()).add(parts[2].upper())
+    return delta
+
+
+def _refresh_panel_countries(panel: pd.DataFrame, delta: dict[str, set[str]]) -> pd.DataFrame:
+    """Replace the panel rows of changed countries with freshly read partitions."""
+    keep = np.ones(len(panel), dtype=bool)
+    fresh: list[pd.DataFrame] = []
+    for section, countries in delta.items():
+        keep &= ~((panel["SECTION"].astype(str) == section) & panel["REF_AREA"].astype(str).isin(countries)).to_numpy()
+        partitions = _split_partition_files(section, countries=sorted(countries))
+        frames = [_read_split_partition(ext_lower, fpath) for ext_lower, fpath in partitions]
+        if frames:
+            section_df = _finalize_jodi_frame(_concat_categorical_frames(frames, JODI_DIMENSION_COLUMNS), section)
+            fresh.append(_reduce_to_panel(section_df))
+    kept = panel.loc[keep].copy()
+    for col in AGG_PANEL_KEYS[:-1]:
+        kept[col] = kept[col].astype(str)
+    for frame in fresh:
+        for col in AGG_PANEL_KEYS[:-1]:
+            frame[col] = frame[col].astype(str)
+    return _categorize_panel(pd.concat([kept, *fresh], ignore_index=True))
+
+
+def _load_panel_cache() -> tuple[pd.DataFrame | None, dict | None]:
+    try:
+        with open(_AGG_PANEL_META, encoding="utf-8") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None, None
+    if meta.get("version") != AGG_PANEL_VERSION:
+        return None, None
+    panel = _load_cached_frame(_agg_panel_path())
+    return (panel, meta) if panel is not None else (None, None)
+
+
+def _save_panel_cache(panel: pd.DataFrame, sources: dict[str, str]) -> None:
+    try:
+        os.makedirs(AGG_CACHE_DIR, exist_ok=True)
+        path = _agg_panel_path()
+        tmp = path + ".tmp"
+        if CACHE_BACKEND == "feather":
+            panel.reset_index(drop=True).to_feather(tmp, compression="uncompressed")
+        else:
+            panel.reset_index(drop=True).to_pickle(tmp)
+        os.replace(tmp, path)
+        tmp = _AGG_PANEL_META + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"version": AGG_PANEL_VERSION, "sources": sources}, f, indent=1)
+        os.replace(tmp, _AGG_PANEL_META)
+    except OSError as exc:
+        print(f"⚠️ 집계 패널 저장 실패: {exc}")
+
+
+def load_aggregation_panel() -> tuple[pd.DataFrame, str]:
+    """Return (country-level panel, token) kept in sync with the JODI store.
+
+    When only split partitions changed (the usual monthly fetch), just those
+    countries are re-read and spliced in; anything else rebuilds from
+    `load_jodi_base`. The token changes whenever the inputs do.
+    """
+    sources = _panel_sources()
+    token = hashlib.sha256(json.dumps(sources, sort_keys=True).encode()).hexdigest()
+    panel, meta = _load_panel_cache()
+    if panel is not None and meta.get("sources") == sources:
+        return panel, token
+
+    delta = _changed_split_countries(meta.get("sources", {}), sources) if panel is not None else None
+    if delta is not None:
+        changed = sum(len(countries) for countries in delta.values())
+        print(f"🔄 집계 패널 부분 갱신: {changed}개 국가")
+        panel = _refresh_panel_countries(panel, delta)
+    else:
+        panel = _reduce_to_panel(load_jodi_base())
+    _save_panel_cache(panel, sources)
+    return panel, token
+
+
+def _region_totals(df: pd.DataFrame, regions: dict[str, list[str] | None]) -> pd.DataFrame:
+    """Sum panel rows into every region in one bincount over (cell, region) codes.
+
+    A region member list of None means every country. Returns long rows with
+    REGION, SECTION, ENERGY_PRODUCT, FLOW_BREAKDOWN, TIME_PERIOD, VALUE, N_REPORTING.
+    """
+    region_names = list(regions)
+    country_cat = df["REF_AREA"] if df["REF_AREA"].dtype.name == "category" else df["REF_AREA"].astype("category")
+    countries = country_cat.cat.categories
+    membership = np.zeros((len(countries), len(region_names)), dtype=bool)
+    for r, members in enumerate(regions.values()):
+        if members is None:
+            membership[:, r] = True
+        else:
+            membership[:, r] = countries.isin({_normalize_country(c) for c in members})
+
+    cell_keys = ["SECTION", "ENERGY_PRODUCT", "FLOW_BREAKDOWN", "TIME_PERIOD"]
+    cell_ids = df.groupby(cell_keys, observed=True, sort=False).ngroup().to_numpy()
+    n_cells = int(cell_ids.max()) + 1 if len(cell_ids) else 0
+    cells = df.iloc[np.unique(cell_ids, return_index=True)[1]][cell_keys].reset_index(drop=True)
+
+    row_idx, region_idx = np.nonzero(membership[country_cat.cat.codes.to_numpy()])
+    combined = cell_ids[row_idx] * len(region_names) + region_idx
+    size = n_cells * len(region_names)
+    totals = np.bincount(combined, weights=df["VALUE_NUM"].to_numpy(dtype="float64")[row_idx], minlength=size)
+    reporting = np.bincount(combined, minlength=size)
+
+    hit = np.nonzero(reporting)[0]
+    out = cells.iloc[hit // len(region_names)].reset_index(drop=True)
+    out.insert(0, "REGION", np.asarray(region_names, dtype=object)[hit % len(region_names)])
+    out["VALUE"] = totals[hit]
+    out["N_REPORTING"] = reporting[hit]
+    return out
+
+
+def _apply_flow_formulas(totals: pd.DataFrame, formulas: dict[str, dict[str, float]]) -> pd.DataFrame:
+    """Append formula measures (e.g. production − demand) to the flow totals."""
+    long = totals.rename(columns={"FLOW_BREAKDOWN": "MEASURE"})[
+        ["REGION", "SECTION", "ENERGY_PRODUCT", "MEASURE", "TIME_PERIOD", "VALUE"]
+    ]
+    if not formulas or totals.empty:
+        return long
+    table = totals.set_index(["REGION", "SECTION", "ENERGY_PRODUCT", "TIME_PERIOD", "FLOW_BREAKDOWN"])["VALUE"].unstack(
+        "FLOW_BREAKDOWN"
+    )
+    pieces = [long]
+    for name, terms in formulas.items():
+        if not terms or any(flow not in table.columns for flow in terms):
+            continue
+        value = sum(table[flow] * coef for flow, coef in terms.items()).dropna()
+        if value.empty:
+            continue
+        piece = value.rename("VALUE").reset_index()
+        piece["MEASURE"] = name
+        pieces.append(piece[long.columns])
+    return pd.concat(pieces, ignore_index=True)
+
+
+def aggregate_jodi(
+    regions: dict[str, list[str]] | None = None,
+    formulas: dict[str, dict[str, float]] | None = None,
+    unit: str = "KBD",
+    products: list[str] | None = None,
+    include_world: bool = True,
+    start_date: str | None = None,
+) -> pd.DataFrame:
+    """Regional totals and flow balances for one unit.
+
+    Returns a wide frame indexed by TIME_PERIOD with (REGION, SECTION,
+    ENERGY_PRODUCT, MEASURE) columns, where MEASURE is a FLOW_BREAKDOWN code or
+    a formula name. Results are memoized per input state and arguments.
+
+    Example:
+        aggregate_jodi({"GULF": ["SA", "AE", "KW", "QA"]}, {"BAL": {"INDPROD": 1, "REFINOBS": -1}})
+    """
+    region_map: dict[str, list[str] | None] = dict(JODI_REGIONS if regions is None else regions)
+    if include_world:
+        region_map[WORLD_REGION] = None
+    formula_map = JODI_FLOW_FORMULAS if formulas is None else formulas
+    product_list = sorted({p.upper() for p in products}) if products else None
+
+    panel, token = load_aggregation_panel()
+    cache_key = hashlib.sha256(
+        json.dumps([token, region_map, formula_map, unit.upper(), product_list, start_date], sort_keys=True, default=str).encode()
+    ).hexdigest()
+    cached = _AGGREGATE_CACHE.get(cache_key)
+    if cached is not None:
+        return cached.copy()
+
+    mask = (panel["UNIT_MEASURE"].astype(str) == unit.upper()).to_numpy()
+    if product_list:
+        mask &= panel["ENERGY_PRODUCT"].astype(str).isin(product_list).to_numpy()
+    if start_date:
+        mask &= (panel["TIME_PERIOD"] >= pd.to_datetime(start_date)).to_numpy()
+    subset = panel.loc[mask]
+
+    long = _apply_flow_formulas(_region_totals(subset, region_map), formula_map)
+    if long.empty:
         return pd.DataFrame()
-    return pd.DataFrame(out)
+    for col in ("SECTION", "ENERGY_PRODUCT", "MEASURE"):
+        long[col] = long[col].astype(str)
+    wide = (
+        long.set_index(["TIME_PERIOD", "REGION", "SECTION", "ENERGY_PRODUCT", "MEASURE"])["VALUE"]
+        .unstack(["REGION", "SECTION", "ENERGY_PRODUCT", "MEASURE"])
+        .sort_index()
+        .sort_index(axis=1)
+    )
+
+    if len(_AGGREGATE_CACHE) >= _AGGREGATE_CACHE_MAX:
+        _AGGREGATE_CACHE.pop(next(iter(_AGGREGATE_CACHE)))
+    _AGGREGATE_CACHE[cache_key] = wide
+    return wide.copy()
 
 
 def list_value_options(df: pd.DataFrame) -> dict:
@@ -1319,38 +2126,10 @@ def build_series_dataframe(series_defs: dict, start_date: str = "2002-01-01") ->
           }
         }
     """
-    df = load_jodi_base()
-    out = {}
-    start_ts = pd.to_datetime(start_date)
-
-    for name, spec in series_defs.items():
-        country = _normalize_country(spec.get("country", ""))
-        product = spec.get("product", "").upper().strip()
-        flow = spec.get("flow", "").upper().strip()
-        unit = spec.get("unit", "").upper().strip()
-        section = spec.get("section", "").upper().strip()
-
-        sel = (
-            (df["REF_AREA"] == country)
-            & (df["ENERGY_PRODUCT"] == product)
-            & (df["FLOW_BREAKDOWN"] == flow)
-            & (df["UNIT_MEASURE"] == unit)
-        )
-        if section:
-            sel = sel & (df["SECTION"] == section)
-        s = (
-            df.loc[sel, ["TIME_PERIOD", "VALUE_NUM"]]
-            .groupby("TIME_PERIOD")
-            .sum()["VALUE_NUM"]
-            .sort_index()
-        )
-        s = s[s.index >= start_ts]
-        out[name] = s
-
-    if not out:
-        return pd.DataFrame()
-    wide = pd.DataFrame(out)
-    return wide
+    wide = query_jodi_series(series_defs, start_date=start_date)
+    if wide is not None:
+        return wide
+    return build_series_dataframe_from_df(load_jodi_base(), series_defs, start_date=start_date)
 
 
 def make_korean_names(series_defs: dict) -> dict:
@@ -1469,67 +2248,12 @@ def run_streamlit_app():
         else:
             st.info(message)
 
-    @st.cache_data(show_spinner=False)
+    @st.cache_resource(show_spinner=False)
     def _load_processed_views():
-        base = load_jodi_base()
-        grouped = (
-            base.groupby(
-                [
-                    "TIME_PERIOD",
-                    "SECTION",
-                    "REF_AREA",
-                    "ENERGY_PRODUCT",
-                    "FLOW_BREAKDOWN",
-                    "UNIT_MEASURE",
-                ],
-                observed=True,
-            )["VALUE_NUM"].sum().astype("float32")
-        )
-        wide = grouped.unstack([
-            "SECTION",
-            "REF_AREA",
-            "ENERGY_PRODUCT",
-            "FLOW_BREAKDOWN",
-            "UNIT_MEASURE",
-        ])
-        wide = wide.sort_index()
-
-        def _valid_series(series: pd.Series) -> bool:
-            ser = series.dropna()
-            if ser.empty:
-                return False
-            if (ser.abs() > 1e-6).any():
-                return True
-            recent_window = 36
-            recent = ser.tail(recent_window)
-            if recent.empty:
-                recent = ser
-            if (recent.abs() > 1e-6).any():
-                return True
-            return False
-
-        valid_mask = wide.apply(_valid_series, axis=0)
-        wide = wide.loc[:, valid_mask]
-
-        combos = wide.columns.to_frame(index=False).reset_index(drop=True)
-        combos.columns = [
-            "SECTION",
-            "REF_AREA",
-            "ENERGY_PRODUCT",
-            "FLOW_BREAKDOWN",
-            "UNIT_MEASURE",
-        ]
+        # Memory-mapped cube; shared read-only across sessions, never pickled
+        wide, combos = ensure_jodi_cube()
 
-        combos["DISPLAY_LABEL"] = combos.apply(
-            lambda row: _series_simple_label(
-                row["REF_AREA"], row["ENERGY_PRODUCT"], row["FLOW_BREAKDOWN"]
-            ),
-            axis=1,
-        )
-
-        units_by_series = {}
-        for tup, label in zip(wide.columns, combos["DISPLAY_LABEL"]):
-            units_by_series[label] = units_by_series.get(label, set()) | {tup[4]}
+        units_by_series = combos.groupby("DISPLAY_LABEL", sort=False)["UNIT_MEASURE"].agg(set).to_dict()
 
         options = {
             "sections": sorted(combos["SECTION"].dropna().astype(str).unique().tolist()),
@@ -1538,7 +2262,23 @@ def run_streamlit_app():
             "flows": sorted(combos["FLOW_BREAKDOWN"].dropna().astype(str).unique().tolist()),
         }
 
-        return wide.astype("float32"), combos, options, units_by_series
+        return wide, combos, options, units_by_series
+
+    @st.cache_resource(show_spinner=False)
+    def _load_seasonal_table():
+        _load_processed_views()  # makes sure the cube (and its seasonal table) is current
+        return load_jodi_seasonal()
+
+    @st.cache_resource(show_spinner=False, max_entries=32)
+    def _registry_for_selection(countries: tuple[str, ...]):
+        # One registry/tree per country filter; entries are copied before per-session edits
+        _, combos, _, _ = _load_processed_views()
+        if countries:
+            combos = combos[combos["REF_AREA"].isin(countries)]
+        combos_sorted = combos.sort_values(
+            ["SECTION", "REF_AREA", "ENERGY_PRODUCT", "FLOW_BREAKDOWN", "UNIT_MEASURE"]
+        ).reset_index(drop=True)
+        return build_jodi_series_registry(combos_sorted)
 
     wide_df, combos_all, options, units_by_series = _load_processed_views()
     combos_filtered = combos_all.copy()
@@ -1558,6 +2298,8 @@ def run_streamlit_app():
                 }
                 try:
                     _load_processed_views.clear()
+                    _registry_for_selection.clear()
+                    _load_seasonal_table.clear()
                 except Exception:
                     pass
                 _trigger_rerun()
@@ -1639,11 +2381,7 @@ def run_streamlit_app():
         if selected_countries:
             combos_filtered = combos_filtered[combos_filtered["REF_AREA"].isin(selected_countries)]
 
-        combos_sorted = combos_filtered.sort_values(
-            ["SECTION", "REF_AREA", "ENERGY_PRODUCT", "FLOW_BREAKDOWN", "UNIT_MEASURE"]
-        ).reset_index(drop=True)
-
-        registry, tree_nodes, default_checked = build_jodi_series_registry(combos_sorted)
+        registry, tree_nodes, default_checked = _registry_for_selection(tuple(sorted(selected_countries)))
 
         if not registry:
             st.info("선택한 조건에 해당하는 시리즈가 없습니다.")
@@ -1759,7 +2497,7 @@ def run_streamlit_app():
                 apply_jodi_preset(payload_copy, registry)
 
     selected_series_keys = list(st.session_state.get("jodi_selection", []))
-    selected_infos = [registry[key] for key in selected_series_keys if key in registry]
+    selected_infos = [dict(registry[key]) for key in selected_series_keys if key in registry]
 
     if not selected_infos:
         with current_tab:
@@ -1831,7 +2569,7 @@ def run_streamlit_app():
         st.session_state["jodi_selection_source"] = "sidebar"
         st.session_state["jodi_series_selection"] = list(active_keys)
         selected_series_keys = list(active_keys)
-        selected_infos = [registry[key] for key in selected_series_keys if key in registry]
+        selected_infos = [label_to_info[label] for label in active_labels if label in label_to_info]
         if not selected_infos:
             with current_tab:
                 st.warning("선택된 시리즈가 없습니다.")
@@ -2185,26 +2923,44 @@ def run_streamlit_app():
         fig = None
         table_df: Optional[pd.DataFrame] = combined_df.copy()
 
+        # Same settings on the same cube build -> resend the serialized figure (five-year charts
+        # also produce their table, so they are always rebuilt)
+        chart_key = chart_fingerprint(
+            "jodi",
+            (_read_cube_meta() or {}).get("built_at"),
+            start_date_str,
+            periods,
+            target_date,
+            snapshot,
+            zero_line,
+        )
+
         if chart_type == "multi_line":
-            fig = _create_single_axis_line_chart(
-                combined_df,
-                custom_single_axis_title or axis_label_default,
-                chart_width,
-                chart_height,
-                zero_line,
-                frequency_map,
+            fig = chart_cache.get_or_build(
+                chart_key,
+                lambda: _create_single_axis_line_chart(
+                    combined_df,
+                    custom_single_axis_title or axis_label_default,
+                    chart_width,
+                    chart_height,
+                    zero_line,
+                    frequency_map,
+                ),
             )
         elif chart_type == "single_line":
             if len(display_labels) > 1:
                 st.warning("단일 라인 차트는 한 개 시리즈만 표시합니다. 첫 번째 시리즈만 사용합니다.")
             single_df = combined_df[[display_labels[0]]] if display_labels else combined_df
-            fig = _create_single_axis_line_chart(
-                single_df,
-                custom_single_axis_title or axis_label_default,
-                chart_width,
-                chart_height,
-                zero_line,
-                frequency_map,
+            fig = chart_cache.get_or_build(
+                chart_key,
+                lambda: _create_single_axis_line_chart(
+                    single_df,
+                    custom_single_axis_title or axis_label_default,
+                    chart_width,
+                    chart_height,
+                    zero_line,
+                    frequency_map,
+                ),
             )
         elif chart_type == "dual_axis":
             if not axis_allocation:
@@ -2215,23 +2971,26 @@ def run_streamlit_app():
             left_axis_dtype = next(iter(left_dtype_keys)).replace("_data", "") if len(left_dtype_keys) == 1 else ""
             right_axis_dtype = next(iter(right_dtype_keys)).replace("_data", "") if len(right_dtype_keys) == 1 else ""
             base_data_type = global_dtype_key.replace("_data", "")
-            fig = _create_dual_axis_chart(
-                df=combined_df,
-                axis_allocation=axis_allocation,
-                label_map={label: label for label in display_labels},
-                data_type=base_data_type,
-                series_defs={info["key"]: {"unit": info.get("unit", "")} for info in selected_infos},
-                chart_width=chart_width,
-                chart_height=chart_height,
-                left_title_offset=left_title_offset,
-                right_title_offset=right_title_offset,
-                left_axis_data_type=left_axis_dtype,
-                right_axis_data_type=right_axis_dtype,
-                left_title_override=(custom_left_axis_title or axis_label_default or None),
-                right_title_override=(custom_right_axis_title or axis_label_default or None),
-                left_axis_range_override=left_axis_range_override,
-                right_axis_range_override=right_axis_range_override,
-                connect_map=frequency_map,
+            fig = chart_cache.get_or_build(
+                chart_key,
+                lambda: _create_dual_axis_chart(
+                    df=combined_df,
+                    axis_allocation=axis_allocation,
+                    label_map={label: label for label in display_labels},
+                    data_type=base_data_type,
+                    series_defs={info["key"]: {"unit": info.get("unit", "")} for info in selected_infos},
+                    chart_width=chart_width,
+                    chart_height=chart_height,
+                    left_title_offset=left_title_offset,
+                    right_title_offset=right_title_offset,
+                    left_axis_data_type=left_axis_dtype,
+                    right_axis_data_type=right_axis_dtype,
+                    left_title_override=(custom_left_axis_title or axis_label_default or None),
+                    right_title_override=(custom_right_axis_title or axis_label_default or None),
+                    left_axis_range_override=left_axis_range_override,
+                    right_axis_range_override=right_axis_range_override,
+                    connect_map=frequency_map,
+                ),
             )
         elif chart_type == "five_year":
             if len(selected_infos) != 1:
@@ -2241,6 +3000,13 @@ def run_streamlit_app():
             unit_label = _axis_title_for("raw", [info["key"]], series_defs)
             series_raw = series_df[info["key"]]
             recent_years = five_year_recent_years or 5
+            precomputed = seasonal_five_year_frame(
+                wide_df,
+                _load_seasonal_table(),
+                info["column_tuple"],
+                history_years=max(recent_years, 5),
+                start_ts=start_ts,
+            )
             fig, formatted_df = _create_monthly_five_year_chart(
                 series=series_raw,
                 series_name=label_map_keys[info["key"]],
@@ -2248,6 +3014,7 @@ def run_streamlit_app():
                 recent_years=recent_years,
                 chart_width=chart_width,
                 chart_height=chart_height,
+                formatted=precomputed,
             )
             if fig is None or formatted_df is None:
                 st.warning("5년 비교 차트를 생성할 수 있는 데이터가 부족합니다.")
@@ -2262,19 +3029,24 @@ def run_streamlit_app():
                 return
             dtype_value = next(iter(dtype_values_set)) if dtype_values_set else global_dtype_key
             dtype_value = dtype_value[:-5] if dtype_value.endswith("_data") else dtype_value
-            fig = plot_economic_series(
-                data_dict=data_pack,
-                series_list=[info["key"] for info in selected_infos],
-                chart_type=chart_type,
-                data_type=dtype_value.replace("_data", ""),
-                periods=periods,
-                target_date=target_date,
-                labels=label_map_for_chart,
-                korean_names=label_map_for_chart,
-                left_ytitle=custom_single_axis_title or axis_label_default or None,
-            )
-            if fig is not None:
-                fig.update_layout(width=chart_width, height=chart_height)
+
+            def _build_series_chart():
+                series_fig = plot_economic_series(
+                    data_dict=data_pack,
+                    series_list=[info["key"] for info in selected_infos],
+                    chart_type=chart_type,
+                    data_type=dtype_value.replace("_data", ""),
+                    periods=periods,
+                    target_date=target_date,
+                    labels=label_map_for_chart,
+                    korean_names=label_map_for_chart,
+                    left_ytitle=custom_single_axis_title or axis_label_default or None,
+                )
+                if series_fig is not None:
+                    series_fig.update_layout(width=chart_width, height=chart_height)
+                return series_fig
+
+            fig = chart_cache.get_or_build(chart_key, _build_series_chart)
 
         if fig is not None:
             fig = _sanitize_plotly_figure(fig)
@@ -2364,7 +3136,10 @@ def _run_cli_demo() -> None:
 
 
 if __name__ == "__main__":
-    if "--cli" in sys.argv:
+    if "--build-cube" in sys.argv:
+        wide, _ = ensure_jodi_cube(force=True)
+        print(f"✅ JODI 큐브 생성 완료: {wide.shape[1]}개 시리즈 × {wide.shape[0]}개월 ({JODI_CUBE_DIR})")
+    elif "--cli" in sys.argv:
         _run_cli_demo()
     else:
         try:
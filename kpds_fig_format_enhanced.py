@@ -20,26 +20,80 @@ left_ytitle, right_ytitle에는 단위가 들어감
 """
 
 import warnings
-import plotly.express as px
-warnings.filterwarnings("ignore")
-
-from pandas.plotting import register_matplotlib_converters
-register_matplotlib_converters()
-
-# 한글폰트 설치 #
-import matplotlib.font_manager as fm
-import matplotlib.pyplot as plt
-from matplotlib import colors as mcolors
+import importlib
+import functools
+import hashlib
+import json
+import threading
+from collections import OrderedDict
 import pandas as pd
 import numpy as np
 import tempfile
 import os
 import datetime
 import colorsys
+warnings.filterwarnings("ignore")
+
+
+# 공개 API - `from kpds_fig_format_enhanced import *` 도 이 목록만 내보냄
+__all__ = [
+    # 폰트/색상 설정
+    "total_font_size", "FONT_SIZE_TITLE", "FONT_SIZE_AXIS_TITLE", "FONT_SIZE_TICK",
+    "FONT_SIZE_LEGEND", "FONT_SIZE_ANNOTATION", "FONT_SIZE_GENERAL", "font_dict",
+    "deepred_pds", "deepblue_pds", "beige_pds", "lightbeige_pds", "red_pds", "blue_pds", "grey_pds",
+    "KPDS_COLORS", "KPDS_EXTENDED_COLORS", "get_kpds_color",
+    # 렌더링 모드 / 데시메이션
+    "PX_PER_CM", "KPDS_RENDER_MODE", "KPDS_WEBGL_THRESHOLD", "set_render_mode", "decimate_minmax",
+    # 축/레이아웃 도우미
+    "calculate_optimal_date_interval", "format_date_ticks", "get_minor_tick_interval",
+    "calculate_title_position", "get_dynamic_margins", "format_date_axis", "df2xa",
+    "LAYOUT_CACHE_SIZE", "clear_layout_cache",
+    # 렌더링된 차트 캐시
+    "CHART_CACHE_MAX_MB", "CHART_CACHE_MAX_ENTRIES", "chart_fingerprint", "FigureCache", "chart_cache",
+    # 차트 빌더
+    "df_line_chart", "df_multi_line_chart", "df_historical_comparison",
+    "create_five_year_comparison_chart", "df_dual_axis_chart", "df_scatter_chart",
+    "df_bar_chart", "create_flexible_mixed_chart", "create_sector_contribution_chart",
+    "create_kpds_cpi_bar_chart", "create_waterfall_chart", "create_horizontal_bar_chart",
+    "quick_line", "quick_multi", "quick_comparison", "quick_dual", "quick_scatter",
+    "quick_bar", "quick_five_year", "quick_five_year_week",
+    # 기존 star-import 사용 모듈 호환용 (신규 코드는 각 라이브러리에서 직접 import)
+    "pd", "np", "go", "px", "pio", "plt", "fm", "mcolors", "make_subplots",
+    "warnings", "os", "datetime", "tempfile", "colorsys",
+]
+
+
+class _LazyModule:
+    """모듈 대리 객체 - 첫 속성 접근(또는 호출) 시점에 실제 import 수행.
+
+    matplotlib/plotly 는 import 비용이 크므로 차트를 그리지 않는 데이터 갱신
+    스크립트에서는 로드하지 않는다. `init` 은 최초 로드 직후 한 번 호출된다.
+    """
+
+    def __init__(self, name, attr=None, init=None):
+        self.__dict__.update(_name=name, _attr=attr, _init=init, _target=None)
+
+    def _load(self):
+        target = self.__dict__["_target"]
+        if target is None:
+            target = importlib.import_module(self._name)
+            if self._attr:
+                target = getattr(target, self._attr)
+            self.__dict__["_target"] = target
+            if self._init:
+                self._init()
+        return target
+
+    def __getattr__(self, item):
+        return getattr(self._load(), item)
+
+    def __call__(self, *args, **kwargs):
+        return self._load()(*args, **kwargs)
+
+    def __repr__(self):
+        state = "loaded" if self.__dict__["_target"] is not None else "not loaded"
+        return f"<lazy {self._name}{'.' + self._attr if self._attr else ''} ({state})>"
 
-# 폰트 설정
-font_list = [font.name for font in fm.fontManager.ttflist]
-plt.rcParams['font.family'] = 'Malgun Gothic'
 
 # 폰트 크기 설정 변수들 (전역으로 조정 가능)
 # 사용법: 원하는 크기로 변경 후 라이브러리 임포트
@@ -53,17 +107,57 @@ FONT_SIZE_LEGEND = total_font_size      # 범례 텍스트
 FONT_SIZE_ANNOTATION = total_font_size  # 주석 텍스트 (Y축 단위 등)
 FONT_SIZE_GENERAL = total_font_size     # 일반 텍스트 (기본 폰트)
 
-# 나눔고딕 폰트 등록
-try:
-    fe = fm.FontEntry(
-        fname='C:/Users/USRP/AppData/Local/Microsoft/Windows/Fonts/NanumGothic.ttf',
-        name='NanumGothic')
-    fm.fontManager.ttflist.insert(0, fe)
-except:
-    print("나눔고딕 폰트를 찾을 수 없습니다. 기본 폰트를 사용합니다.")
+_MATPLOTLIB_READY = False
+fe = None
+
+
+def _init_matplotlib():
+    """matplotlib 경로에서 처음 필요할 때만 한글폰트/rcParams 설정 (1회)"""
+    global _MATPLOTLIB_READY, fe
+    if _MATPLOTLIB_READY:
+        return
+    _MATPLOTLIB_READY = True
+
+    from pandas.plotting import register_matplotlib_converters
+    import matplotlib.font_manager as _fm
+    import matplotlib.pyplot as _plt
+
+    register_matplotlib_converters()
+
+    # 폰트 설정
+    _plt.rcParams['font.family'] = 'Malgun Gothic'
+
+    # 나눔고딕 폰트 등록
+    try:
+        fe = _fm.FontEntry(
+            fname='C:/Users/USRP/AppData/Local/Microsoft/Windows/Fonts/NanumGothic.ttf',
+            name='NanumGothic')
+        _fm.fontManager.ttflist.insert(0, fe)
+    except:
+        print("나눔고딕 폰트를 찾을 수 없습니다. 기본 폰트를 사용합니다.")
+
+    _plt.rcParams.update({'font.size': FONT_SIZE_GENERAL, 'font.family': 'NanumGothic'})
+    _plt.rcParams['axes.unicode_minus'] = False
+
+
+# 한글폰트 설치 # - matplotlib 은 실제 사용 시점에 로드 + 폰트 설정
+plt = _LazyModule("matplotlib.pyplot", init=_init_matplotlib)
+fm = _LazyModule("matplotlib.font_manager", init=_init_matplotlib)
+mcolors = _LazyModule("matplotlib.colors")
+
+# plotly 차트 빌더용 모듈도 첫 사용 시 로드
+px = _LazyModule("plotly.express")
+go = _LazyModule("plotly.graph_objects")
+pio = _LazyModule("plotly.io")
+make_subplots = _LazyModule("plotly.subplots", attr="make_subplots")
+
+
+def __getattr__(name):
+    # font_list 는 fontManager 전체 순회가 필요하므로 요청 시에만 계산
+    if name == "font_list":
+        return [font.name for font in fm.fontManager.ttflist]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-plt.rcParams.update({'font.size': FONT_SIZE_GENERAL, 'font.family': 'NanumGothic'})
-plt.rcParams['axes.unicode_minus'] = False
 
 #### KPDS Color Palette #### 
 deepred_pds = "rgb(242,27,45)"
@@ -95,6 +189,9 @@ def _parse_color_to_rgb_tuple(color: str | None):
             raw = value[value.find("(") + 1 : value.find(")")].split(",")
             r, g, b = [_component_to_int(float(v.strip())) for v in raw[:3]]
             return r, g, b
+        if value.startswith("#") and len(value) in (4, 7):
+            digits = value[1:] if len(value) == 7 else "".join(ch * 2 for ch in value[1:])
+            return int(digits[0:2], 16), int(digits[2:4], 16), int(digits[4:6], 16)
         if value.startswith("#") or value.lower() in mcolors.get_named_colors_mapping():
             r_f, g_f, b_f = mcolors.to_rgb(value)
             return int(round(r_f * 255)), int(round(g_f * 255)), int(round(b_f * 255))
@@ -138,15 +235,29 @@ def _add_colors_from_palette(palette: list[str] | tuple[str, ...]) -> None:
             _KPDS_COLOR_TUPLES.add(rgb_tuple)
 
 
-for attribute in dir(px.colors.qualitative):
-    if attribute.startswith("_"):
-        continue
-    palette_candidate = getattr(px.colors.qualitative, attribute)
-    if isinstance(palette_candidate, (list, tuple)):
-        _add_colors_from_palette(palette_candidate)
+_PLOTLY_PALETTES_ADDED = False
+
+
+def _add_plotly_palettes() -> None:
+    """기본 5색 이후 plotly qualitative 팔레트를 확장 색상으로 추가 (최초 1회)"""
+    global _PLOTLY_PALETTES_ADDED
+    if _PLOTLY_PALETTES_ADDED:
+        return
+    _PLOTLY_PALETTES_ADDED = True
+    from plotly.colors import qualitative
+
+    for attribute in dir(qualitative):
+        if attribute.startswith("_"):
+            continue
+        palette_candidate = getattr(qualitative, attribute)
+        if isinstance(palette_candidate, (list, tuple)):
+            _add_colors_from_palette(palette_candidate)
 
 
 def _ensure_color_capacity(index: int) -> None:
+    if index < len(KPDS_EXTENDED_COLORS):
+        return
+    _add_plotly_palettes()
     if index < len(KPDS_EXTENDED_COLORS):
         return
     seed = len(KPDS_EXTENDED_COLORS)
@@ -160,19 +271,6 @@ def _ensure_color_capacity(index: int) -> None:
         _KPDS_COLOR_TUPLES.add(rgb_tuple)
 
 
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-
-# Jupyter notebook 호환성을 위한 plotly 설정
-try:
-    import plotly.io as pio
-    # 기본 렌더링 설정 (웹 브라우저 대신 기본값 사용)
-    # pio.renderers.default = "browser"  # 주석 처리
-    print("Plotly 기본 렌더링 설정 완료")
-except Exception as e:
-    print(f"Plotly 설정 실패: {e}")
-
 # 기본 폰트 설정
 font_dict = dict(
     family='NanumGothic',
@@ -180,6 +278,71 @@ font_dict = dict(
     color="black"
 )
 
+# 렌더링 모드 (긴 일간/주간 시리즈용, opt-in)
+# - "svg"  : 기존과 동일한 go.Scatter (기본값)
+# - "auto" : 포인트 수가 KPDS_WEBGL_THRESHOLD 를 넘으면 Scattergl + min/max 데시메이션
+# - "webgl": 항상 Scattergl, 목표 픽셀 폭보다 많으면 데시메이션
+PX_PER_CM = 37.7952755906
+DEFAULT_CHART_WIDTH_PX = 686
+KPDS_RENDER_MODE = os.environ.get("KPDS_RENDER_MODE", "svg").lower()
+KPDS_WEBGL_THRESHOLD = int(os.environ.get("KPDS_WEBGL_THRESHOLD", "5000"))
+
+
+def set_render_mode(mode="auto", threshold=None):
+    """라인 차트 기본 렌더링 모드 설정 ('svg', 'auto', 'webgl')"""
+    global KPDS_RENDER_MODE, KPDS_WEBGL_THRESHOLD
+    mode = str(mode).lower()
+    if mode not in ("svg", "auto", "webgl"):
+        raise ValueError(f"render mode must be 'svg', 'auto' or 'webgl', got {mode!r}")
+    KPDS_RENDER_MODE = mode
+    if threshold is not None:
+        KPDS_WEBGL_THRESHOLD = int(threshold)
+
+
+def decimate_minmax(x, y, n_buckets):
+    """픽셀 폭 기준 min/max 보존 데시메이션 (LTTB 계열)
+
+    x 범위를 n_buckets 개 구간(≈ 픽셀 열)으로 나누고 각 구간의 최솟값·최댓값과
+    전체 첫/끝 점만 시간 순서대로 남긴다. 피크와 저점은 그대로 유지되며 출력은
+    최대 2 * n_buckets + 2 포인트. 줄일 필요가 없으면 입력을 그대로 반환.
+    """
+    y_arr = np.asarray(y, dtype=float)
+    valid = np.flatnonzero(~np.isnan(y_arr))
+    n_buckets = max(1, int(n_buckets))
+    if len(valid) <= 2 * n_buckets + 2:
+        return x, y
+
+    x_index = pd.Index(x)
+    y_valid = y_arr[valid]
+    if isinstance(x_index, pd.DatetimeIndex):
+        pos = x_index.asi8[valid].astype(float)
+    elif pd.api.types.is_numeric_dtype(x_index):
+        pos = x_index.to_numpy(dtype=float)[valid]
+    else:
+        pos = valid.astype(float)
+    span = pos[-1] - pos[0]
+    if not span > 0:
+        pos, span = np.arange(len(valid), dtype=float), float(len(valid) - 1)
+
+    bucket = np.minimum(((pos - pos[0]) * n_buckets / span).astype(np.int64), n_buckets - 1)
+    order = np.lexsort((y_valid, bucket))  # 구간별 y 오름차순
+    sorted_bucket = bucket[order]
+    starts = np.flatnonzero(np.r_[True, sorted_bucket[1:] != sorted_bucket[:-1]])
+    ends = np.r_[starts[1:], len(order)] - 1
+    keep = np.unique(np.r_[order[starts], order[ends], 0, len(valid) - 1])
+    return x_index[valid[keep]], y_valid[keep]
+
+
+def _line_trace(x, y, render_mode=None, target_width_px=None, **trace_kwargs):
+    """렌더링 모드에 따라 go.Scatter 또는 (데시메이션된) go.Scattergl 생성"""
+    mode = (render_mode or KPDS_RENDER_MODE).lower()
+    if mode == "svg" or (mode == "auto" and len(y) <= KPDS_WEBGL_THRESHOLD):
+        return go.Scatter(x=x, y=y, **trace_kwargs)
+    width_px = int(target_width_px or DEFAULT_CHART_WIDTH_PX)
+    x_out, y_out = decimate_minmax(x, y, width_px)
+    return go.Scattergl(x=x_out, y=y_out, **trace_kwargs)
+
+
 def calculate_optimal_date_interval(data_length, data_span_years=None):
     """
     데이터 길이에 따라 최적의 날짜 간격을 자동 계산
@@ -211,16 +374,8 @@ def calculate_optimal_date_interval(data_length, data_span_years=None):
     else:  # 8년 초과
         return "M24"  # 2년
 
-def format_date_ticks(fig, date_format='%b-%y', tick_interval="auto", xdata=None):
-    """
-    plotly figure의 날짜 축을 원하는 형식으로 포맷팅 (확대 시 자동 조정 포함)
-    
-    Args:
-        fig: plotly figure 객체
-        date_format: 날짜 형식 ('%b-%y' = Jan-25 형식)
-        tick_interval: 날짜 간격 ("auto"=자동, "M1"=매월, "M3"=3개월, "M6"=6개월)
-        xdata: X축 데이터 (자동 간격 계산용, 선택사항)
-    """
+def _resolve_tick_interval(tick_interval="auto", xdata=None):
+    """"auto" tick 간격을 X축 데이터 길이/기간으로 확정 (format_date_ticks 와 레이아웃 캐시 공용)"""
     if tick_interval == "auto" and xdata is not None:
         try:
             data_length = len(xdata)
@@ -243,6 +398,20 @@ def format_date_ticks(fig, date_format='%b-%y', tick_interval="auto", xdata=None
     elif tick_interval == "auto":
         tick_interval = "M6"
     
+    return tick_interval
+
+def format_date_ticks(fig, date_format='%b-%y', tick_interval="auto", xdata=None):
+    """
+    plotly figure의 날짜 축을 원하는 형식으로 포맷팅 (확대 시 자동 조정 포함)
+    
+    Args:
+        fig: plotly figure 객체
+        date_format: 날짜 형식 ('%b-%y' = Jan-25 형식)
+        tick_interval: 날짜 간격 ("auto"=자동, "M1"=매월, "M3"=3개월, "M6"=6개월)
+        xdata: X축 데이터 (자동 간격 계산용, 선택사항)
+    """
+    tick_interval = _resolve_tick_interval(tick_interval, xdata)
+    
     # 멀티레벨 tick 설정으로 확대 시 더 세밀한 표시
     fig.update_xaxes(
         tickformat=date_format,
@@ -339,6 +508,192 @@ def get_dynamic_margins(ytitle1=None, ytitle2=None, title=None):
     return dict(l=left_margin, r=right_margin, t=top_margin, b=bottom_margin)
 
 
+# 레이아웃 스켈레톤 캐시
+# 라인/다중라인/이중축 차트는 데이터와 무관한 레이아웃(배경, 축 스타일, 범례, 0선,
+# 단위 annotation, margin, 제목, 날짜 tick)이 매번 동일하므로 키별로 한 번만 만들어 두고
+# 호출 시에는 go.Figure(layout=스켈레톤) 에 trace 만 붙인다.
+# 키: (차트 종류, 크기, 축/단위 제목, 차트 제목, tick 간격, 테마)
+LAYOUT_CACHE_SIZE = int(os.environ.get("KPDS_LAYOUT_CACHE_SIZE", "256"))
+
+
+def _theme_key():
+    """현재 폰트 설정 - 모듈 전역 폰트 크기를 바꾸면 새 스켈레톤이 만들어지도록 키에 포함"""
+    return ('NanumGothic', FONT_SIZE_GENERAL, FONT_SIZE_AXIS_TITLE, FONT_SIZE_LEGEND,
+            FONT_SIZE_ANNOTATION, FONT_SIZE_TITLE)
+
+
+def _build_layout_skeleton(chart_type, width, height, xtitle, ytitle, ytitle2, title,
+                           tick_interval, theme):
+    """chart_type('line' / 'dual_axis')별 데이터 독립 레이아웃 생성 (trace 없음)"""
+    font_family, size_general, size_axis, size_legend, size_annotation, size_title = theme
+    axis_title_font = dict(family=font_family, size=size_axis)
+
+    yaxis = dict(
+        title=dict(text=None, font=axis_title_font),
+        showline=False, 
+        tickcolor='white',
+        tickformat=',',
+        showgrid=False
+    )
+    layout = dict(
+        paper_bgcolor='white',
+        plot_bgcolor='white',
+        width=width, 
+        height=height, 
+        font=dict(family=font_family, size=size_general, color="black"),
+        xaxis=dict(
+            title=dict(text=xtitle, font=axis_title_font),
+            showline=True, linewidth=1.3, linecolor='lightgrey', 
+            tickwidth=1.3, tickcolor='lightgrey',
+            ticks='outside',
+            showgrid=False
+        ),
+        yaxis=yaxis,
+        legend=dict(
+            orientation="h",
+            yanchor="bottom", y=1.05,
+            xanchor="center", x=0.5,
+            font=dict(family=font_family, size=size_legend),
+            borderwidth=0,
+            bordercolor="rgba(0,0,0,0)"
+        ),
+        showlegend=True
+    )
+    if chart_type == 'dual_axis':
+        layout['yaxis2'] = dict(yaxis, anchor="x", overlaying="y", side="right")
+
+    fig = go.Figure(layout=layout)
+    fig = format_date_ticks(fig, '%b-%y', tick_interval)
+
+    # 0선 추가
+    fig.add_hline(y=0, line_width=1, line_color="black", opacity=0.5)
+
+    # Y축 단위 annotation (자동 위치 계산)
+    annotation_font = dict(family=font_family, size=size_annotation, color="black")
+    for text, side in ((ytitle, 'left'), (ytitle2, 'right')):
+        if text:
+            fig.add_annotation(
+                text=text,
+                xref="paper", yref="paper",
+                x=calculate_title_position(text, side), y=1.1,
+                showarrow=False,
+                font=annotation_font,
+                align='left'
+            )
+
+    # 동적 margin + 제목
+    fig.update_layout(
+        title=dict(text=title, font=dict(family=font_family, size=size_title)) if title else None,
+        margin=get_dynamic_margins(ytitle1=ytitle, ytitle2=ytitle2, title=title)
+    )
+    return fig.layout
+
+
+_cached_layout_skeleton = functools.lru_cache(maxsize=LAYOUT_CACHE_SIZE)(_build_layout_skeleton)
+
+
+def _skeleton_figure(chart_type, xdata, xtitle=None, ytitle=None, ytitle2=None, title=None,
+                     width=686, height=400):
+    """캐시된 레이아웃 스켈레톤으로 빈 Figure 생성 (go.Figure 가 레이아웃을 복사하므로 캐시는 불변)"""
+    args = (chart_type, width, height, xtitle, ytitle, ytitle2, title,
+            _resolve_tick_interval("auto", xdata), _theme_key())
+    try:
+        layout = _cached_layout_skeleton(*args)
+    except TypeError:  # 해시 불가능한 제목 등 - 캐시 없이 생성
+        layout = _build_layout_skeleton(*args)
+    return go.Figure(layout=layout)
+
+
+def clear_layout_cache():
+    """레이아웃 스켈레톤 캐시 비우기"""
+    _cached_layout_skeleton.cache_clear()
+
+
+# 렌더링된 차트 캐시 (대시보드 rerun 용)
+# Streamlit 은 관련 없는 위젯만 바뀌어도 스크립트 전체를 다시 실행하므로, 데이터 버전과
+# 차트 설정으로 만든 fingerprint 가 같으면 직렬화해 둔 Figure 를 그대로 다시 보낸다.
+# 프로세스 전역 LRU 이며 항목 수와 직렬화 크기(MB) 두 가지 상한으로 제거한다.
+CHART_CACHE_MAX_MB = float(os.environ.get("KPDS_CHART_CACHE_MB", "128"))
+CHART_CACHE_MAX_ENTRIES = int(os.environ.get("KPDS_CHART_CACHE_ENTRIES", "256"))
+
+
+def chart_fingerprint(*parts):
+    """차트 캐시 키 - 선택 시리즈, 데이터 타입, 기간, 차트 유형/크기, 데이터 버전 등을 해시
+
+    dict 는 키 순서와 무관하게, 그 밖의 값(Timestamp, tuple 등)은 str() 로 직렬화한다.
+    """
+    payload = json.dumps(parts, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+class FigureCache:
+    """fingerprint → 직렬화된 Figure(JSON) LRU 캐시 (스레드 안전)"""
+
+    def __init__(self, max_mb=CHART_CACHE_MAX_MB, max_entries=CHART_CACHE_MAX_ENTRIES):
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.max_entries = int(max_entries)
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """캐시된 Figure 를 새 객체로 복원 (없으면 None)"""
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return pio.from_json(payload)
+
+    def put(self, key, fig):
+        if fig is None:
+            return
+        payload = fig.to_json()
+        size = len(payload)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= len(old)
+            self._entries[key] = payload
+            self._bytes += size
+            while self._entries and (self._bytes > self.max_bytes or len(self._entries) > self.max_entries):
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+
+    def get_or_build(self, key, builder):
+        """키가 있으면 캐시에서 복원, 없으면 builder() 로 생성 후 저장"""
+        if key is None:
+            return builder()
+        fig = self.get(key)
+        if fig is None:
+            fig = builder()
+            self.put(key, fig)
+        return fig
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "mb": round(self._bytes / (1024 * 1024), 2),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+chart_cache = FigureCache()
+
+
 def format_date_axis(fig, date_format='monthly'):
     """
     날짜 축 포맷팅
@@ -369,7 +724,7 @@ def df2xa(df, dim_list, coordinates):
 # 데이터프레임 기반 입력을 지원하는 새로운 함수들
 
 def df_line_chart(df, column=None, title=None, xtitle=None, ytitle=None, label=None, 
-                 width_cm=9.5, height_cm=6.5):
+                 width_cm=9.5, height_cm=6.5, render_mode=None, target_width_px=None):
     """
     데이터프레임에서 단일 시리즈 라인 차트 생성
     
@@ -382,6 +737,8 @@ def df_line_chart(df, column=None, title=None, xtitle=None, ytitle=None, label=N
         label: 시리즈 라벨 (None이면 column명 사용)
         width_cm: 차트 너비 (cm, 기본값: 9.5)
         height_cm: 차트 높이 (cm, 기본값: 6.5)
+        render_mode: 'svg' / 'auto' / 'webgl' (None이면 KPDS_RENDER_MODE)
+        target_width_px: 데시메이션 목표 픽셀 폭 (예: int(chart_width_cm * PX_PER_CM))
     """
     # column 자동 선택
     if column is None:
@@ -395,94 +752,24 @@ def df_line_chart(df, column=None, title=None, xtitle=None, ytitle=None, label=N
     if ytitle is None:
         ytitle = column
     
-    fig = go.Figure()
+    fig = _skeleton_figure('line', df.index, xtitle=xtitle, ytitle=ytitle, title=title)
     fig.add_trace(
-        go.Scatter(
-            x=df.index, 
-            y=df[column], 
-            name=label, 
-            line_color=deepred_pds, 
+        _line_trace(
+            df.index,
+            df[column],
+            render_mode=render_mode,
+            target_width_px=target_width_px,
+            name=label,
+            line_color=deepred_pds,
             yaxis='y'
         )
     )
     
-    # 폰트 설정
-    font_family = 'NanumGothic'
-    chart_font = dict(
-        family=font_family,
-        size=FONT_SIZE_GENERAL,
-        color="black"
-    )
-    
-    fig.update_layout(
-        paper_bgcolor='white',
-        plot_bgcolor='white',
-        width=686, 
-        height=400, 
-        font=chart_font,
-        xaxis=dict(
-            title=dict(text=xtitle, font=dict(family=font_family, size=FONT_SIZE_AXIS_TITLE)),
-            showline=True, linewidth=1.3, linecolor='lightgrey', 
-            tickwidth=1.3, tickcolor='lightgrey',
-            ticks='outside',
-            showgrid=False
-        ),
-        yaxis=dict(
-            title=dict(text=None, font=dict(family=font_family, size=FONT_SIZE_AXIS_TITLE)),
-            showline=False, 
-            tickcolor='white',
-            tickformat=',',
-            showgrid=False
-        ),
-        legend=dict(
-            orientation="h",
-            yanchor="bottom", y=1.05,
-            xanchor="center", x=0.5,
-            font=dict(family=font_family, size=FONT_SIZE_LEGEND),
-            borderwidth=0,
-            bordercolor="rgba(0,0,0,0)"
-        ),
-        showlegend=True
-    )
-    
-    # 날짜 포맷 적용 (자동 간격 계산, zoom 지원)
-    fig = format_date_ticks(fig, '%b-%y', "auto", df.index)
-
-    # 0선 추가
-    fig.add_hline(y=0, line_width=1, line_color="black", opacity=0.5)
-
-    # Y축 단위 annotation (자동 위치 계산)
-    if ytitle:
-        x_pos = calculate_title_position(ytitle, 'left')
-        fig.add_annotation(
-            text=ytitle,
-            xref="paper", yref="paper",
-            x=x_pos, y=1.1,
-            showarrow=False,
-            font=dict(size=FONT_SIZE_ANNOTATION, family=font_family, color="black"),
-            align='left'
-        )
-
-    # 동적 margin 적용
-    margins = get_dynamic_margins(ytitle1=ytitle, title=title)
-    
-    # 제목 여부에 따른 여백 조정
-    if title:
-        fig.update_layout(
-            title=dict(text=title, font=dict(family=font_family, size=FONT_SIZE_TITLE)),
-            margin=margins
-        )
-    else:
-        fig.update_layout(
-            title=None,
-            margin=margins
-        )
-    
     fig.show()
     return fig
 
 def df_multi_line_chart(df, columns=None, title=None, xtitle=None, ytitle=None, labels=None, 
-                       width_cm=9.5, height_cm=6.5):
+                       width_cm=9.5, height_cm=6.5, render_mode=None, target_width_px=None):
     """
     데이터프레임에서 다중 시리즈 라인 차트 생성 (동적 데이터 수 지원)
     
@@ -495,12 +782,14 @@ def df_multi_line_chart(df, columns=None, title=None, xtitle=None, ytitle=None,
         labels: 시리즈 라벨 딕셔너리 (None이면 column명 사용)
         width_cm: 차트 너비 (cm, 기본값: 9.5)
         height_cm: 차트 높이 (cm, 기본값: 6.5)
+        render_mode: 'svg' / 'auto' / 'webgl' (None이면 KPDS_RENDER_MODE)
+        target_width_px: 데시메이션 목표 픽셀 폭 (예: int(chart_width_cm * PX_PER_CM))
     """
     # columns 자동 선택
     if columns is None:
         columns = df.columns.tolist()
     
-    fig = go.Figure()
+    fig = _skeleton_figure('line', df.index, xtitle=xtitle, ytitle=ytitle, title=title)
     
     # 동적으로 데이터 수를 판단해서 색상 할당
     for i, col in enumerate(columns):
@@ -508,86 +797,16 @@ def df_multi_line_chart(df, columns=None, title=None, xtitle=None, ytitle=None,
         color = get_kpds_color(i)  # KPDS 색상 순서대로 할당
         
         fig.add_trace(
-            go.Scatter(
-                x=df.index, 
-                y=df[col], 
+            _line_trace(
+                df.index,
+                df[col],
+                render_mode=render_mode,
+                target_width_px=target_width_px,
                 name=label,
                 line_color=color
             )
         )
     
-    # 폰트 설정
-    font_family = 'NanumGothic'
-    chart_font = dict(
-        family=font_family,
-        size=FONT_SIZE_GENERAL,
-        color="black"
-    )
-    
-    fig.update_layout(
-        paper_bgcolor='white',
-        plot_bgcolor='white',
-        width=686, 
-        height=400, 
-        font=chart_font,
-        xaxis=dict(
-            title=dict(text=xtitle, font=dict(family=font_family, size=FONT_SIZE_AXIS_TITLE)),
-            showline=True, linewidth=1.3, linecolor='lightgrey', 
-            tickwidth=1.3, tickcolor='lightgrey',
-            ticks='outside',
-            showgrid=False
-        ),
-        yaxis=dict(
-            title=dict(text=None, font=dict(family=font_family, size=FONT_SIZE_AXIS_TITLE)),
-            showline=False, 
-            tickcolor='white',
-            tickformat=',',
-            showgrid=False
-        ),
-        legend=dict(
-            orientation="h",
-            yanchor="bottom", y=1.05,
-            xanchor="center", x=0.5,
-            font=dict(family=font_family, size=FONT_SIZE_LEGEND),
-            borderwidth=0,
-            bordercolor="rgba(0,0,0,0)"
-        ),
-        showlegend=True
-    )
-    
-    # 날짜 포맷 적용 (자동 간격 계산, zoom 지원)
-    fig = format_date_ticks(fig, '%b-%y', "auto", df.index)
-
-    # 0선 추가
-    fig.add_hline(y=0, line_width=1, line_color="black", opacity=0.5)
-
-    # Y축 단위 annotation (자동 위치 계산)
-    if ytitle:
-        x_pos = calculate_title_position(ytitle, 'left')
-        fig.add_annotation(
-            text=ytitle,
-            xref="paper", yref="paper",
-            x=x_pos, y=1.1,
-            showarrow=False,
-            font=dict(size=FONT_SIZE_ANNOTATION, family=font_family, color="black"),
-            align='left'
-        )
-
-    # 동적 margin 적용
-    margins = get_dynamic_margins(ytitle1=ytitle, title=title)
-    
-    # 제목 여부에 따른 여백 조정
-    if title:
-        fig.update_layout(
-            title=dict(text=title, font=dict(family=font_family, size=FONT_SIZE_TITLE)),
-            margin=margins
-        )
-    else:
-        fig.update_layout(
-            title=None,
-            margin=margins
-        )
-    
     fig.show()
     return fig
 
@@ -970,7 +1189,7 @@ def df_dual_axis_chart(df, left_cols=None, right_cols=None,
                       left_labels=None, right_labels=None, 
                       left_title=None, right_title=None, 
                       title=None, xtitle=None, 
-                      width_cm=9.5, height_cm=6.5):
+                      width_cm=9.5, height_cm=6.5, render_mode=None, target_width_px=None):
     """
     데이터프레임에서 이중 Y축 차트 생성 (다중 시리즈 지원)
     
@@ -986,6 +1205,8 @@ def df_dual_axis_chart(df, left_cols=None, right_cols=None,
         xtitle: X축 제목
         width_cm: 차트 너비 (cm, 기본값: 9.5)
         height_cm: 차트 높이 (cm, 기본값: 6.5)
+        render_mode: 'svg' / 'auto' / 'webgl' (None이면 KPDS_RENDER_MODE)
+        target_width_px: 데시메이션 목표 픽셀 폭 (예: int(chart_width_cm * PX_PER_CM))
     """
     # 열 자동 선택 및 리스트 변환
     if left_cols is None:
@@ -1009,7 +1230,8 @@ def df_dual_axis_chart(df, left_cols=None, right_cols=None,
     elif isinstance(right_labels, str):
         right_labels = [right_labels]
     
-    fig = go.Figure()
+    fig = _skeleton_figure('dual_axis', df.index, xtitle=xtitle,
+                           ytitle=left_title, ytitle2=right_title, title=title)
     
     # 왼쪽 Y축 데이터 추가 (deepred_pds부터 시작)
     left_color_index = 0
@@ -1018,10 +1240,12 @@ def df_dual_axis_chart(df, left_cols=None, right_cols=None,
         color = get_kpds_color(left_color_index)
         
         fig.add_trace(
-            go.Scatter(
-                x=df.index, y=df[col], 
-                name=label, 
-                line_color=color, 
+            _line_trace(
+                df.index, df[col],
+                render_mode=render_mode,
+                target_width_px=target_width_px,
+                name=label,
+                line_color=color,
                 yaxis='y'
             )
         )
@@ -1033,10 +1257,12 @@ def df_dual_axis_chart(df, left_cols=None, right_cols=None,
         color = get_kpds_color(left_color_index + i)
         
         fig.add_trace(
-            go.Scatter(
-                x=df.index, y=df[col], 
-                name=label, 
-                line_color=color, 
+            _line_trace(
+                df.index, df[col],
+                render_mode=render_mode,
+                target_width_px=target_width_px,
+                name=label,
+                line_color=color,
                 yaxis='y2'
             )
         )
@@ -1048,100 +1274,7 @@ def df_dual_axis_chart(df, left_cols=None, right_cols=None,
     left_range = [left_data.min() * 0.95, left_data.max() * 1.05]
     right_range = [right_data.min() * 0.95, right_data.max() * 1.05]
     
-    # 폰트 설정
-    font_family = 'NanumGothic'
-    chart_font = dict(
-        family=font_family,
-        size=FONT_SIZE_GENERAL,
-        color="black"
-    )
-    
-    fig.update_layout(
-        paper_bgcolor='white',
-        plot_bgcolor='white',
-        width=686, 
-        height=400, 
-        font=chart_font,
-        xaxis=dict(
-            title=dict(text=xtitle, font=dict(family=font_family, size=FONT_SIZE_AXIS_TITLE)),
-            showline=True, linewidth=1.3, linecolor='lightgrey', 
-            tickwidth=1.3, tickcolor='lightgrey',
-            ticks='outside',
-            showgrid=False
-        ),
-        yaxis=dict(
-            title=dict(text=None, font=dict(family=font_family, size=FONT_SIZE_AXIS_TITLE)),
-            range=left_range,
-            tickformat=',',
-            showline=False, 
-            tickcolor='white',
-            showgrid=False
-        ),
-        yaxis2=dict(
-            title=dict(text=None, font=dict(family=font_family, size=FONT_SIZE_AXIS_TITLE)),
-            range=right_range,
-            tickformat=',',
-            showline=False, 
-            tickcolor='white',
-            anchor="x", 
-            overlaying="y", 
-            side="right",
-            showgrid=False
-        ),
-        legend=dict(
-            orientation="h",
-            yanchor="bottom", y=1.05,
-            xanchor="center", x=0.5,
-            font=dict(family=font_family, size=FONT_SIZE_LEGEND),
-            borderwidth=0,
-            bordercolor="rgba(0,0,0,0)"
-        ),
-        showlegend=True
-    )
-
-    # 날짜 포맷 적용 (자동 간격 계산, zoom 지원)
-    fig = format_date_ticks(fig, '%b-%y', "auto", df.index)
-
-    # 0선 추가
-    fig.add_hline(y=0, line_width=1, line_color="black", opacity=0.5)
-
-    # 동적 margin 적용
-    margins = get_dynamic_margins(ytitle1=left_title, ytitle2=right_title, title=title)
-    
-    # 제목 및 margin 설정
-    if title:
-        fig.update_layout(
-            title=dict(text=title, font=dict(family=font_family, size=FONT_SIZE_TITLE)),
-            margin=margins
-        )
-    else:
-        fig.update_layout(
-            title=None,
-            margin=margins
-        )
-
-    # Y축 제목 annotation
-    if left_title:
-        x_pos_left = calculate_title_position(left_title, 'left')
-        fig.add_annotation(
-            text=left_title,
-            xref="paper", yref="paper",
-            x=x_pos_left, y=1.1,
-            showarrow=False,
-            font=dict(family=font_family, size=FONT_SIZE_ANNOTATION, color="black"),
-            align='left'
-        )
-
-    if right_title:
-        x_pos_right = calculate_title_position(right_title, 'right')
-        fig.add_annotation(
-            text=right_title,
-            xref="paper", yref="paper",
-            x=x_pos_right, y=1.1,
-            showarrow=False,
-            font=dict(family=font_family, size=FONT_SIZE_ANNOTATION, color="black"),
-            align='left'
-        )
+    fig.update_layout(yaxis_range=left_range, yaxis2_range=right_range)
     
     fig.show()
     return fig
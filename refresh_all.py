@@ -0,0 +1,528 @@
+#!/usr/bin/env python3
+"""
+Unified refresh orchestrator for all data subsystems.
+
+Declares the refresh steps as a dependency DAG and runs them in one process:
+
+  fx_rates       fx_rates.build_fx_rates (incremental, last FX_RECENT_DAYS)   [yahoo]
+  prices         world_indices.update_all_daily_data (primary symbols)        [yahoo]
+  valuations     world_indices.update_all_valuations        <- prices          [yahoo]
+  krx            world_indices.update_krx_indices (pykrx)                      [krx]
+  returns        world_returns.compute_returns_table + save  <- prices, fx_rates
+  jodi           jodi_etl.cli fetch --incremental                              [jodi]
+  us_eco.<stem>  the load_*_data() entry point of each us_eco *_refactor
+                 module (US_ECO_ENTRY_POINTS)                                  [us_eco]
+
+Tasks in the same [lane] share an API (rate limits, key rotation) and run one
+at a time; different lanes run concurrently, so the network-bound us_eco and
+JODI refreshes overlap with the Yahoo chain. A task starts once its
+dependencies succeeded; when a dependency fails its dependents are reported
+as blocked and the remaining branches keep going.
+
+Freshness: refresh_runs/state.json records the last success of every task.
+A task is skipped when its last success is younger than its max age and no
+dependency has been refreshed since (--force disables this). --resume
+re-runs only what did not succeed in the previous run (failed, blocked or
+interrupted). Each run writes one JSON report (task statuses plus the
+run_metrics request/stage report) to refresh_runs/run_<id>.json and
+refresh_runs/latest.json.
+
+The price/valuation/KRX settings honour the same environment variables as
+`python global_universe/world_indices.py` (PRICE_SCOPE, PRICE_PAUSE,
+PRICE_LOOKBACK, VALUATION_PAUSE, KRX_VAL_MODE, KRX_PRICE_MODE, ...).
+
+Usage:
+  python refresh_all.py
+  python refresh_all.py --dry-run
+  python refresh_all.py --only valuations --only us_eco.CPI_analysis_refactor
+  python refresh_all.py --resume
+  python refresh_all.py --skip us_eco --force
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+REPO_ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(REPO_ROOT))
+import run_metrics
+
+_log = run_metrics.get_logger("refresh")
+
+RUNS_DIR = REPO_ROOT / "refresh_runs"
+STATE_FILE = RUNS_DIR / "state.json"
+DEFAULT_WORKERS = 4
+
+# 성공으로 간주하는 상태 (의존 작업 실행 가능)
+DONE_STATUSES = ("ok", "fresh", "resumed")
+
+
+def _env_flag(name: str, default: str = "0") -> bool:
+    return os.environ.get(name, default).lower() in {"1", "true", "yes", "on"}
+
+
+# %%
+# === 작업 정의 ===
+
+@dataclass
+class Task:
+    name: str
+    fn: Callable[[], object]
+    deps: tuple = ()
+    lane: Optional[str] = None      # 같은 lane 은 직렬 실행 (None = 제한 없음)
+    max_age_hours: float = 12.0
+    description: str = ""
+    prepare: Optional[Callable[[], None]] = field(default=None, repr=False)
+
+
+def _world_indices():
+    from global_universe import world_indices
+    return world_indices
+
+
+def _run_fx_rates():
+    from global_universe import fx_rates
+    written = fx_rates.build_fx_rates(recent_days=int(os.environ.get("FX_RECENT_DAYS", "30")))
+    return {"written": [str(p) for p in written]}
+
+
+def _run_prices():
+    wi = _world_indices()
+    if os.environ.get("PRICE_SCOPE", "primary").lower() == "all":
+        syms = wi.list_all_symbols(wi.investment_universe)
+    else:
+        syms = wi.list_primary_symbols(wi.investment_universe)
+    return wi.update_all_daily_data(
+        wi.investment_universe,
+        pause=float(os.environ.get("PRICE_PAUSE", "0.3")),
+        symbols=syms,
+        lookback_days=int(os.environ.get("PRICE_LOOKBACK", "7")),
+    )
+
+
+def _run_valuations():
+    wi = _world_indices()
+    max_info_calls = os.environ.get("MAX_INFO_CALLS")
+    return wi.update_all_valuations(
+        wi.investment_universe,
+        pause=float(os.environ.get("VALUATION_PAUSE", "0.2")),
+        mode=os.environ.get("VALUATION_FETCH_MODE", "batch_quote"),
+        chunk=int(os.environ.get("VALUATION_CHUNK", "20")),
+        info_fallback=_env_flag("VALUATION_INFO_FALLBACK", "1"),
+        max_info_calls=int(max_info_calls) if max_info_calls else None,
+    )
+
+
+def _run_krx():
+    wi = _world_indices()
+    summary = wi.update_krx_indices(
+        run_backfill=os.environ.get("KRX_VAL_MODE", "backfill").lower() == "backfill",
+        price_mode=os.environ.get("KRX_PRICE_MODE", "full"),
+        price_years=int(os.environ.get("KRX_PRICE_YEARS", "3")),
+        workers=int(os.environ.get("KRX_WORKERS", "1")),
+        by_date=_env_flag("KRX_BY_DATE"),
+    )
+    if summary is None:
+        # update_krx_indices 는 pykrx import/배치 실패 시 None 반환
+        raise RuntimeError("KRX 업데이트 실패 (pykrx 사용 불가 또는 배치 오류)")
+    return summary
+
+
+def _run_returns():
+    from global_universe import world_returns
+    df = world_returns.compute_returns_table(period=os.environ.get("RETURNS_PERIOD", "ytd"))
+    return {"rows": len(df), "path": str(world_returns.save_returns_report(df))}
+
+
+def _run_jodi():
+    from jodi_etl import cli as jodi_cli
+    rc = jodi_cli.main(["fetch", "--incremental", "--quiet"])
+    if rc:
+        raise RuntimeError(f"jodi fetch 종료 코드 {rc}")
+    return jodi_cli.load_change_manifest()
+
+
+# us_eco 모듈별 데이터 로드 진입점 (인자 없이 호출하면 모듈 기본값으로 스마트 업데이트)
+US_ECO_ENTRY_POINTS = {
+    "ADP_employ_refactor": "load_adp_data",
+    "CES_employ_refactor": "load_ces_employ_data",
+    "CPI_analysis_refactor": "load_cpi_data",
+    "CPS_employ_refactor": "load_cps_data",
+    "JOLTS_employ_refactor": "load_jolts_data",
+    "PPI_analysis_refactor": "load_ppi_data",
+    "atlanta_wage_growth_refactor": "load_atlanta_wage_growth_data",
+    "construction_spending_refactor": "load_construction_spending_data",
+    "durable_goods_refactor": "load_durable_goods_data",
+    "fed_balance_sheet_refactor": "load_fed_balance_data",
+    "fed_pmi_refactor": "load_all_fed_pmi_data_enhanced",
+    "gdp_analysis_refactor": "load_gdp_data",
+    "house_price_refactor": "load_house_price_data",
+    "house_sales_stock_refactor": "load_house_sales_stock_data",
+    "import_price_refactor_v2": "load_import_data",
+    "industrial_production_refactor": "load_industrial_production_data",
+    "int_trade_refactor": "load_int_trade_data",
+    "ism_pmi_refactor": "load_ism_data",
+    "misc_fred_series_refactor": "load_misc_fred_data",
+    "new_residential_construction_refactor": "load_new_residential_construction_data",
+    "pce_analysis_refactor": "load_pce_data",
+    "personal_income_refactor": "load_personal_income_data",
+    "realtor_housing_inventory_refactor": "load_realtor_housing_inventory_data",
+    "retail_sales_refactor": "load_retail_sales_data",
+}
+
+
+class _UsEcoRefresh:
+    """us_eco 모듈의 `load_*_data()` 진입점을 실제 API 로더로 호출.
+
+    모듈 import 는 하단 예시 셀(차트/출력)까지 실행하므로 CSV 전용 로더로 오프라인
+    import 하고 (stdout 을 가려야 함) 실행 계획 단계에서 메인 스레드가 미리 해 둔다
+    (`prepare`). `from us_eco_utils import *` 로 복사된 로더 이름은 import 시점의
+    CSV 전용 로더를 가리키므로 호출 전에 실제 로더로 다시 묶는다.
+    """
+
+    def __init__(self, stem: str, entry_point: str):
+        self.stem = stem
+        self.entry_point = entry_point
+        self.module = None
+        self.error: Optional[BaseException] = None
+
+    def prepare(self) -> None:
+        try:
+            us_eco_dir = str(REPO_ROOT / "us_eco")
+            if us_eco_dir not in sys.path:
+                sys.path.insert(0, us_eco_dir)
+            import batch_render
+
+            batch_render._init_worker(quiet=False)  # fig.show() 무력화
+            with contextlib.redirect_stdout(io.StringIO()):
+                self.module = batch_render._import_module_offline(self.stem)
+        except Exception as e:
+            self.error = e
+
+    def __call__(self):
+        if self.error is not None:
+            raise self.error
+        import us_eco_utils
+
+        self.module.load_economic_data = us_eco_utils.load_economic_data
+        self.module.load_economic_data_grouped = us_eco_utils.load_economic_data_grouped
+        result = getattr(self.module, self.entry_point)()
+        if not result:
+            # 진입점은 실패 시 False / None 반환
+            raise RuntimeError(f"{self.stem}.{self.entry_point}() 데이터 로드 실패")
+        return {"entry_point": self.entry_point}
+
+
+def build_tasks(us_eco_modules: Optional[List[str]] = None) -> Dict[str, Task]:
+    tasks = [
+        Task("fx_rates", _run_fx_rates, lane="yahoo", description="FX 종가 스토어 증분 갱신"),
+        Task("prices", _run_prices, lane="yahoo", description="세계 지수 일별 가격"),
+        Task("valuations", _run_valuations, deps=("prices",), lane="yahoo", description="밸류에이션 스냅샷"),
+        Task("krx", _run_krx, lane="krx", description="KRX 지수 가격/밸류에이션"),
+        Task("returns", _run_returns, deps=("prices", "fx_rates"), description="수익률 리포트"),
+        Task("jodi", _run_jodi, lane="jodi", max_age_hours=24.0, description="JODI Oil 증분 다운로드"),
+    ]
+    for stem in us_eco_modules or US_ECO_ENTRY_POINTS:
+        if stem not in US_ECO_ENTRY_POINTS:
+            raise ValueError(f"진입점이 등록되지 않은 us_eco 모듈: {stem}")
+        job = _UsEcoRefresh(stem, US_ECO_ENTRY_POINTS[stem])
+        tasks.append(Task(f"us_eco.{stem}", job, lane="us_eco", prepare=job.prepare,
+                          description=f"{stem}.{job.entry_point}()"))
+    return {t.name: t for t in tasks}
+
+
+# %%
+# === DAG 계획 ===
+
+def topo_order(tasks: Dict[str, Task]) -> List[str]:
+    """선언 순서를 유지하는 위상 정렬 (순환 의존성은 ValueError)."""
+    order: List[str] = []
+    visiting: set = set()
+
+    def visit(name: str, path: tuple) -> None:
+        if name in order:
+            return
+        if name in visiting:
+            raise ValueError(f"순환 의존성: {' -> '.join(path + (name,))}")
+        visiting.add(name)
+        for dep in tasks[name].deps:
+            if dep in tasks:  # 선택에서 빠진 의존 작업은 순서 제약 없음
+                visit(dep, path + (name,))
+        visiting.discard(name)
+        order.append(name)
+
+    for name in tasks:
+        visit(name, ())
+    return order
+
+
+def _matches(name: str, selectors: List[str]) -> bool:
+    return any(name == s or name.startswith(s + ".") for s in selectors)
+
+
+def select_tasks(tasks: Dict[str, Task], only: Optional[List[str]], skip: Optional[List[str]]) -> Dict[str, Task]:
+    """--only (상위 의존 작업 포함) / --skip 적용. 'us_eco' 처럼 접두어로도 지정 가능."""
+    for sel in (only or []) + (skip or []):
+        if not any(_matches(name, [sel]) for name in tasks):
+            raise ValueError(f"알 수 없는 작업: {sel}")
+    selected = set(tasks)
+    if only:
+        selected = set()
+        stack = [name for name in tasks if _matches(name, only)]
+        while stack:
+            name = stack.pop()
+            if name not in selected:
+                selected.add(name)
+                stack.extend(tasks[name].deps)
+    if skip:
+        selected = {name for name in selected if not _matches(name, skip)}
+    return {name: t for name, t in tasks.items() if name in selected}
+
+
+def _parse_ts(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
+def plan_tasks(tasks: Dict[str, Task], state: dict, force: bool = False, resume: bool = False,
+               max_age_hours: Optional[float] = None, now: Optional[datetime] = None) -> Dict[str, str]:
+    """작업별 결정: run / fresh (최신 - 건너뜀) / resumed (직전 실행에서 성공).
+
+    선택에서 빠진 의존 작업은 제약으로만 본다 (마지막 성공 시각 비교).
+    """
+    now = now or datetime.now()
+    records = state.get("tasks", {})
+    last_statuses = state.get("last_run", {}).get("statuses", {})
+    plan: Dict[str, str] = {}
+    for name in topo_order(tasks):
+        task = tasks[name]
+        if force:
+            plan[name] = "run"
+            continue
+        if resume and last_statuses.get(name) in DONE_STATUSES:
+            plan[name] = "resumed"
+            continue
+        last_success = _parse_ts(records.get(name, {}).get("last_success"))
+        max_age = timedelta(hours=task.max_age_hours if max_age_hours is None else max_age_hours)
+        if last_success is None or now - last_success > max_age:
+            plan[name] = "run"
+            continue
+        stale = False
+        for dep in task.deps:
+            dep_success = _parse_ts(records.get(dep, {}).get("last_success"))
+            if plan.get(dep) == "run" or (dep_success is not None and dep_success > last_success):
+                stale = True
+        plan[name] = "run" if stale else "fresh"
+    return plan
+
+
+# %%
+# === 상태 / 리포트 ===
+
+def _atomic_write_json(path: Path, payload: dict) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(payload, ensure_ascii=False, indent=2, default=str), encoding="utf-8")
+    os.replace(tmp, path)
+    return path
+
+
+def load_state(path: Path = STATE_FILE) -> dict:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {"tasks": {}}
+
+
+def _summarize(result) -> object:
+    """작업 반환값을 리포트용으로 축약 (DataFrame 은 행 수만)."""
+    if result is None or isinstance(result, (str, int, float, bool)):
+        return result
+    if isinstance(result, dict):
+        return {k: v for k, v in result.items() if isinstance(v, (str, int, float, bool, list, type(None)))}
+    if hasattr(result, "shape"):
+        return {"rows": int(result.shape[0])}
+    return repr(result)[:200]
+
+
+def _execute(task: Task) -> dict:
+    started = datetime.now()
+    t0 = time.perf_counter()
+    _log.info(f"▶️ {task.name} 시작")
+    try:
+        with run_metrics.stage(f"refresh.{task.name}"):
+            result = task.fn()
+    except (Exception, SystemExit) as e:
+        seconds = time.perf_counter() - t0
+        _log.error(f"❌ {task.name} 실패 ({seconds:.1f}s): {e}")
+        _log.debug(traceback.format_exc())
+        return {"status": "failed", "started_at": started.isoformat(timespec="seconds"),
+                "seconds": round(seconds, 3), "error": f"{type(e).__name__}: {e}"}
+    seconds = time.perf_counter() - t0
+    _log.info(f"✅ {task.name} 완료 ({seconds:.1f}s)")
+    return {"status": "ok", "started_at": started.isoformat(timespec="seconds"),
+            "seconds": round(seconds, 3), "summary": _summarize(result)}
+
+
+# %%
+# === 실행 ===
+
+def run_refresh(tasks: Dict[str, Task], plan: Dict[str, str], state: dict,
+                workers: int = DEFAULT_WORKERS, state_path: Path = STATE_FILE) -> dict:
+    """계획대로 DAG 실행. 작업이 끝날 때마다 state 를 저장하므로 중단돼도 --resume 가능."""
+    run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+    run_started = datetime.now()
+    order = topo_order(tasks)
+    results: Dict[str, dict] = {name: {"status": plan[name]} for name in order if plan[name] != "run"}
+    state.setdefault("tasks", {})
+    state["last_run"] = {"run_id": run_id, "started_at": run_started.isoformat(timespec="seconds"),
+                         "statuses": {name: results.get(name, {}).get("status", "pending") for name in order}}
+    _atomic_write_json(state_path, state)
+
+    def finish(name: str, result: dict) -> None:
+        results[name] = result
+        record = state["tasks"].setdefault(name, {})
+        record.update({"last_status": result["status"], "last_run_id": run_id,
+                       "last_attempt": datetime.now().isoformat(timespec="seconds")})
+        if result["status"] == "ok":
+            record["last_success"] = record["last_attempt"]
+            record["seconds"] = result["seconds"]
+            record.pop("error", None)
+        elif "error" in result:
+            record["error"] = result["error"]
+        state["last_run"]["statuses"][name] = result["status"]
+        _atomic_write_json(state_path, state)
+
+    # 계획 단계 준비 (us_eco 로더 인자 캡처) - 메인 스레드에서 순차 실행
+    for name in order:
+        if plan[name] == "run" and tasks[name].prepare is not None:
+            tasks[name].prepare()
+
+    pending = [name for name in order if plan[name] == "run"]
+    running: dict = {}
+    busy_lanes: set = set()
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        while pending or running:
+            for name in list(pending):
+                task = tasks[name]
+                dep_statuses = {dep: results.get(dep, {}).get("status") for dep in task.deps if dep in tasks}
+                failed = [dep for dep, status in dep_statuses.items() if status in ("failed", "blocked")]
+                if failed:
+                    pending.remove(name)
+                    _log.warning(f"⏭️ {name} 건너뜀 - 선행 작업 실패: {', '.join(failed)}")
+                    finish(name, {"status": "blocked", "error": f"선행 작업 실패: {', '.join(failed)}"})
+                    continue
+                if not all(status in DONE_STATUSES for status in dep_statuses.values()):
+                    continue
+                if task.lane is not None and task.lane in busy_lanes:
+                    continue
+                if len(running) >= workers:
+                    break
+                pending.remove(name)
+                if task.lane is not None:
+                    busy_lanes.add(task.lane)
+                running[pool.submit(_execute, task)] = name
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                busy_lanes.discard(tasks[name].lane)
+                finish(name, future.result())
+
+    finished = datetime.now()
+    report = {
+        "run_id": run_id,
+        "started_at": run_started.isoformat(timespec="seconds"),
+        "finished_at": finished.isoformat(timespec="seconds"),
+        "seconds": round((finished - run_started).total_seconds(), 3),
+        "workers": workers,
+        "tasks": {
+            name: dict(results.get(name, {"status": "pending"}), lane=tasks[name].lane, deps=list(tasks[name].deps))
+            for name in order
+        },
+        "counts": {},
+        "metrics": run_metrics.run_report(),
+    }
+    for result in report["tasks"].values():
+        report["counts"][result["status"]] = report["counts"].get(result["status"], 0) + 1
+    state["last_run"]["finished_at"] = report["finished_at"]
+    _atomic_write_json(state_path, state)
+    return report
+
+
+def write_report(report: dict, runs_dir: Path = RUNS_DIR) -> Path:
+    path = _atomic_write_json(runs_dir / f"run_{report['run_id']}.json", report)
+    _atomic_write_json(runs_dir / "latest.json", report)
+    return path
+
+
+def _print_plan(tasks: Dict[str, Task], plan: Dict[str, str], state: dict) -> None:
+    records = state.get("tasks", {})
+    for name in topo_order(tasks):
+        task = tasks[name]
+        last = records.get(name, {}).get("last_success") or "-"
+        deps = ",".join(task.deps) or "-"
+        print(f"  {plan[name]:8s} {name:48s} lane={task.lane or '-':7s} deps={deps:18s} last_success={last}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    p = argparse.ArgumentParser(description="Refresh all data subsystems as a dependency DAG")
+    p.add_argument("--only", action="append", metavar="TASK",
+                   help="Run only these tasks (plus their dependencies); prefixes like 'us_eco' allowed (repeatable)")
+    p.add_argument("--skip", action="append", metavar="TASK", help="Drop these tasks / prefixes (repeatable)")
+    p.add_argument("--us-eco-module", action="append", dest="us_eco_modules", metavar="STEM",
+                   help="us_eco module stems to refresh (default: every module in US_ECO_ENTRY_POINTS)")
+    p.add_argument("--force", action="store_true", help="Ignore freshness and run every selected task")
+    p.add_argument("--resume", action="store_true", help="Re-run only tasks that did not succeed in the previous run")
+    p.add_argument("--max-age-hours", type=float, default=None, help="Override every task's freshness window")
+    p.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help=f"Concurrent tasks across lanes (default: {DEFAULT_WORKERS})")
+    p.add_argument("--state", default=str(STATE_FILE), help="Freshness/resume state file")
+    p.add_argument("--report", default=None, help="Also write the run report to this path")
+    p.add_argument("--dry-run", action="store_true", help="Print the plan and exit")
+    p.add_argument("--verbosity", type=int, choices=(0, 1, 2), default=None, help="Log verbosity (default: RUN_VERBOSITY)")
+    args = p.parse_args(argv)
+
+    if args.verbosity is not None:
+        run_metrics.set_verbosity(args.verbosity)
+    state_path = Path(args.state)
+    try:
+        tasks = select_tasks(build_tasks(args.us_eco_modules), args.only, args.skip)
+        state = load_state(state_path)
+        plan = plan_tasks(tasks, state, force=args.force, resume=args.resume, max_age_hours=args.max_age_hours)
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+
+    to_run = sum(1 for decision in plan.values() if decision == "run")
+    print(f"🗺️ 갱신 계획: 작업 {len(plan)}개 중 실행 {to_run}개")
+    _print_plan(tasks, plan, state)
+    if args.dry_run:
+        return 0
+
+    report = run_refresh(tasks, plan, state, workers=args.workers, state_path=state_path)
+    path = write_report(report, state_path.parent)
+    if args.report:
+        _atomic_write_json(Path(args.report), report)
+
+    counts = ", ".join(f"{status} {n}" for status, n in sorted(report["counts"].items()))
+    print(f"⏱️ 전체 {report['seconds']:.1f}s - {counts}")
+    print(f"📝 실행 리포트: {path}")
+    if any(r["status"] in ("failed", "blocked") for r in report["tasks"].values()):
+        print("❌ 실패한 작업이 있습니다 (--resume 으로 이어서 실행)")
+        return 1
+    print("✅ 모든 작업 완료")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
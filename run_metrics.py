@@ -0,0 +1,642 @@
+"""
+실행 로그/메트릭 공용 모듈
+=========================
+
+데이터 갱신 스크립트(us_eco, global_universe)가 공유하는 로깅과 실행 지표.
+표준 라이브러리만 사용하므로 어느 모듈에서든 부담 없이 import 할 수 있다.
+
+- 로그: 이모지 메시지를 그대로 stdout 으로 출력하되 상세도(verbosity)로 거른다.
+  0 = 경고/오류만, 1 = 단계 진행 (기본), 2 = 시리즈/청크/재시도 단위 상세
+- 지표: 소스별 요청 수, 지연 히스토그램, 전송 바이트, 캐시 적중률,
+  파싱 행 수, 단계별 소요 시간
+- 출력: JSON 실행 리포트, Prometheus 텍스트 포맷 (선택)
+- 프로파일링: `profiled(name)` 단계별 cProfile / 샘플링 스택 / tracemalloc 피크
+
+환경 변수:
+    RUN_VERBOSITY          상세도 (0/1/2, 기본 1)
+    RUN_REPORT_PATH        지정 시 프로세스 종료 시점에 JSON 리포트 저장
+    RUN_METRICS_PROM_PATH  지정 시 프로세스 종료 시점에 Prometheus 텍스트 저장
+    RUN_PROFILE            프로파일 모드 (cprofile,sample,memory 조합 / all / 1 = cprofile,memory)
+    RUN_PROFILE_DIR        프로파일 출력 디렉터리 (기본: 각 진입점의 요약 CSV 옆 profiles/)
+    RUN_PROFILE_INTERVAL   샘플링 간격 초 (기본 0.005)
+"""
+
+import atexit
+import cProfile
+import io
+import json
+import logging
+import os
+import pstats
+import re
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import ContextDecorator, contextmanager
+from datetime import datetime
+from pathlib import Path
+
+__all__ = [
+    "RUN_VERBOSITY", "LATENCY_BUCKETS", "get_logger", "set_verbosity",
+    "RunMetrics", "metrics", "record_request", "record_cache", "record_rows",
+    "stage", "timed_request", "instrument_session",
+    "run_report", "write_run_report", "prometheus_text", "write_prometheus",
+    "PROFILE_MODES", "enable_profiling", "profiling_modes", "profiled",
+]
+
+RUN_VERBOSITY = int(os.environ.get("RUN_VERBOSITY", "1"))
+
+# 초 단위 상한 (마지막 +Inf 버킷은 자동 추가)
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_VERBOSITY_LEVELS = {0: logging.WARNING, 1: logging.INFO, 2: logging.DEBUG}
+_ROOT_LOGGER = "macro"
+
+
+# %%
+# === 로깅 ===
+
+def _level_for(verbosity):
+    verbosity = max(0, min(int(verbosity), 2))
+    return _VERBOSITY_LEVELS[verbosity]
+
+
+def _root_logger():
+    logger = logging.getLogger(_ROOT_LOGGER)
+    if not getattr(logger, "_run_metrics_configured", False):
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        logger.setLevel(_level_for(RUN_VERBOSITY))
+        logger.propagate = False
+        logger._run_metrics_configured = True
+    return logger
+
+
+def get_logger(name):
+    """`macro.<name>` 로거 반환 - 메시지만 stdout 으로 출력 (기존 print 와 동일한 모양)."""
+    _root_logger()
+    return logging.getLogger(f"{_ROOT_LOGGER}.{name}")
+
+
+def set_verbosity(verbosity):
+    """실행 중 상세도 변경 (0 = 경고/오류, 1 = 단계, 2 = 상세)."""
+    global RUN_VERBOSITY
+    RUN_VERBOSITY = max(0, min(int(verbosity), 2))
+    _root_logger().setLevel(_level_for(RUN_VERBOSITY))
+    return RUN_VERBOSITY
+
+
+# %%
+# === 지표 수집 ===
+
+class _Histogram:
+    """고정 버킷 지연 히스토그램 (누적 버킷은 출력 시 계산)."""
+
+    __slots__ = ("counts", "total", "count", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.total = 0.0
+        self.count = 0
+        self.max = 0.0
+
+    def observe(self, seconds):
+        idx = len(LATENCY_BUCKETS)
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                idx = i
+                break
+        self.counts[idx] += 1
+        self.total += seconds
+        self.count += 1
+        if seconds > self.max:
+            self.max = seconds
+
+    def cumulative(self):
+        running = 0
+        out = []
+        for bound, n in zip(list(LATENCY_BUCKETS) + ["+Inf"], self.counts):
+            running += n
+            out.append((bound, running))
+        return out
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "sum_seconds": round(self.total, 6),
+            "mean_seconds": round(self.total / self.count, 6) if self.count else None,
+            "max_seconds": round(self.max, 6),
+            "buckets": {str(bound): n for bound, n in self.cumulative()},
+        }
+
+
+class RunMetrics:
+    """스레드 안전한 실행 지표 저장소.
+
+    카운터는 (지표명, 소스) 단위, 히스토그램은 소스 단위, 단계 시간은 단계명 단위로 쌓는다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.started_at = datetime.now()
+            self._t0 = time.perf_counter()
+            self._counters = {}
+            self._latency = {}
+            self._stages = {}
+
+    # --- 기본 연산 ---
+    def inc(self, name, source, value=1):
+        with self._lock:
+            key = (name, source)
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe_latency(self, source, seconds):
+        with self._lock:
+            hist = self._latency.get(source)
+            if hist is None:
+                hist = self._latency[source] = _Histogram()
+            hist.observe(seconds)
+
+    def add_stage(self, name, seconds, ok=True, peak_bytes=None):
+        with self._lock:
+            entry = self._stages.setdefault(name, {"count": 0, "total": 0.0, "max": 0.0, "failed": 0})
+            entry["count"] += 1
+            entry["total"] += seconds
+            entry["max"] = max(entry["max"], seconds)
+            if not ok:
+                entry["failed"] += 1
+            if peak_bytes is not None:
+                entry["peak_bytes"] = max(entry.get("peak_bytes", 0), int(peak_bytes))
+
+    # --- 도메인 기록 ---
+    def record_request(self, source, seconds, nbytes=0, status=None, ok=True):
+        """API 요청 1건 기록 (지연, 바이트, 상태 코드, 성공 여부)."""
+        self.inc("requests", source)
+        if not ok:
+            self.inc("request_errors", source)
+        if nbytes:
+            self.inc("bytes", source, int(nbytes))
+        if status is not None:
+            self.inc(f"status_{status}", source)
+        self.observe_latency(source, seconds)
+
+    def record_cache(self, source, hit):
+        self.inc("cache_hits" if hit else "cache_misses", source)
+
+    def record_rows(self, source, n):
+        if n:
+            self.inc("rows", source, int(n))
+
+    @contextmanager
+    def stage(self, name):
+        """단계 소요 시간 측정 - 예외가 나면 실패 횟수도 함께 기록."""
+        t0 = time.perf_counter()
+        ok = True
+        try:
+            yield
+        except BaseException:
+            ok = False
+            raise
+        finally:
+            self.add_stage(name, time.perf_counter() - t0, ok)
+
+    @contextmanager
+    def timed_request(self, source):
+        """세션 훅이 없는 클라이언트용 - 블록 실행 시간을 요청 1건으로 기록.
+
+        yield 되는 dict 에 `nbytes`, `status`, `ok` 를 채우면 함께 기록된다.
+        """
+        info = {"nbytes": 0, "status": None, "ok": True}
+        t0 = time.perf_counter()
+        try:
+            yield info
+        except BaseException:
+            info["ok"] = False
+            raise
+        finally:
+            self.record_request(source, time.perf_counter() - t0,
+                                info["nbytes"], info["status"], info["ok"])
+
+    # --- 출력 ---
+    def report(self):
+        """JSON 직렬화 가능한 실행 리포트."""
+        with self._lock:
+            counters = dict(self._counters)
+            latency = {src: h.to_dict() for src, h in self._latency.items()}
+            stages = {
+                name: {
+                    "count": e["count"],
+                    "total_seconds": round(e["total"], 6),
+                    "max_seconds": round(e["max"], 6),
+                    "failed": e["failed"],
+                    **({"peak_bytes": e["peak_bytes"]} if "peak_bytes" in e else {}),
+                }
+                for name, e in self._stages.items()
+            }
+            elapsed = time.perf_counter() - self._t0
+            started_at = self.started_at
+
+        sources = {}
+        for (name, source), value in counters.items():
+            sources.setdefault(source, {})[name] = value
+        for source, values in sources.items():
+            hits = values.get("cache_hits", 0)
+            lookups = hits + values.get("cache_misses", 0)
+            if lookups:
+                values["cache_hit_rate"] = round(hits / lookups, 4)
+            if source in latency:
+                values["latency"] = latency[source]
+        for source in latency.keys() - sources.keys():
+            sources[source] = {"latency": latency[source]}
+
+        return {
+            "started_at": started_at.isoformat(timespec="seconds"),
+            "generated_at": datetime.now().isoformat(timespec="seconds"),
+            "elapsed_seconds": round(elapsed, 3),
+            "pid": os.getpid(),
+            "argv": list(sys.argv),
+            "sources": sources,
+            "stages": stages,
+        }
+
+    def prometheus_text(self, prefix="macro"):
+        """Prometheus text exposition format (0.0.4)."""
+        with self._lock:
+            counters = dict(self._counters)
+            latency = {src: (h.cumulative(), h.total, h.count) for src, h in self._latency.items()}
+            stages = {name: dict(e) for name, e in self._stages.items()}
+
+        lines = []
+        by_name = {}
+        responses = []
+        for (name, source), value in sorted(counters.items()):
+            if name.startswith("status_"):
+                responses.append((source, name[len("status_"):], value))
+            else:
+                by_name.setdefault(name, []).append((source, value))
+        for name, rows in by_name.items():
+            metric = f"{prefix}_{name}_total"
+            lines.append(f"# TYPE {metric} counter")
+            for source, value in rows:
+                lines.append(f'{metric}{{source="{_escape(source)}"}} {value}')
+        if responses:
+            metric = f"{prefix}_responses_total"
+            lines.append(f"# TYPE {metric} counter")
+            for source, status, value in responses:
+                lines.append(f'{metric}{{source="{_escape(source)}",status="{_escape(status)}"}} {value}')
+
+        if latency:
+            metric = f"{prefix}_request_seconds"
+            lines.append(f"# TYPE {metric} histogram")
+            for source, (buckets, total, count) in sorted(latency.items()):
+                label = _escape(source)
+                for bound, n in buckets:
+                    lines.append(f'{metric}_bucket{{source="{label}",le="{bound}"}} {n}')
+                lines.append(f'{metric}_sum{{source="{label}"}} {total:.6f}')
+                lines.append(f'{metric}_count{{source="{label}"}} {count}')
+
+        if stages:
+            lines.append(f"# TYPE {prefix}_stage_seconds_total counter")
+            for name, e in sorted(stages.items()):
+                lines.append(f'{prefix}_stage_seconds_total{{stage="{_escape(name)}"}} {e["total"]:.6f}')
+            lines.append(f"# TYPE {prefix}_stage_runs_total counter")
+            for name, e in sorted(stages.items()):
+                lines.append(f'{prefix}_stage_runs_total{{stage="{_escape(name)}"}} {e["count"]}')
+            peaks = [(name, e["peak_bytes"]) for name, e in sorted(stages.items()) if "peak_bytes" in e]
+            if peaks:
+                lines.append(f"# TYPE {prefix}_stage_peak_bytes gauge")
+                for name, peak in peaks:
+                    lines.append(f'{prefix}_stage_peak_bytes{{stage="{_escape(name)}"}} {peak}')
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _atomic_write_text(path, text):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+    return path
+
+
+# 전역 지표 객체
+metrics = RunMetrics()
+
+
+def record_request(source, seconds, nbytes=0, status=None, ok=True):
+    metrics.record_request(source, seconds, nbytes, status, ok)
+
+
+def record_cache(source, hit):
+    metrics.record_cache(source, hit)
+
+
+def record_rows(source, n):
+    metrics.record_rows(source, n)
+
+
+def stage(name):
+    return metrics.stage(name)
+
+
+def timed_request(source):
+    return metrics.timed_request(source)
+
+
+def instrument_session(session, source):
+    """requests.Session 에 응답 훅을 걸어 모든 요청을 `source` 로 기록.
+
+    같은 세션에 중복으로 걸리지 않으며, 훅을 지원하지 않는 세션이면 False 반환.
+    """
+    hooks = getattr(session, "hooks", None)
+    if not isinstance(hooks, dict):
+        return False
+    if getattr(session, "_run_metrics_source", None) == source:
+        return True
+
+    def _on_response(response, *args, **kwargs):
+        elapsed = getattr(response, "elapsed", None)
+        seconds = elapsed.total_seconds() if elapsed is not None else 0.0
+        try:
+            nbytes = len(response.content or b"")
+        except Exception:
+            nbytes = 0
+        status = getattr(response, "status_code", None)
+        ok = status is None or status < 400
+        metrics.record_request(source, seconds, nbytes, status, ok)
+        return response
+
+    hooks.setdefault("response", []).append(_on_response)
+    session._run_metrics_source = source
+    return True
+
+
+def run_report():
+    return metrics.report()
+
+
+def write_run_report(path):
+    """JSON 실행 리포트를 원자적으로 저장하고 경로 반환."""
+    text = json.dumps(metrics.report(), ensure_ascii=False, indent=2)
+    return _atomic_write_text(path, text)
+
+
+def prometheus_text(prefix="macro"):
+    return metrics.prometheus_text(prefix)
+
+
+def write_prometheus(path, prefix="macro"):
+    """Prometheus 텍스트 (node_exporter textfile collector 용)를 원자적으로 저장."""
+    return _atomic_write_text(path, metrics.prometheus_text(prefix))
+
+
+# %%
+# === 프로파일링 ===
+
+PROFILE_MODES = ("cprofile", "sample", "memory")
+
+_profile_lock = threading.Lock()
+_profile_modes = set()
+_profile_dir = None
+_active_cprofile = None     # cProfile 은 중첩 불가 - 가장 바깥 단계만 프로파일
+_active_sampler = None
+_memory_local = threading.local()   # 스레드별 중첩 단계 스택 (tracemalloc 피크 전파용)
+_memory_open = 0                    # 열려 있는 memory 단계 수 (전 스레드) - tracemalloc 참조 카운트
+_memory_owns_tracing = False        # tracemalloc 을 이 모듈이 시작했는지 (마지막 단계가 stop)
+
+
+def _memory_stack():
+    stack = getattr(_memory_local, "stack", None)
+    if stack is None:
+        stack = _memory_local.stack = []
+    return stack
+
+
+def _parse_modes(value):
+    if value is None:
+        return set()
+    if isinstance(value, str):
+        value = [v.strip().lower() for v in value.split(",")]
+    modes = set()
+    for v in value:
+        if v in ("", "0", "off", "false", "none"):
+            continue
+        if v in ("1", "on", "true", "yes"):
+            modes.update(("cprofile", "memory"))
+        elif v == "all":
+            modes.update(PROFILE_MODES)
+        elif v in PROFILE_MODES:
+            modes.add(v)
+        else:
+            raise ValueError(f"알 수 없는 프로파일 모드: {v} (가능: {', '.join(PROFILE_MODES)}, all)")
+    return modes
+
+
+def enable_profiling(modes="cprofile,memory", out_dir=None):
+    """CLI `--profile` 플래그용 - 프로파일 모드/출력 디렉터리를 실행 중에 지정."""
+    global _profile_modes, _profile_dir
+    _profile_modes = _parse_modes(modes)
+    if out_dir is not None:
+        _profile_dir = Path(out_dir)
+    return set(_profile_modes)
+
+
+def profiling_modes():
+    return set(_profile_modes)
+
+
+def _slug(name):
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", name).strip("_") or "stage"
+
+
+# 데코레이터 래퍼 프레임은 스택에서 제외 (플레임그래프 가독성)
+_SAMPLER_SKIP_FILES = {__file__, getattr(sys.modules.get("contextlib"), "__file__", "")}
+
+
+class _StackSampler(threading.Thread):
+    """sys._current_frames() 를 주기적으로 읽어 collapsed stack 을 집계하는 샘플러.
+
+    출력은 Brendan Gregg 의 folded 포맷 (flamegraph.pl, speedscope, inferno 호환).
+    스레드 풀 작업도 보이도록 샘플러 자신을 제외한 모든 스레드를 샘플링한다.
+    """
+
+    def __init__(self, interval):
+        super().__init__(name="run-metrics-sampler", daemon=True)
+        self.interval = interval
+        self.samples = Counter()
+        self._stop_event = threading.Event()
+
+    def run(self):
+        own = threading.get_ident()
+        while not self._stop_event.wait(self.interval):
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    if code.co_filename not in _SAMPLER_SKIP_FILES:
+                        stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                stack.append(names.get(ident, f"thread-{ident}"))
+                self.samples[";".join(reversed(stack))] += 1
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+    def folded(self):
+        return "".join(f"{stack} {n}\n" for stack, n in self.samples.most_common())
+
+
+class profiled(ContextDecorator):
+    """단계 프로파일링 훅 - 컨텍스트 매니저/데코레이터 겸용.
+
+    항상 `stage(name)` 과 동일하게 단계 시간을 기록하고, 프로파일 모드가 켜져 있으면
+    (RUN_PROFILE 또는 enable_profiling) 다음 파일을 `<out_dir>/profiles/` 에 남긴다.
+
+    - cprofile: `<name>_<ts>.prof` (pstats - snakeviz/flameprof 로 플레임그래프) + 상위 함수 `.txt`
+    - sample:   `<name>_<ts>.folded` (collapsed stacks - flamegraph.pl/speedscope)
+    - memory:   tracemalloc 피크 (리포트 stages.peak_bytes) + 상위 할당 위치 `.mem.txt`
+
+    cProfile/샘플러는 중첩되지 않으므로 이미 바깥 단계가 프로파일 중이면 안쪽 단계는
+    시간/메모리 피크만 기록한다.
+
+    tracemalloc 은 프로세스 전체 상태라 참조 카운트로 관리한다: 마지막으로 끝나는 단계만
+    stop() 하고 `.mem.txt` 를 남긴다. 피크는 열린 단계가 없을 때만 reset 하므로, 중첩 단계나
+    병렬 단계(refresh_all 등)의 peak_bytes 는 동시에 열린 단계의 할당을 포함한 상한값이다.
+    """
+
+    def __init__(self, name, out_dir=None):
+        self.name = name
+        self.out_dir = out_dir
+
+    # ContextDecorator 가 데코레이트된 함수를 호출할 때마다 새 상태를 쓰도록 복제
+    def _recreate_cm(self):
+        return profiled(self.name, self.out_dir)
+
+    def _target_dir(self):
+        base = os.environ.get("RUN_PROFILE_DIR") or _profile_dir
+        if base is None:
+            base = Path(self.out_dir) / "profiles" if self.out_dir is not None else Path.cwd() / "profiles"
+        base = Path(base)
+        base.mkdir(parents=True, exist_ok=True)
+        return base
+
+    def __enter__(self):
+        global _active_cprofile, _active_sampler, _memory_open, _memory_owns_tracing
+        self._modes = _profile_modes or _parse_modes(os.environ.get("RUN_PROFILE"))
+        self._profiler = self._sampler = None
+        self._mem_frame = None
+
+        if "memory" in self._modes:
+            stack = _memory_stack()
+            with _profile_lock:
+                if _memory_open == 0 and not tracemalloc.is_tracing():
+                    tracemalloc.start()
+                    _memory_owns_tracing = True
+                current, _ = tracemalloc.get_traced_memory()
+                # 다른 단계가 열려 있을 때 reset 하면 그 단계의 피크가 사라지므로 첫 단계만 reset
+                if _memory_open == 0:
+                    tracemalloc.reset_peak()
+                _memory_open += 1
+            self._mem_frame = {"base": current, "child_peak": 0}
+            stack.append(self._mem_frame)
+
+        with _profile_lock:
+            if "cprofile" in self._modes and _active_cprofile is None:
+                self._profiler = _active_cprofile = cProfile.Profile()
+            if "sample" in self._modes and _active_sampler is None:
+                interval = float(os.environ.get("RUN_PROFILE_INTERVAL", "0.005"))
+                self._sampler = _active_sampler = _StackSampler(interval)
+        if self._sampler is not None:
+            self._sampler.start()
+        if self._profiler is not None:
+            self._profiler.enable()
+        self._t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        global _active_cprofile, _active_sampler, _memory_open, _memory_owns_tracing
+        seconds = time.perf_counter() - self._t0
+        if self._profiler is not None:
+            self._profiler.disable()
+        if self._sampler is not None:
+            self._sampler.stop()
+
+        peak_bytes = None
+        snapshot = None
+        if self._mem_frame is not None:
+            stack = _memory_stack()
+            with _profile_lock:
+                _, peak = tracemalloc.get_traced_memory()
+                peak = max(peak, self._mem_frame["child_peak"])
+                peak_bytes = max(0, peak - self._mem_frame["base"])
+                stack.pop()
+                if stack:
+                    parent = stack[-1]
+                    parent["child_peak"] = max(parent["child_peak"], peak)
+                _memory_open -= 1
+                if _memory_open == 0 and _memory_owns_tracing:
+                    snapshot = tracemalloc.take_snapshot()
+                    tracemalloc.stop()
+                    _memory_owns_tracing = False
+
+        metrics.add_stage(self.name, seconds, exc_type is None, peak_bytes)
+
+        if self._profiler is not None or self._sampler is not None or snapshot is not None:
+            try:
+                self._write_outputs(seconds, peak_bytes, snapshot)
+            except OSError as e:
+                print(f"⚠️ 프로파일 저장 실패 ({self.name}): {e}", file=sys.stderr)
+        with _profile_lock:
+            if self._profiler is not None:
+                _active_cprofile = None
+            if self._sampler is not None:
+                _active_sampler = None
+        return False
+
+    def _write_outputs(self, seconds, peak_bytes, snapshot):
+        stem = f"{_slug(self.name)}_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
+        target = self._target_dir()
+        if self._profiler is not None:
+            prof_path = target / f"{stem}.prof"
+            self._profiler.dump_stats(str(prof_path))
+            buf = io.StringIO()
+            stats = pstats.Stats(self._profiler, stream=buf)
+            stats.sort_stats("cumulative").print_stats(40)
+            _atomic_write_text(target / f"{stem}.txt", buf.getvalue())
+        if self._sampler is not None:
+            _atomic_write_text(target / f"{stem}.folded", self._sampler.folded())
+        if snapshot is not None:
+            top = snapshot.statistics("lineno")[:25]
+            lines = [f"{self.name}: {seconds:.3f}s, peak {peak_bytes / 1e6:.1f} MB", "# 단계 종료 시점에 남아 있는 할당 상위 위치"]
+            lines.extend(str(stat) for stat in top)
+            _atomic_write_text(target / f"{stem}.mem.txt", "\n".join(lines) + "\n")
+
+
+def _dump_at_exit():
+    report_path = os.environ.get("RUN_REPORT_PATH")
+    prom_path = os.environ.get("RUN_METRICS_PROM_PATH")
+    try:
+        if report_path:
+            write_run_report(report_path)
+        if prom_path:
+            write_prometheus(prom_path)
+    except OSError as e:
+        print(f"⚠️ 실행 리포트 저장 실패: {e}", file=sys.stderr)
+
+
+atexit.register(_dump_at_exit)
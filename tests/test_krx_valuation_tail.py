@@ -0,0 +1,59 @@
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("pykrx")
+pytest.importorskip("yfinance")  # global_universe/__init__ imports world_indices
+
+krx_data = pytest.importorskip("global_universe.krx_data")
+
+HEADER = ",".join(krx_data.VAL_CANONICAL_COLS)
+
+
+@pytest.fixture
+def val_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(krx_data, "VAL_DIR", tmp_path)
+    monkeypatch.setattr(krx_data, "VAL_STATE_PATH", tmp_path / "state.json")
+    monkeypatch.setattr(krx_data, "_VAL_STATE", None)
+    return tmp_path
+
+
+def _row(date, pe, pb):
+    return f"{date},{pe},{pb},0.02,KRX:1001,KRW,INDEX"
+
+
+def test_two_invalid_trailing_rows_are_truncated(val_dir):
+    path = krx_data._valuation_csv_path("1001")
+    path.write_text("\n".join([
+        HEADER,
+        _row("2025-01-02", 11.0, 1.0),
+        _row("2025-01-03", 11.5, 1.1),
+        _row("2025-01-06", 0, 0),     # invalid
+        _row("2025-01-07", "", ""),  # invalid
+    ]) + "\n", encoding="utf-8")
+
+    scanned = krx_data._scan_valuation_file(path)
+    assert scanned["last_date"] == "2025-01-07"
+    assert scanned["last_valid_date"] == "2025-01-03"
+
+    new = pd.DataFrame({"Date": ["2025-01-08"], "trailingPE": [12.0], "priceToBook": [1.2],
+                        "trailingAnnualDividendYield": [0.02]})
+    assert krx_data.append_index_valuation_rows("1001", new) == 1
+
+    df = pd.read_csv(path)
+    assert df["Date"].tolist() == ["2025-01-02", "2025-01-03", "2025-01-08"]
+
+
+def test_no_valid_rows_in_tail_reports_none(val_dir):
+    path = krx_data._valuation_csv_path("1001")
+    path.write_text("\n".join([HEADER, _row("2025-01-06", 0, 0), _row("2025-01-07", 0, 0)]) + "\n",
+                    encoding="utf-8")
+    assert krx_data._scan_valuation_file(path)["last_valid_date"] is None
+    assert krx_data._truncate_invalid_tail(path) is None
+    assert path.read_text(encoding="utf-8") == HEADER + "\n"
+
+
+def test_partial_last_line_is_dropped(val_dir):
+    path = krx_data._valuation_csv_path("1001")
+    path.write_text("\n".join([HEADER, _row("2025-01-02", 11.0, 1.0), "2025-01-03,11.2"]), encoding="utf-8")
+    assert krx_data._truncate_invalid_tail(path) == "2025-01-02"
+    assert path.read_text(encoding="utf-8").endswith(_row("2025-01-02", 11.0, 1.0) + "\n")
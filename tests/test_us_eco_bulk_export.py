@@ -0,0 +1,58 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+pq = pytest.importorskip("pyarrow.parquet")
+
+US_ECO_DIR = Path(__file__).resolve().parents[1] / "us_eco"
+sys.path.insert(0, str(US_ECO_DIR))
+
+us_eco_utils = pytest.importorskip("us_eco_utils")
+cpi_series = pytest.importorskip("cpi_complete_all_series")
+
+# CPI 시리즈 중 한국어 이름이 겹치는 쌍 ('주거', '주거 임대료', '병원 서비스') + 유일한 이름 하나
+CPI_COLUMNS = ["housing", "shelter", "rent_primary", "rent_of_shelter",
+               "hospital_services", "hospital_services_detail", "headline"]
+
+
+def _cpi_data_dict():
+    index = pd.date_range("2022-01-01", periods=30, freq="MS")
+    raw = pd.DataFrame({col: [100.0 + i + n for i in range(len(index))] for n, col in enumerate(CPI_COLUMNS)},
+                       index=index)
+    # 로더가 미리 계산한 값이 재사용되는지 확인하도록 원자료와 다른 표식 값을 넣어 둔다
+    mom = pd.DataFrame(1.25, index=index, columns=CPI_COLUMNS)
+    return {"raw_data": raw, "mom_data": mom}
+
+
+def test_cpi_parquet_dump_reads_back(tmp_path):
+    written = us_eco_utils.export_economic_data_bulk(
+        _cpi_data_dict(), data_types=("raw", "mom"), korean_names=cpi_series.ALL_KOREAN_NAMES,
+        export_path=tmp_path / "cpi.parquet", file_format="parquet",
+    )
+    assert written and len(written) == 2
+
+    for path in written:
+        table = pq.read_table(path)
+        assert len(set(table.column_names)) == len(table.column_names)
+        frame = pd.read_parquet(path)
+        assert list(frame.columns) == table.column_names
+        assert len(frame) == 30
+        assert any(c.startswith("주거") and "[housing]" in c for c in frame.columns)
+        assert any(c.startswith("주거") and "[shelter]" in c for c in frame.columns)
+
+    mom = pd.read_parquet(next(p for p in written if "전월대비변화율" in p.name))
+    values = mom.drop(columns=["날짜"])
+    assert (values == 1.25).all().all()
+
+
+def test_cpi_csv_headers_unique(tmp_path):
+    written = us_eco_utils.export_economic_data_bulk(
+        _cpi_data_dict(), data_types=("raw",), korean_names=cpi_series.ALL_KOREAN_NAMES,
+        export_path=tmp_path / "cpi.csv", file_format="csv",
+    )
+    frame = pd.read_csv(written[0], encoding="utf-8-sig")
+    assert frame.columns.is_unique
+    assert "주거 [housing]" in frame.columns and "주거 [shelter]" in frame.columns
+    assert "전체 품목 (헤드라인 CPI)" in frame.columns
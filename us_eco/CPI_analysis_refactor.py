@@ -176,6 +176,37 @@ def export_cpi_data(series_list, data_type='mom', periods=None, target_date=None
         file_format=file_format
     )
 
+def export_cpi_data_all(series_list=None, data_types=('raw', 'mom', 'mom_change', 'yoy', 'yoy_change'),
+                        periods=None, target_date=None, export_path=None, file_format='excel'):
+    """
+    CPI 전체(또는 지정) 시리즈 × 여러 변환을 한 번에 export (변환별 시트, 스트리밍 저장)
+    
+    Args:
+        series_list: export할 시리즈 리스트 (None이면 로드된 전체 시리즈)
+        data_types: 변환 목록 ('raw', 'mom', 'mom_change', 'yoy', 'yoy_change')
+        periods: 표시할 기간 (개월, None이면 전체 데이터)
+        target_date: 특정 날짜 기준 (예: '2025-06-01')
+        export_path: export할 파일 경로 (None이면 자동 생성)
+        file_format: 파일 형식 ('excel', 'csv', 'parquet')
+    
+    Returns:
+        list: export된 파일 경로 목록 (성공시) 또는 None (실패시)
+    """
+    if not CPI_DATA:
+        print("⚠️ 먼저 load_cpi_data()를 실행하세요.")
+        return None
+    
+    return export_economic_data_bulk(
+        CPI_DATA,
+        series_list=series_list,
+        data_types=data_types,
+        periods=periods,
+        target_date=target_date,
+        korean_names=CPI_KOREAN_NAMES,
+        export_path=export_path,
+        file_format=file_format,
+    )
+
 # === 메인 데이터 로드 함수 ===
 def print_load_info():
     """로드 정보 출력"""
@@ -0,0 +1,469 @@
+#!/usr/bin/env python3
+"""
+KPDS 차트 일괄 렌더링 - 선언형 차트 스펙 목록을 프로세스 풀에서 PNG/HTML 등으로 내보냄
+
+주간 자료처럼 수백 개 차트를 한 번에 만들 때 사용. 각 워커 프로세스가 모듈 데이터를
+CSV 에서 한 번만 읽어 두고(네트워크 호출 없음) plot_economic_series 로 Figure 를 만든 뒤
+바로 내보낸다. 정적 이미지(kaleido) 내보내기도 워커별로 병렬 실행된다.
+
+스펙 파일(JSON)은 차트 목록 또는 {"charts": [...]}:
+    [
+        {"name": "nfp_mom", "module": "CES_employ_refactor", "series": ["nonfarm_total"],
+         "data_type": "mom", "periods": 24, "chart_type": "multi_line",
+         "width_cm": 18, "height_cm": 10, "formats": ["png", "html"]}
+    ]
+
+선택 필드: labels, left_ytitle, right_ytitle, target_date, axis_allocation, scale(PNG 배율)
+
+출력 폴더의 manifest.json 에 차트별 입력 데이터 fingerprint(스펙 + 선택 시리즈 데이터 해시)와
+출력 경로를 기록하고, 다음 실행에서 fingerprint 가 같고 파일이 남아 있으면 재사용한다.
+
+사용법:
+  python us_eco/batch_render.py weekly_pack.json
+  python us_eco/batch_render.py weekly_pack.json --out us_eco/exports/charts --workers 6
+  python us_eco/batch_render.py weekly_pack.json --force
+"""
+
+import argparse
+import atexit
+import hashlib
+import importlib.util
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+import plotly.graph_objects as go
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import us_eco_utils as utils_module
+from kpds_fig_format_enhanced import PX_PER_CM
+
+try:
+    import kaleido  # noqa: F401  (plotly 정적 이미지 내보내기 백엔드)
+    KALEIDO_AVAILABLE = True
+except ImportError:
+    KALEIDO_AVAILABLE = False
+
+
+US_ECO_DIR = Path(__file__).resolve().parent
+DEFAULT_OUTPUT_DIR = US_ECO_DIR / "exports" / "charts"
+MANIFEST_NAME = "manifest.json"
+# 렌더링 결과가 달라지는 변경(차트 빌더, 내보내기 옵션 등)이 있으면 올려서 전체 재렌더링
+RENDER_VERSION = 1
+
+DATA_TYPE_KEYS = {
+    "raw": "raw_data",
+    "mom": "mom_data",
+    "mom_change": "mom_change",
+    "yoy": "yoy_data",
+    "yoy_change": "yoy_change",
+}
+STATIC_FORMATS = {"png", "svg", "pdf"}
+SUPPORTED_FORMATS = STATIC_FORMATS | {"html", "json"}
+
+# 워커 프로세스별 모듈 데이터 캐시: stem -> (data_dict, korean_names)
+_MODULE_DATA: dict[str, tuple[dict, dict]] = {}
+# quiet 워커의 stdout 대체 핸들
+_DEVNULL = None
+
+
+# -----------------------------------------------------------------------------
+# 스펙
+# -----------------------------------------------------------------------------
+
+def _safe_name(name: str) -> str:
+    return re.sub(r"[^\w\-.]+", "_", str(name)).strip("_") or "chart"
+
+
+def normalize_spec(raw: dict, index: int) -> dict:
+    """스펙 검증 + 기본값 채우기"""
+    if not isinstance(raw, dict):
+        raise ValueError(f"차트 스펙 #{index} 는 dict 여야 합니다: {raw!r}")
+    module = raw.get("module")
+    series = raw.get("series")
+    if not module or not series:
+        raise ValueError(f"차트 스펙 #{index} 에 module / series 가 필요합니다")
+    if isinstance(series, str):
+        series = [series]
+
+    data_type = raw.get("data_type", "mom")
+    if data_type not in DATA_TYPE_KEYS:
+        raise ValueError(f"차트 스펙 #{index}: 지원하지 않는 data_type '{data_type}'")
+    chart_type = raw.get("chart_type", "multi_line")
+
+    formats = raw.get("formats") or ["png", "html"]
+    if isinstance(formats, str):
+        formats = [formats]
+    formats = [fmt.lower() for fmt in formats]
+    unknown = [fmt for fmt in formats if fmt not in SUPPORTED_FORMATS]
+    if unknown:
+        raise ValueError(f"차트 스펙 #{index}: 지원하지 않는 형식 {unknown}")
+
+    spec = {
+        "name": _safe_name(raw.get("name") or f"{module}_{data_type}_{chart_type}_{index:03d}"),
+        "module": module,
+        "series": list(series),
+        "data_type": data_type,
+        "chart_type": chart_type,
+        "periods": raw.get("periods"),
+        "target_date": raw.get("target_date"),
+        "width_cm": raw.get("width_cm"),
+        "height_cm": raw.get("height_cm"),
+        "formats": formats,
+        "scale": raw.get("scale", 2),
+        "labels": raw.get("labels") or {},
+        "left_ytitle": raw.get("left_ytitle"),
+        "right_ytitle": raw.get("right_ytitle"),
+        "axis_allocation": raw.get("axis_allocation"),
+    }
+    return spec
+
+
+def load_specs(path) -> list[dict]:
+    """JSON 스펙 파일 로드 (이름 중복 검사 포함)"""
+    with open(path, "r", encoding="utf-8") as f:
+        payload = json.load(f)
+    raw_specs = payload.get("charts", []) if isinstance(payload, dict) else payload
+    specs = [normalize_spec(raw, i) for i, raw in enumerate(raw_specs)]
+    seen: set[str] = set()
+    for spec in specs:
+        if spec["name"] in seen:
+            raise ValueError(f"차트 이름이 중복됩니다: {spec['name']}")
+        seen.add(spec["name"])
+    return specs
+
+
+# -----------------------------------------------------------------------------
+# 워커: 모듈 데이터 (CSV 전용, 네트워크 호출 없음)
+# -----------------------------------------------------------------------------
+
+def _csv_data_dict(raw_df: pd.DataFrame | None) -> dict:
+    if raw_df is None or raw_df.empty:
+        return {}
+    raw = raw_df.sort_index().apply(pd.to_numeric, errors="coerce").dropna(axis=1, how="all")
+    raw = raw.dropna(how="all")
+    if raw.empty:
+        return {}
+    return {
+        "raw_data": raw,
+        "mom_data": utils_module.calculate_mom_percent(raw),
+        "mom_change": utils_module.calculate_mom_change(raw),
+        "yoy_data": utils_module.calculate_yoy_percent(raw),
+        "yoy_change": utils_module.calculate_yoy_change(raw),
+        "load_info": {
+            "loaded": True,
+            "load_time": datetime.now(),
+            "series_count": raw.shape[1],
+            "data_points": raw.shape[0],
+            "source": "CSV (batch)",
+        },
+    }
+
+
+def _csv_only_loader(series_dict, data_source="BLS", csv_file_path=None, **kwargs):
+    """모듈 import 시점의 load_economic_data 호출을 CSV 읽기로 대체"""
+    raw = utils_module.load_data_from_csv(csv_file_path) if csv_file_path else None
+    return _csv_data_dict(raw)
+
+
+def _csv_only_group_loader(series_groups, data_source="FRED", csv_file_path=None, **kwargs):
+    return _csv_only_loader(series_groups, data_source, csv_file_path)
+
+
+def _import_module_offline(stem: str, calls: list | None = None):
+    """네트워크 없이 모듈 import. `calls` 를 주면 로더 호출 인자를 기록한다.
+
+    기록 형식: (loader_name, series_dict_or_groups, data_source, kwargs)
+    """
+    path = US_ECO_DIR / f"{stem}.py"
+    if not path.exists():
+        raise FileNotFoundError(f"모듈 파일이 없습니다: {path}")
+    name = f"us_eco_batch_{stem}"
+    spec = importlib.util.spec_from_file_location(name, path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"spec not found for {path}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+
+    if calls is None:
+        loader, group_loader = _csv_only_loader, _csv_only_group_loader
+    else:
+        def loader(series_dict, data_source="BLS", csv_file_path=None, **kwargs):
+            calls.append(("load_economic_data", series_dict, data_source, dict(kwargs, csv_file_path=csv_file_path)))
+            return _csv_only_loader(series_dict, data_source, csv_file_path)
+
+        def group_loader(series_groups, data_source="FRED", csv_file_path=None, **kwargs):
+            calls.append(("load_economic_data_grouped", series_groups, data_source, dict(kwargs, csv_file_path=csv_file_path)))
+            return _csv_only_group_loader(series_groups, data_source, csv_file_path)
+
+    originals = (utils_module.load_economic_data, utils_module.load_economic_data_grouped)
+    utils_module.load_economic_data = loader
+    utils_module.load_economic_data_grouped = group_loader
+    try:
+        spec.loader.exec_module(module)
+    except Exception as exc:
+        # 모듈 하단의 예시 실행 셀이 실패해도 데이터/이름 정의는 이미 끝난 상태
+        print(f"⚠️ {path.name} 로드 중 예외 발생: {exc}")
+    finally:
+        utils_module.load_economic_data, utils_module.load_economic_data_grouped = originals
+    return module
+
+
+def capture_loader_calls(stem: str) -> list[tuple]:
+    """모듈이 import 시점에 load_economic_data(_grouped) 에 넘기는 인자 목록.
+
+    시리즈 딕셔너리/CSV 경로/시작일을 모듈 코드 그대로 재사용해 API 갱신을
+    따로 돌릴 때 사용 (fetch_bench, refresh_all).
+    """
+    calls: list[tuple] = []
+    _import_module_offline(stem, calls)
+    return calls
+
+
+def _module_data(stem: str) -> tuple[dict, dict]:
+    """모듈의 data_dict 와 한국어 이름 (프로세스당 한 번 로드)"""
+    cached = _MODULE_DATA.get(stem)
+    if cached is not None:
+        return cached
+
+    module = _import_module_offline(stem)
+    data_dict = None
+    korean_names: dict = {}
+    series_defs: dict = {}
+    for attr in dir(module):
+        value = getattr(module, attr)
+        if not isinstance(value, dict):
+            continue
+        if attr.endswith("_DATA") and data_dict is None:
+            raw = value.get("raw_data")
+            if isinstance(raw, pd.DataFrame) and not raw.empty:
+                data_dict = value
+        elif attr.endswith("KOREAN_NAMES"):
+            korean_names.update(value)
+        elif attr.endswith("_SERIES"):
+            series_defs.update(value)
+
+    if data_dict is None:
+        csv_path = getattr(module, "CSV_FILE_PATH", None)
+        data_dict = _csv_data_dict(utils_module.load_data_from_csv(csv_path) if csv_path else None)
+
+    # CSV 컬럼이 시리즈 ID 인 모듈은 시리즈 키로 변환 (대시보드와 동일)
+    id_map = {v: k for k, v in series_defs.items() if isinstance(v, str)}
+    if id_map:
+        data_dict = {
+            key: value.rename(columns=lambda c: id_map.get(c, c)) if isinstance(value, pd.DataFrame) else value
+            for key, value in data_dict.items()
+        }
+
+    _MODULE_DATA[stem] = (data_dict, korean_names)
+    return data_dict, korean_names
+
+
+# -----------------------------------------------------------------------------
+# 워커: 렌더링 + 내보내기
+# -----------------------------------------------------------------------------
+
+def _init_worker(quiet: bool) -> None:
+    global _DEVNULL
+    # 차트 빌더들은 내부에서 fig.show() 를 호출함 - 워커에서는 브라우저/노트북 출력이 없어야 함
+    go.Figure.show = lambda self, *args, **kwargs: None
+    if quiet and _DEVNULL is None:
+        # 워커당 핸들 하나 - 프로세스 종료 시 닫음
+        _DEVNULL = open(os.devnull, "w", encoding="utf-8")
+        atexit.register(_close_devnull)
+        sys.stdout = _DEVNULL
+
+
+def _close_devnull() -> None:
+    if sys.stdout is _DEVNULL:
+        sys.stdout = sys.__stdout__
+    _DEVNULL.close()
+
+
+def input_fingerprint(spec: dict, data_dict: dict) -> str:
+    """스펙 + 선택 시리즈 데이터(해당 data_type 프레임, 없으면 raw) 해시"""
+    frame = data_dict.get(DATA_TYPE_KEYS[spec["data_type"]])
+    if not isinstance(frame, pd.DataFrame):
+        frame = data_dict.get("raw_data")
+    digest = hashlib.sha1()
+    digest.update(json.dumps({"v": RENDER_VERSION, "spec": spec}, sort_keys=True, default=str).encode("utf-8"))
+    if isinstance(frame, pd.DataFrame):
+        cols = [c for c in spec["series"] if c in frame.columns]
+        digest.update(json.dumps(cols).encode("utf-8"))
+        digest.update(pd.util.hash_pandas_object(frame[cols], index=True).values.tobytes())
+    return digest.hexdigest()
+
+
+def _export_figure(fig, fmt: str, path: str, scale: float) -> None:
+    tmp_path = f"{path}.tmp"
+    if fmt == "html":
+        fig.write_html(tmp_path, include_plotlyjs="cdn")
+    elif fmt == "json":
+        fig.write_json(tmp_path)
+    else:
+        if not KALEIDO_AVAILABLE:
+            raise RuntimeError("정적 이미지 내보내기에는 kaleido 가 필요합니다: pip install kaleido")
+        fig.write_image(tmp_path, format=fmt, scale=scale)
+    os.replace(tmp_path, path)
+
+
+def render_chart(spec: dict, out_dir: str, previous: dict | None = None) -> dict:
+    """차트 하나 렌더링 (워커에서 실행). manifest 항목 반환"""
+    started = time.perf_counter()
+    outputs = {fmt: os.path.join(out_dir, f"{spec['name']}.{fmt}") for fmt in spec["formats"]}
+    entry = {
+        "name": spec["name"],
+        "spec": spec,
+        "status": "failed",
+        "fingerprint": None,
+        "outputs": outputs,
+        "error": None,
+        "rendered_at": None,
+        "elapsed_s": None,
+    }
+    try:
+        data_dict, korean_names = _module_data(spec["module"])
+        if not data_dict:
+            raise ValueError(f"{spec['module']} 데이터를 불러올 수 없습니다 (CSV 없음)")
+        missing = [s for s in spec["series"] if s not in data_dict["raw_data"].columns]
+        if missing:
+            raise ValueError(f"{spec['module']} 에 없는 시리즈: {missing}")
+
+        fingerprint = input_fingerprint(spec, data_dict)
+        entry["fingerprint"] = fingerprint
+        if (
+            previous
+            and previous.get("fingerprint") == fingerprint
+            and previous.get("status") in ("rendered", "cached")
+            and all(os.path.exists(p) for p in outputs.values())
+        ):
+            entry.update(status="cached", rendered_at=previous.get("rendered_at"))
+            return entry
+
+        labels = {s: korean_names.get(s, s) for s in spec["series"]}
+        labels.update(spec["labels"])
+        fig = utils_module.plot_economic_series(
+            data_dict=data_dict,
+            series_list=spec["series"],
+            chart_type=spec["chart_type"],
+            data_type=spec["data_type"],
+            periods=spec["periods"],
+            labels=labels,
+            left_ytitle=spec["left_ytitle"],
+            right_ytitle=spec["right_ytitle"],
+            target_date=spec["target_date"],
+            korean_names=labels,
+            axis_allocation=spec["axis_allocation"],
+        )
+        if fig is None:
+            raise ValueError("차트를 생성하지 못했습니다")
+        if spec["width_cm"] and spec["height_cm"]:
+            fig.update_layout(
+                width=int(spec["width_cm"] * PX_PER_CM),
+                height=int(spec["height_cm"] * PX_PER_CM),
+            )
+
+        for fmt, path in outputs.items():
+            _export_figure(fig, fmt, path, spec["scale"])
+        entry.update(status="rendered", rendered_at=datetime.now().isoformat(timespec="seconds"))
+    except Exception as exc:
+        entry["error"] = f"{type(exc).__name__}: {exc}"
+    finally:
+        entry["elapsed_s"] = round(time.perf_counter() - started, 3)
+    return entry
+
+
+# -----------------------------------------------------------------------------
+# 배치 실행 + manifest
+# -----------------------------------------------------------------------------
+
+def load_manifest(out_dir) -> dict:
+    path = os.path.join(out_dir, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+
+def _write_manifest(out_dir, manifest: dict) -> str:
+    path = os.path.join(out_dir, MANIFEST_NAME)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2, default=str)
+    os.replace(tmp_path, path)
+    return path
+
+
+def render_batch(specs: list[dict], out_dir=DEFAULT_OUTPUT_DIR, workers: int | None = None,
+                 force: bool = False, quiet: bool = True) -> dict:
+    """스펙 목록을 프로세스 풀로 렌더링하고 manifest 를 기록/반환"""
+    out_dir = str(out_dir)
+    os.makedirs(out_dir, exist_ok=True)
+    previous = {} if force else {c["name"]: c for c in load_manifest(out_dir).get("charts", [])}
+    workers = max(1, min(workers or os.cpu_count() or 1, len(specs) or 1))
+
+    if not KALEIDO_AVAILABLE and any(set(s["formats"]) & STATIC_FORMATS for s in specs):
+        print("⚠️ kaleido 가 없어 PNG/SVG/PDF 내보내기는 실패로 기록됩니다 (pip install kaleido)")
+
+    started = time.perf_counter()
+    results: dict[str, dict] = {}
+    # 같은 모듈 차트를 연달아 제출해 워커별 모듈 데이터 캐시 적중률을 높임
+    ordered = sorted(specs, key=lambda s: s["module"])
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(quiet,)) as pool:
+        futures = {pool.submit(render_chart, spec, out_dir, previous.get(spec["name"])): spec for spec in ordered}
+        for done, future in enumerate(as_completed(futures), start=1):
+            spec = futures[future]
+            try:
+                entry = future.result()
+            except Exception as exc:  # 워커 프로세스 자체가 죽은 경우
+                entry = {"name": spec["name"], "spec": spec, "status": "failed",
+                         "error": f"{type(exc).__name__}: {exc}", "outputs": {}}
+            results[spec["name"]] = entry
+            mark = {"rendered": "✅", "cached": "♻️"}.get(entry["status"], "❌")
+            detail = f" - {entry['error']}" if entry.get("error") else ""
+            print(f"{mark} [{done}/{len(specs)}] {spec['name']} ({entry['status']}){detail}")
+
+    charts = [results[spec["name"]] for spec in specs]
+    counts = {status: sum(1 for c in charts if c["status"] == status) for status in ("rendered", "cached", "failed")}
+    manifest = {
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "render_version": RENDER_VERSION,
+        "output_dir": out_dir,
+        "workers": workers,
+        "elapsed_s": round(time.perf_counter() - started, 3),
+        "counts": counts,
+        "charts": charts,
+    }
+    path = _write_manifest(out_dir, manifest)
+    print(f"📦 렌더링 {counts['rendered']}개, 재사용 {counts['cached']}개, 실패 {counts['failed']}개 → {path}")
+    return manifest
+
+
+def main(argv=None) -> int:
+    p = argparse.ArgumentParser(description="Render KPDS charts from a JSON spec list in parallel")
+    p.add_argument("spec_file", help="Chart spec JSON (list or {\"charts\": [...]})")
+    p.add_argument("--out", default=str(DEFAULT_OUTPUT_DIR), help="Output directory (manifest.json goes here)")
+    p.add_argument("--workers", type=int, help="Worker processes (default: CPU count)")
+    p.add_argument("--force", action="store_true", help="Ignore the previous manifest and re-render everything")
+    p.add_argument("--verbose", action="store_true", help="Keep worker stdout (module load logs)")
+    args = p.parse_args(argv)
+
+    specs = load_specs(args.spec_file)
+    if not specs:
+        print("⚠️ 렌더링할 차트 스펙이 없습니다.")
+        return 0
+    manifest = render_batch(specs, args.out, workers=args.workers, force=args.force, quiet=not args.verbose)
+    return 1 if manifest["counts"]["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
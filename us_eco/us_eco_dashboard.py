@@ -8,6 +8,7 @@ import importlib.util
 import inspect
 import os
 import sys
+from collections import OrderedDict
 from datetime import datetime, date
 from pathlib import Path
 from typing import Any
@@ -45,6 +46,8 @@ try:
         FONT_SIZE_ANNOTATION,
         calculate_title_position,
         create_five_year_comparison_chart,
+        chart_cache,
+        chart_fingerprint,
     )
 except ImportError:
     sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
@@ -56,6 +59,8 @@ except ImportError:
         FONT_SIZE_ANNOTATION,
         calculate_title_position,
         create_five_year_comparison_chart,
+        chart_cache,
+        chart_fingerprint,
     )
 
 
@@ -718,6 +723,49 @@ def build_combined_dataframe(selected_infos: list[dict[str, Any]], dtype_map: di
     return combined, label_dtype
 
 
+COMBINED_FRAME_CACHE_SIZE = 16
+_COMBINED_FRAME_CACHE: OrderedDict[str, tuple[pd.DataFrame, dict[str, str]]] = OrderedDict()
+
+
+def _module_data_version(meta: dict[str, Any], data_dict: dict[str, Any] | None = None) -> tuple:
+    """모듈 데이터 버전 - 새로 로드되면 load_time 과 raw_data 객체가 바뀐다."""
+    if data_dict is None:
+        data_dict = meta.get("data_dict") or getattr(meta["module"], meta["data_attr_name"], None) or {}
+    load_info = data_dict.get("load_info") or {}
+    raw = data_dict.get("raw_data")
+    return (
+        meta.get("module_path"),
+        str(load_info.get("load_time")),
+        id(raw),
+        getattr(raw, "shape", None),
+    )
+
+
+def cached_combined_dataframe(
+    selected_infos: list[dict[str, Any]], dtype_map: dict[str, str]
+) -> tuple[pd.DataFrame, dict[str, str]]:
+    """build_combined_dataframe 결과를 (시리즈, 데이터 타입, 데이터 버전) 키로 재사용.
+
+    반환된 DataFrame 은 여러 rerun 이 공유하므로 제자리 수정하지 말 것.
+    """
+    parts = []
+    for info in selected_infos:
+        meta = info["meta"]
+        if not meta.get("data_dict"):
+            ensure_module_data(meta)
+        parts.append((info["key"], dtype_map.get(info["key"]), info["display_label"], _module_data_version(meta)))
+    key = chart_fingerprint("combined", parts)
+    hit = _COMBINED_FRAME_CACHE.get(key)
+    if hit is not None:
+        _COMBINED_FRAME_CACHE.move_to_end(key)
+        return hit
+    result = build_combined_dataframe(selected_infos, dtype_map)
+    _COMBINED_FRAME_CACHE[key] = result
+    while len(_COMBINED_FRAME_CACHE) > COMBINED_FRAME_CACHE_SIZE:
+        _COMBINED_FRAME_CACHE.popitem(last=False)
+    return result
+
+
 def _dtype_key_to_axis(dtype_key: str | None) -> str:
     if not dtype_key:
         return ""
@@ -1415,7 +1463,7 @@ def _render_beveridge_curves(
 
 def discover_modules() -> list[dict[str, Any]]:
     module_dir = Path(__file__).parent
-    exclude = {"us_eco_utils", "us_eco_dashboard", "cpi_complete_all_series"}
+    exclude = {"us_eco_utils", "us_eco_dashboard", "cpi_complete_all_series", "batch_render"}
     modules: list[dict[str, Any]] = []
     for path in sorted(module_dir.glob("*.py")):
         stem = path.stem
@@ -1960,7 +2008,7 @@ def render_global_dashboard(metas: list[dict[str, Any]]) -> None:
         st.warning("선택한 시리즈에 대한 데이터 타입을 결정할 수 없습니다.")
         return
 
-    combined_df, _ = build_combined_dataframe(selected_infos, dtype_map)
+    combined_df, _ = cached_combined_dataframe(selected_infos, dtype_map)
     if effective_label_map:
         combined_df = combined_df.rename(columns=effective_label_map)
     if combined_df.empty:
@@ -1971,7 +2019,7 @@ def render_global_dashboard(metas: list[dict[str, Any]]) -> None:
 
     if isinstance(combined_df.index, pd.DatetimeIndex) and frequency_option == FREQUENCY_OPTIONS[1]:
         raw_map = {info["key"]: "raw_data" for info in selected_infos}
-        raw_df, _ = build_combined_dataframe(selected_infos, raw_map)
+        raw_df, _ = cached_combined_dataframe(selected_infos, raw_map)
         if effective_label_map:
             raw_df = raw_df.rename(columns=effective_label_map)
         raw_df = raw_df.resample("M").last()
@@ -2424,31 +2472,54 @@ def render_global_dashboard(metas: list[dict[str, Any]]) -> None:
         fig: go.Figure | None = None
         table_df: pd.DataFrame | None = combined_df.copy()
 
+        # 설정 스냅샷 + 시리즈별 데이터 버전이 같으면 직렬화된 차트를 그대로 재사용
+        chart_key = chart_fingerprint(
+            "us_eco_global",
+            {key: value for key, value in snapshot.items() if key != "generated_at"},
+            sorted({_module_data_version(info["meta"]) for info in selected_infos}, key=str),
+            left_axis_range_override,
+            right_axis_range_override,
+            zero_line,
+            frequency_map,
+        )
+
         if chart_type == "multi_line":
-            fig = _create_single_axis_line_chart(
-                combined_df, single_axis_title, chart_width, chart_height, zero_line, frequency_map
+            fig = chart_cache.get_or_build(
+                chart_key,
+                lambda: _create_single_axis_line_chart(
+                    combined_df, single_axis_title, chart_width, chart_height, zero_line, frequency_map
+                ),
             )
         elif chart_type == "single_line":
             if len(display_labels) > 1:
                 st.warning("단일 라인 차트는 1개 시리즈만 표시합니다. 첫 번째 시리즈만 사용합니다.")
             single_df = combined_df[[display_labels[0]]] if display_labels else combined_df
-            fig = _create_single_axis_line_chart(
-                single_df, single_axis_title, chart_width, chart_height, zero_line, frequency_map
+            fig = chart_cache.get_or_build(
+                chart_key,
+                lambda: _create_single_axis_line_chart(
+                    single_df, single_axis_title, chart_width, chart_height, zero_line, frequency_map
+                ),
             )
         elif chart_type == "horizontal_bar":
-            latest_values = pd.Series(
-                {
-                    label: combined_df[label].dropna().iloc[-1]
-                    for label in display_labels
-                    if not combined_df[label].dropna().empty
-                }
-            )
-            fig = _create_horizontal_bar_chart_simple(
-                latest_values, single_axis_title, chart_width, chart_height
-            )
+            def _build_horizontal_bar() -> go.Figure | None:
+                latest_values = pd.Series(
+                    {
+                        label: combined_df[label].dropna().iloc[-1]
+                        for label in display_labels
+                        if not combined_df[label].dropna().empty
+                    }
+                )
+                return _create_horizontal_bar_chart_simple(
+                    latest_values, single_axis_title, chart_width, chart_height
+                )
+
+            fig = chart_cache.get_or_build(chart_key, _build_horizontal_bar)
         elif chart_type == "vertical_bar":
-            fig = _create_vertical_bar_chart_simple(
-                combined_df, single_axis_title, chart_width, chart_height
+            fig = chart_cache.get_or_build(
+                chart_key,
+                lambda: _create_vertical_bar_chart_simple(
+                    combined_df, single_axis_title, chart_width, chart_height
+                ),
             )
         elif chart_type == "five_year":
             if len(display_labels) != 1:
@@ -2536,27 +2607,30 @@ def render_global_dashboard(metas: list[dict[str, Any]]) -> None:
                     info.get("effective_label", info["display_label"]): {"unit": info.get("unit", "")}
                     for info in selected_infos
                 }
-                fig = _create_dual_axis_chart(
-                    df=combined_df,
-                    axis_allocation=axis_allocation,
-                    label_map={label: label for label in display_labels},
-                    data_type=base_data_type,
-                    series_defs=series_defs,
-                    chart_width=chart_width,
-                    chart_height=chart_height,
-                    left_title_offset=left_title_offset,
-                    right_title_offset=right_title_offset,
-                    left_axis_data_type=_dtype_key_to_axis(next(iter(left_dtype_keys)))
-                    if len(left_dtype_keys) == 1
-                    else None,
-                    right_axis_data_type=_dtype_key_to_axis(next(iter(right_dtype_keys)))
-                    if len(right_dtype_keys) == 1
-                    else None,
-                    left_title_override=(custom_left_axis_title or left_label_default or None),
-                    right_title_override=(custom_right_axis_title or right_label_default or None),
-                    left_axis_range_override=left_axis_range_override,
-                    right_axis_range_override=right_axis_range_override,
-                    connect_map=frequency_map,
+                fig = chart_cache.get_or_build(
+                    chart_key,
+                    lambda: _create_dual_axis_chart(
+                        df=combined_df,
+                        axis_allocation=axis_allocation,
+                        label_map={label: label for label in display_labels},
+                        data_type=base_data_type,
+                        series_defs=series_defs,
+                        chart_width=chart_width,
+                        chart_height=chart_height,
+                        left_title_offset=left_title_offset,
+                        right_title_offset=right_title_offset,
+                        left_axis_data_type=_dtype_key_to_axis(next(iter(left_dtype_keys)))
+                        if len(left_dtype_keys) == 1
+                        else None,
+                        right_axis_data_type=_dtype_key_to_axis(next(iter(right_dtype_keys)))
+                        if len(right_dtype_keys) == 1
+                        else None,
+                        left_title_override=(custom_left_axis_title or left_label_default or None),
+                        right_title_override=(custom_right_axis_title or right_label_default or None),
+                        left_axis_range_override=left_axis_range_override,
+                        right_axis_range_override=right_axis_range_override,
+                        connect_map=frequency_map,
+                    ),
                 )
 
         if fig is not None:
@@ -3061,6 +3135,30 @@ def module_page(meta: dict[str, Any]) -> None:
     fig = None
     table_df = None
 
+    # 5년 비교는 표(fmt)도 함께 만들어지므로 캐시하지 않음
+    chart_key = chart_fingerprint(
+        "us_eco_module",
+        meta["module_path"],
+        _module_data_version(meta, data_dict),
+        selected_series,
+        series_type_map,
+        data_type_key,
+        chart_type,
+        chart_width,
+        chart_height,
+        custom_single_axis_title,
+        custom_left_axis_title,
+        custom_right_axis_title,
+        left_title_offset,
+        right_title_offset,
+        axis_allocation,
+        phillips_inflation,
+        phillips_color_by,
+        phillips_show_labels,
+        bev_color_by,
+        bev_show_labels,
+    )
+
     if chart_type == "five_year":
         if len(selected_series) != 1:
             st.warning("5년 비교는 하나의 시리즈만 선택하세요.")
@@ -3119,21 +3217,24 @@ def module_page(meta: dict[str, Any]) -> None:
             series = filtered_standard[label].dropna()
             if isinstance(series.index, pd.DatetimeIndex):
                 connect_map_local[korean_names.get(label, label)] = _infer_series_period(series)
-        fig = _create_dual_axis_chart(
-            df=filtered_standard,
-            axis_allocation=axis_allocation,
-            label_map={s: korean_names.get(s, s) for s in selected_series},
-            data_type=base_data_type,
-            series_defs={s: {"unit": s} for s in selected_series},
-            chart_width=chart_width,
-            chart_height=chart_height,
-            left_title_offset=left_title_offset,
-            right_title_offset=right_title_offset,
-            left_axis_data_type=left_axis_dtype,
-            right_axis_data_type=right_axis_dtype,
-            left_title_override=left_override or None,
-            right_title_override=right_override or None,
-            connect_map=connect_map_local,
+        fig = chart_cache.get_or_build(
+            chart_key,
+            lambda: _create_dual_axis_chart(
+                df=filtered_standard,
+                axis_allocation=axis_allocation,
+                label_map={s: korean_names.get(s, s) for s in selected_series},
+                data_type=base_data_type,
+                series_defs={s: {"unit": s} for s in selected_series},
+                chart_width=chart_width,
+                chart_height=chart_height,
+                left_title_offset=left_title_offset,
+                right_title_offset=right_title_offset,
+                left_axis_data_type=left_axis_dtype,
+                right_axis_data_type=right_axis_dtype,
+                left_title_override=left_override or None,
+                right_title_override=right_override or None,
+                connect_map=connect_map_local,
+            ),
         )
         table_df = filtered_standard.rename(columns=lambda x: korean_names.get(x, x))
         table_df.index.name = "날짜"
@@ -3141,21 +3242,27 @@ def module_page(meta: dict[str, Any]) -> None:
         func_basic = getattr(module, "create_phillips_curve", None)
         func_detailed = getattr(module, "create_phillips_curve_detailed", None)
         if chart_type == "phillips_curve" and callable(func_basic):
-            fig = func_basic(
-                inflation_type=phillips_inflation or selected_series[0],
-                color_by_period=phillips_color_by,
-                show_labels=phillips_show_labels,
-            )
+            curve_fn, curve_kwargs = func_basic, {
+                "inflation_type": phillips_inflation or selected_series[0],
+                "color_by_period": phillips_color_by,
+                "show_labels": phillips_show_labels,
+            }
         elif chart_type == "phillips_curve_detailed" and callable(func_detailed):
-            fig = func_detailed(
-                inflation_type=phillips_inflation or selected_series[0],
-                show_labels=phillips_show_labels,
-            )
+            curve_fn, curve_kwargs = func_detailed, {
+                "inflation_type": phillips_inflation or selected_series[0],
+                "show_labels": phillips_show_labels,
+            }
         else:
             st.warning("필립스 커브 함수를 찾을 수 없습니다.")
             return
-        if fig is not None:
-            fig.update_layout(width=chart_width, height=chart_height)
+
+        def _build_phillips() -> go.Figure | None:
+            curve = curve_fn(**curve_kwargs)
+            if curve is not None:
+                curve.update_layout(width=chart_width, height=chart_height)
+            return curve
+
+        fig = chart_cache.get_or_build(chart_key, _build_phillips)
         combined = getattr(module, "PHILLIPS_DATA", {}).get("combined_data")
         if isinstance(combined, pd.DataFrame) and not combined.empty:
             display_cols = combined.columns
@@ -3168,14 +3275,20 @@ def module_page(meta: dict[str, Any]) -> None:
         func_basic = getattr(module, "create_beveridge_curve", None)
         func_detailed = getattr(module, "create_beveridge_curve_detailed", None)
         if chart_type == "beveridge_curve" and callable(func_basic):
-            fig = func_basic(color_by_period=bev_color_by, show_labels=bev_show_labels)
+            curve_fn, curve_kwargs = func_basic, {"color_by_period": bev_color_by, "show_labels": bev_show_labels}
         elif chart_type == "beveridge_curve_detailed" and callable(func_detailed):
-            fig = func_detailed(show_labels=bev_show_labels)
+            curve_fn, curve_kwargs = func_detailed, {"show_labels": bev_show_labels}
         else:
             st.warning("베버리지 커브 함수를 찾을 수 없습니다.")
             return
-        if fig is not None:
-            fig.update_layout(width=chart_width, height=chart_height)
+
+        def _build_beveridge() -> go.Figure | None:
+            curve = curve_fn(**curve_kwargs)
+            if curve is not None:
+                curve.update_layout(width=chart_width, height=chart_height)
+            return curve
+
+        fig = chart_cache.get_or_build(chart_key, _build_beveridge)
         combined = getattr(module, "BEVERIDGE_DATA", {}).get("combined_data")
         if isinstance(combined, pd.DataFrame) and not combined.empty:
             table_df = combined.rename(columns=lambda x: korean_names.get(x, x))
@@ -3185,40 +3298,36 @@ def module_page(meta: dict[str, Any]) -> None:
             table_df.index.name = "날짜"
     else:
         if use_standard_flow and filtered_standard is not None:
-            working_dict = {"raw_data": filtered_standard}
-            fig = plot_economic_series(
-                data_dict=working_dict,
-                series_list=selected_series,
-                chart_type=chart_type,
-                data_type="raw",
-                labels={s: korean_names.get(s, s) for s in selected_series},
-                korean_names={s: korean_names.get(s, s) for s in selected_series},
-            )
-            if fig is not None:
-                fig.update_layout(width=chart_width, height=chart_height)
-                if chart_type == "horizontal_bar":
-                    _apply_custom_axis_title(fig, "x", custom_single_axis_title)
-                else:
-                    _apply_custom_axis_title(fig, "y", custom_single_axis_title)
-            table_df = filtered_standard.rename(columns=lambda x: korean_names.get(x, x))
-            table_df.index.name = "날짜"
+            series_source = {"raw_data": filtered_standard}
+            series_data_type = "raw"
+            table_source = filtered_standard
         else:
-            fig = plot_economic_series(
-                data_dict=data_dict,
+            series_source = data_dict
+            series_data_type = data_type_key.replace("_data", "")
+            table_source = filtered_df
+
+        def _build_series_chart() -> go.Figure | None:
+            series_fig = plot_economic_series(
+                data_dict=series_source,
                 series_list=selected_series,
                 chart_type=chart_type,
-                data_type=data_type_key.replace("_data", ""),
+                data_type=series_data_type,
                 labels={s: korean_names.get(s, s) for s in selected_series},
                 korean_names={s: korean_names.get(s, s) for s in selected_series},
+                render_mode="auto",
+                target_width_px=chart_width,
             )
-            if fig is not None:
-                fig.update_layout(width=chart_width, height=chart_height)
+            if series_fig is not None:
+                series_fig.update_layout(width=chart_width, height=chart_height)
                 if chart_type == "horizontal_bar":
-                    _apply_custom_axis_title(fig, "x", custom_single_axis_title)
+                    _apply_custom_axis_title(series_fig, "x", custom_single_axis_title)
                 else:
-                    _apply_custom_axis_title(fig, "y", custom_single_axis_title)
-            table_df = filtered_df.rename(columns=lambda x: korean_names.get(x, x))
-            table_df.index.name = "날짜"
+                    _apply_custom_axis_title(series_fig, "y", custom_single_axis_title)
+            return series_fig
+
+        fig = chart_cache.get_or_build(chart_key, _build_series_chart)
+        table_df = table_source.rename(columns=lambda x: korean_names.get(x, x))
+        table_df.index.name = "날짜"
 
     if fig is not None:
         fig = _sanitize_plotly_figure(fig)
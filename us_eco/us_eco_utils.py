@@ -30,6 +30,10 @@ EXPORT_ROOT = REPO_ROOT
 sys.path.append(str(REPO_ROOT))
 from kpds_fig_format_enhanced import *
 
+# 실행 로그/지표 (상세도: RUN_VERBOSITY=0/1/2, 리포트: RUN_REPORT_PATH / RUN_METRICS_PROM_PATH)
+import run_metrics as _run_metrics
+_log = _run_metrics.get_logger("us_eco")
+
 
 def ensure_directory(path: Path) -> Path:
     """Ensure directory exists and return the path."""
@@ -75,9 +79,9 @@ class APIConfig:
         
         try:
             import requests
-            print("✓ requests 라이브러리 사용 가능")
+            _log.debug("✓ requests 라이브러리 사용 가능")
         except ImportError:
-            print("⚠️ requests 라이브러리가 없습니다. 설치하세요: pip install requests")
+            _log.warning("⚠️ requests 라이브러리가 없습니다. 설치하세요: pip install requests")
             self.BLS_API_AVAILABLE = False
             self.FRED_API_AVAILABLE = False
 
@@ -100,7 +104,7 @@ def initialize_bls_api(api_key=None):
     global api_config
     
     if not api_config.BLS_API_AVAILABLE:
-        print("⚠️ BLS API 사용 불가 (requests 라이브러리 없음)")
+        _log.warning("⚠️ BLS API 사용 불가 (requests 라이브러리 없음)")
         return False
     
     if api_key:
@@ -109,10 +113,11 @@ def initialize_bls_api(api_key=None):
     
     try:
         api_config.BLS_SESSION = requests.Session()
-        print("✓ BLS API 세션 초기화 성공")
+        _run_metrics.instrument_session(api_config.BLS_SESSION, "bls")
+        _log.debug("✓ BLS API 세션 초기화 성공")
         return True
     except Exception as e:
-        print(f"⚠️ BLS API 초기화 실패: {e}")
+        _log.warning(f"⚠️ BLS API 초기화 실패: {e}")
         return False
 
 def initialize_fred_api(api_key=None):
@@ -128,22 +133,23 @@ def initialize_fred_api(api_key=None):
     global api_config
     
     if not api_config.FRED_API_AVAILABLE:
-        print("⚠️ FRED API 사용 불가 (requests 라이브러리 없음)")
+        _log.warning("⚠️ FRED API 사용 불가 (requests 라이브러리 없음)")
         return False
     
     if api_key:
         api_config.FRED_API_KEY = api_key
     
     if not api_config.FRED_API_KEY or api_config.FRED_API_KEY == 'YOUR_FRED_API_KEY_HERE':
-        print("⚠️ FRED API 키가 설정되지 않았습니다.")
+        _log.warning("⚠️ FRED API 키가 설정되지 않았습니다.")
         return False
     
     try:
         api_config.FRED_SESSION = requests.Session()
-        print("✓ FRED API 세션 초기화 성공")
+        _run_metrics.instrument_session(api_config.FRED_SESSION, "fred")
+        _log.debug("✓ FRED API 세션 초기화 성공")
         return True
     except Exception as e:
-        print(f"⚠️ FRED API 초기화 실패: {e}")
+        _log.warning(f"⚠️ FRED API 초기화 실패: {e}")
         return False
 
 def switch_bls_api_key():
@@ -152,29 +158,33 @@ def switch_bls_api_key():
     
     if api_config.CURRENT_BLS_KEY == api_config.BLS_API_KEY:
         api_config.CURRENT_BLS_KEY = api_config.BLS_API_KEY2
-        print("🔄 BLS API 키를 KEY2로 전환")
+        _log.info("🔄 BLS API 키를 KEY2로 전환")
     elif api_config.CURRENT_BLS_KEY == api_config.BLS_API_KEY2:
         api_config.CURRENT_BLS_KEY = api_config.BLS_API_KEY3
-        print("🔄 BLS API 키를 KEY3로 전환")
+        _log.info("🔄 BLS API 키를 KEY3로 전환")
     else:
         api_config.CURRENT_BLS_KEY = api_config.BLS_API_KEY
-        print("🔄 BLS API 키를 KEY1로 전환")
+        _log.info("🔄 BLS API 키를 KEY1로 전환")
 
 # %%
 # === 데이터 로드 함수들 ===
 
 BLS_MAX_YEAR_SPAN = 19  # inclusive span → 20년 단위 요청
 
+# API 엔드포인트 (오프라인 벤치마크/테스트 서버로 교체 가능)
+BLS_API_URL = os.environ.get('BLS_API_URL', 'https://api.bls.gov/publicAPI/v2/timeseries/data/')
+FRED_API_URL = os.environ.get('FRED_API_URL', 'https://api.stlouisfed.org/fred/series/observations')
+
 
 def _fetch_bls_series_range(series_id, start_year, end_year):
     """단일 BLS API 호출로 주어진 연도 구간을 가져온다."""
     global api_config
     
     if not api_config.BLS_API_AVAILABLE or api_config.BLS_SESSION is None:
-        print(f"❌ BLS API 사용 불가 - {series_id}")
+        _log.error(f"❌ BLS API 사용 불가 - {series_id}")
         return None
 
-    url = 'https://api.bls.gov/publicAPI/v2/timeseries/data/'
+    url = BLS_API_URL
     headers = {'Content-type': 'application/json'}
 
     payload = {
@@ -190,7 +200,7 @@ def _fetch_bls_series_range(series_id, start_year, end_year):
         payload['registrationkey'] = api_config.CURRENT_BLS_KEY
 
     try:
-        print(f"📊 BLS에서 로딩: {series_id} ({start_year}~{end_year})")
+        _log.debug(f"📊 BLS에서 로딩: {series_id} ({start_year}~{end_year})")
         response = api_config.BLS_SESSION.post(url, data=json.dumps(payload), headers=headers, timeout=30)
         response.raise_for_status()
         
@@ -220,23 +230,25 @@ def _fetch_bls_series_range(series_id, start_year, end_year):
                 df = pd.DataFrame({'date': dates, 'value': values})
                 df = df.sort_values('date')
                 series = pd.Series(df['value'].values, index=df['date'], name=series_id)
-                print(f"✓ BLS 성공: {series_id} ({len(series)}개 포인트)")
+                _run_metrics.record_rows("bls", len(series))
+                _log.debug(f"✓ BLS 성공: {series_id} ({len(series)}개 포인트)")
                 return series
-            print(f"❌ BLS 데이터 없음: {series_id}")
+            _log.error(f"❌ BLS 데이터 없음: {series_id}")
             return None
         else:
             error_msg = json_data.get('message', 'Unknown error')
-            print(f"⚠️ BLS API 오류: {error_msg}")
+            _log.warning(f"⚠️ BLS API 오류: {error_msg}")
             
             # Daily threshold 초과시 API 키 전환 시도
             if 'daily threshold' in error_msg.lower() or 'daily quota' in error_msg.lower():
-                print("📈 Daily threshold 초과 - API 키 전환 시도")
+                _log.info("📈 Daily threshold 초과 - API 키 전환 시도")
                 switch_bls_api_key()
                 
                 # 새로운 API 키로 재시도
                 payload['registrationkey'] = api_config.CURRENT_BLS_KEY
                 try:
-                    print(f"🔄 새 API 키로 재시도: {series_id}")
+                    _log.debug(f"🔄 새 API 키로 재시도: {series_id}")
+                    _run_metrics.metrics.inc("retries", "bls")
                     response = api_config.BLS_SESSION.post(url, data=json.dumps(payload), headers=headers, timeout=30)
                     response.raise_for_status()
                     
@@ -264,19 +276,20 @@ def _fetch_bls_series_range(series_id, start_year, end_year):
                             df = pd.DataFrame({'date': dates, 'value': values})
                             df = df.sort_values('date')
                             series = pd.Series(df['value'].values, index=df['date'], name=series_id)
-                            print(f"✓ BLS 재시도 성공: {series_id}")
+                            _run_metrics.record_rows("bls", len(series))
+                            _log.debug(f"✓ BLS 재시도 성공: {series_id}")
                             return series
                     
-                    print(f"❌ BLS 재시도 실패: {series_id}")
+                    _log.error(f"❌ BLS 재시도 실패: {series_id}")
                     return None
                 except Exception as retry_e:
-                    print(f"❌ BLS 재시도 중 오류: {retry_e}")
+                    _log.error(f"❌ BLS 재시도 중 오류: {retry_e}")
                     return None
             
             return None
             
     except Exception as e:
-        print(f"❌ BLS 요청 실패: {series_id} - {e}")
+        _log.error(f"❌ BLS 요청 실패: {series_id} - {e}")
         return None
 
 
@@ -288,7 +301,7 @@ def get_bls_data(series_id, start_year=2020, end_year=None):
         end_year = dt_datetime.now().year
 
     if start_year > end_year:
-        print(f"⚠️ 잘못된 연도 범위: {start_year} > {end_year}")
+        _log.warning(f"⚠️ 잘못된 연도 범위: {start_year} > {end_year}")
         return None
 
     chunks = []
@@ -296,6 +309,7 @@ def get_bls_data(series_id, start_year=2020, end_year=None):
     while chunk_start <= end_year:
         chunk_end = min(chunk_start + BLS_MAX_YEAR_SPAN, end_year)
         series_chunk = _fetch_bls_series_range(series_id, chunk_start, chunk_end)
+        _run_metrics.metrics.inc("chunks", "bls")
         if series_chunk is not None and not series_chunk.empty:
             chunks.append(series_chunk)
         chunk_start = chunk_end + 1
@@ -322,13 +336,13 @@ def get_fred_data(series_id, start_date='2020-01-01', end_date=None):
     global api_config
     
     if not api_config.FRED_API_AVAILABLE or api_config.FRED_SESSION is None:
-        print(f"❌ FRED API 사용 불가 - {series_id}")
+        _log.error(f"❌ FRED API 사용 불가 - {series_id}")
         return None
     
     if end_date is None:
         end_date = dt_datetime.now().strftime('%Y-%m-%d')
     
-    url = f'https://api.stlouisfed.org/fred/series/observations'
+    url = FRED_API_URL
     params = {
         'series_id': series_id,
         'api_key': api_config.FRED_API_KEY,
@@ -339,7 +353,7 @@ def get_fred_data(series_id, start_date='2020-01-01', end_date=None):
     }
     
     try:
-        print(f"📊 FRED에서 로딩: {series_id}")
+        _log.debug(f"📊 FRED에서 로딩: {series_id}")
         response = api_config.FRED_SESSION.get(url, params=params, timeout=30)
         response.raise_for_status()
         
@@ -365,23 +379,24 @@ def get_fred_data(series_id, start_date='2020-01-01', end_date=None):
                 series = pd.Series(values, index=dates, name=series_id)
                 series = series.sort_index()
                 
-                print(f"✓ FRED 성공: {series_id} ({len(series)}개 포인트)")
+                _run_metrics.record_rows("fred", len(series))
+                _log.debug(f"✓ FRED 성공: {series_id} ({len(series)}개 포인트)")
                 return series
             else:
-                print(f"❌ FRED 데이터 없음: {series_id}")
+                _log.error(f"❌ FRED 데이터 없음: {series_id}")
                 return None
         else:
-            print(f"❌ FRED 응답에 데이터 없음: {series_id}")
+            _log.error(f"❌ FRED 응답에 데이터 없음: {series_id}")
             return None
             
     except requests.exceptions.HTTPError as e:
         if 'Bad Request' in str(e):
-            print(f"❌ FRED API 오류: 잘못된 시리즈 ID '{series_id}' - 존재하지 않는 시리즈일 수 있습니다")
+            _log.error(f"❌ FRED API 오류: 잘못된 시리즈 ID '{series_id}' - 존재하지 않는 시리즈일 수 있습니다")
         else:
-            print(f"❌ FRED HTTP 오류: {series_id} - {e}")
+            _log.error(f"❌ FRED HTTP 오류: {series_id} - {e}")
         return None
     except Exception as e:
-        print(f"❌ FRED 요청 실패: {series_id} - {e}")
+        _log.error(f"❌ FRED 요청 실패: {series_id} - {e}")
         return None
 
 # %%
@@ -393,7 +408,7 @@ def ensure_data_directory(csv_file_path):
     data_dir = path_obj.parent
     if not data_dir.exists():
         data_dir.mkdir(parents=True)
-        print(f"📁 데이터 디렉터리 생성: {data_dir}")
+        _log.info(f"📁 데이터 디렉터리 생성: {data_dir}")
 
 def save_data_to_csv(data_df, csv_file_path):
     """
@@ -407,7 +422,7 @@ def save_data_to_csv(data_df, csv_file_path):
         bool: 저장 성공 여부
     """
     if data_df.empty:
-        print("⚠️ 저장할 데이터가 없습니다.")
+        _log.warning("⚠️ 저장할 데이터가 없습니다.")
         return False
     
     ensure_data_directory(csv_file_path)
@@ -416,10 +431,11 @@ def save_data_to_csv(data_df, csv_file_path):
         df_to_save = data_df.copy()
         df_to_save.index.name = 'date'
         df_to_save.to_csv(csv_file_path)
-        print(f"💾 데이터 저장 완료: {csv_file_path}")
+        _run_metrics.metrics.inc("bytes_written", "csv", os.path.getsize(csv_file_path))
+        _log.info(f"💾 데이터 저장 완료: {csv_file_path}")
         return True
     except Exception as e:
-        print(f"❌ CSV 저장 실패: {e}")
+        _log.error(f"❌ CSV 저장 실패: {e}")
         return False
 
 def load_data_from_csv(csv_file_path):
@@ -433,15 +449,16 @@ def load_data_from_csv(csv_file_path):
         pandas.DataFrame: 로드된 데이터 (실패시 None)
     """
     if not os.path.exists(csv_file_path):
-        print("📂 저장된 CSV 파일이 없습니다.")
+        _log.info("📂 저장된 CSV 파일이 없습니다.")
         return None
     
     try:
         df = pd.read_csv(csv_file_path, index_col=0, parse_dates=True)
-        print(f"📂 CSV 데이터 로드: {len(df)}개 데이터 포인트")
+        _run_metrics.record_rows("csv", len(df))
+        _log.debug(f"📂 CSV 데이터 로드: {len(df)}개 데이터 포인트")
         return df
     except Exception as e:
-        print(f"❌ CSV 로드 실패: {e}")
+        _log.error(f"❌ CSV 로드 실패: {e}")
         return None
 
 # %%
@@ -885,7 +902,8 @@ def create_heatmap_chart(data, series_names, months=12, korean_names=None, title
 
 def plot_economic_series(data_dict, series_list, chart_type='multi_line', data_type='mom',
                          periods=None, labels=None, left_ytitle=None, right_ytitle=None, 
-                         target_date=None, korean_names=None, axis_allocation=None):
+                         target_date=None, korean_names=None, axis_allocation=None,
+                         render_mode=None, target_width_px=None):
     """
     범용 경제 데이터 시각화 함수 - 어떤 경제 데이터든 원하는 시리즈로 다양한 차트 생성
     
@@ -901,6 +919,8 @@ def plot_economic_series(data_dict, series_list, chart_type='multi_line', data_t
         target_date: 특정 날짜 기준 (예: '2025-06-01', None이면 최신 데이터)
         korean_names: 한국어 이름 매핑 딕셔너리
         axis_allocation: 이중축 차트에서 왼쪽/오른쪽 축에 배치할 시리즈 지정
+        render_mode: 라인 차트 렌더링 모드 ('svg', 'auto', 'webgl'; None이면 KPDS 기본값)
+        target_width_px: 긴 시리즈 데시메이션 목표 픽셀 폭 (차트 너비)
     
     Returns:
         plotly figure
@@ -993,7 +1013,9 @@ def plot_economic_series(data_dict, series_list, chart_type='multi_line', data_t
             df=recent_data,
             columns=available_cols,
             ytitle=left_ytitle,
-            labels=labels
+            labels=labels,
+            render_mode=render_mode,
+            target_width_px=target_width_px
         )
     
     elif chart_type == 'single_line' and len(available_cols) == 1:
@@ -1002,7 +1024,9 @@ def plot_economic_series(data_dict, series_list, chart_type='multi_line', data_t
             df=recent_data,
             column=available_cols[0],
             ytitle=left_ytitle,
-            label=labels[available_cols[0]]
+            label=labels[available_cols[0]],
+            render_mode=render_mode,
+            target_width_px=target_width_px
         )
     
     elif chart_type == 'dual_axis' and len(available_cols) >= 2:
@@ -1045,7 +1069,9 @@ def plot_economic_series(data_dict, series_list, chart_type='multi_line', data_t
             left_labels=[labels[col] for col in left_cols],
             right_labels=[labels[col] for col in right_cols],
             left_title=left_ytitle,
-            right_title=right_ytitle or left_ytitle
+            right_title=right_ytitle or left_ytitle,
+            render_mode=render_mode,
+            target_width_px=target_width_px
         )
     
     elif chart_type == 'horizontal_bar':
@@ -1478,6 +1504,318 @@ def export_economic_data(data_dict, series_list, data_type='mom', periods=None,
         print(f"❌ 파일 저장 실패: {e}")
         return None
 
+# %%
+# === 일괄(bulk) export - 다수 시리즈 × 다수 변환을 한 번에 스트리밍 저장 ===
+
+# data_type -> (변환 함수, 설명, 단위); 'raw' 는 변환 없음
+EXPORT_TRANSFORMS = {
+    'raw': (None, "수준", "천명"),
+    'mom': (calculate_mom_percent, "전월대비변화율", "%"),
+    'mom_change': (calculate_mom_change, "전월대비변화량", "천명"),
+    'yoy': (calculate_yoy_percent, "전년동월대비변화율", "%"),
+    'yoy_change': (calculate_yoy_change, "전년동월대비변화량", "천명"),
+}
+# data_type -> 로더가 미리 계산해 둔 data_dict 키 (export_economic_data 와 같은 값을 재사용)
+EXPORT_DATA_KEYS = {
+    'raw': 'raw_data',
+    'mom': 'mom_data',
+    'mom_change': 'mom_change',
+    'yoy': 'yoy_data',
+    'yoy_change': 'yoy_change',
+}
+BULK_EXPORT_BLOCK_ROWS = 500  # 파일로 한 번에 내보내는 행 수
+
+
+def _bulk_column_name(col, korean_names, unit, suffix=None):
+    name = korean_names.get(col, col) if korean_names else col
+    if suffix:
+        name = f"{name} - {suffix}"
+    if unit and unit != "천명":
+        name = f"{name} ({unit})"
+    return name
+
+
+def _unique_headers(headers, columns):
+    """같은 한국어 이름을 가진 시리즈(예: CPI '주거')는 시리즈 ID 를 붙여 헤더를 유일하게
+
+    Parquet 필드명 / 엑셀·CSV 헤더가 겹치면 다시 읽을 때 컬럼을 구분할 수 없다.
+    """
+    counts = {}
+    for header in headers:
+        counts[header] = counts.get(header, 0) + 1
+    unique = [f"{header} [{col}]" if counts[header] > 1 else header
+              for header, (_, col, _) in zip(headers, columns)]
+    # 시리즈 ID 까지 같은 경우 (같은 시리즈를 여러 소스에서) 순번으로 구분
+    seen = {}
+    for i, header in enumerate(unique):
+        n = seen.get(header, 0) + 1
+        seen[header] = n
+        if n > 1:
+            unique[i] = f"{header} ({n})"
+    return unique
+
+
+def _excel_sheet_name(name, used):
+    clean = "".join("_" if ch in '[]:*?/\\' else ch for ch in str(name))[:31] or "Sheet"
+    candidate, n = clean, 2
+    while candidate in used:
+        candidate = f"{clean[:28]}_{n}"
+        n += 1
+    used.add(candidate)
+    return candidate
+
+
+def _fill_sheet_buffer(columns, sources, rows, chunk_size):
+    """시트 하나의 값 버퍼(행 × 열, float64)를 소스·변환별 컬럼 청크 단위로 채움
+
+    로더가 미리 계산한 mom_data/yoy_data 등이 있으면 그대로 사용한다 (export_economic_data 와 동일).
+    없을 때만 청크의 전체 이력으로 변환을 계산한 뒤(전월/전년 대비가 잘리지 않도록) 내보낼 행으로
+    맞춘다. 동시에 메모리에 올라가는 변환 결과는 청크 하나뿐이다.
+    """
+    buffer = np.full((len(rows), len(columns)), np.nan)
+    groups = {}
+    for pos, (label, col, data_type) in enumerate(columns):
+        groups.setdefault((label, data_type), []).append((pos, col))
+    for (label, data_type), members in groups.items():
+        raw = sources[label]['raw_data']
+        precomputed = sources[label].get(EXPORT_DATA_KEYS[data_type])
+        func = EXPORT_TRANSFORMS[data_type][0]
+        for start in range(0, len(members), chunk_size):
+            chunk = members[start:start + chunk_size]
+            chunk_cols = [col for _, col in chunk]
+            if isinstance(precomputed, pd.DataFrame) and all(col in precomputed.columns for col in chunk_cols):
+                block = precomputed[chunk_cols].apply(pd.to_numeric, errors='coerce')
+            else:
+                block = raw[chunk_cols].apply(pd.to_numeric, errors='coerce')
+                if func is not None:
+                    block = func(block)
+            block = block.reindex(rows)
+            buffer[:, [pos for pos, _ in chunk]] = block.to_numpy(dtype=float)
+    return buffer
+
+
+def _iter_row_blocks(rows, buffer, block_rows):
+    for start in range(0, len(rows), block_rows):
+        yield rows[start:start + block_rows], buffer[start:start + block_rows]
+
+
+def _excel_cells(values):
+    """값 블록 → 행 리스트 (NaN/inf 는 빈 셀)"""
+    cells = values.astype(object)
+    cells[~np.isfinite(values)] = None
+    return cells.tolist()
+
+
+def _write_bulk_excel(export_path, sheets, block_rows):
+    """엑셀: xlsxwriter constant_memory 모드(행 단위 flush), 없으면 openpyxl write_only"""
+    try:
+        import xlsxwriter
+    except ImportError:
+        xlsxwriter = None
+
+    if xlsxwriter is not None:
+        workbook = xlsxwriter.Workbook(str(export_path), {'constant_memory': True})
+        header_fmt = workbook.add_format({'bold': True, 'font_color': '#FFFFFF', 'bg_color': '#366092',
+                                          'align': 'center', 'valign': 'vcenter'})
+        date_fmt = workbook.add_format({'num_format': 'yyyy-mm-dd'})
+        try:
+            for sheet_name, headers, rows, fill in sheets:
+                worksheet = workbook.add_worksheet(sheet_name)
+                worksheet.set_column(0, 0, 12)
+                worksheet.set_column(1, len(headers), 18)
+                worksheet.freeze_panes(1, 1)
+                worksheet.write_row(0, 0, ['날짜'] + headers, header_fmt)
+                r = 1
+                for dates, values in _iter_row_blocks(rows, fill(), block_rows):
+                    for date_value, row in zip(dates, _excel_cells(values)):
+                        worksheet.write_datetime(r, 0, date_value.to_pydatetime(), date_fmt)
+                        worksheet.write_row(r, 1, row)
+                        r += 1
+        finally:
+            workbook.close()
+        return
+
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font, PatternFill, Alignment
+
+    workbook = Workbook(write_only=True)
+    header_font = Font(bold=True, color='FFFFFF')
+    header_fill = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
+    for sheet_name, headers, rows, fill in sheets:
+        worksheet = workbook.create_sheet(sheet_name)
+        header_cells = []
+        for text in ['날짜'] + headers:
+            cell = WriteOnlyCell(worksheet, value=text)
+            cell.font = header_font
+            cell.fill = header_fill
+            cell.alignment = Alignment(horizontal='center', vertical='center')
+            header_cells.append(cell)
+        worksheet.append(header_cells)
+        for dates, values in _iter_row_blocks(rows, fill(), block_rows):
+            for date_value, row in zip(dates, _excel_cells(values)):
+                worksheet.append([date_value.to_pydatetime()] + row)
+    workbook.save(str(export_path))
+
+
+def _write_bulk_csv(path, headers, rows, buffer, block_rows):
+    with open(path, 'w', encoding='utf-8-sig', newline='') as f:
+        pd.DataFrame(columns=['날짜'] + headers).to_csv(f, index=False)
+        for dates, values in _iter_row_blocks(rows, buffer, block_rows):
+            block = pd.DataFrame(values, columns=headers)
+            block.insert(0, '날짜', dates.strftime('%Y-%m-%d'))
+            block.to_csv(f, index=False, header=False)
+
+
+def _write_bulk_parquet(path, headers, rows, buffer, block_rows):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([pa.field('날짜', pa.timestamp('ns'))] + [pa.field(h, pa.float64()) for h in headers])
+    with pq.ParquetWriter(str(path), schema) as writer:
+        for dates, values in _iter_row_blocks(rows, buffer, block_rows):
+            arrays = [pa.array(dates.values, type=pa.timestamp('ns'))]
+            arrays += [pa.array(values[:, i], type=pa.float64(), from_pandas=True) for i in range(values.shape[1])]
+            writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=schema))
+
+
+def export_economic_data_bulk(sources, series_list=None, data_types=('raw', 'mom', 'mom_change', 'yoy', 'yoy_change'),
+                              periods=None, target_date=None, korean_names=None, export_path=None,
+                              file_format='excel', sheet_by='data_type', chunk_size=64):
+    """
+    다수 시리즈 × 다수 변환을 한 파일(엑셀) 또는 시트별 파일(CSV/Parquet)로 일괄 export
+
+    export_economic_data 를 data_type 마다 반복 호출하는 대신, 변환을 시트 단위·컬럼 청크 단위로
+    계산하고 행 블록 단위로 스트리밍 저장한다 (엑셀은 xlsxwriter constant_memory 모드).
+    동시에 메모리에 있는 것은 원자료 + 현재 시트의 값 버퍼뿐이다.
+
+    Args:
+        sources: 데이터 딕셔너리 하나 또는 {모듈명: 데이터 딕셔너리} (각각 'raw_data' 필요)
+        series_list: export할 시리즈 (None이면 raw_data 전체, dict면 {모듈명: [시리즈]})
+        data_types: 변환 목록 ('raw', 'mom', 'mom_change', 'yoy', 'yoy_change')
+        periods: 표시할 기간 (개월, None이면 전체 데이터)
+        target_date: 특정 날짜 기준 (예: '2025-06-01', None이면 최신 데이터)
+        korean_names: 한국어 이름 매핑 딕셔너리
+        export_path: 저장 경로 (None이면 us_eco/exports 에 자동 생성, CSV/Parquet은 시트별 접미사)
+        file_format: 'excel', 'csv', 'parquet'
+        sheet_by: 'data_type' (변환별 시트) 또는 'module' (모듈별 시트, 컬럼 = 시리즈 × 변환)
+        chunk_size: 변환을 한 번에 계산할 컬럼 수
+
+    Returns:
+        list[Path]: 저장된 파일 경로 목록 (실패시 None)
+    """
+    if isinstance(sources, dict) and 'raw_data' in sources:
+        sources = {'데이터': sources}
+    sources = {
+        label: data_dict for label, data_dict in (sources or {}).items()
+        if data_dict and isinstance(data_dict.get('raw_data'), pd.DataFrame) and not data_dict['raw_data'].empty
+    }
+    if not sources:
+        print("⚠️ 데이터가 로드되지 않았습니다. 먼저 데이터를 로드하세요.")
+        return None
+
+    unknown = [dt for dt in data_types if dt not in EXPORT_TRANSFORMS]
+    if unknown:
+        print(f"❌ 지원하지 않는 data_type입니다: {unknown}")
+        return None
+    if file_format not in ('excel', 'csv', 'parquet'):
+        print("❌ file_format은 'excel', 'csv', 'parquet' 중 선택하세요.")
+        return None
+    if sheet_by not in ('data_type', 'module'):
+        print("❌ sheet_by는 'data_type' 또는 'module' 중 선택하세요.")
+        return None
+
+    # 소스별 export 컬럼
+    selected = {}
+    for label, data_dict in sources.items():
+        raw_cols = list(data_dict['raw_data'].columns)
+        wanted = series_list.get(label) if isinstance(series_list, dict) else series_list
+        cols = [col for col in (wanted or raw_cols) if col in raw_cols]
+        if cols:
+            selected[label] = cols
+    if not selected:
+        print("❌ 요청한 시리즈가 데이터에 없습니다.")
+        return None
+
+    # 내보낼 행 (모든 소스 날짜의 합집합 → target_date / periods 적용)
+    rows = None
+    for label in selected:
+        index = pd.DatetimeIndex(sources[label]['raw_data'].index)
+        rows = index if rows is None else rows.union(index)
+    rows = rows.sort_values()
+    if target_date:
+        try:
+            rows = rows[rows <= pd.to_datetime(target_date)]
+        except Exception:
+            print(f"⚠️ 잘못된 날짜 형식입니다: {target_date}. 'YYYY-MM-DD' 형식을 사용하세요.")
+            return None
+    if periods is not None:
+        rows = rows[-periods:]
+    if len(rows) == 0:
+        print("❌ 선택한 기간에 데이터가 없습니다.")
+        return None
+
+    multi_source = len(selected) > 1
+
+    def _display(label, col, data_type, with_suffix):
+        _, desc, unit = EXPORT_TRANSFORMS[data_type]
+        name = _bulk_column_name(col, korean_names, unit, desc if with_suffix else None)
+        return f"{name} [{label}]" if multi_source and sheet_by == 'data_type' else name
+
+    # 시트 정의: (시트 이름, [(소스, 시리즈, data_type)])
+    sheet_defs = []
+    if sheet_by == 'data_type':
+        for data_type in data_types:
+            cols = [(label, col, data_type) for label, cols in selected.items() for col in cols]
+            sheet_defs.append((EXPORT_TRANSFORMS[data_type][1], cols, False))
+    else:
+        for label, cols in selected.items():
+            sheet_defs.append((label, [(label, col, dt) for dt in data_types for col in cols], True))
+
+    if export_path is None:
+        timestamp = dt_datetime.now().strftime('%Y%m%d_%H%M%S')
+        n_series = sum(len(cols) for cols in selected.values())
+        export_dir = repo_path('us_eco', 'exports')
+        export_dir.mkdir(parents=True, exist_ok=True)
+        suffix = {'excel': '.xlsx', 'csv': '.csv', 'parquet': '.parquet'}[file_format]
+        export_path = export_dir / f"일괄_{n_series}개시리즈_{len(data_types)}개변환_{timestamp}{suffix}"
+    else:
+        export_path = Path(export_path)
+    ensure_data_directory(export_path)
+
+    used_names = set()
+    sheets = []
+    for sheet_name, columns, with_suffix in sheet_defs:
+        headers = _unique_headers([_display(label, col, dt, with_suffix) for label, col, dt in columns], columns)
+        fill = (lambda columns=columns: _fill_sheet_buffer(columns, sources, rows, chunk_size))
+        sheets.append((_excel_sheet_name(sheet_name, used_names), headers, rows, fill))
+
+    written = []
+    try:
+        if file_format == 'excel':
+            _write_bulk_excel(export_path, sheets, BULK_EXPORT_BLOCK_ROWS)
+            written.append(export_path)
+            print(f"📊 엑셀 파일로 일괄 export 완료: {export_path} ({len(sheets)}개 시트)")
+        else:
+            writer = _write_bulk_csv if file_format == 'csv' else _write_bulk_parquet
+            for sheet_name, headers, sheet_rows, fill in sheets:
+                path = export_path.with_name(f"{export_path.stem}_{sheet_name}{export_path.suffix}")
+                writer(path, headers, sheet_rows, fill(), BULK_EXPORT_BLOCK_ROWS)
+                written.append(path)
+            kind = "CSV" if file_format == 'csv' else "Parquet"
+            print(f"📄 {kind} 파일 {len(written)}개로 일괄 export 완료: {export_path.parent}")
+    except ImportError as e:
+        print(f"❌ 필요한 라이브러리가 없습니다: {e}")
+        return None
+    except Exception as e:
+        print(f"❌ 파일 저장 실패: {e}")
+        return None
+
+    print(f"   📅 기간: {rows[0].strftime('%Y-%m-%d')} ~ {rows[-1].strftime('%Y-%m-%d')}")
+    print(f"   📈 시리즈: {sum(len(cols) for cols in selected.values())}개 × 변환 {len(data_types)}개")
+    print(f"   📊 데이터 포인트: {len(rows)}개")
+    return written
+
 # %%
 # === 분석 함수들 ===
 
@@ -1535,6 +1873,7 @@ def analyze_latest_trends(data, series_names, korean_names=None):
 # %%
 # === 통합 데이터 로드 함수 ===
 
+@_run_metrics.profiled("us_eco.load_economic_data", out_dir=DATA_DIR)
 def load_economic_data(series_dict, data_source='BLS', csv_file_path=None,
                       start_date='2020-01-01', smart_update=True, force_reload=False,
                       tolerance=10.0):
@@ -1553,20 +1892,20 @@ def load_economic_data(series_dict, data_source='BLS', csv_file_path=None,
     Returns:
         dict: 로드된 데이터와 메타정보
     """
-    print(f"🚀 {data_source} 데이터 로딩 시작...")
-    print("="*50)
+    _log.info(f"🚀 {data_source} 데이터 로딩 시작...")
+    _log.info("="*50)
     
     # API 초기화
     if data_source == 'BLS':
         if not initialize_bls_api():
-            print("❌ BLS API 초기화 실패")
+            _log.error("❌ BLS API 초기화 실패")
             return None
     elif data_source == 'FRED':
         if not initialize_fred_api():
-            print("❌ FRED API 초기화 실패")
+            _log.error("❌ FRED API 초기화 실패")
             return None
     else:
-        print("❌ 지원하지 않는 데이터 소스")
+        _log.error("❌ 지원하지 않는 데이터 소스")
         return None
     
     # 스마트 업데이트 로직
@@ -1574,14 +1913,14 @@ def load_economic_data(series_dict, data_source='BLS', csv_file_path=None,
     consistency_result = None
     
     if smart_update and not force_reload and csv_file_path:
-        print("🤖 스마트 업데이트 모드 활성화")
+        _log.info("🤖 스마트 업데이트 모드 활성화")
         
         # CSV에서 데이터 로드 시도
         csv_data = load_data_from_csv(csv_file_path)
         
         if csv_data is not None and not csv_data.empty:
             # 최신 몇 개 데이터만 API로 가져와서 비교
-            print("🔍 최근 데이터 일치성 확인 중...")
+            _log.info("🔍 최근 데이터 일치성 확인 중...")
             
             # 대표 시리즈 하나만 확인 (빠른 체크)
             main_series = list(series_dict.keys())[0]
@@ -1604,8 +1943,9 @@ def load_economic_data(series_dict, data_source='BLS', csv_file_path=None,
                 
                 needs_api_call = consistency_result['needs_update']
                 
+                _run_metrics.record_cache(data_source.lower(), not needs_api_call)
                 if not needs_api_call:
-                    print("✅ 최근 데이터가 일치함 - API 호출 건너뛰기")
+                    _log.info("✅ 최근 데이터가 일치함 - API 호출 건너뛰기")
                     return {
                         'raw_data': csv_data,
                         'mom_data': calculate_mom_percent(csv_data),
@@ -1623,11 +1963,11 @@ def load_economic_data(series_dict, data_source='BLS', csv_file_path=None,
                         }
                     }
                 else:
-                    print("📡 데이터 불일치 감지 - 전체 API 호출 진행")
+                    _log.info("📡 데이터 불일치 감지 - 전체 API 호출 진행")
     
     # API를 통한 전체 데이터 로드
     if needs_api_call:
-        print(f"📊 {data_source} API를 통한 데이터 수집...")
+        _log.info(f"📊 {data_source} API를 통한 데이터 수집...")
         
         raw_data_dict = {}
         
@@ -1641,10 +1981,10 @@ def load_economic_data(series_dict, data_source='BLS', csv_file_path=None,
             if series_data is not None and len(series_data) > 0:
                 raw_data_dict[series_name] = series_data
             else:
-                print(f"❌ 데이터 로드 실패: {series_name}")
+                _log.error(f"❌ 데이터 로드 실패: {series_name}")
         
         if len(raw_data_dict) == 0:
-            print("❌ 로드된 시리즈가 없습니다.")
+            _log.error("❌ 로드된 시리즈가 없습니다.")
             return None
         
         # DataFrame 생성
@@ -1660,7 +2000,7 @@ def load_economic_data(series_dict, data_source='BLS', csv_file_path=None,
         if csv_file_path:
             save_data_to_csv(raw_data, csv_file_path)
         
-        print(f"\n✅ 데이터 로딩 완료! 시리즈: {len(raw_data_dict)}개")
+        _log.info(f"\n✅ 데이터 로딩 완료! 시리즈: {len(raw_data_dict)}개")
         
         return {
             'raw_data': raw_data,
@@ -1718,14 +2058,14 @@ def check_group_consistency(existing_data, group_name, main_series_dict, data_so
     main_series_name = list(main_series_dict.keys())[0]
     main_series_id = list(main_series_dict.values())[0]
     
-    print(f"🔍 {group_name} 그룹 일치성 확인 중...")
-    print(f"   메인 시리즈: {main_series_name} ({main_series_id})")
+    _log.debug(f"🔍 {group_name} 그룹 일치성 확인 중...")
+    _log.debug(f"   메인 시리즈: {main_series_name} ({main_series_id})")
     
     # 기존 데이터에서 그룹 시리즈 확인
     group_columns = [col for col in existing_data.columns if col.startswith(f"{group_name}_")]
     
     if not group_columns:
-        print(f"   ⚠️ 기존 데이터에 {group_name} 그룹 없음")
+        _log.warning(f"   ⚠️ 기존 데이터에 {group_name} 그룹 없음")
         return {
             'need_update': True,
             'reason': f'{group_name} 그룹 기존 데이터 없음',
@@ -1735,7 +2075,7 @@ def check_group_consistency(existing_data, group_name, main_series_dict, data_so
     
     # 메인 시리즈 확인
     if main_series_name not in existing_data.columns:
-        print(f"   ⚠️ 메인 시리즈 없음: {main_series_name}")
+        _log.warning(f"   ⚠️ 메인 시리즈 없음: {main_series_name}")
         return {
             'need_update': True,
             'reason': f'{group_name} 메인 시리즈 없음',
@@ -1746,7 +2086,7 @@ def check_group_consistency(existing_data, group_name, main_series_dict, data_so
     # 기존 데이터 최신 날짜
     existing_series = existing_data[main_series_name].dropna()
     if existing_series.empty:
-        print(f"   ⚠️ 메인 시리즈 데이터 비어있음")
+        _log.warning(f"   ⚠️ 메인 시리즈 데이터 비어있음")
         return {
             'need_update': True,
             'reason': f'{group_name} 메인 시리즈 비어있음',
@@ -1755,7 +2095,7 @@ def check_group_consistency(existing_data, group_name, main_series_dict, data_so
         }
     
     existing_latest_date = existing_series.index[-1]
-    print(f"   기존 데이터 최신: {existing_latest_date.strftime('%Y-%m')}")
+    _log.debug(f"   기존 데이터 최신: {existing_latest_date.strftime('%Y-%m')}")
     
     # 최근 3개월 데이터만 API에서 확인
     try:
@@ -1767,7 +2107,7 @@ def check_group_consistency(existing_data, group_name, main_series_dict, data_so
             recent_start_year = dt_datetime.now().year - 1
             recent_api_data = get_bls_data(main_series_id, recent_start_year)
         else:
-            print(f"   ❌ 지원하지 않는 데이터 소스: {data_source}")
+            _log.error(f"   ❌ 지원하지 않는 데이터 소스: {data_source}")
             return {
                 'need_update': True,
                 'reason': f'지원하지 않는 데이터 소스: {data_source}',
@@ -1776,7 +2116,7 @@ def check_group_consistency(existing_data, group_name, main_series_dict, data_so
             }
         
         if recent_api_data is None or recent_api_data.empty:
-            print(f"   ⚠️ API 데이터 조회 실패")
+            _log.warning(f"   ⚠️ API 데이터 조회 실패")
             return {
                 'need_update': True,
                 'reason': f'{group_name} API 조회 실패',
@@ -1785,14 +2125,14 @@ def check_group_consistency(existing_data, group_name, main_series_dict, data_so
             }
         
         api_latest_date = recent_api_data.index[-1]
-        print(f"   API 데이터 최신: {api_latest_date.strftime('%Y-%m')}")
+        _log.debug(f"   API 데이터 최신: {api_latest_date.strftime('%Y-%m')}")
         
         # 날짜 비교 (월 단위)
         existing_month = existing_latest_date.to_period('M')
         api_month = api_latest_date.to_period('M')
         
         if api_month > existing_month:
-            print(f"   🆕 {group_name} 새로운 데이터: {existing_latest_date.strftime('%Y-%m')} → {api_latest_date.strftime('%Y-%m')}")
+            _log.info(f"   🆕 {group_name} 새로운 데이터: {existing_latest_date.strftime('%Y-%m')} → {api_latest_date.strftime('%Y-%m')}")
             return {
                 'need_update': True,
                 'reason': f'{group_name} 새로운 데이터 ({api_latest_date.strftime("%Y-%m")})',
@@ -1810,7 +2150,7 @@ def check_group_consistency(existing_data, group_name, main_series_dict, data_so
                 if pd.notna(existing_val) and pd.notna(api_val):
                     diff = abs(existing_val - api_val)
                     if diff > tolerance:
-                        print(f"   🚨 {group_name} 값 불일치 ({date.strftime('%Y-%m')}): {existing_val:.1f} vs {api_val:.1f}")
+                        _log.warning(f"   🚨 {group_name} 값 불일치 ({date.strftime('%Y-%m')}): {existing_val:.1f} vs {api_val:.1f}")
                         return {
                             'need_update': True,
                             'reason': f'{group_name} 값 불일치 ({date.strftime("%Y-%m")})',
@@ -1818,7 +2158,7 @@ def check_group_consistency(existing_data, group_name, main_series_dict, data_so
                             'api_date': api_latest_date
                         }
         
-        print(f"   ✅ {group_name} 데이터 일치")
+        _log.debug(f"   ✅ {group_name} 데이터 일치")
         return {
             'need_update': False,
             'reason': f'{group_name} 데이터 일치',
@@ -1827,7 +2167,7 @@ def check_group_consistency(existing_data, group_name, main_series_dict, data_so
         }
         
     except Exception as e:
-        print(f"   ❌ {group_name} 일치성 확인 오류: {e}")
+        _log.error(f"   ❌ {group_name} 일치성 확인 오류: {e}")
         return {
             'need_update': True,
             'reason': f'{group_name} 확인 오류: {str(e)}',
@@ -1849,7 +2189,7 @@ def update_group_data(group_name, group_series_dict, existing_data, data_source=
     Returns:
         pandas.DataFrame: 업데이트된 전체 데이터
     """
-    print(f"🔄 {group_name} 그룹 데이터 업데이트 중...")
+    _log.info(f"🔄 {group_name} 그룹 데이터 업데이트 중...")
     
     # 그룹 데이터 새로 수집
     new_group_data = {}
@@ -1862,21 +2202,21 @@ def update_group_data(group_name, group_series_dict, existing_data, data_source=
                 start_year = int(start_date[:4])
                 series_data = get_bls_data(series_id, start_year)
             else:
-                print(f"   ❌ 지원하지 않는 데이터 소스: {data_source}")
+                _log.error(f"   ❌ 지원하지 않는 데이터 소스: {data_source}")
                 continue
                 
             if series_data is not None and len(series_data) > 0:
                 new_group_data[series_name] = series_data
-                print(f"   ✓ {series_name}: {len(series_data.dropna())}개 포인트")
+                _log.debug(f"   ✓ {series_name}: {len(series_data.dropna())}개 포인트")
             else:
-                print(f"   ❌ {series_name}: 데이터 없음")
+                _log.error(f"   ❌ {series_name}: 데이터 없음")
                 
         except Exception as e:
-            print(f"   ❌ {series_name} 업데이트 실패: {e}")
+            _log.error(f"   ❌ {series_name} 업데이트 실패: {e}")
             continue
     
     if not new_group_data:
-        print(f"   ❌ {group_name} 그룹 업데이트 실패 - 새 데이터 없음")
+        _log.error(f"   ❌ {group_name} 그룹 업데이트 실패 - 새 데이터 없음")
         return existing_data
     
     # 새 그룹 데이터를 DataFrame으로 변환
@@ -1890,10 +2230,11 @@ def update_group_data(group_name, group_series_dict, existing_data, data_source=
     # 새 그룹 데이터 병합
     updated_data = updated_data.join(new_group_df, how='outer')
     
-    print(f"   ✅ {group_name} 그룹 업데이트 완료: {len(new_group_data)}개 시리즈")
+    _log.info(f"   ✅ {group_name} 그룹 업데이트 완료: {len(new_group_data)}개 시리즈")
     
     return updated_data
 
+@_run_metrics.profiled("us_eco.load_economic_data_grouped", out_dir=DATA_DIR)
 def load_economic_data_grouped(series_groups, data_source='FRED', csv_file_path=None,
                               start_date='2020-01-01', smart_update=True, force_reload=False,
                               tolerance=10.0):
@@ -1913,33 +2254,33 @@ def load_economic_data_grouped(series_groups, data_source='FRED', csv_file_path=
     Returns:
         dict: 로드된 데이터와 메타정보
     """
-    print(f"🚀 그룹별 {data_source} 데이터 로딩 시작...")
-    print(f"   그룹 수: {len(series_groups)}")
-    print(f"   그룹명: {list(series_groups.keys())}")
-    print("="*50)
+    _log.info(f"🚀 그룹별 {data_source} 데이터 로딩 시작...")
+    _log.info(f"   그룹 수: {len(series_groups)}")
+    _log.info(f"   그룹명: {list(series_groups.keys())}")
+    _log.info("="*50)
     
     # API 초기화
     if data_source == 'BLS':
         if not initialize_bls_api():
-            print("❌ BLS API 초기화 실패")
+            _log.error("❌ BLS API 초기화 실패")
             return None
     elif data_source == 'FRED':
         if not initialize_fred_api():
-            print("❌ FRED API 초기화 실패")
+            _log.error("❌ FRED API 초기화 실패")
             return None
     else:
-        print("❌ 지원하지 않는 데이터 소스")
+        _log.error("❌ 지원하지 않는 데이터 소스")
         return None
     
     # 스마트 업데이트 로직
     if smart_update and not force_reload and csv_file_path:
-        print("🤖 그룹별 스마트 업데이트 모드 활성화")
+        _log.info("🤖 그룹별 스마트 업데이트 모드 활성화")
         
         # CSV에서 기존 데이터 로드
         existing_data = load_data_from_csv(csv_file_path)
         
         if existing_data is not None and not existing_data.empty:
-            print("📂 기존 CSV 데이터 로드 완료")
+            _log.debug("📂 기존 CSV 데이터 로드 완료")
             
             # 각 그룹별 일치성 확인
             groups_to_update = []
@@ -1956,16 +2297,17 @@ def load_economic_data_grouped(series_groups, data_source='FRED', csv_file_path=
                 )
                 
                 group_consistency_results[group_name] = consistency_result
+                _run_metrics.record_cache(data_source.lower(), not consistency_result['need_update'])
                 
                 if consistency_result['need_update']:
                     groups_to_update.append(group_name)
-                    print(f"   📝 {group_name}: 업데이트 필요 - {consistency_result['reason']}")
+                    _log.debug(f"   📝 {group_name}: 업데이트 필요 - {consistency_result['reason']}")
                 else:
-                    print(f"   ✅ {group_name}: 데이터 일치")
+                    _log.debug(f"   ✅ {group_name}: 데이터 일치")
             
             # 업데이트가 필요한 그룹만 처리
             if not groups_to_update:
-                print("✅ 모든 그룹 데이터 일치 - API 호출 건너뛰기")
+                _log.info("✅ 모든 그룹 데이터 일치 - API 호출 건너뛰기")
                 return {
                     'raw_data': existing_data,
                     'mom_data': calculate_mom_percent(existing_data),
@@ -1986,7 +2328,7 @@ def load_economic_data_grouped(series_groups, data_source='FRED', csv_file_path=
                 }
             
             # 필요한 그룹만 업데이트
-            print(f"📡 {len(groups_to_update)}개 그룹 개별 업데이트: {groups_to_update}")
+            _log.info(f"📡 {len(groups_to_update)}개 그룹 개별 업데이트: {groups_to_update}")
             
             updated_data = existing_data.copy()
             
@@ -2000,7 +2342,7 @@ def load_economic_data_grouped(series_groups, data_source='FRED', csv_file_path=
             if csv_file_path:
                 save_data_to_csv(updated_data, csv_file_path)
             
-            print(f"\n✅ 그룹별 부분 업데이트 완료! ({len(groups_to_update)}개 그룹 업데이트)")
+            _log.info(f"\n✅ 그룹별 부분 업데이트 완료! ({len(groups_to_update)}개 그룹 업데이트)")
             
             return {
                 'raw_data': updated_data,
@@ -2021,10 +2363,10 @@ def load_economic_data_grouped(series_groups, data_source='FRED', csv_file_path=
                 }
             }
         else:
-            print("⚠️ CSV 로드 실패 - 전체 로드로 진행")
+            _log.warning("⚠️ CSV 로드 실패 - 전체 로드로 진행")
     
     # 전체 로드 (스마트 업데이트 실패하거나 비활성화된 경우)
-    print("📊 전체 그룹 데이터 로드 진행")
+    _log.info("📊 전체 그룹 데이터 로드 진행")
     
     # 모든 시리즈를 하나의 딕셔너리로 통합
     all_series = {}
@@ -2053,55 +2395,55 @@ def load_economic_data_grouped(series_groups, data_source='FRED', csv_file_path=
 # %%
 # === 사용 예시 ===
 
-print("✅ US Economic Data Utils 로드 완료!")
-print("\n=== 주요 함수들 ===")
-print("1. API 초기화:")
-print("   - initialize_bls_api(api_key=None)")
-print("   - initialize_fred_api(api_key=None)")
-print()
-print("2. 데이터 로드:")
-print("   - get_bls_data(series_id, start_year, end_year)")
-print("   - get_fred_data(series_id, start_date, end_date)")
-print("   - load_economic_data(series_dict, data_source, csv_file_path, ...)")
-print()
-print("3. 데이터 저장/로드:")
-print("   - save_data_to_csv(data_df, csv_file_path)")
-print("   - load_data_from_csv(csv_file_path)")
-print()
-print("4. 데이터 계산:")
-print("   - calculate_mom_percent/change(data)")
-print("   - calculate_yoy_percent/change(data)")
-print()
-print("5. 시각화 (KPDS 포맷):")
-print("   - create_timeseries_chart(data, series_names, chart_type, ...)")
-print("   - create_comparison_chart(data, series_names, periods, ...)")
-print("   - create_heatmap_chart(data, series_names, months, ...)")
-print("   🔥 plot_economic_series(data_dict, series_list, chart_type, data_type, ...)")
-print("      └─ 가장 강력한 범용 시각화 함수!")
-print("      └─ 차트 타입: 'multi_line', 'single_line', 'dual_axis', 'horizontal_bar', 'vertical_bar'")
-print("      └─ 데이터 타입: 'mom', 'raw', 'mom_change', 'yoy', 'yoy_change'")
-print("      └─ 기간 설정, 특정 날짜 기준 시각화 지원")
-print("   🔥 export_economic_data(data_dict, series_list, data_type, ...)")
-print("      └─ 시각화와 동일한 데이터를 엑셀/CSV로 export!")
-print("      └─ 한국어 컬럼명, 스타일링, 자동 경로 생성")
-print()
-print("6. 분석:")
-print("   - analyze_latest_trends(data, series_names, korean_names)")
-print()
-print("7. 스마트 업데이트:")
-print("   - check_recent_data_consistency(csv_data, api_data, tolerance)")
-print()
-print("🎯 사용 예시:")
-print("   # 전체 데이터 시각화 (기본)")
-print("   plot_economic_series(data_dict, ['series1', 'series2'], 'multi_line', 'mom')")
-print("   plot_economic_series(data_dict, ['series1', 'series2'], 'dual_axis', 'yoy')")
-print("   # 기간 제한 시각화")
-print("   plot_economic_series(data_dict, ['series1'], 'single_line', 'raw', periods=24)")
-print("   # 특정 날짜 기준")
-print("   plot_economic_series(data_dict, ['series1'], 'single_line', 'mom', target_date='2024-06-01')")
-print("   # 시계열 세로 바 차트 (기여도 분석에 최적)")
-print("   plot_economic_series(data_dict, ['consumption', 'investment'], 'vertical_bar', 'mom')")
-print("   # 데이터 export (엑셀)")
-print("   export_economic_data(data_dict, ['series1', 'series2'], 'mom')")
-print("   # 데이터 export (CSV, 최근 24개월)")
-print("   export_economic_data(data_dict, ['series1'], 'raw', periods=24, file_format='csv')")
+_log.info("✅ US Economic Data Utils 로드 완료!")
+_log.debug("\n=== 주요 함수들 ===")
+_log.debug("1. API 초기화:")
+_log.debug("   - initialize_bls_api(api_key=None)")
+_log.debug("   - initialize_fred_api(api_key=None)")
+_log.debug("")
+_log.debug("2. 데이터 로드:")
+_log.debug("   - get_bls_data(series_id, start_year, end_year)")
+_log.debug("   - get_fred_data(series_id, start_date, end_date)")
+_log.debug("   - load_economic_data(series_dict, data_source, csv_file_path, ...)")
+_log.debug("")
+_log.debug("3. 데이터 저장/로드:")
+_log.debug("   - save_data_to_csv(data_df, csv_file_path)")
+_log.debug("   - load_data_from_csv(csv_file_path)")
+_log.debug("")
+_log.debug("4. 데이터 계산:")
+_log.debug("   - calculate_mom_percent/change(data)")
+_log.debug("   - calculate_yoy_percent/change(data)")
+_log.debug("")
+_log.debug("5. 시각화 (KPDS 포맷):")
+_log.debug("   - create_timeseries_chart(data, series_names, chart_type, ...)")
+_log.debug("   - create_comparison_chart(data, series_names, periods, ...)")
+_log.debug("   - create_heatmap_chart(data, series_names, months, ...)")
+_log.debug("   🔥 plot_economic_series(data_dict, series_list, chart_type, data_type, ...)")
+_log.debug("      └─ 가장 강력한 범용 시각화 함수!")
+_log.debug("      └─ 차트 타입: 'multi_line', 'single_line', 'dual_axis', 'horizontal_bar', 'vertical_bar'")
+_log.debug("      └─ 데이터 타입: 'mom', 'raw', 'mom_change', 'yoy', 'yoy_change'")
+_log.debug("      └─ 기간 설정, 특정 날짜 기준 시각화 지원")
+_log.debug("   🔥 export_economic_data(data_dict, series_list, data_type, ...)")
+_log.debug("      └─ 시각화와 동일한 데이터를 엑셀/CSV로 export!")
+_log.debug("      └─ 한국어 컬럼명, 스타일링, 자동 경로 생성")
+_log.debug("")
+_log.debug("6. 분석:")
+_log.debug("   - analyze_latest_trends(data, series_names, korean_names)")
+_log.debug("")
+_log.debug("7. 스마트 업데이트:")
+_log.debug("   - check_recent_data_consistency(csv_data, api_data, tolerance)")
+_log.debug("")
+_log.debug("🎯 사용 예시:")
+_log.debug("   # 전체 데이터 시각화 (기본)")
+_log.debug("   plot_economic_series(data_dict, ['series1', 'series2'], 'multi_line', 'mom')")
+_log.debug("   plot_economic_series(data_dict, ['series1', 'series2'], 'dual_axis', 'yoy')")
+_log.debug("   # 기간 제한 시각화")
+_log.debug("   plot_economic_series(data_dict, ['series1'], 'single_line', 'raw', periods=24)")
+_log.debug("   # 특정 날짜 기준")
+_log.debug("   plot_economic_series(data_dict, ['series1'], 'single_line', 'mom', target_date='2024-06-01')")
+_log.debug("   # 시계열 세로 바 차트 (기여도 분석에 최적)")
+_log.debug("   plot_economic_series(data_dict, ['consumption', 'investment'], 'vertical_bar', 'mom')")
+_log.debug("   # 데이터 export (엑셀)")
+_log.debug("   export_economic_data(data_dict, ['series1', 'series2'], 'mom')")
+_log.debug("   # 데이터 export (CSV, 최근 24개월)")
+_log.debug("   export_economic_data(data_dict, ['series1'], 'raw', periods=24, file_format='csv')")